@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Backfill or rebuild the full-text segment index used by web search.
+
+New databases get the index from init_database(); existing databases are
+backfilled the first time it runs. Use this script to rebuild the index after
+restoring a database or if search results look out of date.
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+from typing import Sequence
+
+from transcriptx.database import init_database
+from transcriptx.database.segment_search import rebuild_segment_search_index
+
+
+def _parse_args(argv: Sequence[str]) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Rebuild the full-text index over transcript segment text.",
+    )
+    return parser.parse_args(list(argv))
+
+
+def main(argv: Sequence[str]) -> int:
+    _parse_args(argv)
+    manager = init_database()
+    try:
+        count = rebuild_segment_search_index(manager.engine)
+    except Exception as e:
+        print(f"ERROR: {type(e).__name__}: {e}")
+        return 1
+    print(f"Segment search index rebuilt: {count} segments indexed.")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main(sys.argv[1:]))
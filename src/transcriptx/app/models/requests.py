@@ -113,3 +113,7 @@ class BatchAnalysisRequest:
     selected_modules: Optional[list[str]] = None
     skip_speaker_gate: bool = False
     persist: bool = False
+    # Worker processes (None = workflow.batch_workers; 1 = in-process, one at a time)
+    workers: Optional[int] = None
+    # Recycle a worker once its RSS exceeds this (None = workflow.batch_worker_memory_mb)
+    worker_memory_mb: Optional[int] = None
@@ -2,17 +2,43 @@
 Prompt-free batch analysis workflow. No questionary, rich, click, or typer.
 
 Accepts BatchAnalysisRequest, runs analysis on each transcript, returns BatchAnalysisResult.
+
+With more than one worker, transcripts are analyzed by long-lived worker
+processes. Each worker loads the config and NLP models once, then runs the
+full pipeline for each transcript path the parent hands it over its own task
+queue, one at a time, so the parent always knows which transcript a worker
+holds.
+Logs, pipeline events and per-transcript results are streamed back over a
+message queue and forwarded to the ProgressCallback in the parent. A worker
+whose memory grows past ``worker_memory_mb`` finishes its current transcript
+and is replaced by a fresh one; a worker that dies mid-transcript records a
+failure for that transcript and is replaced as well, while a transcript
+handed to a worker that dies before starting it goes to another worker.
 """
 
 from __future__ import annotations
 
+import multiprocessing
+import os
+import queue
+from collections import deque
 from pathlib import Path
+from typing import Any, Optional
 
 from transcriptx.app.compat import discover_all_transcript_paths
 from transcriptx.app.models.requests import AnalysisRequest, BatchAnalysisRequest
 from transcriptx.app.models.results import AnalysisResult, BatchAnalysisResult
-from transcriptx.app.progress import NullProgress, ProgressCallback
+from transcriptx.app.progress import NullProgress, ProgressCallback, ProgressEvent
 from transcriptx.app.workflows.analysis import run_analysis
+from transcriptx.core.utils.config import get_config, set_config
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+# Seconds between liveness checks while waiting for worker messages
+_POLL_SECONDS = 1.0
+# Seconds a worker gets to exit after its stop sentinel before it is terminated
+_SHUTDOWN_SECONDS = 10.0
 
 
 def run_batch_analysis(
@@ -44,8 +70,67 @@ def run_batch_analysis(
             message="No transcript JSON files found",
         )
 
+    total = len(transcript_paths)
+    workers, memory_mb = _resolve_pool_settings(request, total)
+    if workers > 1:
+        outcomes = _run_worker_pool(
+            transcript_paths, request, progress, workers, memory_mb
+        )
+    else:
+        outcomes = _run_in_process(transcript_paths, request, progress)
+
     errors: list[str] = []
     success_count = 0
+    for path, (success, result_errors) in zip(transcript_paths, outcomes):
+        if success:
+            success_count += 1
+        else:
+            errors.extend([f"{path.name}: {e}" for e in result_errors])
+
+    return BatchAnalysisResult(
+        success=success_count > 0 and len(errors) == 0,
+        transcript_count=total,
+        errors=errors if errors else [],
+        message=f"Processed {total} transcript(s), {success_count} succeeded",
+    )
+
+
+def _analysis_request(path: Path, request: BatchAnalysisRequest) -> AnalysisRequest:
+    return AnalysisRequest(
+        transcript_path=path,
+        mode=request.analysis_mode,
+        modules=request.selected_modules,
+        skip_speaker_mapping=request.skip_speaker_gate,
+        persist=request.persist,
+    )
+
+
+def _resolve_pool_settings(
+    request: BatchAnalysisRequest, total: int
+) -> tuple[int, int]:
+    """(worker count, per-worker memory ceiling in MB; 0 = none)."""
+    workflow = getattr(get_config(), "workflow", None)
+    workers = request.workers
+    if workers is None:
+        workers = getattr(workflow, "batch_workers", 1)
+    memory_mb = request.worker_memory_mb
+    if memory_mb is None:
+        memory_mb = getattr(workflow, "batch_worker_memory_mb", 0)
+    try:
+        workers = int(workers)
+    except (TypeError, ValueError):
+        workers = 1
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, total)), max(0, int(memory_mb or 0))
+
+
+def _run_in_process(
+    transcript_paths: list[Path],
+    request: BatchAnalysisRequest,
+    progress: ProgressCallback,
+) -> list[tuple[bool, list[str]]]:
+    outcomes: list[tuple[bool, list[str]]] = []
     total = len(transcript_paths)
 
     for idx, path in enumerate(transcript_paths):
@@ -55,24 +140,283 @@ def run_batch_analysis(
         )
         progress.on_log(f"Analyzing {path.name}", level="info")
 
-        analysis_request = AnalysisRequest(
-            transcript_path=path,
-            mode=request.analysis_mode,
-            modules=request.selected_modules,
-            skip_speaker_mapping=request.skip_speaker_gate,
-            persist=request.persist,
+        result: AnalysisResult = run_analysis(
+            _analysis_request(path, request), progress
         )
-        result: AnalysisResult = run_analysis(analysis_request, progress)
-        if result.success:
-            success_count += 1
-        else:
-            errors.extend([f"{path.name}: {e}" for e in result.errors])
+        outcomes.append((result.success, list(result.errors)))
 
         progress.on_stage_complete("batch_analysis")
 
-    return BatchAnalysisResult(
-        success=success_count > 0 and len(errors) == 0,
-        transcript_count=total,
-        errors=errors if errors else [],
-        message=f"Processed {total} transcript(s), {success_count} succeeded",
+    return outcomes
+
+
+# ---------------------------------------------------------------------------
+# Worker pool
+# ---------------------------------------------------------------------------
+
+
+class _QueueProgress:
+    """ProgressCallback that forwards logs and events to the parent process."""
+
+    def __init__(self, messages: Any) -> None:
+        self._messages = messages
+        self.index = -1
+
+    def on_stage_start(self, stage_name: str) -> None:
+        pass
+
+    def on_stage_progress(self, message: str, pct: Optional[float] = None) -> None:
+        pass
+
+    def on_stage_complete(self, stage_name: str) -> None:
+        pass
+
+    def on_log(self, message: str, level: str = "info") -> None:
+        self._messages.put(("log", self.index, message, level))
+
+    def on_event(self, event: ProgressEvent) -> None:
+        self._messages.put(("event", self.index, dict(event)))
+
+
+def _rss_mb() -> float:
+    """Resident memory of this process in MB."""
+    try:
+        import psutil
+
+        return psutil.Process().memory_info().rss / (1024 * 1024)
+    except Exception:
+        import resource
+
+        # Peak RSS; kilobytes on Linux
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _warm_models(modules: Optional[list[str]]) -> None:
+    """Load the spaCy model up front when a selected module needs it."""
+    try:
+        from transcriptx.core.pipeline.module_registry import (
+            get_available_modules,
+            get_module_info,
+        )
+
+        names = modules or get_available_modules()
+        if any(
+            "nlp" in (getattr(get_module_info(name), "required_extras", None) or ())
+            for name in names
+        ):
+            from transcriptx.core.utils.nlp_runtime import get_nlp_model
+
+            get_nlp_model()
+    except Exception as e:
+        # Best-effort: modules load their models on first use instead
+        logger.debug(f"Batch worker warm-up skipped: {e}")
+
+
+def _run_nested_pools_in_process(config: Any) -> None:
+    """Feature and k-sweep pools run in-process; the batch pool uses the cores."""
+    analysis = getattr(config, "analysis", None)
+    for section, field_name in (
+        ("voice", "feature_workers"),
+        ("topic_modeling", "k_sweep_workers"),
+    ):
+        settings = getattr(analysis, section, None)
+        if settings is not None and hasattr(settings, field_name):
+            setattr(settings, field_name, 1)
+
+
+def _batch_worker(
+    config: Any,
+    request: BatchAnalysisRequest,
+    tasks: Any,
+    messages: Any,
+    memory_mb: int,
+) -> None:
+    """
+    Worker process loop: analyze queued transcripts until a None sentinel.
+
+    Models loaded while analyzing one transcript stay loaded for the next.
+    """
+    _run_nested_pools_in_process(config)
+    set_config(config)
+    _warm_models(request.selected_modules)
+    progress = _QueueProgress(messages)
+    pid = os.getpid()
+    while True:
+        item = tasks.get()
+        if item is None:
+            break
+        idx, path = item
+        progress.index = idx
+        messages.put(("started", idx, pid))
+        try:
+            result = run_analysis(_analysis_request(Path(path), request), progress)
+            outcome = (result.success, list(result.errors))
+        except Exception as e:
+            outcome = (False, [str(e)])
+        messages.put(("done", idx, outcome))
+        if memory_mb and _rss_mb() > memory_mb:
+            messages.put(("recycle", idx, pid))
+            break
+
+
+def _run_worker_pool(
+    transcript_paths: list[Path],
+    request: BatchAnalysisRequest,
+    progress: ProgressCallback,
+    workers: int,
+    memory_mb: int,
+) -> list[tuple[bool, list[str]]]:
+    """Analyze transcripts in ``workers`` processes; outcomes in input order."""
+    total = len(transcript_paths)
+    # spawn: workers must not inherit the parent's threads or loaded models
+    ctx = multiprocessing.get_context("spawn")
+    messages = ctx.Queue()
+    pending = deque(range(total))
+
+    config = get_config()
+    procs: dict[int, Any] = {}
+    task_queues: dict[int, Any] = {}  # pid -> that worker's task queue
+    # pid -> transcript index, set when the task is handed out, so a worker
+    # dying at any point after that is attributed to its transcript
+    in_flight: dict[int, int] = {}
+    started: set[int] = set()  # pids that reported "started" for their task
+    outcomes: dict[int, tuple[bool, list[str]]] = {}
+    # Workers that die before taking work are replaced, but not forever
+    spawn_budget = total + 2 * workers
+
+    def _dispatch(pid: int) -> None:
+        if not pending or pid in in_flight:
+            return
+        idx = pending.popleft()
+        in_flight[pid] = idx
+        task_queues[pid].put((idx, str(transcript_paths[idx])))
+
+    def _spawn() -> None:
+        nonlocal spawn_budget
+        spawn_budget -= 1
+        tasks = ctx.Queue()
+        # Not daemonic: workers may start processes of their own (model
+        # libraries, nested pools); the finally block below cleans them up
+        proc = ctx.Process(
+            target=_batch_worker,
+            args=(config, request, tasks, messages, memory_mb),
+            daemon=False,
+        )
+        proc.start()
+        procs[proc.pid] = proc
+        task_queues[proc.pid] = tasks
+        _dispatch(proc.pid)
+
+    def _drop(pid: int) -> Optional[int]:
+        """Forget a worker: requeue a task it never started, return one it did."""
+        procs.pop(pid, None)
+        tasks = task_queues.pop(pid, None)
+        if tasks is not None:
+            tasks.cancel_join_thread()  # Unread items die with the worker
+        idx = in_flight.pop(pid, None)
+        if pid in started:
+            started.discard(pid)
+            return idx
+        if idx is not None:
+            pending.appendleft(idx)
+        return None
+
+    def _top_up() -> None:
+        for pid in list(procs):
+            _dispatch(pid)
+        while pending and len(procs) < workers:
+            if spawn_budget <= 0:
+                return
+            _spawn()
+
+    def _finish(idx: int, outcome: tuple[bool, list[str]]) -> None:
+        outcomes[idx] = outcome
+        name = transcript_paths[idx].name
+        status = "done" if outcome[0] else "failed"
+        progress.on_stage_progress(
+            f"Finished {len(outcomes)}/{total}: {name} ({status})",
+            pct=len(outcomes) / total,
+        )
+
+    def _reap() -> None:
+        """Drop exited workers; a transcript a worker died on counts as failed."""
+        for pid, proc in list(procs.items()):
+            if proc.is_alive():
+                continue
+            proc.join()
+            idx = _drop(pid)
+            if idx is not None and idx not in outcomes:
+                _finish(idx, (False, [f"Worker exited with code {proc.exitcode}"]))
+
+    progress.on_stage_start("batch_analysis")
+    progress.on_log(
+        f"Analyzing {total} transcript(s) with {workers} worker processes",
+        level="info",
     )
+    completed = False
+    try:
+        _top_up()
+        while len(outcomes) < total:
+            try:
+                message = messages.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                # Only reap once the queue is drained, so a worker's last
+                # messages are read before its exit is treated as a crash
+                _reap()
+                _top_up()
+                if not procs:
+                    for idx in range(total):
+                        if idx not in outcomes:
+                            _finish(idx, (False, ["No batch worker could be started"]))
+                continue
+
+            kind, idx = message[0], message[1]
+            name = transcript_paths[idx].name
+            if kind == "started":
+                started.add(message[2])
+                progress.on_log(f"Analyzing {name}", level="info")
+            elif kind == "done":
+                pid = next((p for p, i in in_flight.items() if i == idx), None)
+                if pid is not None:
+                    del in_flight[pid]
+                    started.discard(pid)
+                    if pid in procs:
+                        _dispatch(pid)
+                _finish(idx, message[2])
+            elif kind == "log":
+                progress.on_log(f"{name}: {message[2]}", level=message[3])
+            elif kind == "event":
+                event = message[2]
+                if event.get("message"):
+                    event["message"] = f"{name}: {event['message']}"
+                try:
+                    progress.on_event(event)  # type: ignore[arg-type]
+                except Exception:
+                    pass
+            elif kind == "recycle":
+                logger.info(
+                    f"Batch worker {message[2]} exceeded {memory_mb} MB; replacing it"
+                )
+                proc = procs.get(message[2])
+                # The task handed out after its last "done" goes back to pending
+                _drop(message[2])
+                if proc is not None:
+                    proc.join(timeout=_SHUTDOWN_SECONDS)
+                _top_up()
+        completed = True
+    finally:
+        if completed:
+            for tasks in task_queues.values():
+                tasks.put(None)
+        for proc in procs.values():
+            if completed:
+                proc.join(timeout=_SHUTDOWN_SECONDS)
+            if proc.is_alive():
+                proc.terminate()
+                proc.join(timeout=_SHUTDOWN_SECONDS)
+            if proc.is_alive():
+                proc.kill()
+                proc.join()
+        progress.on_stage_complete("batch_analysis")
+
+    return [outcomes[idx] for idx in range(total)]
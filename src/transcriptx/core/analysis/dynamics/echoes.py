@@ -7,6 +7,7 @@ Detects explicit quotes, lexical echoes, and optional paraphrases.
 from __future__ import annotations
 
 import os
+import threading
 from collections import Counter, defaultdict
 from typing import Any, Dict, List, Optional, Tuple
 
@@ -22,6 +23,7 @@ from transcriptx.core.models.events import (
 from transcriptx.core.utils.config import get_config
 from transcriptx.core.utils.lazy_imports import lazy_pyplot
 from transcriptx.core.utils.similarity_utils import SimilarityCalculator
+from transcriptx.core.utils.time_windows import forward_window_ends
 from transcriptx.io import save_csv, save_json
 from transcriptx.core.utils.viz_ids import (
     VIZ_ECHOES_HEATMAP,
@@ -45,6 +47,26 @@ EXPLICIT_QUOTE_PATTERNS = [
     "what i am hearing is",
 ]
 
+PARAPHRASE_MODEL = "all-MiniLM-L6-v2"
+
+
+_PARAPHRASE_MODEL: Any = None
+_PARAPHRASE_MODEL_LOCK = threading.Lock()
+
+
+def _load_paraphrase_model():
+    """Paraphrase embedding model, loaded once per process (None if unavailable)."""
+    global _PARAPHRASE_MODEL
+    with _PARAPHRASE_MODEL_LOCK:
+        if _PARAPHRASE_MODEL is None:
+            try:
+                from sentence_transformers import SentenceTransformer
+
+                _PARAPHRASE_MODEL = SentenceTransformer(PARAPHRASE_MODEL)
+            except Exception:
+                return None
+        return _PARAPHRASE_MODEL
+
 
 class EchoesAnalysis(AnalysisModule):
     """Detect quote/echo/paraphrase links across segments."""
@@ -58,14 +80,41 @@ class EchoesAnalysis(AnalysisModule):
 
     def _get_embedding_model(self):
         if self._embedding_model is None:
-            try:
-                from sentence_transformers import SentenceTransformer
-
-                self._embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-            except Exception:
-                self._embedding_model = None
+            self._embedding_model = _load_paraphrase_model()
         return self._embedding_model
 
+    def _segment_embeddings(
+        self, segments: List[Dict[str, Any]]
+    ) -> Optional[Dict[str, np.ndarray]]:
+        """
+        Embedding per unique segment text, from the shared embedding store.
+
+        Each text is embedded at most once per run (and not at all when a
+        previous run stored it). Returns None when the model is unavailable.
+        """
+        model = self._get_embedding_model()
+        if not model:
+            return None
+        from transcriptx.core.utils.embedding_store import embed_with_store
+
+        texts = list(
+            dict.fromkeys(
+                (seg.get("text") or "").strip()
+                for seg in segments
+                if (seg.get("text") or "").strip()
+            )
+        )
+        vectors = embed_with_store(
+            f"sentence-transformers:{PARAPHRASE_MODEL}",
+            texts,
+            lambda batch: list(model.encode(batch, show_progress_bar=False)),
+        )
+        return {
+            text: vector
+            for text, vector in zip(texts, vectors, strict=True)
+            if vector is not None
+        }
+
     def _token_count(self, text: str) -> int:
         return len([tok for tok in text.lower().split() if tok.strip()])
 
@@ -141,15 +190,48 @@ class EchoesAnalysis(AnalysisModule):
         counts_by_kind = Counter()
         counts_by_speaker = defaultdict(Counter)
 
-        for idx, seg in enumerate(segments):
-            text = (seg.get("text") or "").strip()
-            if self._is_trivial(text) or self._token_count(text) < min_tokens:
-                continue
+        text_embeddings = (
+            self._segment_embeddings(segments) if enable_semantic_paraphrase else None
+        )
 
-            speaker = self._speaker_for_segment(seg, segments)
+        texts = [(seg.get("text") or "").strip() for seg in segments]
+        eligible = [
+            not self._is_trivial(text) and self._token_count(text) >= min_tokens
+            for text in texts
+        ]
+        speakers = [self._speaker_for_segment(seg, segments) for seg in segments]
+
+        # Score every lexical candidate pair in one batch against a TF-IDF
+        # matrix fitted once, instead of fitting a vectorizer per pair
+        candidates_by_idx: Dict[int, List[int]] = {}
+        lexical_pairs: List[Tuple[int, int]] = []
+        for idx in range(len(segments)):
+            if not eligible[idx]:
+                continue
             candidates = self._collect_candidates(
                 segments, idx, lookback_seconds, max_candidates
             )
+            candidates_by_idx[idx] = candidates
+            lexical_pairs.extend(
+                (cand_idx, idx)
+                for cand_idx in candidates
+                if eligible[cand_idx] and speakers[cand_idx] != speakers[idx]
+            )
+        lexical_scores = dict(
+            zip(
+                lexical_pairs,
+                self.similarity.calculate_pair_similarities(
+                    texts, lexical_pairs, method="tfidf"
+                ),
+            )
+        )
+
+        for idx, seg in enumerate(segments):
+            if not eligible[idx]:
+                continue
+            text = texts[idx]
+            speaker = speakers[idx]
+            candidates = candidates_by_idx[idx]
 
             # Tier A: explicit quote detection
             lower_text = text.lower()
@@ -159,7 +241,7 @@ class EchoesAnalysis(AnalysisModule):
             if explicit_match and candidates:
                 target_idx = candidates[0]
                 target_seg = segments[target_idx]
-                target_speaker = self._speaker_for_segment(target_seg, segments)
+                target_speaker = speakers[target_idx]
                 if target_speaker != speaker:
                     event = Event(
                         event_id=generate_event_id(
@@ -198,21 +280,9 @@ class EchoesAnalysis(AnalysisModule):
             # Tier B: lexical echo
             candidate_scores: List[Tuple[int, float, str]] = []
             for cand_idx in candidates:
-                cand_seg = segments[cand_idx]
-                cand_text = (cand_seg.get("text") or "").strip()
-                if (
-                    self._is_trivial(cand_text)
-                    or self._token_count(cand_text) < min_tokens
-                ):
-                    continue
-                cand_speaker = self._speaker_for_segment(cand_seg, segments)
-                if cand_speaker == speaker:
-                    continue
-                score = self.similarity.calculate_text_similarity(
-                    cand_text, text, method="tfidf"
-                )
-                if score >= lexical_threshold:
-                    candidate_scores.append((cand_idx, score, cand_speaker))
+                score = lexical_scores.get((cand_idx, idx))
+                if score is not None and score >= lexical_threshold:
+                    candidate_scores.append((cand_idx, score, speakers[cand_idx]))
 
             candidate_scores.sort(key=lambda item: (-item[1], abs(idx - item[0])))
 
@@ -272,71 +342,56 @@ class EchoesAnalysis(AnalysisModule):
                 echo_edges[(cand_speaker, speaker)].append(event.score or 0.0)
 
             # Tier C: semantic paraphrase (optional)
-            if enable_semantic_paraphrase:
-                model = self._get_embedding_model()
-                if model:
-                    embeddings = model.encode(
-                        [text]
-                        + [(segments[c].get("text") or "").strip() for c in candidates],
-                        show_progress_bar=False,
+            if text_embeddings is not None and text in text_embeddings:
+                query_emb = text_embeddings[text]
+                for cand_idx in candidates:
+                    if not eligible[cand_idx]:
+                        continue
+                    cand_seg = segments[cand_idx]
+                    cand_speaker = speakers[cand_idx]
+                    if cand_speaker == speaker:
+                        continue
+                    cand_emb = text_embeddings.get(texts[cand_idx])
+                    if cand_emb is None:
+                        continue
+                    sim = float(
+                        np.dot(query_emb, cand_emb)
+                        / (np.linalg.norm(query_emb) * np.linalg.norm(cand_emb) + 1e-8)
                     )
-                    query_emb = embeddings[0]
-                    for cand_idx, cand_emb in zip(
-                        candidates, embeddings[1:], strict=False
-                    ):
-                        cand_seg = segments[cand_idx]
-                        cand_text = (cand_seg.get("text") or "").strip()
-                        if (
-                            self._is_trivial(cand_text)
-                            or self._token_count(cand_text) < min_tokens
-                        ):
-                            continue
-                        cand_speaker = self._speaker_for_segment(cand_seg, segments)
-                        if cand_speaker == speaker:
-                            continue
-                        sim = float(
-                            np.dot(query_emb, cand_emb)
-                            / (
-                                np.linalg.norm(query_emb) * np.linalg.norm(cand_emb)
-                                + 1e-8
-                            )
+                    if sim >= paraphrase_threshold:
+                        event = Event(
+                            event_id=generate_event_id(
+                                transcript_hash,
+                                "paraphrase",
+                                cand_idx,
+                                idx,
+                                cand_seg.get("start", 0.0),
+                                seg.get("end", seg.get("start", 0.0)),
+                            ),
+                            kind="paraphrase",
+                            time_start=float(seg.get("start", 0.0)),
+                            time_end=float(seg.get("end", seg.get("start", 0.0))),
+                            speaker=speaker,
+                            segment_start_idx=cand_idx,
+                            segment_end_idx=idx,
+                            severity=min(1.0, sim),
+                            score=sim,
+                            evidence=[
+                                {
+                                    "source": "echoes",
+                                    "feature": "semantic_similarity",
+                                    "value": sim,
+                                }
+                            ],
+                            links=[
+                                {"type": "segment", "idx": cand_idx},
+                                {"type": "segment", "idx": idx},
+                            ],
                         )
-                        if sim >= paraphrase_threshold:
-                            event = Event(
-                                event_id=generate_event_id(
-                                    transcript_hash,
-                                    "paraphrase",
-                                    cand_idx,
-                                    idx,
-                                    cand_seg.get("start", 0.0),
-                                    seg.get("end", seg.get("start", 0.0)),
-                                ),
-                                kind="paraphrase",
-                                time_start=float(seg.get("start", 0.0)),
-                                time_end=float(seg.get("end", seg.get("start", 0.0))),
-                                speaker=speaker,
-                                segment_start_idx=cand_idx,
-                                segment_end_idx=idx,
-                                severity=min(1.0, sim),
-                                score=sim,
-                                evidence=[
-                                    {
-                                        "source": "echoes",
-                                        "feature": "semantic_similarity",
-                                        "value": sim,
-                                    }
-                                ],
-                                links=[
-                                    {"type": "segment", "idx": cand_idx},
-                                    {"type": "segment", "idx": idx},
-                                ],
-                            )
-                            events.append(event)
-                            counts_by_kind[event.kind] += 1
-                            counts_by_speaker[speaker][event.kind] += 1
-                            echo_edges[(cand_speaker, speaker)].append(
-                                event.score or 0.0
-                            )
+                        events.append(event)
+                        counts_by_kind[event.kind] += 1
+                        counts_by_speaker[speaker][event.kind] += 1
+                        echo_edges[(cand_speaker, speaker)].append(event.score or 0.0)
 
         # Echo burst detection
         burst_events = self._detect_echo_bursts(events, transcript_hash)
@@ -383,11 +438,10 @@ class EchoesAnalysis(AnalysisModule):
             return []
 
         echo_events = sort_events_deterministically(echo_events)
-        counts = []
-        for idx, event in enumerate(echo_events):
-            window_end = event.time_start + window_seconds
-            count = sum(1 for e in echo_events[idx:] if e.time_start <= window_end)
-            counts.append(count)
+        window_ends = forward_window_ends(
+            [e.time_start for e in echo_events], window_seconds
+        )
+        counts = window_ends - np.arange(len(echo_events))
         count_threshold = max(
             min_events, int(np.percentile(counts, percentile_threshold * 100))
         )
@@ -395,9 +449,7 @@ class EchoesAnalysis(AnalysisModule):
         bursts: List[Event] = []
         idx = 0
         while idx < len(echo_events):
-            window_start = echo_events[idx].time_start
-            window_end = window_start + window_seconds
-            window_events = [e for e in echo_events[idx:] if e.time_start <= window_end]
+            window_events = echo_events[idx : window_ends[idx]]
             if len(window_events) >= count_threshold:
                 burst_start = window_events[0].time_start
                 burst_end = window_events[-1].time_end
@@ -25,6 +25,7 @@ from transcriptx.core.io.events_io import save_events_json
 from transcriptx.core.models.events import Event, generate_event_id
 from transcriptx.core.utils.config import get_config
 from transcriptx.core.utils.artifact_writer import write_text
+from transcriptx.core.utils.time_windows import IntervalIndex
 from transcriptx.io import save_csv, save_json
 from transcriptx.core.utils.viz_ids import VIZ_MOMENTS_TIMELINE
 from transcriptx.core.viz.axis_utils import time_axis_display
@@ -34,14 +35,28 @@ from transcriptx.core.viz.specs import ScatterSpec, ScatterSeries
 DEFAULT_WEIGHT = 0.2
 
 
+def _segment_interval_index(segments: List[Dict[str, Any]]) -> IntervalIndex:
+    """IntervalIndex over segment 'start'/'end' (or 'start_time'/'end_time')."""
+    return IntervalIndex(
+        [seg.get("start", seg.get("start_time")) for seg in segments],
+        [seg.get("end", seg.get("end_time")) for seg in segments],
+    )
+
+
 def _overlapping_segments(
-    segments: List[Dict[str, Any]], t0: float, t1: float
+    segments: List[Dict[str, Any]],
+    t0: float,
+    t1: float,
+    index: Optional[IntervalIndex] = None,
 ) -> List[Tuple[int, Dict[str, Any]]]:
     """Return (index, segment) for each segment overlapping [t0, t1].
 
     Overlap condition: seg.start < t1 and seg.end > t0.
-    Uses 'start'/'end' or 'start_time'/'end_time' on segment dicts.
+    Uses 'start'/'end' or 'start_time'/'end_time' on segment dicts. Pass an
+    ``index`` from ``_segment_interval_index`` when querying many spans.
     """
+    if index is not None:
+        return [(int(i), segments[i]) for i in index.overlapping(t0, t1)]
     out: List[Tuple[int, Dict[str, Any]]] = []
     for i, seg in enumerate(segments):
         start = seg.get("start", seg.get("start_time"))
@@ -245,13 +260,16 @@ class MomentsAnalysis(AnalysisModule):
                 expanded_spans.append(span)
                 continue
             # Split into time chunks of max_span_seconds
+            candidate_index = IntervalIndex(
+                [c["time_start"] for c in span_candidates],
+                [c["time_end"] for c in span_candidates],
+            )
             t = start
             while t < end:
                 chunk_end = min(t + max_span_seconds, end)
                 chunk_candidates = [
-                    c
-                    for c in span_candidates
-                    if c["time_start"] < chunk_end and c["time_end"] > t
+                    span_candidates[i]
+                    for i in candidate_index.overlapping(t, chunk_end)
                 ]
                 if chunk_candidates:
                     expanded_spans.append(
@@ -263,6 +281,7 @@ class MomentsAnalysis(AnalysisModule):
                     )
                 t = chunk_end
 
+        segment_index = _segment_interval_index(segments) if segments else None
         moments = []
         for span in expanded_spans:
             span_candidates = span["candidates"]
@@ -276,7 +295,9 @@ class MomentsAnalysis(AnalysisModule):
             speakers_list: List[str] = []
             excerpt = ""
             if segments:
-                overlapping = _overlapping_segments(segments, t0, t1)
+                overlapping = _overlapping_segments(
+                    segments, t0, t1, index=segment_index
+                )
                 if overlapping:
                     segment_refs = sorted(idx for idx, _ in overlapping)
                     speakers_set = set()
@@ -7,7 +7,6 @@ Computes a stall/flow index across time windows and detects stall zones and clif
 from __future__ import annotations
 
 import os
-import re
 from typing import Any, Dict, List, Optional
 
 import numpy as np
@@ -17,6 +16,15 @@ from transcriptx.core.io.events_io import save_events_json
 from transcriptx.core.models.events import Event, generate_event_id
 from transcriptx.core.utils.config import get_config
 from transcriptx.core.utils.lazy_imports import lazy_pyplot
+from transcriptx.core.utils.time_windows import (
+    IntervalIndex,
+    count_in_windows,
+    sorted_times,
+)
+from transcriptx.core.utils.timeline_index import (
+    SegmentTimeline,
+    timeline_for_segments,
+)
 from transcriptx.io import save_csv, save_json
 from transcriptx.core.utils.viz_ids import VIZ_MOMENTUM_TIMESERIES
 from transcriptx.core.viz.axis_utils import time_axis_display
@@ -33,61 +41,24 @@ class MomentumAnalysis(AnalysisModule):
         self.module_name = "momentum"
         self.config = get_config().analysis.momentum
 
-    def _tokenize(self, text: str) -> List[str]:
-        from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
-
-        tokens = re.findall(r"\b\w+\b", text.lower())
-        return [tok for tok in tokens if tok not in ENGLISH_STOP_WORDS and len(tok) > 2]
-
-    def _window_segments(
-        self, segments: List[Dict[str, Any]], start: float, end: float
-    ) -> List[Dict[str, Any]]:
-        return [
-            seg
-            for seg in segments
-            if seg.get("start", 0.0) >= start and seg.get("start", 0.0) < end
-        ]
-
-    def _calculate_turn_energy(self, window_segments: List[Dict[str, Any]]) -> float:
-        if not window_segments:
+    def _calculate_turn_energy(self, turns: int, alternations: int) -> float:
+        if not turns:
             return 0.0
-        speakers = [seg.get("speaker") for seg in window_segments]
-        alternations = sum(
-            1 for i in range(1, len(speakers)) if speakers[i] != speakers[i - 1]
-        )
-        turns = len(window_segments)
         # Normalize to 0-1 with a soft cap
         turn_energy = min(1.0, (turns + alternations) / max(turns * 2, 1))
         return float(turn_energy)
 
     def _calculate_novelty(
         self,
-        window_segments: List[Dict[str, Any]],
+        window_tokens: set,
         previous_tokens: List[set],
     ) -> float:
-        if not window_segments:
-            return 0.0
-        window_tokens = set()
-        for seg in window_segments:
-            text = seg.get("text", "")
-            window_tokens.update(self._tokenize(text))
         if not window_tokens:
             return 0.0
         prev_union = set().union(*previous_tokens) if previous_tokens else set()
         novel_tokens = window_tokens - prev_union
         return float(len(novel_tokens) / max(len(window_tokens), 1))
 
-    def _calculate_pause_seconds(
-        self, pause_events: List[Event], window_start: float, window_end: float
-    ) -> float:
-        total = 0.0
-        for event in pause_events:
-            overlap_start = max(window_start, event.time_start)
-            overlap_end = min(window_end, event.time_end)
-            if overlap_end > overlap_start:
-                total += overlap_end - overlap_start
-        return total
-
     def analyze(
         self,
         segments: List[Dict[str, Any]],
@@ -155,56 +126,60 @@ class MomentumAnalysis(AnalysisModule):
             windows.append((t, min(t + window_length, total_duration)))
             t += window_step
 
+        # Per-window segment ranges and event counts: one binary search per
+        # window edge against the start-sorted timeline
+        window_starts = [start for start, _ in windows]
+        window_ends = [end for _, end in windows]
+        timeline: SegmentTimeline = timeline_for_segments(segments)
+        segment_lo, segment_hi = timeline.start_bounds(window_starts, window_ends)
+        turn_counts = segment_hi - segment_lo
+        speaker_changes = timeline.speaker_changes(segment_lo, segment_hi)
+        pause_index = IntervalIndex(
+            [e.time_start for e in pause_events], [e.time_end for e in pause_events]
+        )
+        echo_counts = count_in_windows(
+            sorted_times(e.time_start for e in echo_events), window_starts, window_ends
+        )
+        loop_counts = count_in_windows(
+            sorted_times(getattr(loop, "turn_1_timestamp", 0.0) for loop in loops),
+            window_starts,
+            window_ends,
+        )
+        repetition_events = (similarity_data or {}).get("repetition_events", []) or []
+        repetition_counts = count_in_windows(
+            sorted_times(e.get("start", 0.0) for e in repetition_events),
+            window_starts,
+            window_ends,
+        )
+
         timeseries = []
         novelty_history: List[set] = []
         scores = []
 
-        for window_start, window_end in windows:
-            window_segments = self._window_segments(segments, window_start, window_end)
-            pause_seconds = self._calculate_pause_seconds(
-                pause_events, window_start, window_end
-            )
+        for window_idx, (window_start, window_end) in enumerate(windows):
+            lo, hi = int(segment_lo[window_idx]), int(segment_hi[window_idx])
+            pause_seconds = pause_index.overlap_seconds(window_start, window_end)
             pause_rate = pause_seconds / max(window_end - window_start, 1e-6)
+            window_minutes = max((window_end - window_start) / 60.0, 1e-6)
 
-            echo_rate = sum(
-                1
-                for e in echo_events
-                if e.time_start >= window_start and e.time_start < window_end
-            ) / max((window_end - window_start) / 60.0, 1e-6)
-
-            loop_rate = 0.0
-            if loops:
-                loop_rate = sum(
-                    1
-                    for loop in loops
-                    if getattr(loop, "turn_1_timestamp", 0.0) >= window_start
-                    and getattr(loop, "turn_1_timestamp", 0.0) < window_end
-                ) / max((window_end - window_start) / 60.0, 1e-6)
-
-            repetition_rate = 0.0
-            if similarity_data:
-                repetition_events = similarity_data.get("repetition_events", [])
-                if repetition_events:
-                    repetition_rate = sum(
-                        1
-                        for e in repetition_events
-                        if e.get("start", 0.0) >= window_start
-                        and e.get("start", 0.0) < window_end
-                    ) / max((window_end - window_start) / 60.0, 1e-6)
-
-            turn_energy = self._calculate_turn_energy(window_segments)
+            echo_rate = int(echo_counts[window_idx]) / window_minutes
+            loop_rate = int(loop_counts[window_idx]) / window_minutes
+            repetition_rate = int(repetition_counts[window_idx]) / window_minutes
+
+            turn_energy = self._calculate_turn_energy(
+                int(turn_counts[window_idx]), int(speaker_changes[window_idx])
+            )
 
             # Novelty
+            window_tokens = timeline.window_tokens(lo, hi)
             novelty = self._calculate_novelty(
-                window_segments, novelty_history[-novelty_lookback:]
+                window_tokens, novelty_history[-novelty_lookback:]
             )
-            window_tokens = set()
-            for seg in window_segments:
-                window_tokens.update(self._tokenize(seg.get("text", "")))
             novelty_history.append(window_tokens)
 
             sentiment_volatility = 0.0
             if sentiment_map:
+                window_segments = timeline.segments_in(lo, hi)
                 window_sentiments = [
                     sentiment_map.get(seg.get("start", 0.0))
                     for seg in window_segments
@@ -26,6 +26,10 @@ from transcriptx.utils.text_utils import is_named_speaker
 from transcriptx.core.utils.notifications import notify_user
 from transcriptx.io import save_transcript
 from transcriptx.core.utils.path_utils import get_enriched_transcript_path
+from transcriptx.core.utils.transformer_inference import (
+    classify_batched,
+    get_batch_size,
+)
 from transcriptx.core.utils.viz_ids import (
     VIZ_EMOTION_RADAR_SPEAKER,
     VIZ_EMOTION_RADAR_GLOBAL,
@@ -108,7 +112,9 @@ def _load_emotion_model(model_name: str | None = None):
                 "EMOTION", "Downloads disabled; skipping contextual emotion model load"
             )
             return None
-        from transcriptx.core.utils.lazy_imports import get_transformers
+        from transcriptx.core.utils.transformer_inference import (
+            load_text_classification_pipeline,
+        )
 
         if model_name is None:
             from transcriptx.core.utils.config import get_config
@@ -124,12 +130,7 @@ def _load_emotion_model(model_name: str | None = None):
             suppress_stdout_stderr(),
             spinner("🔮 Loading contextual emotion model..."),
         ):
-            transformers = get_transformers()
-            emotion_model = transformers.pipeline(
-                "text-classification",
-                model=model_name,
-                top_k=None,
-            )
+            emotion_model = load_text_classification_pipeline(model_name)
         log_info("EMOTION", "Contextual emotion model loaded successfully")
         return emotion_model
     except Exception as e:
@@ -167,6 +168,7 @@ class EmotionAnalysis(AnalysisModule):
             "bhadresh-savani/distilbert-base-uncased-emotion",
         )
         self.emotion_model = _load_emotion_model(model_name)
+        self.emotion_batch_size = get_batch_size(cfg)
         self.emotion_output_mode = getattr(cfg, "emotion_output_mode", "top1")
         self.emotion_score_threshold = float(
             getattr(cfg, "emotion_score_threshold", 0.30)
@@ -477,6 +479,8 @@ class EmotionAnalysis(AnalysisModule):
         contextual_emotions = defaultdict(list)
         emotion_examples = defaultdict(lambda: defaultdict(list))
 
+        # Collect eligible segments first so the model runs in batches
+        pending = []
         for segment in segments:
             speaker_info = extract_speaker_info(segment)
             if speaker_info is None:
@@ -489,7 +493,14 @@ class EmotionAnalysis(AnalysisModule):
             text = segment.get("text", "").strip()
             if not text:
                 continue
-            raw = self.emotion_model(text)[0]
+            pending.append((segment, speaker, text))
+
+        raw_results = classify_batched(
+            self.emotion_model,
+            [text for _, _, text in pending],
+            batch_size=self.emotion_batch_size,
+        )
+        for (segment, speaker, text), raw in zip(pending, raw_results):
             primary, scores_dict = self._parse_pipeline_emotion_result(raw)
             segment["context_emotion_primary"] = primary
             segment["context_emotion_scores"] = scores_dict
@@ -523,7 +534,7 @@ class EmotionAnalysis(AnalysisModule):
         ax.set_xticks(angles[:-1])
         ax.set_xticklabels(categories, fontsize=10)
         ax.set_title(f"Emotion Profile: {speaker}", size=14, pad=20)
-        plt.tight_layout()
+        fig.tight_layout()
 
         return fig
 
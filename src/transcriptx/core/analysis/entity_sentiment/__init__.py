@@ -12,11 +12,10 @@ from typing import Any, Dict, List
 import numpy as np
 
 from transcriptx.core.analysis.base import AnalysisModule
-from transcriptx.core.analysis.ner import extract_named_entities
+from transcriptx.core.analysis.ner import extract_named_entities_batch
 from transcriptx.core.analysis.sentiment import score_sentiment
 from transcriptx.core.utils.nlp_utils import preprocess_for_sentiment
 from transcriptx.utils.text_utils import is_named_speaker
-from transcriptx.core.utils.lazy_imports import lazy_pyplot
 from transcriptx.core.utils.viz_ids import (
     VIZ_ENTITY_SENTIMENT_HEATMAP,
     VIZ_ENTITY_SENTIMENT_TYPE_ANALYSIS,
@@ -24,8 +23,6 @@ from transcriptx.core.utils.viz_ids import (
 )
 from transcriptx.core.viz.specs import BarCategoricalSpec, HeatmapMatrixSpec
 
-plt = lazy_pyplot()
-
 
 def normalize_entity_name(entity_name: str) -> str:
     """
@@ -119,26 +116,30 @@ class EntitySentimentAnalysis(AnalysisModule):
             get_speaker_display_name,
         )
 
-        # Process each segment
+        # Resolve speakers first, skipping segments from unnamed speakers
+        named_segments = []
         for i, segment in enumerate(segments):
-            text = segment.get("text", "")
             speaker_info = extract_speaker_info(segment)
             if speaker_info is None:
                 continue
             speaker = get_speaker_display_name(
                 speaker_info.grouping_key, [segment], segments
             )
-
-            # Skip segments from unnamed speakers
             if not speaker or not is_named_speaker(speaker):
                 continue
+            named_segments.append((i, segment, speaker))
 
-            # Extract entities from this segment
-            # Use cached NER data if available, otherwise compute
-            if i in entity_map:
-                entities = entity_map[i]
-            else:
-                entities = extract_named_entities(text)
+        # Use cached NER data if available, otherwise extract in one batch
+        uncached = [i for i, _, _ in named_segments if i not in entity_map]
+        extracted = extract_named_entities_batch(
+            [segments[i].get("text", "") for i in uncached]
+        )
+        entity_map.update(zip(uncached, extracted, strict=True))
+
+        # Process each segment
+        for i, segment, speaker in named_segments:
+            text = segment.get("text", "")
+            entities = entity_map[i]
 
             # Calculate sentiment for this segment
             # Use cached sentiment data if available, otherwise compute
@@ -512,24 +513,6 @@ class EntitySentimentAnalysis(AnalysisModule):
                 continue
 
             entity_names, counts = zip(*top_entities, strict=False)
-            sentiments = [
-                (
-                    entity_stats[entity_name]["avg_sentiment"]
-                    if entity_name in entity_stats
-                    else 0
-                )
-                for entity_name in entity_names
-            ]
-
-            plt.figure(figsize=(10, 6))
-            plt.bar(
-                range(len(entity_names)),
-                counts,
-                color=[
-                    "red" if s < -0.1 else "blue" if s > 0.1 else "gray"
-                    for s in sentiments
-                ],
-            )
             spec = BarCategoricalSpec(
                 viz_id=VIZ_ENTITY_SENTIMENT_MENTIONS_SPEAKER,
                 module=self.module_name,
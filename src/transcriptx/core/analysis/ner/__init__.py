@@ -3,6 +3,7 @@ Named Entity Recognition (NER) Module for TranscriptX.
 """
 
 from __future__ import annotations
+import time
 import warnings
 from collections import Counter, defaultdict
 from pathlib import Path
@@ -38,6 +39,42 @@ def extract_named_entities(text: str) -> list:
     return [(ent.text, ent.label_) for ent in doc.ents]
 
 
+def extract_named_entities_batch(
+    texts: List[str], batch_size: int | None = None, n_process: int | None = None
+) -> List[list]:
+    """
+    Extract named entities from many texts in one pass.
+
+    Texts from the current transcript are served from the shared Doc layer when
+    it was parsed with the NER model; otherwise they are streamed through
+    nlp.pipe with only the NER components enabled. ``batch_size`` and
+    ``n_process`` default to the ``ner_batch_size``/``ner_n_process`` settings.
+    """
+    from transcriptx.core.utils.doc_layer import docs_for_texts
+    from transcriptx.core.utils.nlp_runtime import NER_COMPONENTS, pipe_docs
+
+    texts = list(texts)
+    if not texts:
+        return []
+    nlp = _get_ner_nlp()
+    docs = docs_for_texts(texts, nlp=nlp)
+    if docs is None:
+        analysis_config = get_config().analysis
+        if batch_size is None:
+            batch_size = getattr(analysis_config, "ner_batch_size", 100)
+        batch_size = max(1, batch_size)
+        if n_process is None:
+            n_process = getattr(analysis_config, "ner_n_process", 1)
+        docs = pipe_docs(
+            nlp,
+            texts,
+            batch_size=batch_size,
+            n_process=n_process,
+            keep=NER_COMPONENTS,
+        )
+    return [[(ent.text, ent.label_) for ent in doc.ents] for doc in docs]
+
+
 class NERAnalysis(AnalysisModule):
     """
     Named Entity Recognition analysis module.
@@ -77,9 +114,13 @@ class NERAnalysis(AnalysisModule):
             get_speaker_display_name,
         )
 
+        from transcriptx.core.utils.doc_layer import docs_for_segments
+        from transcriptx.core.utils.nlp_runtime import NER_COMPONENTS, pipe_docs
+
         # Apply segment limits from config to prevent timeouts
         max_segments = getattr(self.config.analysis, "ner_max_segments", 5000)
-        batch_size = getattr(self.config.analysis, "ner_batch_size", 100)
+        batch_size = max(1, getattr(self.config.analysis, "ner_batch_size", 100))
+        n_process = getattr(self.config.analysis, "ner_n_process", 1)
 
         # Limit segments if transcript is very large
         if len(segments) > max_segments:
@@ -97,35 +138,56 @@ class NERAnalysis(AnalysisModule):
         location_entities_per_speaker = defaultdict(Counter)
         entity_sentences_per_speaker = defaultdict(lambda: defaultdict(list))
 
-        # Process segments in batches
-        for i in range(0, total_segments, batch_size):
-            batch = segments[i : i + batch_size]
-            print(
-                f"Processing batch {i // batch_size + 1}/{(total_segments + batch_size - 1) // batch_size} "
-                f"({len(batch)} segments)"
+        # Resolve speakers up front; the speaker rides along as nlp.pipe context
+        speaker_segments = []
+        speaker_texts = []
+        for seg in segments:
+            speaker_info = extract_speaker_info(seg)
+            if speaker_info is None:
+                continue
+            speaker = get_speaker_display_name(
+                speaker_info.grouping_key, [seg], segments
             )
-
-            for seg in batch:
-                speaker_info = extract_speaker_info(seg)
-                if speaker_info is None:
-                    continue
-                speaker = get_speaker_display_name(
-                    speaker_info.grouping_key, [seg], segments
-                )
-                if not speaker or not is_named_speaker(speaker):
-                    continue
-
-                text = seg.get("text", "")
-                entities = extract_named_entities(text)
-
-                for ent_text, label in entities:
-                    entity_counts_per_speaker[speaker][ent_text] += 1
-                    label_counts_per_speaker[speaker][label] += 1
-                    entity_sentences_per_speaker[speaker][ent_text].append(text)
-                    if label in {"GPE", "LOC"}:
-                        location_entities_per_speaker[speaker][ent_text] += 1
-
-        print("NER processing complete.")
+            if not speaker or not is_named_speaker(speaker):
+                continue
+            speaker_segments.append(seg)
+            speaker_texts.append((seg.get("text", ""), speaker))
+
+        start_time = time.perf_counter()
+        # Reuse the transcript's shared Doc layer when it was parsed with the
+        # same model; otherwise stream texts through spaCy with only NER enabled
+        layer_docs = docs_for_segments(speaker_segments, nlp=self.nlp)
+        if layer_docs is not None:
+            docs = zip(layer_docs, (speaker for _, speaker in speaker_texts))
+        else:
+            docs = pipe_docs(
+                self.nlp,
+                speaker_texts,
+                batch_size=batch_size,
+                n_process=n_process,
+                keep=NER_COMPONENTS,
+                as_tuples=True,
+            )
+        processed = 0
+        for doc, speaker in docs:
+            text = doc.text
+            for ent in doc.ents:
+                ent_text, label = ent.text, ent.label_
+                entity_counts_per_speaker[speaker][ent_text] += 1
+                label_counts_per_speaker[speaker][label] += 1
+                entity_sentences_per_speaker[speaker][ent_text].append(text)
+                if label in {"GPE", "LOC"}:
+                    location_entities_per_speaker[speaker][ent_text] += 1
+            processed += 1
+            if processed % batch_size == 0:
+                print(f"Processed {processed}/{len(speaker_texts)} segments")
+
+        elapsed = time.perf_counter() - start_time
+        segments_per_second = processed / elapsed if elapsed > 0 else 0.0
+        print(
+            f"NER processing complete: {processed} segments in {elapsed:.2f}s "
+            f"({segments_per_second:.1f} segments/sec)."
+        )
 
         # Aggregate all speaker entities
         all_entity_counter = Counter()
@@ -180,6 +242,7 @@ class NERAnalysis(AnalysisModule):
             "speaker_csv_rows": speaker_csv_rows,
             "all_rows": all_rows,
             "all_label_counter": dict(all_label_counter),
+            "segments_per_second": segments_per_second,
         }
         # Backward-compatible keys for tests/legacy consumers
         result["entities"] = list(all_entity_counter.keys())
@@ -25,7 +25,7 @@ from transcriptx.core.utils.speaker_extraction import (
 
 from .analysis_integration import load_analysis_results
 from .clustering import cluster_repetitions_advanced, cluster_repetitions_basic
-from .embeddings import EmbeddingCache, get_text_embedding
+from .embeddings import EmbeddingCache, get_text_embedding, semantic_model_id
 from .models import SemanticModelManager
 from .quality_scoring import AdvancedQualityScorer, BasicQualityScorer
 from .repetition_detection import (
@@ -33,8 +33,10 @@ from .repetition_detection import (
     detect_cross_speaker_repetitions_basic,
     detect_speaker_repetitions_advanced,
     detect_speaker_repetitions_basic,
+    limit_speaker_segments,
 )
 from .similarity import SemanticSimilarityCalculator
+from .similarity_matrix import DEFAULT_MAX_BLOCK_ELEMENTS, EmbeddingMatrix
 from .summary import (
     generate_repetition_summary_advanced,
     generate_repetition_summary_basic,
@@ -51,6 +53,23 @@ class ComparisonState:
     max_comparisons: int
 
 
+def _build_embedding_matrix(
+    calculator: SemanticSimilarityCalculator,
+    config: Any,
+    segments: list[dict[str, Any]],
+    batch_size: int,
+) -> EmbeddingMatrix | None:
+    """Embed the segments the detectors compare once, in batches."""
+    texts = [seg.get("text", "").strip() for seg in segments]
+    return calculator.build_matrix(
+        texts,
+        batch_size=batch_size,
+        max_block_elements=getattr(
+            config.analysis, "semantic_matrix_max_elements", DEFAULT_MAX_BLOCK_ELEMENTS
+        ),
+    )
+
+
 class SemanticSimilarityAnalyzer:
     """Semantic similarity and repetition detection analyzer."""
 
@@ -90,7 +109,7 @@ class SemanticSimilarityAnalyzer:
             progress_logger=log_progress,
         )
         self.model_manager.initialize()
-        self.embedding_cache = EmbeddingCache()
+        self.embedding_cache = EmbeddingCache(model_id=semantic_model_id(model_name))
         self.similarity_calculator = SemanticSimilarityCalculator(
             self.model_manager, self.embedding_cache, "SEMANTIC"
         )
@@ -138,6 +157,29 @@ class SemanticSimilarityAnalyzer:
                     continue
                 speaker_segments[speaker].append(segment)
 
+            # Embed only what the detectors compare: each speaker's list as
+            # limited per speaker, plus named speakers in the cross-speaker slice
+            named_ids = {id(seg) for segs in speaker_segments.values() for seg in segs}
+            max_per_speaker = getattr(
+                self.config.analysis, "max_segments_per_speaker", 300
+            )
+            for speaker, segments_list in speaker_segments.items():
+                speaker_segments[speaker] = limit_speaker_segments(
+                    speaker,
+                    segments_list,
+                    max_per_speaker,
+                    self.quality_scorer.filter_segments,
+                    "SEMANTIC",
+                )
+            max_cross = getattr(
+                self.config.analysis, "max_segments_for_cross_speaker", 500
+            )
+            compared = [seg for segs in speaker_segments.values() for seg in segs]
+            compared.extend(seg for seg in segments[:max_cross] if id(seg) in named_ids)
+            embedding_matrix = _build_embedding_matrix(
+                self.similarity_calculator, self.config, compared, self.batch_size
+            )
+
             results = {
                 "repetitions": [],
                 "speaker_repetitions": {},
@@ -177,6 +219,7 @@ class SemanticSimilarityAnalyzer:
                     ),
                     filter_segments_fn=self.quality_scorer.filter_segments,
                     log_tag="SEMANTIC",
+                    embedding_matrix=embedding_matrix,
                 )
                 results["speaker_repetitions"][speaker] = speaker_reps
 
@@ -195,6 +238,7 @@ class SemanticSimilarityAnalyzer:
                         self.config.analysis, "max_segments_for_cross_speaker", 500
                     ),
                     log_tag="SEMANTIC",
+                    embedding_matrix=embedding_matrix,
                 )
                 results["cross_speaker_repetitions"] = cross_speaker_reps
             else:
@@ -284,7 +328,9 @@ class AdvancedSemanticSimilarityAnalyzer:
             )
             self.model_manager.initialize()
 
-            self.embedding_cache = EmbeddingCache()
+            self.embedding_cache = EmbeddingCache(
+                model_id=semantic_model_id(model_name)
+            )
             self.similarity_calculator = SemanticSimilarityCalculator(
                 self.model_manager, self.embedding_cache, "SEMANTIC_ADVANCED"
             )
@@ -350,6 +396,13 @@ class AdvancedSemanticSimilarityAnalyzer:
                     continue
                 speaker_segments_map[speaker].append(seg)
 
+            embedding_matrix = _build_embedding_matrix(
+                self.similarity_calculator,
+                self.config,
+                [seg for segs in speaker_segments_map.values() for seg in segs],
+                self.batch_size,
+            )
+
             for speaker, speaker_segments in speaker_segments_map.items():
                 if len(speaker_segments) > 1:
                     speaker_repetitions[speaker] = detect_speaker_repetitions_advanced(
@@ -358,6 +411,7 @@ class AdvancedSemanticSimilarityAnalyzer:
                         self.calculate_semantic_similarity,
                         self.comparison_state,
                         "SEMANTIC_ADVANCED",
+                        embedding_matrix=embedding_matrix,
                     )
 
             cross_speaker_repetitions = detect_cross_speaker_repetitions_advanced(
@@ -365,6 +419,7 @@ class AdvancedSemanticSimilarityAnalyzer:
                 self.calculate_semantic_similarity,
                 self.comparison_state,
                 "SEMANTIC_ADVANCED",
+                embedding_matrix=embedding_matrix,
             )
 
             clusters = cluster_repetitions_advanced(
@@ -8,21 +8,57 @@ from typing import Any, Dict, Optional
 
 import numpy as np
 
+from transcriptx.core.utils.embedding_store import EmbeddingStore, get_embedding_store
 from transcriptx.core.utils.logger import log_warning
 from transcriptx.core.utils.nlp_utils import preprocess_for_similarity
 
 
-class EmbeddingCache:
-    """Simple embedding cache keyed by preprocessed text."""
+def semantic_model_id(model_name: str) -> str:
+    """Embedding store id for masked mean-pooled ``transformers`` embeddings."""
+    return f"transformers-mean:{model_name}"
+
 
-    def __init__(self) -> None:
+class EmbeddingCache:
+    """
+    Embedding cache keyed by preprocessed text.
+
+    With a ``model_id``, misses fall through to the persistent cross-run
+    embedding store for that model and new embeddings are written back.
+    """
+
+    def __init__(
+        self,
+        model_id: Optional[str] = None,
+        store: Optional[EmbeddingStore] = None,
+    ) -> None:
         self._cache: Dict[str, np.ndarray] = {}
+        if store is None and model_id:
+            store = get_embedding_store(model_id)
+        self.store = store
 
     def get(self, key: str) -> Optional[np.ndarray]:
-        return self._cache.get(key)
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: list[str]) -> list[Optional[np.ndarray]]:
+        results = [self._cache.get(key) for key in keys]
+        if self.store is None:
+            return results
+        missing = [idx for idx, value in enumerate(results) if value is None]
+        if missing:
+            stored = self.store.get_many([keys[idx] for idx in missing])
+            for idx, vector in zip(missing, stored):
+                if vector is not None:
+                    results[idx] = self._cache[keys[idx]] = vector[np.newaxis, :]
+        return results
 
     def set(self, key: str, value: np.ndarray) -> None:
-        self._cache[key] = value
+        self.set_many([key], [value])
+
+    def set_many(self, keys: list[str], values: list[np.ndarray]) -> None:
+        for key, value in zip(keys, values):
+            self._cache[key] = value
+        if self.store is not None:
+            self.store.put_many(keys, values)
 
 
 def get_text_embedding(
@@ -35,33 +71,77 @@ def get_text_embedding(
     log_tag: str,
 ) -> Optional[np.ndarray]:
     """Generate embedding for a text, with caching and preprocessing."""
+    return get_text_embeddings(
+        [text], model, tokenizer, device, torch_module, cache, log_tag
+    )[0]
+
+
+def get_text_embeddings(
+    texts: list[str],
+    model: Any,
+    tokenizer: Any,
+    device: Any,
+    torch_module: Any,
+    cache: EmbeddingCache,
+    log_tag: str,
+    batch_size: int = 32,
+) -> list[Optional[np.ndarray]]:
+    """
+    Batched get_text_embedding: one embedding (or None) per text, in order.
+
+    Uncached texts are embedded in padded, length-sorted batches; mean pooling
+    is masked so each result equals the single-text embedding.
+    """
+    results: list[Optional[np.ndarray]] = [None] * len(texts)
     if not model or not tokenizer:
-        return None
-
-    try:
-        preprocessed_text = preprocess_for_similarity(text)
-        if not preprocessed_text:
-            return None
-
-        cached = cache.get(preprocessed_text)
-        if cached is not None:
-            return cached
-
-        inputs = tokenizer(
-            preprocessed_text,
-            return_tensors="pt",
-            max_length=512,
-            truncation=True,
-            padding=True,
-        ).to(device)
-
-        with torch_module.no_grad():
-            outputs = model(**inputs)
-            embeddings = outputs.last_hidden_state.mean(dim=1)
-            result = embeddings.cpu().numpy()
-
-        cache.set(preprocessed_text, result)
-        return result
-    except Exception as exc:
-        log_warning(log_tag, f"Failed to get embedding for text: {exc}")
-        return None
+        return results
+
+    preprocessed: Dict[str, list[int]] = {}
+    for idx, text in enumerate(texts):
+        try:
+            preprocessed_text = preprocess_for_similarity(text)
+        except Exception as exc:
+            log_warning(log_tag, f"Failed to preprocess text for embedding: {exc}")
+            continue
+        if preprocessed_text:
+            preprocessed.setdefault(preprocessed_text, []).append(idx)
+
+    pending: Dict[str, list[int]] = {}
+    unique = list(preprocessed)
+    for key, cached in zip(unique, cache.get_many(unique)):
+        if cached is None:
+            pending[key] = preprocessed[key]
+            continue
+        for idx in preprocessed[key]:
+            results[idx] = cached
+
+    keys = sorted(pending, key=len)
+    batch_size = max(1, batch_size)
+    for start in range(0, len(keys), batch_size):
+        batch = keys[start : start + batch_size]
+        try:
+            inputs = tokenizer(
+                batch,
+                return_tensors="pt",
+                max_length=512,
+                truncation=True,
+                padding=True,
+            ).to(device)
+
+            with torch_module.no_grad():
+                outputs = model(**inputs)
+                hidden = outputs.last_hidden_state
+                mask = inputs["attention_mask"].unsqueeze(-1).to(hidden.dtype)
+                pooled = (hidden * mask).sum(dim=1) / mask.sum(dim=1).clamp(min=1)
+                embeddings = pooled.cpu().numpy()
+        except Exception as exc:
+            log_warning(log_tag, f"Failed to get embeddings for batch: {exc}")
+            continue
+
+        values = [embedding[np.newaxis, :] for embedding in embeddings]
+        cache.set_many(batch, values)
+        for key, value in zip(batch, values):
+            for idx in pending[key]:
+                results[idx] = value
+
+    return results
@@ -4,12 +4,17 @@ Transformer model management for semantic similarity analysis.
 
 from __future__ import annotations
 
+import threading
 import warnings
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Dict, Optional, Tuple
 
 from transcriptx.core.utils.logger import log_error, log_info, log_warning
 from transcriptx.core.utils.lazy_imports import get_torch, get_transformers
 
+# (model name, device) -> (tokenizer, model), shared by every manager in the process
+_LOADED_MODELS: Dict[Tuple[str, str], Tuple[Any, Any]] = {}
+_LOADED_MODELS_LOCK = threading.Lock()
+
 
 class SemanticModelManager:
     """Load and manage transformer models for semantic similarity."""
@@ -51,6 +56,13 @@ class SemanticModelManager:
             self.tokenizer = None
             return
 
+        key = (self.model_name, str(self.device))
+        with _LOADED_MODELS_LOCK:
+            loaded = _LOADED_MODELS.get(key)
+        if loaded is not None:
+            self.tokenizer, self.model = loaded
+            return
+
         try:
             transformers = get_transformers()
             # Suppress FutureWarning about resume_download deprecation in huggingface_hub
@@ -97,3 +109,7 @@ class SemanticModelManager:
             )
             self.model = None
             self.tokenizer = None
+            return
+        if self.model is not None and self.tokenizer is not None:
+            with _LOADED_MODELS_LOCK:
+                _LOADED_MODELS.setdefault(key, (self.tokenizer, self.model))
@@ -4,7 +4,9 @@ Repetition detection logic for semantic similarity analysis.
 
 from __future__ import annotations
 
-from typing import Any, Callable
+from typing import Any, Callable, Iterator, Optional
+
+import numpy as np
 
 from transcriptx.core.utils.logger import log_error, log_warning
 from transcriptx.core.utils.nlp_utils import has_meaningful_content
@@ -14,6 +16,8 @@ from transcriptx.core.utils.speaker_extraction import (
 )
 from transcriptx.utils.text_utils import is_named_speaker
 
+from .similarity_matrix import EmbeddingMatrix
+
 
 def classify_agreement_disagreement_advanced(
     text1: str, text2: str, similarity: float, log_tag: str
@@ -126,15 +130,365 @@ def classify_agreement_disagreement_basic(
     return "neutral"
 
 
+def _segment_starts(segments: list[dict[str, Any]]) -> np.ndarray:
+    return np.array([seg.get("start", 0) for seg in segments], dtype=np.float64)
+
+
+def _named_speaker_keys(
+    segments: list[dict[str, Any]],
+) -> tuple[list[str | None], np.ndarray]:
+    """Display name (None if not a named speaker) and integer key per segment."""
+    names: list[str | None] = []
+    key_ids: dict[Any, int] = {}
+    keys = np.full(len(segments), -1, dtype=np.intp)
+    for idx, seg in enumerate(segments):
+        speaker_info = extract_speaker_info(seg)
+        name = None
+        if speaker_info is not None:
+            name = get_speaker_display_name(speaker_info.grouping_key, [seg], segments)
+            if name and is_named_speaker(name):
+                keys[idx] = key_ids.setdefault(speaker_info.grouping_key, len(key_ids))
+            else:
+                name = None
+        names.append(name)
+    return names, keys
+
+
+def _resolve_pairs(
+    matrix: EmbeddingMatrix,
+    sims: np.ndarray,
+    left_texts: list[str],
+    right_texts: list[str],
+    left_idx: np.ndarray,
+    right_idx: np.ndarray,
+    comparison_state: Any,
+) -> np.ndarray:
+    """
+    Count the pairs as comparisons and resolve their similarities.
+
+    As in the analyzers' pairwise ``calculate_semantic_similarity``, a pair
+    whose comparison number exceeds the limit, or whose texts lack an
+    embedding, is scored with the matrix's fallback (TF-IDF).
+    """
+    first = comparison_state.comparison_count + 1
+    comparison_state.comparison_count += len(sims)
+    over_budget = np.arange(first, first + len(sims)) > comparison_state.max_comparisons
+    if over_budget.any():
+        sims = sims.astype(np.float64, copy=True)
+        sims[over_budget] = np.nan
+    return matrix.resolve(sims, left_texts, right_texts, left_idx, right_idx)
+
+
+def _iter_matrix_candidates(
+    matrix: EmbeddingMatrix,
+    texts: list[str],
+    candidate_mask: Callable[[int, int], np.ndarray],
+    comparison_state: Any,
+) -> Iterator[tuple[np.ndarray, np.ndarray, np.ndarray]]:
+    """
+    Yield ``(i, j, similarity)`` arrays for candidate pairs, in row-major order.
+
+    ``candidate_mask(start, stop)`` returns the boolean candidate block for
+    rows ``start:stop`` against all columns. Each candidate counts as one
+    comparison; evaluation stops at the same pair as the pairwise loops.
+    """
+    rows = matrix.rows(texts)
+    for start, block in matrix.iter_blocks(rows):
+        budget = comparison_state.max_comparisons - comparison_state.comparison_count
+        if budget < 0:
+            return
+        ii, jj = np.nonzero(candidate_mask(start, start + len(block)))
+        ii, jj = ii[: budget + 1], jj[: budget + 1]
+        sims = _resolve_pairs(
+            matrix, block[ii, jj], texts[start:], texts, ii, jj, comparison_state
+        )
+        yield ii + start, jj, sims
+
+
+def _upper_triangle(start: int, stop: int, n: int) -> np.ndarray:
+    return np.arange(n)[np.newaxis, :] > np.arange(start, stop)[:, np.newaxis]
+
+
+def _iter_matrix_rows(
+    matrix: EmbeddingMatrix, texts: list[str]
+) -> Iterator[tuple[int, np.ndarray]]:
+    """Yield ``(i, similarity_row)`` for each text, computed in tiles."""
+    rows = matrix.rows(texts)
+    for start, block in matrix.iter_blocks(rows):
+        for offset, sims_row in enumerate(block):
+            yield start + offset, sims_row
+
+
+def _speaker_repetitions_advanced_matrix(
+    speaker: str,
+    segments: list[dict[str, Any]],
+    texts: list[str],
+    matrix: EmbeddingMatrix,
+    comparison_state: Any,
+) -> list[dict[str, Any]]:
+    eligible = np.array([has_meaningful_content(t) for t in texts], dtype=bool)
+    starts = _segment_starts(segments)
+
+    def candidate_mask(start: int, stop: int) -> np.ndarray:
+        gaps = np.abs(starts[start:stop, np.newaxis] - starts[np.newaxis, :])
+        return (
+            _upper_triangle(start, stop, len(texts))
+            & eligible[start:stop, np.newaxis]
+            & eligible[np.newaxis, :]
+            & (gaps >= 30)
+        )
+
+    repetitions: list[dict[str, Any]] = []
+    for ii, jj, sims in _iter_matrix_candidates(
+        matrix, texts, candidate_mask, comparison_state
+    ):
+        for i, j, similarity in zip(ii, jj, sims):
+            if similarity <= 0.7:
+                continue
+            seg1, seg2 = segments[i], segments[j]
+            repetitions.append(
+                {
+                    "type": "self_repetition",
+                    "speaker": speaker,
+                    "segment1": {
+                        "text": seg1["text"],
+                        "start": seg1.get("start", 0),
+                        "end": seg1.get("end", 0),
+                    },
+                    "segment2": {
+                        "text": seg2["text"],
+                        "start": seg2.get("start", 0),
+                        "end": seg2.get("end", 0),
+                    },
+                    "similarity": float(similarity),
+                    "time_gap": abs(seg1.get("start", 0) - seg2.get("start", 0)),
+                }
+            )
+    return repetitions
+
+
+def _cross_speaker_repetitions_advanced_matrix(
+    segments: list[dict[str, Any]],
+    texts: list[str],
+    matrix: EmbeddingMatrix,
+    comparison_state: Any,
+    log_tag: str,
+) -> list[dict[str, Any]] | None:
+    """Matrix path; None if the matrix lacks an eligible segment's text."""
+    _, keys = _named_speaker_keys(segments)
+    eligible = (keys >= 0) & np.array(
+        [has_meaningful_content(t) for t in texts], dtype=bool
+    )
+    if not matrix.covers([t for t, ok in zip(texts, eligible) if ok]):
+        return None
+    starts = _segment_starts(segments)
+
+    def candidate_mask(start: int, stop: int) -> np.ndarray:
+        gaps = np.abs(starts[start:stop, np.newaxis] - starts[np.newaxis, :])
+        return (
+            _upper_triangle(start, stop, len(texts))
+            & eligible[start:stop, np.newaxis]
+            & eligible[np.newaxis, :]
+            & (keys[start:stop, np.newaxis] != keys[np.newaxis, :])
+            & (gaps >= 10)
+        )
+
+    repetitions: list[dict[str, Any]] = []
+    for ii, jj, sims in _iter_matrix_candidates(
+        matrix, texts, candidate_mask, comparison_state
+    ):
+        for i, j, similarity in zip(ii, jj, sims):
+            if similarity <= 0.6:
+                continue
+            seg1, seg2 = segments[i], segments[j]
+            similarity = float(similarity)
+            repetitions.append(
+                {
+                    "type": "cross_speaker_repetition",
+                    "speaker1": seg1.get("speaker", ""),
+                    "speaker2": seg2.get("speaker", ""),
+                    "segment1": {
+                        "text": seg1["text"],
+                        "start": seg1.get("start", 0),
+                        "end": seg1.get("end", 0),
+                    },
+                    "segment2": {
+                        "text": seg2["text"],
+                        "start": seg2.get("start", 0),
+                        "end": seg2.get("end", 0),
+                    },
+                    "similarity": similarity,
+                    "classification": classify_agreement_disagreement_advanced(
+                        seg1["text"], seg2["text"], similarity, log_tag
+                    ),
+                    "time_gap": abs(seg1.get("start", 0) - seg2.get("start", 0)),
+                }
+            )
+    return repetitions
+
+
+def _speaker_repetitions_basic_matrix(
+    speaker: str,
+    segments: list[dict[str, Any]],
+    texts: list[str],
+    matrix: EmbeddingMatrix,
+    comparison_state: Any,
+    similarity_threshold: float,
+    time_window: int,
+) -> list[dict[str, Any]]:
+    eligible = np.array([has_meaningful_content(t) for t in texts], dtype=bool)
+    starts = _segment_starts(segments)
+    max_comparisons_per_segment = 50
+
+    repetitions: list[dict[str, Any]] = []
+    for i, sims_row in _iter_matrix_rows(matrix, texts):
+        if comparison_state.comparison_count > comparison_state.max_comparisons:
+            break
+        if not eligible[i]:
+            continue
+
+        later = slice(i + 1, None)
+        candidates = np.flatnonzero(
+            eligible[later] & (starts[later] - starts[i] <= time_window)
+        )[:max_comparisons_per_segment] + (i + 1)
+        sims = _resolve_pairs(
+            matrix,
+            sims_row[candidates],
+            texts,
+            texts,
+            np.full_like(candidates, i),
+            candidates,
+            comparison_state,
+        )
+
+        start_time1 = segments[i].get("start", 0)
+        for j, similarity in zip(candidates, sims):
+            if similarity < similarity_threshold:
+                continue
+            start_time2 = segments[j].get("start", 0)
+            repetitions.append(
+                {
+                    "speaker": speaker,
+                    "segment1": {
+                        "index": i,
+                        "text": texts[i],
+                        "start": start_time1,
+                        "end": segments[i].get("end", start_time1),
+                    },
+                    "segment2": {
+                        "index": int(j),
+                        "text": texts[j],
+                        "start": start_time2,
+                        "end": segments[j].get("end", start_time2),
+                    },
+                    "similarity": float(similarity),
+                    "time_gap": start_time2 - start_time1,
+                    "type": "self_repetition",
+                }
+            )
+    return repetitions
+
+
+def _cross_speaker_repetitions_basic_matrix(
+    segments: list[dict[str, Any]],
+    texts: list[str],
+    matrix: EmbeddingMatrix,
+    comparison_state: Any,
+    similarity_threshold: float,
+    time_window: int,
+    log_tag: str,
+) -> list[dict[str, Any]] | None:
+    """Matrix path; None if the matrix lacks an eligible segment's text."""
+    names, keys = _named_speaker_keys(segments)
+    eligible = (keys >= 0) & np.array(
+        [bool(t) and len(t.split()) >= 3 for t in texts], dtype=bool
+    )
+    if not matrix.covers([t for t, ok in zip(texts, eligible) if ok]):
+        return None
+    starts = _segment_starts(segments)
+    max_cross_comparisons_per_segment = 30
+
+    cross_repetitions: list[dict[str, Any]] = []
+    for i, sims_row in _iter_matrix_rows(matrix, texts):
+        if comparison_state.comparison_count > comparison_state.max_comparisons:
+            log_warning(
+                log_tag,
+                "Stopping cross-speaker analysis due to comparison limit",
+            )
+            break
+        if not eligible[i]:
+            continue
+
+        later = slice(i + 1, None)
+        candidates = np.flatnonzero(
+            eligible[later]
+            & (keys[later] != keys[i])
+            & (starts[later] - starts[i] <= time_window)
+        )[:max_cross_comparisons_per_segment] + (i + 1)
+        sims = _resolve_pairs(
+            matrix,
+            sims_row[candidates],
+            texts,
+            texts,
+            np.full_like(candidates, i),
+            candidates,
+            comparison_state,
+        )
+
+        start_time1 = segments[i].get("start", 0)
+        for j, similarity in zip(candidates, sims):
+            if similarity < similarity_threshold:
+                continue
+            similarity = float(similarity)
+            start_time2 = segments[j].get("start", 0)
+            cross_repetitions.append(
+                {
+                    "speaker1": names[i],
+                    "speaker2": names[j],
+                    "segment1": {
+                        "index": i,
+                        "text": texts[i],
+                        "start": start_time1,
+                        "end": segments[i].get("end", start_time1),
+                    },
+                    "segment2": {
+                        "index": int(j),
+                        "text": texts[j],
+                        "start": start_time2,
+                        "end": segments[j].get("end", start_time2),
+                    },
+                    "similarity": similarity,
+                    "time_gap": start_time2 - start_time1,
+                    "type": "cross_speaker",
+                    "agreement_type": classify_agreement_disagreement_basic(
+                        texts[i], texts[j], similarity
+                    ),
+                }
+            )
+    return cross_repetitions
+
+
 def detect_speaker_repetitions_advanced(
     speaker: str,
     segments: list[dict[str, Any]],
     similarity_fn: Callable[[str, str], float],
     comparison_state: Any,
     log_tag: str,
+    embedding_matrix: Optional[EmbeddingMatrix] = None,
 ) -> list[dict[str, Any]]:
-    """Detect repetitions within a single speaker's segments (advanced)."""
+    """
+    Detect repetitions within a single speaker's segments (advanced).
+
+    With ``embedding_matrix`` covering the segment texts, similarities come
+    from tiled matrix products instead of per-pair ``similarity_fn`` calls.
+    """
     try:
+        texts = [seg.get("text", "").strip() for seg in segments]
+        if embedding_matrix is not None and embedding_matrix.covers(texts):
+            return _speaker_repetitions_advanced_matrix(
+                speaker, segments, texts, embedding_matrix, comparison_state
+            )
+
         repetitions: list[dict[str, Any]] = []
 
         for i, seg1 in enumerate(segments):
@@ -193,9 +547,18 @@ def detect_cross_speaker_repetitions_advanced(
     similarity_fn: Callable[[str, str], float],
     comparison_state: Any,
     log_tag: str,
+    embedding_matrix: Optional[EmbeddingMatrix] = None,
 ) -> list[dict[str, Any]]:
-    """Detect cross-speaker repetitions (advanced)."""
+    """Detect cross-speaker repetitions (advanced); see embedding_matrix above."""
     try:
+        texts = [seg.get("text", "").strip() for seg in segments]
+        if embedding_matrix is not None:
+            matrix_repetitions = _cross_speaker_repetitions_advanced_matrix(
+                segments, texts, embedding_matrix, comparison_state, log_tag
+            )
+            if matrix_repetitions is not None:
+                return matrix_repetitions
+
         repetitions: list[dict[str, Any]] = []
 
         for i, seg1 in enumerate(segments):
@@ -275,6 +638,23 @@ def detect_cross_speaker_repetitions_advanced(
         return []
 
 
+def limit_speaker_segments(
+    speaker: str,
+    segments: list[dict[str, Any]],
+    max_segments_per_speaker: int,
+    filter_segments_fn: Callable[[list[dict[str, Any]], int], list[dict[str, Any]]],
+    log_tag: str,
+) -> list[dict[str, Any]]:
+    """Quality-filter a speaker's segments down to the per-speaker limit."""
+    if len(segments) <= max_segments_per_speaker:
+        return segments
+    log_warning(
+        log_tag,
+        f"Limiting {speaker} segments from {len(segments)} to {max_segments_per_speaker} (quality-filtered)",
+    )
+    return filter_segments_fn(segments, max_segments_per_speaker)
+
+
 def detect_speaker_repetitions_basic(
     speaker: str,
     segments: list[dict[str, Any]],
@@ -285,15 +665,25 @@ def detect_speaker_repetitions_basic(
     max_segments_per_speaker: int,
     filter_segments_fn: Callable[[list[dict[str, Any]], int], list[dict[str, Any]]],
     log_tag: str,
+    embedding_matrix: Optional[EmbeddingMatrix] = None,
 ) -> list[dict[str, Any]]:
     """Detect repetitions within a single speaker's utterances (basic)."""
     repetitions: list[dict[str, Any]] = []
-    if len(segments) > max_segments_per_speaker:
-        log_warning(
-            log_tag,
-            f"Limiting {speaker} segments from {len(segments)} to {max_segments_per_speaker} (quality-filtered)",
+    segments = limit_speaker_segments(
+        speaker, segments, max_segments_per_speaker, filter_segments_fn, log_tag
+    )
+
+    texts = [seg.get("text", "").strip() for seg in segments]
+    if embedding_matrix is not None and embedding_matrix.covers(texts):
+        return _speaker_repetitions_basic_matrix(
+            speaker,
+            segments,
+            texts,
+            embedding_matrix,
+            comparison_state,
+            similarity_threshold,
+            time_window,
         )
-        segments = filter_segments_fn(segments, max_segments_per_speaker)
 
     for i, seg1 in enumerate(segments):
         if comparison_state.comparison_count > comparison_state.max_comparisons:
@@ -356,6 +746,7 @@ def detect_cross_speaker_repetitions_basic(
     time_window: int,
     max_segments_for_cross_speaker: int,
     log_tag: str,
+    embedding_matrix: Optional[EmbeddingMatrix] = None,
 ) -> list[dict[str, Any]]:
     """Detect cross-speaker repetitions (basic)."""
     cross_repetitions: list[dict[str, Any]] = []
@@ -368,6 +759,20 @@ def detect_cross_speaker_repetitions_basic(
         )
         segments = segments[:max_segments_for_cross]
 
+    texts = [seg.get("text", "").strip() for seg in segments]
+    if embedding_matrix is not None:
+        matrix_repetitions = _cross_speaker_repetitions_basic_matrix(
+            segments,
+            texts,
+            embedding_matrix,
+            comparison_state,
+            similarity_threshold,
+            time_window,
+            log_tag,
+        )
+        if matrix_repetitions is not None:
+            return matrix_repetitions
+
     for i, seg1 in enumerate(segments):
         if comparison_state.comparison_count > comparison_state.max_comparisons:
             log_warning(
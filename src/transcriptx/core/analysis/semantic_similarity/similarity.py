@@ -4,13 +4,14 @@ Semantic similarity calculations with transformer and TF-IDF fallback.
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional
 
 from transcriptx.core.utils.config import get_config
 from transcriptx.core.utils.logger import log_warning
 from transcriptx.core.utils.nlp_utils import preprocess_for_similarity
 
-from .embeddings import EmbeddingCache, get_text_embedding
+from .embeddings import EmbeddingCache, get_text_embedding, get_text_embeddings
+from .similarity_matrix import DEFAULT_MAX_BLOCK_ELEMENTS, EmbeddingMatrix
 
 
 class SemanticSimilarityCalculator:
@@ -58,6 +59,40 @@ class SemanticSimilarityCalculator:
         similarity = cosine_similarity(emb1, emb2)[0][0]
         return float(similarity)
 
+    def build_matrix(
+        self,
+        texts: list[str],
+        batch_size: int = 32,
+        max_block_elements: int = DEFAULT_MAX_BLOCK_ELEMENTS,
+    ) -> Optional[EmbeddingMatrix]:
+        """
+        Embed ``texts`` in batches into a normalised similarity matrix.
+
+        Returns None when no transformer model is loaded (callers keep the
+        pairwise TF-IDF path). Texts that cannot be embedded fall back to
+        TF-IDF per pair, as in ``calculate``.
+        """
+        if not self.model_manager.model or not self.model_manager.tokenizer:
+            return None
+
+        unique_texts = list(dict.fromkeys(texts))
+        embeddings = get_text_embeddings(
+            unique_texts,
+            self.model_manager.model,
+            self.model_manager.tokenizer,
+            self.model_manager.device,
+            self.model_manager.torch,
+            self.embedding_cache,
+            self.log_tag,
+            batch_size=batch_size,
+        )
+        return EmbeddingMatrix(
+            unique_texts,
+            embeddings,
+            self.tfidf_similarity,
+            max_block_elements=max_block_elements,
+        )
+
     def tfidf_similarity(self, text1: str, text2: str) -> float:
         """Calculate TF-IDF similarity as fallback."""
         try:
@@ -0,0 +1,143 @@
+"""
+Matrix-based cosine similarity over batched segment embeddings.
+
+Repetition detection compares many segment pairs. Instead of embedding and
+comparing two texts per call, every text is embedded once (in batches), rows
+are L2-normalised into a single matrix, and similarities are produced as
+matrix products. Products are computed in row tiles so the largest block held
+in memory stays under ``max_block_elements`` floats, however long the
+transcript.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterator, Optional, Sequence
+
+import numpy as np
+
+DEFAULT_MAX_BLOCK_ELEMENTS = 4_000_000
+
+
+class EmbeddingMatrix:
+    """
+    L2-normalised embeddings for a set of texts, one row per unique text.
+
+    Texts whose embedding is missing have no valid row; similarities involving
+    them are NaN and callers resolve those pairs with ``fallback_fn``.
+    """
+
+    def __init__(
+        self,
+        texts: Sequence[str],
+        embeddings: Sequence[Optional[np.ndarray]],
+        fallback_fn: Callable[[str, str], float],
+        max_block_elements: int = DEFAULT_MAX_BLOCK_ELEMENTS,
+    ) -> None:
+        """
+        Args:
+            texts: Texts, aligned with ``embeddings``
+            embeddings: One embedding (any shape with ``dim`` elements) or
+                None per text
+            fallback_fn: Pairwise similarity for texts without an embedding
+            max_block_elements: Upper bound on similarity block size
+        """
+        self.fallback_fn = fallback_fn
+        self.max_block_elements = max(1, int(max_block_elements))
+        self._row_of: dict[str, int] = {}
+        vectors: list[Optional[np.ndarray]] = []
+        for text, embedding in zip(texts, embeddings, strict=True):
+            if text in self._row_of:
+                continue
+            self._row_of[text] = len(vectors)
+            vectors.append(
+                None
+                if embedding is None
+                else np.asarray(embedding, dtype=np.float32).ravel()
+            )
+
+        dim = next((len(v) for v in vectors if v is not None), 0)
+        matrix = np.zeros((len(vectors), dim), dtype=np.float32)
+        valid = np.zeros(len(vectors), dtype=bool)
+        for row, vector in enumerate(vectors):
+            if vector is not None and len(vector) == dim:
+                matrix[row] = vector
+                valid[row] = True
+        norms = np.linalg.norm(matrix, axis=1)
+        valid &= norms > 0
+        matrix[valid] /= norms[valid, np.newaxis]
+        self.matrix = matrix
+        self.valid = valid
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def covers(self, texts: Sequence[str]) -> bool:
+        """True if every text has a row (embedded or not)."""
+        return all(text in self._row_of for text in texts)
+
+    def rows(self, texts: Sequence[str]) -> np.ndarray:
+        """Row index per text (-1 for texts without a row)."""
+        return np.fromiter(
+            (self._row_of.get(text, -1) for text in texts),
+            dtype=np.intp,
+            count=len(texts),
+        )
+
+    def tile_rows(self, n_cols: int) -> int:
+        """Rows per tile so a tile against ``n_cols`` columns fits the budget."""
+        return max(1, self.max_block_elements // max(1, n_cols))
+
+    def iter_blocks(
+        self, rows: np.ndarray, cols: Optional[np.ndarray] = None
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Yield ``(start, block)`` tiles of the cosine similarity matrix.
+
+        ``block[a, b]`` is the similarity of ``rows[start + a]`` and ``cols[b]``
+        (``cols`` defaults to ``rows``); pairs without embeddings, or with a
+        row of -1, are NaN.
+        """
+        if cols is None:
+            cols = rows
+        right, right_valid = self._gather(cols)
+        step = self.tile_rows(len(cols))
+        for start in range(0, len(rows), step):
+            left, left_valid = self._gather(rows[start : start + step])
+            block = left @ right.T
+            invalid = ~(left_valid[:, np.newaxis] & right_valid[np.newaxis, :])
+            if invalid.any():
+                block[invalid] = np.nan
+            yield start, block
+
+    def _gather(self, rows: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        known = rows >= 0
+        safe_rows = np.where(known, rows, 0)
+        if not len(self.matrix):
+            return (
+                np.zeros((len(rows), self.matrix.shape[1]), dtype=np.float32),
+                np.zeros(len(rows), dtype=bool),
+            )
+        return self.matrix[safe_rows], self.valid[safe_rows] & known
+
+    def resolve(
+        self,
+        sims: np.ndarray,
+        left_texts: Sequence[str],
+        right_texts: Sequence[str],
+        left_idx: np.ndarray,
+        right_idx: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Replace NaN entries of ``sims`` with ``fallback_fn``.
+
+        ``sims[k]`` is the similarity of ``left_texts[left_idx[k]]`` and
+        ``right_texts[right_idx[k]]``.
+        """
+        missing = np.flatnonzero(np.isnan(sims))
+        if len(missing):
+            sims = sims.astype(np.float64, copy=True)
+            for k in missing:
+                sims[k] = self.fallback_fn(
+                    left_texts[left_idx[k]], right_texts[right_idx[k]]
+                )
+        return sims
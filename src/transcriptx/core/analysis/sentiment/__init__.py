@@ -26,6 +26,11 @@ from transcriptx.core.utils.notifications import notify_user
 from transcriptx.io import save_transcript
 from transcriptx.core.utils.path_utils import get_enriched_transcript_path
 from transcriptx.core.utils.artifact_writer import write_csv
+from transcriptx.core.utils.transformer_inference import (
+    classify_batched,
+    get_batch_size,
+    load_text_classification_pipeline,
+)
 from transcriptx.core.utils.viz_ids import (
     VIZ_SENTIMENT_ROLLING_SPEAKER,
     VIZ_SENTIMENT_MULTI_SPEAKER_GLOBAL,
@@ -144,15 +149,8 @@ def _score_sentiment_textblob(text: str) -> Dict[str, float]:
 def _load_sentiment_transformers(model_name: str):
     """Load transformers sentiment pipeline. Returns None on failure."""
     try:
-        from transcriptx.core.utils.lazy_imports import get_transformers
-
         with suppress_stdout_stderr(), spinner("Loading sentiment model…"):
-            transformers = get_transformers()
-            pipe = transformers.pipeline(
-                "text-classification",
-                model=model_name,
-                top_k=None,
-            )
+            pipe = load_text_classification_pipeline(model_name)
         log_info("SENTIMENT", "Transformers sentiment model loaded successfully")
         return pipe
     except Exception as e:
@@ -222,6 +220,7 @@ class SentimentAnalysis(AnalysisModule):
         )
         self.sia = None
         self._transformers_pipe = None
+        self.transformer_batch_size = get_batch_size(cfg)
         if self.sentiment_backend == "vader":
             try:
                 _ensure_vader_lexicon()
@@ -262,9 +261,10 @@ class SentimentAnalysis(AnalysisModule):
         )
 
         # Calculate sentiment scores for each segment; set raw + normalized
-        for seg in segments:
-            text = seg.get("text", "")
-            raw = self._score_sentiment(text)
+        raw_scores = self._score_sentiment_batch(
+            [seg.get("text", "") for seg in segments]
+        )
+        for seg, raw in zip(segments, raw_scores):
             seg["sentiment"] = raw
             seg["sentiment_backend"] = self.sentiment_backend
             seg["sentiment_compound_norm"] = raw.get("compound", 0.0)
@@ -462,6 +462,24 @@ class SentimentAnalysis(AnalysisModule):
             "neg": scores["neg"],
         }
 
+    def _score_sentiment_batch(self, texts: List[str]) -> List[Dict[str, Any]]:
+        """Score many texts; the transformers backend runs in batches."""
+        if not (self.sentiment_backend == "transformers" and self._transformers_pipe):
+            return [self._score_sentiment(text) for text in texts]
+
+        scores: List[Dict[str, Any]] = [
+            {"compound": 0.0, "pos": 0.0, "neu": 1.0, "neg": 0.0} for _ in texts
+        ]
+        positions = [i for i, text in enumerate(texts) if text and text.strip()]
+        raw_results = classify_batched(
+            self._transformers_pipe,
+            [texts[i] for i in positions],
+            batch_size=self.transformer_batch_size,
+        )
+        for i, raw in zip(positions, raw_results):
+            scores[i] = _normalize_transformers_sentiment(raw)
+        return scores
+
     def _is_named_speaker(self, speaker: str) -> bool:
         """Check if speaker is named (not a system ID)."""
         return is_named_speaker(speaker)
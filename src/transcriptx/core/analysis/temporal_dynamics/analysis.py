@@ -18,6 +18,10 @@ import numpy as np
 
 from transcriptx.core.analysis.base import AnalysisModule
 from transcriptx.core.utils.logger import get_logger
+from transcriptx.core.utils.timeline_index import (
+    SegmentTimeline,
+    timeline_for_segments,
+)
 from transcriptx.utils.text_utils import is_named_speaker
 from transcriptx.core.utils.viz_ids import (
     VIZ_TEMPORAL_ENGAGEMENT_TIMESERIES,
@@ -111,13 +115,23 @@ class TemporalDynamicsAnalysis(AnalysisModule):
         time_windows = self._create_time_windows(total_duration)
 
         # Calculate metrics for each window
+        timeline = timeline_for_segments(segments)
+        word_counts = timeline.list_order(timeline.word_counts)
+        speaker_codes = timeline.list_order(timeline.speaker_codes)
         window_metrics = []
         for window in time_windows:
-            window_segments = self._get_segments_in_window(
-                segments, window["window_start"], window["window_end"]
+            # Segments overlapping the window, in list order
+            positions = timeline.overlapping(
+                window["window_start"], window["window_end"]
             )
             metrics = self._calculate_window_metrics(
-                window_segments, speaker_map, sentiment_data, emotion_data, topic_data
+                [segments[pos] for pos in positions],
+                speaker_map,
+                sentiment_data,
+                emotion_data,
+                topic_data,
+                word_counts=word_counts[positions],
+                speaker_codes=speaker_codes[positions],
             )
             window["metrics"] = metrics["global"]
             window["speaker_metrics"] = metrics["speakers"]
@@ -160,21 +174,6 @@ class TemporalDynamicsAnalysis(AnalysisModule):
 
         return windows
 
-    def _get_segments_in_window(
-        self, segments: List[Dict[str, Any]], window_start: float, window_end: float
-    ) -> List[Dict[str, Any]]:
-        """Get segments that overlap with the time window."""
-        window_segments = []
-        for seg in segments:
-            seg_start = seg.get("start", 0)
-            seg_end = seg.get("end", seg.get("start", 0))
-
-            # Check if segment overlaps with window
-            if seg_start < window_end and seg_end > window_start:
-                window_segments.append(seg)
-
-        return window_segments
-
     def _calculate_window_metrics(
         self,
         window_segments: List[Dict[str, Any]],
@@ -182,8 +181,16 @@ class TemporalDynamicsAnalysis(AnalysisModule):
         sentiment_data: Optional[Dict[str, Any]] = None,
         emotion_data: Optional[Dict[str, Any]] = None,
         topic_data: Optional[Dict[str, Any]] = None,
+        word_counts: Optional[np.ndarray] = None,
+        speaker_codes: Optional[np.ndarray] = None,
     ) -> Dict[str, Any]:
-        """Calculate metrics for a time window."""
+        """
+        Calculate metrics for a time window.
+
+        ``word_counts`` and ``speaker_codes`` are the window segments' columns
+        from the ``SegmentTimeline``; they are derived from the segments when
+        not given.
+        """
         if not window_segments:
             return {
                 "global": {
@@ -201,28 +208,23 @@ class TemporalDynamicsAnalysis(AnalysisModule):
         # Basic metrics
         num_segments = len(window_segments)
         window_duration = self.window_size
-        total_words = sum(len(seg.get("text", "").split()) for seg in window_segments)
+        if word_counts is None or speaker_codes is None:
+            timeline = SegmentTimeline(window_segments)
+            word_counts = timeline.list_order(timeline.word_counts)
+            speaker_codes = timeline.list_order(timeline.speaker_codes)
+        total_words = int(word_counts.sum())
         speaking_rate = (
             (total_words / window_duration) * 60.0 if window_duration > 0 else 0.0
         )
 
         # Turn frequency (speaker changes per minute)
-        speaker_changes = sum(
-            1
-            for i in range(1, len(window_segments))
-            if window_segments[i].get("speaker")
-            != window_segments[i - 1].get("speaker")
-        )
+        speaker_changes = int(np.count_nonzero(speaker_codes[1:] != speaker_codes[:-1]))
         turn_frequency = (
             (speaker_changes / window_duration) * 60.0 if window_duration > 0 else 0.0
         )
 
         # Engagement score (combination of factors)
-        avg_segment_length = (
-            np.mean([len(seg.get("text", "").split()) for seg in window_segments])
-            if window_segments
-            else 0
-        )
+        avg_segment_length = word_counts.mean()
         question_count = sum(1 for seg in window_segments if "?" in seg.get("text", ""))
         engagement_score = self._calculate_engagement_score(
             num_segments, avg_segment_length, question_count, window_duration
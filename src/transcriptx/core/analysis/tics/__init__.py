@@ -189,18 +189,18 @@ class TicsAnalysis(AnalysisModule):
     def _create_tic_chart(self, speaker: str, top_tics: List[tuple]) -> Any:
         """Create bar chart for tics."""
         labels, values = zip(*top_tics, strict=False)
-        plt.figure(figsize=(8, 4))
-        bars = plt.bar(labels, values, color="salmon")
-        plt.title(f"Top Verbal Tics: {speaker}")
-        plt.ylabel("Count")
-        plt.xticks(rotation=30)
+        fig, ax = plt.subplots(figsize=(8, 4))
+        bars = ax.bar(labels, values, color="salmon")
+        ax.set_title(f"Top Verbal Tics: {speaker}")
+        ax.set_ylabel("Count")
+        ax.tick_params(axis="x", labelrotation=30)
         for bar, count in zip(bars, values, strict=False):
-            plt.text(
+            ax.text(
                 bar.get_x() + bar.get_width() / 2,
                 bar.get_height(),
                 str(count),
                 ha="center",
                 va="bottom",
             )
-        plt.tight_layout()
-        return plt.gcf()
+        fig.tight_layout()
+        return fig
@@ -8,6 +8,7 @@ import numpy as np
 from transcriptx.core.utils.lazy_imports import lazy_module
 
 from .utils import (
+    CoherenceStats,
     calculate_topic_coherence,
     find_optimal_k,
     generate_topic_labels,
@@ -77,6 +78,7 @@ def perform_enhanced_lda_analysis(
     )
     doc_topics = lda.fit_transform(X)
 
+    coherence_stats = CoherenceStats(X, feature_names)
     topics = []
     for topic_idx, topic in enumerate(lda.components_):
         top_words_idx = topic.argsort()[-10:][::-1]
@@ -87,7 +89,9 @@ def perform_enhanced_lda_analysis(
         topic_label = generate_topic_labels(top_words, top_weights)
 
         # Calculate topic coherence
-        coherence = calculate_topic_coherence(top_words, texts, vectorizer)
+        coherence = calculate_topic_coherence(
+            top_words, texts, vectorizer, stats=coherence_stats
+        )
 
         topics.append(
             {
@@ -3,8 +3,10 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
-from itertools import combinations
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any
 
@@ -155,63 +157,252 @@ def prepare_text_data(
     return texts, speaker_labels, time_labels
 
 
+class CoherenceStats:
+    """
+    Document frequencies and co-occurrence counts for PMI coherence.
+
+    Built once from a binary document-term matrix ``B`` (``C = Bᵀ B``) and
+    reused for every topic and every k, instead of re-vectorizing the texts
+    and multiplying sparse columns per word pair.
+    """
+
+    def __init__(self, X, feature_names) -> None:
+        binary = X.tocsr(copy=True).astype(np.float32)
+        binary.data = np.ones_like(binary.data)
+        binary.eliminate_zeros()
+        self.n_documents = binary.shape[0]
+        self.doc_freq = np.asarray(binary.sum(axis=0)).ravel()
+        self.cooccurrence = (binary.T @ binary).tocsr()
+        self.word_to_idx = {word: idx for idx, word in enumerate(feature_names)}
+
+    @classmethod
+    def from_texts(cls, texts: list[str], vectorizer) -> "CoherenceStats":
+        return cls(vectorizer.transform(texts), vectorizer.get_feature_names_out())
+
+    def coherence(self, top_words: list[str]) -> float:
+        """Mean PMI over top-word pairs that co-occur in some document."""
+        indices = [
+            self.word_to_idx[word]
+            for word in dict.fromkeys(top_words)
+            if word in self.word_to_idx and self.doc_freq[self.word_to_idx[word]] > 0
+        ]
+        return self.coherence_indices(indices)
+
+    def coherence_indices(self, indices) -> float:
+        indices = np.asarray(indices, dtype=np.int64)
+        if len(indices) < 2:
+            return 0.0
+        pairs = self.cooccurrence[indices][:, indices].toarray()
+        upper = np.triu_indices(len(indices), k=1)
+        co = pairs[upper]
+        freq = self.doc_freq[indices]
+        expected = freq[upper[0]] * freq[upper[1]]
+        mask = (co > 0) & (expected > 0)
+        if not mask.any():
+            return 0.0
+        pmi = np.log(co[mask] * self.n_documents / expected[mask])
+        return float(np.mean(pmi))
+
+
 def calculate_topic_coherence(
-    top_words: list[str], texts: list[str], vectorizer
+    top_words: list[str],
+    texts: list[str],
+    vectorizer,
+    stats: CoherenceStats | None = None,
 ) -> float:
     """
     Calculate topic coherence using pointwise mutual information.
 
+    PMI uses document frequencies: log(D(w1, w2) * N / (D(w1) * D(w2))),
+    averaged over top-word pairs that co-occur.
+
     Args:
         top_words: Top words for the topic
         texts: All text documents
         vectorizer: Fitted vectorizer for document-term matrix
+        stats: Precomputed co-occurrence statistics for these texts
+            (pass one instance when scoring many topics)
 
     Returns:
         Coherence score (higher is better)
     """
     try:
-        # Get document-term matrix
-        X = vectorizer.transform(texts)
-        feature_names = vectorizer.get_feature_names_out()
+        if stats is None:
+            stats = CoherenceStats.from_texts(texts, vectorizer)
+        return stats.coherence(top_words)
+
+    except Exception as e:
+        print(f"[TOPICS] Warning: Could not calculate coherence: {e}")
+        return 0.0
 
-        # Create word-to-index mapping
-        word_to_idx = {word: idx for idx, word in enumerate(feature_names)}
 
-        # Calculate word frequencies
-        word_freqs = {}
-        for word in top_words:
-            if word in word_to_idx:
-                idx = word_to_idx[word]
-                word_freqs[word] = float(X[:, idx].sum())
+# Below this many documents a process pool costs more than it saves
+_PARALLEL_MIN_DOCUMENTS = 500
+
+_FAILED_K = {
+    "held_out_likelihood": 0.0,
+    "coherence": 0.0,
+    "silhouette": 0.0,
+    "residuals": float("inf"),
+    "perplexity": 0.0,
+}
 
-        if len(word_freqs) < 2:
-            return 0.0
 
-        # Calculate pairwise mutual information
-        coherence_scores = []
-        word_pairs = list(combinations(word_freqs.keys(), 2))
+def _resolve_k_workers(configured: Any, k_count: int) -> int:
+    try:
+        workers = int(configured)
+    except (TypeError, ValueError):
+        workers = 1
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, k_count))
+
+
+def _evaluate_k(
+    k: int,
+    algorithm: str,
+    X_train,
+    X_test,
+    stats: CoherenceStats,
+    model_params: dict[str, Any],
+) -> dict[str, float]:
+    """Fit one topic model and compute its diagnostics (runs in workers)."""
+    from sklearn.decomposition import NMF, LatentDirichletAllocation
+    from sklearn.metrics import silhouette_score
+
+    try:
+        if algorithm == "lda":
+            model = LatentDirichletAllocation(
+                n_components=k,
+                random_state=model_params["random_state"],
+                learning_method=model_params["learning_method"],
+                max_iter=model_params["max_iter"],
+            )
+        else:
+            model = NMF(
+                n_components=k,
+                random_state=model_params["random_state"],
+                alpha_H=model_params["alpha_H"],
+                max_iter=model_params["max_iter"],
+                tol=model_params["tol"],
+                init="nndsvd",  # Better initialization for faster convergence
+            )
+
+        # Fit model
+        doc_topics = model.fit_transform(X_train)
 
-        for word1, word2 in word_pairs:
-            if word1 in word_to_idx and word2 in word_to_idx:
-                idx1, idx2 = word_to_idx[word1], word_to_idx[word2]
+        # 1. Held-out likelihood (log-likelihood on test set)
+        if algorithm == "lda":
+            log_likelihood = model.score(X_test)
+        else:
+            # For NMF, use reconstruction error as proxy
+            test_topics = model.transform(X_test)
+            X_reconstructed = test_topics @ model.components_
+            log_likelihood = -np.mean((X_test.toarray() - X_reconstructed) ** 2)
+
+        # 2. Topic coherence over each topic's top 10 words
+        top_words_idx = np.argsort(model.components_, axis=1)[:, -10:][:, ::-1]
+        coherence = float(
+            np.mean([stats.coherence_indices(idx) for idx in top_words_idx])
+        )
 
-                # Co-occurrence count
-                co_occurrence = (X[:, idx1].multiply(X[:, idx2]) > 0).sum()
+        # 3. Silhouette score (topic separation)
+        dominant_topics = np.argmax(doc_topics, axis=1)
+        silhouette = (
+            silhouette_score(doc_topics, dominant_topics)
+            if k > 1 and len(set(dominant_topics)) > 1
+            else 0.0
+        )
 
-                # Individual frequencies
-                freq1 = word_freqs[word1]
-                freq2 = word_freqs[word2]
+        # 4. Residuals (reconstruction error)
+        X_reconstructed = doc_topics @ model.components_
+        residuals = float(np.mean((X_train.toarray() - X_reconstructed) ** 2))
 
-                # Calculate PMI
-                if co_occurrence > 0 and freq1 > 0 and freq2 > 0:
-                    pmi = np.log((co_occurrence * len(texts)) / (freq1 * freq2))
-                    coherence_scores.append(float(pmi))
+        # 5. Perplexity (for LDA)
+        perplexity = model.perplexity(X_train) if algorithm == "lda" else 0.0
 
-        return float(np.mean(coherence_scores)) if coherence_scores else 0.0
+        return {
+            "held_out_likelihood": float(log_likelihood),
+            "coherence": coherence,
+            "silhouette": float(silhouette),
+            "residuals": residuals,
+            "perplexity": float(perplexity),
+        }
 
     except Exception as e:
-        print(f"[TOPICS] Warning: Could not calculate coherence: {e}")
-        return 0.0
+        print(f"[TOPICS] Warning: Error evaluating k={k}: {e}")
+        return dict(_FAILED_K)
+
+
+def _plateau_index(coherences: list[float], patience: int, tolerance: float) -> int:
+    """Index of the last k to keep, or -1 while coherence is still improving."""
+    if patience <= 0:
+        return -1
+    best = float("-inf")
+    since_best = 0
+    for i, value in enumerate(coherences):
+        if value > best + tolerance:
+            best = value
+            since_best = 0
+        else:
+            since_best += 1
+            if since_best >= patience:
+                return i
+    return -1
+
+
+def _sweep_k(
+    k_values: list[int],
+    evaluate,
+    workers: int,
+    patience: int,
+    tolerance: float,
+) -> list[dict[str, float]]:
+    """
+    Evaluate k values in order, ``workers`` at a time.
+
+    Stops once coherence has not improved by ``tolerance`` for ``patience``
+    consecutive k. Results past the plateau are dropped, so the evaluated
+    range does not depend on the worker count.
+    """
+    results: list[dict[str, float]] = []
+    pool = None
+    if workers > 1:
+        try:
+            # spawn: the pipeline may be running other modules in threads
+            pool = ProcessPoolExecutor(
+                max_workers=workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        except Exception as e:
+            print(f"[TOPICS] Warning: Parallel k sweep unavailable ({e})")
+    try:
+        for start in range(0, len(k_values), workers):
+            wave = k_values[start : start + workers]
+            wave_results = None
+            if pool is not None:
+                try:
+                    wave_results = list(pool.map(evaluate, wave))
+                except Exception as e:
+                    print(
+                        f"[TOPICS] Warning: Parallel k sweep failed ({e}); "
+                        "continuing in-process"
+                    )
+                    pool.shutdown(cancel_futures=True)
+                    pool = None
+            if wave_results is None:
+                wave_results = [evaluate(k) for k in wave]
+            results.extend(wave_results)
+            stop = _plateau_index(
+                [result["coherence"] for result in results], patience, tolerance
+            )
+            if stop >= 0:
+                print(f"[TOPICS] Coherence plateaued at k={k_values[stop]}")
+                return results[: stop + 1]
+    finally:
+        if pool is not None:
+            pool.shutdown(cancel_futures=True)
+    return results
 
 
 def find_optimal_k(
@@ -223,6 +414,10 @@ def find_optimal_k(
     """
     Find optimal number of topics using diagnostic metrics (STM-inspired).
 
+    Candidate k values can be fitted in a process pool (opt-in via
+    ``topic_modeling.k_sweep_workers``) and the sweep stops early once
+    coherence plateaus (``k_plateau_patience``/``k_plateau_tolerance``).
+
     Args:
         texts: List of text documents
         k_range: Range of k values to test (min, max). If None, uses config.
@@ -253,9 +448,7 @@ def find_optimal_k(
         print("[TOPICS] Warning: Insufficient data for optimal k selection")
         return {"optimal_k": min(3, len(texts)), "diagnostics": {}}
 
-    from sklearn.decomposition import NMF, LatentDirichletAllocation
     from sklearn.feature_extraction.text import CountVectorizer, TfidfVectorizer
-    from sklearn.metrics import silhouette_score
     from sklearn.model_selection import train_test_split
 
     # Prepare vectorizer using config
@@ -295,94 +488,49 @@ def find_optimal_k(
     if len(k_values) < 2:
         return {"optimal_k": k_values[0] if k_values else 3, "diagnostics": {}}
 
-    diagnostics = {
-        "k_values": k_values,
-        "held_out_likelihood": [],
-        "coherence_scores": [],
-        "silhouette_scores": [],
-        "residuals": [],
-        "perplexity_scores": [],
-    }
-
     # Split data for held-out likelihood
     X_train, X_test = train_test_split(
         X, test_size=topic_config.test_size, random_state=topic_config.random_state
     )
 
-    for k in k_values:
-        try:
-            if algorithm == "lda":
-                model = LatentDirichletAllocation(
-                    n_components=k,
-                    random_state=topic_config.random_state,
-                    learning_method=topic_config.learning_method,
-                    max_iter=max_iter,
-                )
-            else:
-                model = NMF(
-                    n_components=k,
-                    random_state=topic_config.random_state,
-                    alpha_H=topic_config.alpha_H,
-                    max_iter=max_iter,
-                    tol=topic_config.tol,
-                    init="nndsvd",  # Better initialization for faster convergence
-                )
-
-            # Fit model
-            doc_topics = model.fit_transform(X_train)
-
-            # Calculate diagnostic metrics
-            # 1. Held-out likelihood (log-likelihood on test set)
-            test_topics = model.transform(X_test)
-            if algorithm == "lda":
-                log_likelihood = model.score(X_test)
-            else:
-                # For NMF, use reconstruction error as proxy
-                X_reconstructed = test_topics @ model.components_
-                log_likelihood = -np.mean((X_test.toarray() - X_reconstructed) ** 2)
-
-            diagnostics["held_out_likelihood"].append(float(log_likelihood))
-
-            # 2. Topic coherence
-            coherence_scores = []
-            for topic_idx in range(k):
-                top_words_idx = model.components_[topic_idx].argsort()[-10:][::-1]
-                top_words = [
-                    vectorizer.get_feature_names_out()[i] for i in top_words_idx
-                ]
-                coherence = calculate_topic_coherence(top_words, texts, vectorizer)
-                coherence_scores.append(coherence)
-
-            avg_coherence = float(np.mean(coherence_scores))
-            diagnostics["coherence_scores"].append(avg_coherence)
-
-            # 3. Silhouette score (topic separation)
-            if k > 1:
-                dominant_topics = np.argmax(doc_topics, axis=1)
-                silhouette = silhouette_score(doc_topics, dominant_topics)
-                diagnostics["silhouette_scores"].append(float(silhouette))
-            else:
-                diagnostics["silhouette_scores"].append(0.0)
-
-            # 4. Residuals (reconstruction error)
-            X_reconstructed = doc_topics @ model.components_
-            residuals = float(np.mean((X_train.toarray() - X_reconstructed) ** 2))
-            diagnostics["residuals"].append(residuals)
-
-            # 5. Perplexity (for LDA)
-            if algorithm == "lda":
-                perplexity = model.perplexity(X_train)
-                diagnostics["perplexity_scores"].append(float(perplexity))
-            else:
-                diagnostics["perplexity_scores"].append(0.0)
+    # Co-occurrence statistics shared by every k and topic
+    stats = CoherenceStats(X, vectorizer.get_feature_names_out())
+    evaluate = partial(
+        _evaluate_k,
+        algorithm=algorithm,
+        X_train=X_train,
+        X_test=X_test,
+        stats=stats,
+        model_params={
+            "random_state": topic_config.random_state,
+            "learning_method": topic_config.learning_method,
+            "alpha_H": topic_config.alpha_H,
+            "tol": topic_config.tol,
+            "max_iter": max_iter,
+        },
+    )
+    workers = (
+        _resolve_k_workers(getattr(topic_config, "k_sweep_workers", 1), len(k_values))
+        if len(texts) >= _PARALLEL_MIN_DOCUMENTS
+        else 1
+    )
+    results = _sweep_k(
+        k_values,
+        evaluate,
+        workers,
+        patience=getattr(topic_config, "k_plateau_patience", 0),
+        tolerance=getattr(topic_config, "k_plateau_tolerance", 0.0),
+    )
+    k_values = k_values[: len(results)]
 
-        except Exception as e:
-            print(f"[TOPICS] Warning: Error evaluating k={k}: {e}")
-            diagnostics["held_out_likelihood"].append(0.0)
-            diagnostics["coherence_scores"].append(0.0)
-            diagnostics["silhouette_scores"].append(0.0)
-            diagnostics["residuals"].append(float("inf"))
-            diagnostics["perplexity_scores"].append(0.0)
+    diagnostics = {
+        "k_values": k_values,
+        "held_out_likelihood": [r["held_out_likelihood"] for r in results],
+        "coherence_scores": [r["coherence"] for r in results],
+        "silhouette_scores": [r["silhouette"] for r in results],
+        "residuals": [r["residuals"] for r in results],
+        "perplexity_scores": [r["perplexity"] for r in results],
+    }
 
     # Find optimal k based on diagnostic metrics
     if len(diagnostics["held_out_likelihood"]) > 0:
@@ -185,7 +185,7 @@ def create_diagnostic_plots(
             ax4.set_ylabel("Residuals")
             ax4.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save diagnostic plots
         if output_service:
@@ -253,7 +253,7 @@ def create_discourse_analysis_charts(
             ax1.set_title("Topic Prevalence by Discourse", fontweight="bold")
             ax1.set_xlabel("Topics")
             ax1.set_ylabel("Discourse Phase")
-            plt.colorbar(im1, ax=ax1)
+            fig.colorbar(im1, ax=ax1)
 
         # Plot 2: Topic Confidence by Discourse
         topic_confidence = discourse_analysis.get("topic_confidence", {})
@@ -271,7 +271,7 @@ def create_discourse_analysis_charts(
             ax2.set_title("Topic Confidence by Discourse", fontweight="bold")
             ax2.set_xlabel("Topics")
             ax2.set_ylabel("Discourse Phase")
-            plt.colorbar(im2, ax=ax2)
+            fig.colorbar(im2, ax=ax2)
 
         # Plot 3: Discourse Summary
         discourse_summary = discourse_analysis.get("discourse_summary", {})
@@ -318,7 +318,7 @@ def create_discourse_analysis_charts(
             ax4.set_title("Average Topic Confidence by Discourse", fontweight="bold")
             ax4.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         # Save discourse analysis charts
         if output_service:
@@ -393,7 +393,7 @@ def create_enhanced_global_heatmaps(
         ax.set_xlabel("Words")
         ax.set_ylabel("Topics (with Labels and Coherence)")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if output_service:
             spec = HeatmapMatrixSpec(
@@ -458,7 +458,7 @@ def create_enhanced_global_heatmaps(
         ax.set_xlabel("Words")
         ax.set_ylabel("Topics (with Labels and Coherence)")
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         if output_service:
             spec = HeatmapMatrixSpec(
@@ -562,7 +562,6 @@ def create_speaker_charts(
 
     except Exception as e:
         print(f"[TOPICS] Warning: Could not process speaker topic data: {e}")
-        plt.close("all")  # Close any open figures
 
 
 def create_html_report(html_path, chart_paths):
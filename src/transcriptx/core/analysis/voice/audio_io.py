@@ -1,8 +1,10 @@
 from __future__ import annotations
 
 import hashlib
+import struct
 import subprocess
 import shutil
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Tuple
 
@@ -63,24 +65,34 @@ def compute_audio_fingerprint(path: str, *, strict: bool) -> str:
 
 
 def ensure_cached_wav(
-    audio_path: str, *, cache_dir: Path, sample_rate: int
+    audio_path: str,
+    *,
+    cache_dir: Path,
+    sample_rate: int,
+    mono_pcm: bool = False,
 ) -> Tuple[str, Dict[str, Any]]:
     """
     Ensure we have a seekable (wav) file for segment-level random access.
 
     For mp3/m4a/aac: prefer ffmpeg to cached wav. If ffmpeg missing, fall back to
     librosa full-decode (still returns a cached wav for repeatability).
+
+    With mono_pcm=True the returned file is always an uncompressed mono wav at
+    sample_rate (see wav_layout), so it can be memory-mapped; other wav, flac
+    and ogg sources are converted into the cache as well.
     """
     src = Path(audio_path)
     meta: Dict[str, Any] = {"source_path": str(src), "source_ext": src.suffix.lower()}
     cache_dir.mkdir(parents=True, exist_ok=True)
 
-    if src.suffix.lower() in {".wav"}:
+    if src.suffix.lower() in {".wav"} and (
+        not mono_pcm or wav_layout(str(src), sample_rate=sample_rate) is not None
+    ):
         meta["decoder"] = "soundfile"
         return str(src), meta
 
     # If soundfile can read it seekably (flac/ogg), just use it directly
-    if src.suffix.lower() in SEEKABLE_EXTENSIONS:
+    if src.suffix.lower() in SEEKABLE_EXTENSIONS and not mono_pcm:
         meta["decoder"] = "soundfile"
         return str(src), meta
 
@@ -104,6 +116,8 @@ def ensure_cached_wav(
             "1",
             "-ar",
             str(sample_rate),
+            "-c:a",
+            "pcm_s16le",
             str(target),
         ]
         subprocess.run(cmd, check=True, capture_output=True)
@@ -120,13 +134,128 @@ def ensure_cached_wav(
         "soundfile", "audio decoding for voice features", "voice", auto_install=True
     )
     y, sr = librosa.load(str(src), sr=sample_rate, mono=True)
-    sf.write(str(target), y, sample_rate)
+    sf.write(str(target), y, sample_rate, subtype="PCM_16")
     meta["decoder"] = "librosa"
     meta["cached"] = True
     meta["cached_path"] = str(target)
     return str(target), meta
 
 
+# WAVE format tags with a fixed sample dtype we can memory-map
+_WAV_PCM = 0x0001
+_WAV_IEEE_FLOAT = 0x0003
+_WAV_EXTENSIBLE = 0xFFFE
+
+
+@dataclass(frozen=True)
+class WavLayout:
+    """Location of the sample data of a mono, uncompressed wav file."""
+
+    path: str
+    data_offset: int
+    frames: int
+    sample_rate: int
+    dtype: str  # "<i2" (PCM 16-bit) or "<f4" (IEEE float 32-bit)
+
+    def open(self) -> "np.ndarray":
+        """Read-only memory map over all samples (no data is read up front)."""
+        import numpy as np
+
+        return np.memmap(
+            self.path,
+            dtype=self.dtype,
+            mode="r",
+            offset=self.data_offset,
+            shape=(self.frames,),
+        )
+
+    def read_segment(
+        self,
+        samples: "np.ndarray",
+        *,
+        start_s: float,
+        end_s: float,
+        pad_s: float,
+    ) -> "np.ndarray":
+        """
+        Padded segment from an open memory map as float32.
+
+        Frame bounds and scaling match read_audio_segment on the same file.
+        """
+        import numpy as np
+
+        start_s = max(0.0, float(start_s) - float(pad_s))
+        end_s = max(start_s, float(end_s) + float(pad_s))
+        start_frame = max(0, min(int(start_s * self.sample_rate), self.frames))
+        end_frame = max(start_frame, min(int(end_s * self.sample_rate), self.frames))
+        chunk = samples[start_frame:end_frame]
+        if self.dtype == "<i2":
+            return chunk.astype(np.float32) / np.float32(32768.0)
+        return np.array(chunk, dtype=np.float32)
+
+
+def wav_layout(path: str, *, sample_rate: int) -> WavLayout | None:
+    """
+    Parse a RIFF/WAVE header for memory-mapped access.
+
+    Returns None unless the file is mono 16-bit PCM or 32-bit float at
+    sample_rate; callers then fall back to read_audio_segment.
+    """
+    p = Path(path)
+    try:
+        with p.open("rb") as f:
+            riff = f.read(12)
+            if len(riff) < 12 or riff[:4] != b"RIFF" or riff[8:12] != b"WAVE":
+                return None
+            fmt: Tuple[int, int, int, int] | None = None
+            while True:
+                header = f.read(8)
+                if len(header) < 8:
+                    return None
+                chunk_id, size = header[:4], struct.unpack("<I", header[4:])[0]
+                if chunk_id == b"fmt ":
+                    body = f.read(size)
+                    if len(body) < 16:
+                        return None
+                    tag, channels, rate = struct.unpack("<HHI", body[:8])
+                    bits = struct.unpack("<H", body[14:16])[0]
+                    if tag == _WAV_EXTENSIBLE and len(body) >= 26:
+                        tag = struct.unpack("<H", body[24:26])[0]
+                    fmt = (tag, channels, rate, bits)
+                    if size % 2:
+                        f.seek(1, 1)
+                elif chunk_id == b"data":
+                    if fmt is None:
+                        return None
+                    data_offset = f.tell()
+                    break
+                else:
+                    f.seek(size + (size % 2), 1)
+    except OSError:
+        return None
+
+    tag, channels, rate, bits = fmt
+    if channels != 1 or rate != int(sample_rate):
+        return None
+    if tag == _WAV_PCM and bits == 16:
+        dtype, width = "<i2", 2
+    elif tag == _WAV_IEEE_FLOAT and bits == 32:
+        dtype, width = "<f4", 4
+    else:
+        return None
+    # Trust the file size over the header: streamed writers may leave it unset
+    data_bytes = max(0, p.stat().st_size - data_offset)
+    declared = size if size not in (0, 0xFFFFFFFF) else data_bytes
+    frames = min(declared, data_bytes) // width
+    return WavLayout(
+        path=str(p),
+        data_offset=data_offset,
+        frames=int(frames),
+        sample_rate=int(rate),
+        dtype=dtype,
+    )
+
+
 def read_audio_segment(
     *,
     wav_path: str,
@@ -224,7 +224,10 @@ class ProsodyDashboardAnalysis(AnalysisModule):
 
             voice_cfg = getattr(getattr(get_config(), "analysis", None), "voice", None)
             egemaps_enabled = bool(getattr(voice_cfg, "egemaps_enabled", True))
-            deps = check_voice_optional_deps(egemaps_enabled=egemaps_enabled)
+            deps = check_voice_optional_deps(
+                egemaps_enabled=egemaps_enabled,
+                vad_backend=str(getattr(voice_cfg, "vad_backend", "numpy")),
+            )
             if not deps.get("ok"):
                 payload = {
                     "status": "skipped",
@@ -3,7 +3,6 @@ from __future__ import annotations
 import importlib.util
 from typing import Iterable
 
-
 INSTALL_HINT = "pip install transcriptx[voice]"
 
 
@@ -19,14 +18,19 @@ def _missing_specs(packages: Iterable[str]) -> list[str]:
 
 
 def check_voice_optional_deps(
-    *, egemaps_enabled: bool | None = None, required: list[str] | None = None
+    *,
+    egemaps_enabled: bool | None = None,
+    vad_backend: str | None = None,
+    required: list[str] | None = None,
 ) -> dict:
     """
     Cheap dependency check for voice modules (no heavy imports).
     Returns structured metadata suitable for skip payloads.
     """
     if required is None:
-        required = ["webrtcvad", "librosa", "soundfile"]
+        required = ["librosa", "soundfile"]
+        if vad_backend == "webrtcvad":
+            required.append("webrtcvad")
         if egemaps_enabled:
             required.append("opensmile")
     missing = _missing_specs(required)
@@ -2,20 +2,25 @@ from __future__ import annotations
 
 import hashlib
 import json
+import multiprocessing
+import os
 import shutil
 import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from transcriptx.core.utils.config import get_config  # type: ignore[import-untyped]
 from transcriptx.core.utils.logger import get_logger  # type: ignore[import-untyped]
 from transcriptx.core.utils.artifact_writer import write_json
 
 from .audio_io import (
+    WavLayout,
     compute_audio_fingerprint,
     ensure_cached_wav,
     read_audio_segment,
     resolve_audio_path,
+    wav_layout,
 )
 from .cache import (
     get_voice_cache_root,
@@ -24,6 +29,7 @@ from .cache import (
     save_voice_features,
 )
 from .features import (
+    VadTrack,
     compute_pitch_stats,
     compute_rms_db,
     compute_speech_rate_wps,
@@ -57,6 +63,7 @@ def compute_voice_config_hash(config: Any) -> str:
     payload = {
         "sample_rate": getattr(voice, "sample_rate", 16000),
         "vad_mode": getattr(voice, "vad_mode", 2),
+        "vad_backend": getattr(voice, "vad_backend", "numpy"),
         "pad_s": getattr(voice, "pad_s", 0.15),
         "max_seconds_for_pitch": getattr(voice, "max_seconds_for_pitch", 20.0),
         "egemaps_enabled": getattr(voice, "egemaps_enabled", True),
@@ -86,15 +93,203 @@ def _copy_if_needed(src: Path, dst: Path) -> None:
     shutil.copyfile(src, dst)
 
 
+# (segment_idx, segment_id, speaker, start_s, end_s, text)
+SegmentTask = Tuple[int, str, Any, float, float, str]
+
+
+def _segment_reader(
+    wav_path: str, layout: WavLayout | None, sample_rate: int, pad_s: float
+) -> Callable[[float, float], Any]:
+    """Segment reader over the memory-mapped wav (or per-call soundfile reads)."""
+    if layout is not None:
+        samples = layout.open()
+        return lambda start, end: layout.read_segment(
+            samples, start_s=start, end_s=end, pad_s=pad_s
+        )
+    return lambda start, end: read_audio_segment(
+        wav_path=wav_path,
+        start_s=start,
+        end_s=end,
+        sample_rate=sample_rate,
+        pad_s=pad_s,
+    )
+
+
+def _featurize_chunk(
+    wav_path: str,
+    layout: WavLayout | None,
+    tasks: List[SegmentTask],
+    params: Dict[str, Any],
+    vad_track: VadTrack | None = None,
+) -> List[Tuple[Dict[str, Any], Dict[str, List[float]]]]:
+    """
+    Classic (RMS, VAD runs, pitch, speech rate, eGeMAPS) features for a chunk.
+
+    Module-level so it can run in a worker process. Returns (row, vad_runs)
+    per readable segment, in task order. VAD runs are sliced from vad_track
+    when given, otherwise computed on each segment's samples.
+    """
+    sample_rate = int(params["sample_rate"])
+    pad_s = float(params["pad_s"])
+    vad_backend = str(params.get("vad_backend", "numpy"))
+    read = _segment_reader(wav_path, layout, sample_rate, pad_s)
+    out: List[Tuple[Dict[str, Any], Dict[str, List[float]]]] = []
+    for idx, seg_id, speaker, start, end, text in tasks:
+        try:
+            wave = read(start, end)
+        except Exception:
+            continue
+        duration = float(end - start)
+
+        rms_db = compute_rms_db(wave)
+        if vad_track is not None:
+            voiced_ratio, voiced_runs, silence_runs = vad_track.runs(start, end, pad_s)
+        else:
+            voiced_ratio, voiced_runs, silence_runs = compute_vad_runs(
+                wave, sample_rate, int(params["vad_mode"]), backend=vad_backend
+            )
+        f0_mean, f0_std, f0_range = compute_pitch_stats(
+            wave, sample_rate, max_seconds=float(params["max_pitch"])
+        )
+        speech_rate = compute_speech_rate_wps(text, duration)
+        eg = extract_egemaps(wave, sample_rate) if params["egemaps_enabled"] else {}
+
+        row: Dict[str, Any] = {
+            "segment_idx": idx,
+            "segment_id": seg_id,
+            "speaker": speaker,
+            "start_s": start,
+            "end_s": end,
+            "duration_s": duration,
+            "voiced_ratio": voiced_ratio,
+            "rms_db": rms_db,
+            "f0_mean_hz": f0_mean,
+            "f0_std_hz": f0_std,
+            "f0_range_semitones": f0_range,
+            "speech_rate_wps": speech_rate,
+        }
+        for k, v in eg.items():
+            row[f"eg_{k}"] = v
+        out.append(
+            (row, {"voiced_runs_s": voiced_runs, "silence_runs_s": silence_runs})
+        )
+    return out
+
+
+# Per-worker arguments shared by every chunk, set once by the pool initializer
+_worker_args: Tuple[Any, ...] | None = None
+
+
+def _init_featurize_worker(
+    wav_path: str,
+    layout: WavLayout | None,
+    params: Dict[str, Any],
+    vad_track: VadTrack | None,
+) -> None:
+    """Pool initializer: receive the recording-wide arguments (and VAD) once."""
+    global _worker_args
+    _worker_args = (wav_path, layout, params, vad_track)
+
+
+def _featurize_worker_chunk(
+    tasks: List[SegmentTask],
+) -> List[Tuple[Dict[str, Any], Dict[str, List[float]]]]:
+    wav_path, layout, params, vad_track = _worker_args
+    return _featurize_chunk(wav_path, layout, tasks, params, vad_track)
+
+
+def _resolve_workers(configured: Any, chunk_count: int) -> int:
+    try:
+        workers = int(configured)
+    except (TypeError, ValueError):
+        workers = 1
+    if workers < 0:
+        workers = os.cpu_count() or 1
+    return max(1, min(workers, chunk_count))
+
+
+def featurize_segments(
+    wav_path: str,
+    tasks: List[SegmentTask],
+    params: Dict[str, Any],
+    *,
+    layout: WavLayout | None = None,
+    vad_track: VadTrack | None = None,
+    workers: int = 1,
+    chunk_size: int = 64,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
+) -> List[Tuple[Dict[str, Any], Dict[str, List[float]]]]:
+    """
+    Compute classic voice features for all segment tasks.
+
+    Tasks are split into chunks of ``chunk_size`` segments. With more than one
+    worker the chunks run in a process pool that memory-maps ``layout``;
+    results are reassembled in task order, so output does not depend on the
+    worker count. ``vad_track`` (frame VAD over the whole recording) replaces
+    per-segment VAD. ``progress_callback(done, total, message)`` is called as
+    chunks finish.
+    """
+    chunk_size = max(1, int(chunk_size))
+    chunks = [tasks[i : i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    total = len(tasks)
+    results: Dict[int, List[Tuple[Dict[str, Any], Dict[str, List[float]]]]] = {}
+    done = 0
+
+    def _report(chunk_idx: int) -> None:
+        nonlocal done
+        done += len(chunks[chunk_idx])
+        if progress_callback:
+            progress_callback(done, total, f"Voice features: {done}/{total} segments")
+
+    worker_count = _resolve_workers(workers, len(chunks))
+    if worker_count > 1:
+        try:
+            # spawn: the pipeline may be running other modules in threads.
+            # The VAD track covers the whole recording, so it is sent once per
+            # worker instead of with every chunk.
+            with ProcessPoolExecutor(
+                max_workers=worker_count,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_featurize_worker,
+                initargs=(wav_path, layout, params, vad_track),
+            ) as pool:
+                futures = {
+                    pool.submit(_featurize_worker_chunk, chunk): i
+                    for i, chunk in enumerate(chunks)
+                }
+                for future in as_completed(futures):
+                    chunk_idx = futures[future]
+                    results[chunk_idx] = future.result()
+                    _report(chunk_idx)
+        except Exception as e:
+            logger.warning(
+                f"Parallel voice feature extraction failed ({e}); "
+                "continuing in-process"
+            )
+
+    for chunk_idx, chunk in enumerate(chunks):
+        if chunk_idx in results:
+            continue
+        results[chunk_idx] = _featurize_chunk(
+            wav_path, layout, chunk, params, vad_track
+        )
+        _report(chunk_idx)
+
+    return [item for chunk_idx in range(len(chunks)) for item in results[chunk_idx]]
+
+
 def load_or_compute_voice_features(
     *,
     context: Any,
     output_service: Any,
+    progress_callback: Optional[Callable[[int, int, str], None]] = None,
 ) -> Dict[str, Any]:
     """
     Compute (or reuse cached) per-segment voice features.
 
     Returns a *locator payload* used by downstream modules.
+    progress_callback(done, total, message) reports segments featurized on a
+    cache miss.
     """
     started = time.time()
     cfg = get_config()
@@ -118,6 +313,7 @@ def load_or_compute_voice_features(
 
     sample_rate = int(getattr(voice_cfg, "sample_rate", 16000))
     vad_mode = int(getattr(voice_cfg, "vad_mode", 2))
+    vad_backend = str(getattr(voice_cfg, "vad_backend", "numpy"))
     pad_s = float(getattr(voice_cfg, "pad_s", 0.15))
     max_pitch = float(getattr(voice_cfg, "max_seconds_for_pitch", 20.0))
     egemaps_enabled = bool(getattr(voice_cfg, "egemaps_enabled", True))
@@ -129,6 +325,8 @@ def load_or_compute_voice_features(
     store_parquet = str(getattr(voice_cfg, "store_parquet", "auto"))
     strict_audio_hash = bool(getattr(voice_cfg, "strict_audio_hash", False))
     max_segments_considered = getattr(voice_cfg, "max_segments_considered", None)
+    feature_workers = getattr(voice_cfg, "feature_workers", 1)
+    feature_chunk_size = int(getattr(voice_cfg, "feature_chunk_size", 64))
 
     audio_fingerprint = compute_audio_fingerprint(audio_path, strict=strict_audio_hash)
     segments_hash = compute_segments_timing_hash(segments, transcript_key)
@@ -221,54 +419,79 @@ def load_or_compute_voice_features(
 
     cache_audio_dir = cache_root / "audio"
     seekable_path, decode_meta = ensure_cached_wav(
-        audio_path, cache_dir=cache_audio_dir, sample_rate=sample_rate
+        audio_path,
+        cache_dir=cache_audio_dir,
+        sample_rate=sample_rate,
+        mono_pcm=True,
+    )
+    # Mono wav at sample_rate: every worker maps it instead of seeking,
+    # reading and resampling per segment
+    layout = wav_layout(seekable_path, sample_rate=sample_rate)
+    decode_meta["memory_mapped"] = layout is not None
+    # Frame VAD runs once over the whole recording; segments slice it
+    vad_track = (
+        VadTrack.from_samples(layout.open(), sample_rate, vad_mode, backend=vad_backend)
+        if layout is not None
+        else None
     )
 
-    pd = __import__("pandas")
-    rows: list[dict[str, Any]] = []
-    vad_runs: dict[str, dict[str, list[float]]] = {}
-    deep_available = False
-    deep_errors: list[str] = []
+    tasks: List[SegmentTask] = []
     for idx, seg in enumerate(segments_to_use):
         start = float(seg.get("start", 0.0) or 0.0)
         end = float(seg.get("end", start) or start)
         if end <= start:
             continue
-        speaker = seg.get("speaker")
-        seg_id = resolve_segment_id(seg, transcript_key)
-        duration = float(end - start)
-        text = seg.get("text", "") or ""
-
-        try:
-            wave = read_audio_segment(
-                wav_path=seekable_path,
-                start_s=start,
-                end_s=end,
-                sample_rate=sample_rate,
-                pad_s=pad_s,
+        tasks.append(
+            (
+                idx,
+                resolve_segment_id(seg, transcript_key),
+                seg.get("speaker"),
+                start,
+                end,
+                seg.get("text", "") or "",
             )
-        except Exception:
-            continue
-
-        rms_db = compute_rms_db(wave)
-        voiced_ratio, voiced_runs, silence_runs = compute_vad_runs(
-            wave, sample_rate, vad_mode
-        )
-        vad_runs[str(seg_id)] = {
-            "voiced_runs_s": voiced_runs,
-            "silence_runs_s": silence_runs,
-        }
-        f0_mean, f0_std, f0_range = compute_pitch_stats(
-            wave, sample_rate, max_seconds=max_pitch
         )
-        speech_rate = compute_speech_rate_wps(text, duration)
-        eg = extract_egemaps(wave, sample_rate) if egemaps_enabled else {}
 
-        deep_payload: dict[str, Any] = {}
-        if deep_mode:
+    featurized = featurize_segments(
+        seekable_path,
+        tasks,
+        {
+            "sample_rate": sample_rate,
+            "vad_mode": vad_mode,
+            "vad_backend": vad_backend,
+            "pad_s": pad_s,
+            "max_pitch": max_pitch,
+            "egemaps_enabled": egemaps_enabled,
+        },
+        layout=layout,
+        vad_track=vad_track,
+        workers=feature_workers,
+        chunk_size=feature_chunk_size,
+        progress_callback=progress_callback,
+    )
+    logger.debug(
+        f"Featurized {len(featurized)}/{len(tasks)} voice segments "
+        f"in {time.time() - started:.1f}s"
+    )
+
+    pd = __import__("pandas")
+    rows: list[dict[str, Any]] = []
+    vad_runs: dict[str, dict[str, list[float]]] = {}
+    deep_available = False
+    deep_errors: list[str] = []
+    read_deep = (
+        _segment_reader(seekable_path, layout, sample_rate, pad_s)
+        if deep_mode
+        else None
+    )
+    for row, runs in featurized:
+        vad_runs[str(row["segment_id"])] = runs
+        if read_deep is not None:
+            # Deep models stay in this process (one model load per run)
             try:
                 from .deep import infer_deep_emotion_and_valence
 
+                wave = read_deep(row["start_s"], row["end_s"])
                 deep_payload = infer_deep_emotion_and_valence(
                     wave,
                     sample_rate,
@@ -280,26 +503,9 @@ def load_or_compute_voice_features(
                 # Best-effort: fall back silently to classic proxies
                 deep_errors.append(str(e)[:200])
                 deep_payload = {}
-
-        row: dict[str, Any] = {
-            "segment_idx": idx,
-            "segment_id": seg_id,
-            "speaker": speaker,
-            "start_s": start,
-            "end_s": end,
-            "duration_s": duration,
-            "voiced_ratio": voiced_ratio,
-            "rms_db": rms_db,
-            "f0_mean_hz": f0_mean,
-            "f0_std_hz": f0_std,
-            "f0_range_semitones": f0_range,
-            "speech_rate_wps": speech_rate,
-        }
-        for k, v in eg.items():
-            row[f"eg_{k}"] = v
-        # Deep-mode (optional) columns live in core table (non eg_* prefix)
-        for k, v in (deep_payload or {}).items():
-            row[k] = v
+            # Deep-mode (optional) columns live in core table (non eg_* prefix)
+            for k, v in (deep_payload or {}).items():
+                row[k] = v
         rows.append(row)
 
     df = pd.DataFrame(rows)
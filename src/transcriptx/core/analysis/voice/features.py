@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import Any, Dict, Tuple
 
 import numpy as np
@@ -18,117 +19,232 @@ def compute_rms_db(wave: np.ndarray) -> float | None:
     return float(20.0 * np.log10(rms + 1e-12))
 
 
-def compute_voiced_ratio(
-    wave: np.ndarray, sample_rate: int, vad_mode: int
-) -> float | None:
+FRAME_MS = 20
+_WEBRTC_RATES = {8000, 16000, 32000, 48000}
+
+# Per vad_mode (0 = permissive .. 3 = aggressive), mirroring webrtcvad modes:
+# dB above the noise floor, and the spectral flatness / zero-crossing rate
+# above which a frame counts as noise-like.
+_ENERGY_MARGIN_DB = (3.0, 6.0, 9.0, 12.0)
+_FLATNESS_MAX = (0.6, 0.5, 0.4, 0.3)
+_ZCR_MAX = (0.35, 0.3, 0.25, 0.2)
+_ABS_FLOOR_DB = -55.0
+_FFT_BLOCK_FRAMES = 4096
+
+
+@dataclass(frozen=True)
+class FrameFeatures:
+    """Per-frame features over non-overlapping FRAME_MS frames."""
+
+    energy_db: np.ndarray
+    zcr: np.ndarray
+    flatness: np.ndarray
+
+    def __len__(self) -> int:
+        return int(self.energy_db.shape[0])
+
+
+def frame_length(sample_rate: int, frame_ms: int = FRAME_MS) -> int:
+    return int(sample_rate * frame_ms / 1000)
+
+
+def frame_view(wave: np.ndarray, frame_len: int) -> np.ndarray:
+    """
+    (n_frames, frame_len) strided view of wave; the trailing partial frame is dropped.
+
+    No samples are copied, so this works over memory-mapped recordings.
+    """
+    if frame_len <= 0 or wave is None or len(wave) < frame_len:
+        return np.empty((0, max(frame_len, 0)), dtype=np.float32)
+    windows = np.lib.stride_tricks.sliding_window_view(wave, frame_len)
+    return windows[::frame_len]
+
+
+def _as_float_frames(frames: np.ndarray) -> np.ndarray:
+    if np.issubdtype(frames.dtype, np.integer):
+        return frames.astype(np.float32) / np.float32(32768.0)
+    return frames.astype(np.float32, copy=False)
+
+
+def compute_frame_features(
+    wave: np.ndarray, sample_rate: int, *, frame_ms: int = FRAME_MS
+) -> FrameFeatures:
     """
-    Voice activity ratio using webrtcvad (20ms frames).
+    Energy (dB), zero-crossing rate and spectral flatness for every frame.
 
-    Returns None if webrtcvad is unavailable or sample_rate unsupported.
+    Accepts float audio or raw int16 PCM (e.g. a WavLayout memory map); frames
+    are processed in blocks so whole recordings stay within bounded memory.
     """
+    frames = frame_view(wave, frame_length(sample_rate, frame_ms))
+    n = frames.shape[0]
+    energy_db = np.empty(n, dtype=np.float64)
+    zcr = np.empty(n, dtype=np.float64)
+    flatness = np.empty(n, dtype=np.float64)
+    for lo in range(0, n, _FFT_BLOCK_FRAMES):
+        hi = min(n, lo + _FFT_BLOCK_FRAMES)
+        block = _as_float_frames(frames[lo:hi])
+        power = np.mean(np.square(block, dtype=np.float64), axis=1)
+        energy_db[lo:hi] = 10.0 * np.log10(power + 1e-10)
+        signs = np.signbit(block)
+        zcr[lo:hi] = np.mean(signs[:, 1:] != signs[:, :-1], axis=1)
+        spectrum = np.square(np.abs(np.fft.rfft(block, axis=1))) + 1e-12
+        flatness[lo:hi] = np.exp(np.mean(np.log(spectrum), axis=1)) / np.mean(
+            spectrum, axis=1
+        )
+    return FrameFeatures(energy_db=energy_db, zcr=zcr, flatness=flatness)
+
+
+def classify_frames(features: FrameFeatures, vad_mode: int) -> np.ndarray:
+    """
+    Vectorised speech/silence decision per frame.
+
+    A frame is speech when it is louder than an adaptive threshold (noise floor
+    plus a mode-dependent margin, capped just below the loud frames so fully
+    voiced input stays voiced) and is not both spectrally flat and
+    high-crossing (hiss, broadband noise).
+    """
+    if len(features) == 0:
+        return np.zeros(0, dtype=bool)
+    mode = min(max(int(vad_mode), 0), 3)
+    energy = features.energy_db
+    noise_floor = float(np.percentile(energy, 10))
+    loud_level = float(np.percentile(energy, 95))
+    threshold = max(
+        min(noise_floor + _ENERGY_MARGIN_DB[mode], loud_level - 3.0), _ABS_FLOOR_DB
+    )
+    noise_like = (features.flatness > _FLATNESS_MAX[mode]) & (
+        features.zcr > _ZCR_MAX[mode]
+    )
+    return (energy > threshold) & ~noise_like
+
+
+def _webrtc_frame_flags(
+    wave: np.ndarray, sample_rate: int, vad_mode: int
+) -> np.ndarray | None:
     try:
         webrtcvad = optional_import("webrtcvad", "voice activity detection")
     except ImportError:
         return None
-
-    if sample_rate not in {8000, 16000, 32000, 48000}:
+    if sample_rate not in _WEBRTC_RATES:
         return None
 
     vad = webrtcvad.Vad(int(vad_mode))
-    # Convert float32 [-1,1] to 16-bit PCM bytes
-    pcm = np.clip(wave, -1.0, 1.0)
-    pcm16 = (pcm * 32767.0).astype(np.int16, copy=False)
-    pcm_bytes = pcm16.tobytes()
-
-    frame_ms = 20
-    frame_len = int(sample_rate * frame_ms / 1000)
-    bytes_per_frame = frame_len * 2
-    if bytes_per_frame <= 0:
-        return None
+    frames = frame_view(wave, frame_length(sample_rate))
+    flags = np.zeros(frames.shape[0], dtype=bool)
+    for lo in range(0, frames.shape[0], _FFT_BLOCK_FRAMES):
+        block = np.clip(_as_float_frames(frames[lo : lo + _FFT_BLOCK_FRAMES]), -1, 1)
+        pcm16 = (block * 32767.0).astype(np.int16)
+        for i, frame in enumerate(pcm16):
+            try:
+                flags[lo + i] = vad.is_speech(frame.tobytes(), sample_rate)
+            except Exception:
+                # If VAD throws (rare), treat frame as unvoiced
+                continue
+    return flags
 
-    total = 0
-    voiced = 0
-    for i in range(0, len(pcm_bytes) - bytes_per_frame + 1, bytes_per_frame):
-        frame = pcm_bytes[i : i + bytes_per_frame]
-        total += 1
-        try:
-            if vad.is_speech(frame, sample_rate):
-                voiced += 1
-        except Exception:
-            # If VAD throws (rare), treat frame as unvoiced
-            continue
 
-    if total == 0:
+def compute_frame_vad(
+    wave: np.ndarray, sample_rate: int, vad_mode: int, *, backend: str = "numpy"
+) -> np.ndarray | None:
+    """
+    Speech flags per FRAME_MS frame.
+
+    backend="webrtcvad" uses webrtcvad when it is installed and supports the
+    sample rate, and otherwise falls back to the NumPy classifier.
+    """
+    if backend == "webrtcvad":
+        flags = _webrtc_frame_flags(wave, sample_rate, vad_mode)
+        if flags is not None:
+            return flags
+    if frame_length(sample_rate) <= 0:
         return None
-    return float(voiced / total)
+    return classify_frames(compute_frame_features(wave, sample_rate), vad_mode)
 
 
-def compute_vad_runs(
-    wave: np.ndarray, sample_rate: int, vad_mode: int
+def vad_runs_from_flags(
+    flags: np.ndarray, frame_ms: int = FRAME_MS
 ) -> tuple[float | None, list[float], list[float]]:
+    """Voiced ratio and voiced/silence run lengths (seconds) from frame flags."""
+    flags = np.asarray(flags, dtype=bool)
+    if flags.size == 0:
+        return (None, [], [])
+    bounds = np.flatnonzero(flags[1:] != flags[:-1]) + 1
+    starts = np.concatenate(([0], bounds))
+    lengths = np.diff(np.concatenate((starts, [flags.size])))
+    seconds = (lengths * frame_ms / 1000.0).tolist()
+    voiced = flags[starts]
+    voiced_runs = [s for s, v in zip(seconds, voiced) if v]
+    silence_runs = [s for s, v in zip(seconds, voiced) if not v]
+    return (float(np.count_nonzero(flags) / flags.size), voiced_runs, silence_runs)
+
+
+@dataclass(frozen=True)
+class VadTrack:
     """
-    Compute voiced/silence run lengths (in seconds) and voiced ratio.
+    Frame speech flags for a whole recording, sliced per segment.
+
+    Frames sit on a fixed FRAME_MS grid from t=0; a segment uses the frames
+    that lie entirely within its padded sample range.
     """
-    try:
-        webrtcvad = optional_import("webrtcvad", "voice activity detection")
-    except ImportError:
-        return (None, [], [])
 
-    if sample_rate not in {8000, 16000, 32000, 48000}:
-        return (None, [], [])
+    flags: np.ndarray
+    sample_rate: int
+    frame_ms: int = FRAME_MS
+
+    @classmethod
+    def from_samples(
+        cls,
+        samples: np.ndarray,
+        sample_rate: int,
+        vad_mode: int,
+        *,
+        backend: str = "numpy",
+    ) -> "VadTrack | None":
+        flags = compute_frame_vad(samples, sample_rate, vad_mode, backend=backend)
+        if flags is None:
+            return None
+        return cls(flags=flags, sample_rate=int(sample_rate))
+
+    def segment_flags(self, start_s: float, end_s: float, pad_s: float) -> np.ndarray:
+        frame_len = frame_length(self.sample_rate, self.frame_ms)
+        start_s = max(0.0, float(start_s) - float(pad_s))
+        end_s = max(start_s, float(end_s) + float(pad_s))
+        first = -(-int(start_s * self.sample_rate) // frame_len)
+        last = int(end_s * self.sample_rate) // frame_len
+        return self.flags[first : max(first, last)]
+
+    def runs(
+        self, start_s: float, end_s: float, pad_s: float
+    ) -> tuple[float | None, list[float], list[float]]:
+        return vad_runs_from_flags(
+            self.segment_flags(start_s, end_s, pad_s), self.frame_ms
+        )
 
-    vad = webrtcvad.Vad(int(vad_mode))
-    pcm = np.clip(wave, -1.0, 1.0)
-    pcm16 = (pcm * 32767.0).astype(np.int16, copy=False)
-    pcm_bytes = pcm16.tobytes()
-
-    frame_ms = 20
-    frame_len = int(sample_rate * frame_ms / 1000)
-    bytes_per_frame = frame_len * 2
-    if bytes_per_frame <= 0:
-        return (None, [], [])
 
-    voiced_runs: list[float] = []
-    silence_runs: list[float] = []
-    total_frames = 0
-    voiced_frames = 0
-    current_state: bool | None = None
-    current_len = 0
+def compute_voiced_ratio(
+    wave: np.ndarray, sample_rate: int, vad_mode: int, *, backend: str = "numpy"
+) -> float | None:
+    """
+    Voice activity ratio over 20ms frames.
 
-    for i in range(0, len(pcm_bytes) - bytes_per_frame + 1, bytes_per_frame):
-        frame = pcm_bytes[i : i + bytes_per_frame]
-        total_frames += 1
-        try:
-            is_voiced = bool(vad.is_speech(frame, sample_rate))
-        except Exception:
-            is_voiced = False
-        if is_voiced:
-            voiced_frames += 1
-        if current_state is None:
-            current_state = is_voiced
-            current_len = 1
-            continue
-        if is_voiced == current_state:
-            current_len += 1
-        else:
-            run_seconds = (current_len * frame_ms) / 1000.0
-            if current_state:
-                voiced_runs.append(run_seconds)
-            else:
-                silence_runs.append(run_seconds)
-            current_state = is_voiced
-            current_len = 1
-
-    if current_state is not None and current_len > 0:
-        run_seconds = (current_len * frame_ms) / 1000.0
-        if current_state:
-            voiced_runs.append(run_seconds)
-        else:
-            silence_runs.append(run_seconds)
-
-    if total_frames == 0:
-        return (None, voiced_runs, silence_runs)
-    return (float(voiced_frames / total_frames), voiced_runs, silence_runs)
+    Returns None if the wave is shorter than one frame.
+    """
+    flags = compute_frame_vad(wave, sample_rate, vad_mode, backend=backend)
+    if flags is None or flags.size == 0:
+        return None
+    return float(np.count_nonzero(flags) / flags.size)
+
+
+def compute_vad_runs(
+    wave: np.ndarray, sample_rate: int, vad_mode: int, *, backend: str = "numpy"
+) -> tuple[float | None, list[float], list[float]]:
+    """
+    Compute voiced/silence run lengths (in seconds) and voiced ratio.
+    """
+    flags = compute_frame_vad(wave, sample_rate, vad_mode, backend=backend)
+    if flags is None:
+        return (None, [], [])
+    return vad_runs_from_flags(flags)
 
 
 def compute_pitch_stats(
@@ -46,6 +46,9 @@ class VoiceFeaturesAnalysis(AnalysisModule):
         # Not used; this module runs via run_from_context to access transcript_path/output_dir.
         return {}
 
+    def _log_progress(self, done: int, total: int, message: str) -> None:
+        logger.info(message)
+
     def run_from_context(self, context: Any) -> Dict[str, Any]:
         started_at = now_iso()
         try:
@@ -61,7 +64,10 @@ class VoiceFeaturesAnalysis(AnalysisModule):
 
             voice_cfg = getattr(getattr(get_config(), "analysis", None), "voice", None)
             egemaps_enabled = bool(getattr(voice_cfg, "egemaps_enabled", True))
-            deps = check_voice_optional_deps(egemaps_enabled=egemaps_enabled)
+            deps = check_voice_optional_deps(
+                egemaps_enabled=egemaps_enabled,
+                vad_backend=str(getattr(voice_cfg, "vad_backend", "numpy")),
+            )
             if not deps.get("ok"):
                 payload = {
                     "status": "skipped",
@@ -94,6 +100,7 @@ class VoiceFeaturesAnalysis(AnalysisModule):
             locator = load_or_compute_voice_features(
                 context=context,
                 output_service=output_service,
+                progress_callback=self._log_progress,
             )
 
             # Persist the locator payload (small)
@@ -22,6 +22,8 @@ from scipy.sparse import spmatrix
 from transcriptx.core.analysis.base import AnalysisModule
 from transcriptx.core.analysis.wordclouds.models import WordcloudTerm, WordcloudTerms
 from transcriptx.core.utils.config import get_config
+from transcriptx.core.utils.doc_layer import docs_for_texts
+from transcriptx.core.utils.nlp_runtime import get_nlp_model
 from transcriptx.core.utils.nlp_utils import (
     ALL_STOPWORDS,
     extract_tics_from_text,
@@ -528,14 +530,14 @@ def generate_wordcloud(
     wc = _get_wordcloud_class()(
         width=800, height=400, background_color="white"
     ).generate_from_frequencies(freq)
-    fig = plt.figure(figsize=(10, 5))
+    fig, ax = plt.subplots(figsize=(10, 5))
     chart_path = None
     view_speaker = None if speaker == "wordcloud-ALL" else speaker
     try:
-        plt.imshow(wc, interpolation="bilinear")
-        plt.axis("off")
-        plt.title(title)
-        plt.tight_layout()
+        ax.imshow(wc, interpolation="bilinear")
+        ax.axis("off")
+        ax.set_title(title)
+        fig.tight_layout()
 
         if speaker == "wordcloud-ALL":
             chart_path = save_global_chart(
@@ -636,13 +638,13 @@ def generate_bigram_wordclouds(
         wc = _get_wordcloud_class()(
             width=800, height=400, background_color="white"
         ).generate_from_frequencies(freq)
-        fig = plt.figure(figsize=(10, 5))
+        fig, ax = plt.subplots(figsize=(10, 5))
         chart_path = None
         try:
-            plt.imshow(wc, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(f"{speaker} – Bigrams Only")
-            plt.tight_layout()
+            ax.imshow(wc, interpolation="bilinear")
+            ax.axis("off")
+            ax.set_title(f"{speaker} – Bigrams Only")
+            fig.tight_layout()
             chart_path = save_speaker_chart(
                 fig,
                 output_structure,
@@ -745,13 +747,13 @@ def generate_tfidf_wordclouds(
         wc = _get_wordcloud_class()(
             width=800, height=400, background_color="white"
         ).generate_from_frequencies(freq)
-        fig = plt.figure(figsize=(10, 5))
+        fig, ax = plt.subplots(figsize=(10, 5))
         chart_path = None
         try:
-            plt.imshow(wc, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(f"{speaker} – TF-IDF Keywords")
-            plt.tight_layout()
+            ax.imshow(wc, interpolation="bilinear")
+            ax.axis("off")
+            ax.set_title(f"{speaker} – TF-IDF Keywords")
+            fig.tight_layout()
             chart_path = save_speaker_chart(
                 fig,
                 output_structure,
@@ -802,13 +804,13 @@ def generate_tfidf_wordclouds(
     wc = _get_wordcloud_class()(
         width=800, height=400, background_color="white"
     ).generate_from_frequencies(global_freq)
-    fig = plt.figure(figsize=(10, 5))
+    fig, ax = plt.subplots(figsize=(10, 5))
     chart_path = None
     try:
-        plt.imshow(wc, interpolation="bilinear")
-        plt.axis("off")
-        plt.title("All Speakers – TF-IDF")
-        plt.tight_layout()
+        ax.imshow(wc, interpolation="bilinear")
+        ax.axis("off")
+        ax.set_title("All Speakers – TF-IDF")
+        fig.tight_layout()
         chart_path = save_global_chart(
             fig,
             output_structure,
@@ -892,13 +894,13 @@ def generate_bigram_tfidf_wordclouds(
         wc = _get_wordcloud_class()(
             width=800, height=400, background_color="white"
         ).generate_from_frequencies(freq)
-        fig = plt.figure(figsize=(10, 5))
+        fig, ax = plt.subplots(figsize=(10, 5))
         chart_path = None
         try:
-            plt.imshow(wc, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(f"{speaker} – TF-IDF Bigrams")
-            plt.tight_layout()
+            ax.imshow(wc, interpolation="bilinear")
+            ax.axis("off")
+            ax.set_title(f"{speaker} – TF-IDF Bigrams")
+            fig.tight_layout()
             chart_path = save_speaker_chart(
                 fig,
                 output_structure,
@@ -953,13 +955,13 @@ def generate_bigram_tfidf_wordclouds(
     wc = _get_wordcloud_class()(
         width=800, height=400, background_color="white"
     ).generate_from_frequencies(global_freq)
-    fig = plt.figure(figsize=(10, 5))
+    fig, ax = plt.subplots(figsize=(10, 5))
     chart_path = None
     try:
-        plt.imshow(wc, interpolation="bilinear")
-        plt.axis("off")
-        plt.title("All Speakers – TF-IDF Bigrams")
-        plt.tight_layout()
+        ax.imshow(wc, interpolation="bilinear")
+        ax.axis("off")
+        ax.set_title("All Speakers – TF-IDF Bigrams")
+        fig.tight_layout()
         chart_path = save_global_chart(
             fig,
             output_structure,
@@ -1014,13 +1016,13 @@ def generate_tic_wordclouds(
         wc = _get_wordcloud_class()(
             width=800, height=400, background_color="white"
         ).generate_from_frequencies(freq)
-        fig = plt.figure(figsize=(10, 5))
+        fig, ax = plt.subplots(figsize=(10, 5))
         chart_path = None
         try:
-            plt.imshow(wc, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(f"{speaker} – Verbal Tics")
-            plt.tight_layout()
+            ax.imshow(wc, interpolation="bilinear")
+            ax.axis("off")
+            ax.set_title(f"{speaker} – Verbal Tics")
+            fig.tight_layout()
             chart_path = save_speaker_chart(
                 fig,
                 output_structure,
@@ -1057,6 +1059,26 @@ def generate_tic_wordclouds(
         )
 
 
+def _pos_tokens(texts: list[str], pos_tags: set[str]) -> list[str]:
+    """
+    Lowercased tokens with the given POS tags, stopwords removed.
+
+    Uses the transcript's shared parse-once Doc layer when it covers ``texts``
+    and was parsed with the same (tagging) pipeline; otherwise parses the
+    joined text.
+    """
+    docs = docs_for_texts(texts, nlp=get_nlp_model())
+    if docs is not None:
+        return [
+            token.lower_
+            for doc in docs
+            for token in doc
+            if token.pos_ in pos_tags and token.lower_ not in ALL_STOPWORDS
+        ]
+    doc = nlp(" ".join(texts).lower())
+    return [t.text for t in doc if t.pos_ in pos_tags and t.text not in ALL_STOPWORDS]
+
+
 def generate_pos_wordclouds(
     grouped: dict[str, list[str]], output_structure, base_name: str, pos_filter: str
 ) -> None:
@@ -1067,24 +1089,20 @@ def generate_pos_wordclouds(
     }.get(pos_filter.lower(), set())
 
     for speaker, texts in grouped.items():
-        text = " ".join(texts)
-        doc = nlp(text.lower())
-        tokens = [
-            t.text for t in doc if t.pos_ in pos_tags and t.text not in ALL_STOPWORDS
-        ]
+        tokens = _pos_tokens(texts, pos_tags)
         freq = Counter(tokens)
         if not freq:
             continue
         wc = _get_wordcloud_class()(
             width=800, height=400, background_color="white"
         ).generate_from_frequencies(freq)
-        fig = plt.figure(figsize=(10, 5))
+        fig, ax = plt.subplots(figsize=(10, 5))
         chart_path = None
         try:
-            plt.imshow(wc, interpolation="bilinear")
-            plt.axis("off")
-            plt.title(f"{speaker} – {pos_filter.title()}s")
-            plt.tight_layout()
+            ax.imshow(wc, interpolation="bilinear")
+            ax.axis("off")
+            ax.set_title(f"{speaker} – {pos_filter.title()}s")
+            fig.tight_layout()
             chart_path = save_speaker_chart(
                 fig,
                 output_structure,
@@ -1346,13 +1364,13 @@ def run_all_wordclouds(
                 wc = _get_wordcloud_class()(
                     width=800, height=400, background_color="white"
                 ).generate_from_frequencies(global_freq)
-                fig = plt.figure(figsize=(10, 5))
+                fig, ax = plt.subplots(figsize=(10, 5))
                 chart_path = None
                 try:
-                    plt.imshow(wc, interpolation="bilinear")
-                    plt.axis("off")
-                    plt.title("All Speakers – Bigrams Only")
-                    plt.tight_layout()
+                    ax.imshow(wc, interpolation="bilinear")
+                    ax.axis("off")
+                    ax.set_title("All Speakers – Bigrams Only")
+                    fig.tight_layout()
                     chart_path = save_global_chart(
                         fig,
                         output_structure,
@@ -1433,26 +1451,20 @@ def run_all_wordclouds(
         "adj": {"ADJ"},
     }.items():
         try:
-            all_text = " ".join(" ".join(texts) for texts in grouped.values())
-            doc = nlp(all_text.lower())
-            tokens = [
-                token.text
-                for token in doc
-                if token.pos_ in allowed_tags and token.text not in ALL_STOPWORDS
-            ]
-            global_freq = Counter(tokens)
+            all_texts = [text for texts in grouped.values() for text in texts]
+            global_freq = Counter(_pos_tokens(all_texts, allowed_tags))
 
             if global_freq:
                 wc = _get_wordcloud_class()(
                     width=800, height=400, background_color="white"
                 ).generate_from_frequencies(global_freq)
-                fig = plt.figure(figsize=(10, 5))
+                fig, ax = plt.subplots(figsize=(10, 5))
                 chart_path = None
                 try:
-                    plt.imshow(wc, interpolation="bilinear")
-                    plt.axis("off")
-                    plt.title(f"All Speakers – {pos_filter.title()}s")
-                    plt.tight_layout()
+                    ax.imshow(wc, interpolation="bilinear")
+                    ax.axis("off")
+                    ax.set_title(f"All Speakers – {pos_filter.title()}s")
+                    fig.tight_layout()
                     chart_path = save_global_chart(
                         fig,
                         output_structure,
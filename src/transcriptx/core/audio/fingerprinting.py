@@ -4,11 +4,28 @@ Audio fingerprinting utilities for content-based duplicate detection.
 This module provides functions for generating audio fingerprints and comparing
 audio files to detect duplicates based on actual audio content, not just file size.
 Uses librosa for robust audio feature extraction.
+
+Duplicate detection over large folders avoids recomputing and comparing every
+file pair:
+
+- fingerprints are persisted in a ``FingerprintStore`` keyed by the file's
+  content hash, so unchanged files are never decoded again;
+- candidates are found from a bounded prefix of each file (the first
+  ``DUPLICATE_FINGERPRINT_SECONDS``); only files matching on their prefix
+  are then decoded whole and regrouped, so reported duplicates match on the
+  full file;
+- the 12-dim fingerprints are compared exactly in blocks of matrix products.
+  This is still quadratic in the number of files, with a small constant:
+  mean chroma vectors are non-negative and unrelated files already sit near
+  cosine 0.9, so bucketing (LSH) would not prune candidate pairs.
 """
 
 import hashlib
+import json
+import os
+import threading
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Sequence, Tuple
 import numpy as np
 
 try:
@@ -23,12 +40,16 @@ from transcriptx.core.utils.logger import get_logger, log_error
 
 logger = get_logger()
 
-# Cache for audio fingerprints to avoid recomputing
-_fingerprint_cache: Dict[Path, Optional[np.ndarray]] = {}
+# Cache for audio fingerprints to avoid recomputing, keyed by (path, max_duration)
+_fingerprint_cache: Dict[Tuple[Path, Optional[float]], Optional[np.ndarray]] = {}
+
+# Seconds of audio decoded per file for duplicate detection
+DUPLICATE_FINGERPRINT_SECONDS = 180.0
+FINGERPRINT_STORE_VERSION = 1
 
 
 def compute_audio_fingerprint(
-    file_path: Path, use_cache: bool = True
+    file_path: Path, use_cache: bool = True, max_duration: Optional[float] = None
 ) -> Optional[np.ndarray]:
     """
     Generate an audio fingerprint for a file using librosa's chroma features.
@@ -40,6 +61,8 @@ def compute_audio_fingerprint(
     Args:
         file_path: Path to audio file
         use_cache: Whether to use cached fingerprint if available (default: True)
+        max_duration: Only decode the first max_duration seconds (None = whole
+            file). Files no longer than this get the same fingerprint either way.
 
     Returns:
         numpy array representing the audio fingerprint, or None if computation fails
@@ -56,17 +79,19 @@ def compute_audio_fingerprint(
         return None
 
     # Check cache first
-    if use_cache and file_path in _fingerprint_cache:
-        return _fingerprint_cache[file_path]
+    cache_key = (file_path, max_duration)
+    if use_cache and cache_key in _fingerprint_cache:
+        return _fingerprint_cache[cache_key]
 
     try:
         # Load audio file, normalize to mono and 22050 Hz
-        # This ensures consistent comparison regardless of original format
+        # This ensures consistent comparison regardless of original format.
+        # With max_duration, decoding stops after the prefix.
         y, sr = librosa.load(
             str(file_path),
             sr=22050,  # Standard sample rate for fingerprinting
             mono=True,  # Convert to mono for comparison
-            duration=None,  # Load entire file
+            duration=max_duration,
             res_type="kaiser_best",  # High quality resampling
         )
 
@@ -75,7 +100,7 @@ def compute_audio_fingerprint(
             logger.warning(
                 f"Audio file {file_path.name} is too short for fingerprinting"
             )
-            _fingerprint_cache[file_path] = None
+            _fingerprint_cache[cache_key] = None
             return None
 
         # Compute chroma features using Constant-Q Transform
@@ -88,7 +113,7 @@ def compute_audio_fingerprint(
 
         # Cache the result
         if use_cache:
-            _fingerprint_cache[file_path] = fingerprint
+            _fingerprint_cache[cache_key] = fingerprint
 
         return fingerprint
 
@@ -100,7 +125,7 @@ def compute_audio_fingerprint(
         )
         # Cache None to avoid repeated failed attempts
         if use_cache:
-            _fingerprint_cache[file_path] = None
+            _fingerprint_cache[cache_key] = None
         return None
 
 
@@ -138,40 +163,239 @@ def compare_audio_files(
     if fp1 is None or fp2 is None:
         return False, 0.0
 
-    # Compute cosine similarity
-    # Normalize fingerprints to unit vectors
-    norm1 = np.linalg.norm(fp1)
-    norm2 = np.linalg.norm(fp2)
+    similarity = fingerprint_similarity(fp1, fp2)
+    return similarity >= threshold, similarity
 
-    if norm1 == 0 or norm2 == 0:
-        # One of the fingerprints is all zeros (silence)
-        return False, 0.0
 
-    # Cosine similarity: dot product of normalized vectors
-    similarity = np.dot(fp1 / norm1, fp2 / norm2)
+def _unit_rows(fingerprints: Sequence[np.ndarray]) -> np.ndarray:
+    """Fingerprints as unit-length rows; all-zero (silent) rows stay zero."""
+    matrix = np.asarray(fingerprints, dtype=np.float64)
+    if matrix.ndim != 2:
+        matrix = matrix.reshape(len(fingerprints), -1)
+    norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+    return np.divide(matrix, norms, out=np.zeros_like(matrix), where=norms > 0)
+
 
+def fingerprint_similarity(fp1: np.ndarray, fp2: np.ndarray) -> float:
+    """
+    Cosine similarity between two fingerprints, clamped to [0, 1].
+
+    Returns 0.0 when either fingerprint is all zeros (silence).
+    """
+    unit = _unit_rows([fp1, fp2])
     # Clamp similarity to [0, 1] range (should already be in range, but safety check)
-    similarity = max(0.0, min(1.0, similarity))
+    return float(max(0.0, min(1.0, np.dot(unit[0], unit[1]))))
+
+
+class FingerprintStore:
+    """
+    Persistent duplicate-detection fingerprints keyed by file content hash.
+
+    Content hashes are SHA256 over the file bytes, memoized per path by
+    (size, mtime) so unchanged files are neither re-read nor re-decoded.
+    Fingerprints are stored canonicalized, per ``max_duration``. The store is a
+    JSON file written atomically; ``path=None`` keeps it in memory only.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.RLock()
+        self._fingerprints: Dict[str, List[float]] = {}
+        self._files: Dict[str, Dict[str, Any]] = {}
+        self._dirty = 0
+        if self.path is not None and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+                if data.get("version") == FINGERPRINT_STORE_VERSION:
+                    self._fingerprints = dict(data.get("fingerprints") or {})
+                    self._files = dict(data.get("files") or {})
+            except (OSError, ValueError) as e:
+                logger.warning(
+                    f"Ignoring unreadable fingerprint store {self.path}: {e}"
+                )
+
+    def __len__(self) -> int:
+        return len(self._fingerprints)
+
+    def content_hash(self, file_path: Path) -> str:
+        """SHA256 of the file bytes, reused while size and mtime are unchanged."""
+        stat = file_path.stat()
+        key = str(file_path.resolve())
+        with self._lock:
+            known = self._files.get(key)
+            if (
+                known
+                and known.get("size") == stat.st_size
+                and known.get("mtime_ns") == stat.st_mtime_ns
+            ):
+                return str(known["sha256"])
+        digest = hashlib.sha256()
+        with file_path.open("rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                digest.update(block)
+        sha = digest.hexdigest()
+        with self._lock:
+            self._files[key] = {
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "sha256": sha,
+            }
+            self._dirty += 1
+        return sha
+
+    @staticmethod
+    def _key(content_hash: str, max_duration: Optional[float]) -> str:
+        return (
+            f"{content_hash}:{'full' if max_duration is None else float(max_duration)}"
+        )
 
-    is_duplicate = similarity >= threshold
+    def get(
+        self, content_hash: str, max_duration: Optional[float]
+    ) -> Optional[np.ndarray]:
+        with self._lock:
+            vector = self._fingerprints.get(self._key(content_hash, max_duration))
+        return None if vector is None else np.asarray(vector, dtype=np.float64)
+
+    def put(
+        self, content_hash: str, max_duration: Optional[float], fingerprint: np.ndarray
+    ) -> None:
+        canonical = np.frombuffer(canonicalize_fingerprint(fingerprint), np.float32)
+        with self._lock:
+            self._fingerprints[self._key(content_hash, max_duration)] = [
+                float(v) for v in canonical
+            ]
+            self._dirty += 1
+
+    def fingerprint(
+        self, file_path: Path, max_duration: Optional[float] = None
+    ) -> Optional[np.ndarray]:
+        """Stored fingerprint for file_path, computing and storing it on a miss."""
+        try:
+            sha = self.content_hash(file_path)
+        except OSError as e:
+            logger.warning(f"Cannot read {file_path} for fingerprinting: {e}")
+            return None
+        cached = self.get(sha, max_duration)
+        if cached is not None:
+            return cached
+        fingerprint = compute_audio_fingerprint(
+            file_path, use_cache=False, max_duration=max_duration
+        )
+        if fingerprint is not None:
+            self.put(sha, max_duration, fingerprint)
+        return fingerprint
 
-    return is_duplicate, float(similarity)
+    def save(self) -> None:
+        """Write pending changes (atomic replace)."""
+        if self.path is None:
+            return
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = {
+                "version": FINGERPRINT_STORE_VERSION,
+                "fingerprints": self._fingerprints,
+                "files": self._files,
+            }
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.path.with_name(f"{self.path.name}.{os.getpid()}.tmp")
+            try:
+                tmp.write_text(json.dumps(payload), encoding="utf-8")
+                tmp.replace(self.path)
+                self._dirty = 0
+            except OSError as e:
+                logger.warning(f"Could not save fingerprint store {self.path}: {e}")
+                tmp.unlink(missing_ok=True)
+
+
+_STORE: Optional[FingerprintStore] = None
+_STORE_LOCK = threading.Lock()
+
+
+def get_fingerprint_store() -> FingerprintStore:
+    """Process-wide store under ``DATA_DIR/cache/audio_fingerprints``."""
+    global _STORE
+    with _STORE_LOCK:
+        if _STORE is None:
+            from transcriptx.core.utils.paths import DATA_DIR
+
+            _STORE = FingerprintStore(
+                Path(DATA_DIR) / "cache" / "audio_fingerprints" / "fingerprints.json"
+            )
+        return _STORE
+
+
+def group_duplicate_fingerprints(
+    fingerprints: Dict[Path, np.ndarray],
+    threshold: float = 0.90,
+    block_size: int = 500,
+) -> Dict[Path, List[Path]]:
+    """
+    Duplicate groups among fingerprints, from an exact blocked comparison.
+
+    Each pair is a duplicate when its cosine similarity (as in
+    ``compare_audio_files``) is >= threshold. Similarities are computed
+    ``block_size`` rows at a time against the later fingerprints, so memory
+    stays under ``block_size * len(fingerprints)`` floats. Groups are the
+    transitive closure of duplicate pairs, in input order, keyed by their
+    first file.
+    """
+    files = list(fingerprints)
+    if len(files) < 2:
+        return {}
+    unit = _unit_rows([fingerprints[f] for f in files])
+    block_size = max(1, int(block_size))
+    # Component label per file: the index of its first file. Merging labels
+    # directly avoids listing pairs, which is quadratic when most files match.
+    labels = np.arange(len(files))
+    for start in range(0, len(files), block_size):
+        # Only later files: pairs with earlier ones came up in earlier blocks
+        block = unit[start : start + block_size] @ unit[start:].T
+        np.clip(block, 0.0, 1.0, out=block)
+        for offset, row in enumerate(block >= threshold):
+            i = start + offset
+            neighbours = np.flatnonzero(row[offset + 1 :]) + i + 1
+            if not neighbours.size:
+                continue
+            merged = np.unique(labels[np.append(neighbours, i)])
+            if merged.size > 1:
+                labels[np.isin(labels, merged)] = merged[0]
+
+    groups: Dict[int, List[Path]] = {}
+    for file, label in zip(files, labels.tolist()):
+        groups.setdefault(label, []).append(file)
+    return {
+        group_files[0]: group_files
+        for group_files in groups.values()
+        if len(group_files) > 1
+    }
 
 
 def batch_compare_audio_group(
-    files: List[Path], threshold: float = 0.90, use_cache: bool = True
+    files: List[Path],
+    threshold: float = 0.90,
+    use_cache: bool = True,
+    max_duration: Optional[float] = DUPLICATE_FINGERPRINT_SECONDS,
+    store: Optional[FingerprintStore] = None,
 ) -> Dict[Path, List[Path]]:
     """
     Compare all files in a group and return duplicate groups.
 
-    This function performs pairwise comparison of all files and groups them
-    into duplicate clusters. Files are considered duplicates if they have
-    similarity >= threshold with at least one other file in the group.
+    Fingerprints come from the persistent fingerprint store (computed from the
+    first ``max_duration`` seconds on a miss) and are compared exactly with
+    ``group_duplicate_fingerprints``. Files that match on their prefix are
+    then fingerprinted whole and regrouped, so only full-file duplicates are
+    reported. Files are considered duplicates if they have similarity >=
+    threshold with at least one other file in the group.
 
     Args:
         files: List of file paths to compare
         threshold: Similarity threshold for duplicate detection (default: 0.90)
-        use_cache: Whether to use cached fingerprints (default: True)
+        use_cache: Whether to use (and update) the persistent fingerprint
+            store (default: True)
+        max_duration: Seconds decoded per file before confirmation
+            (None = whole file, no confirmation pass)
+        store: Fingerprint store to use (default: ``get_fingerprint_store()``)
 
     Returns:
         Dictionary mapping each file path to a list of its duplicate file paths.
@@ -188,58 +412,41 @@ def batch_compare_audio_group(
     if len(files) < 2:
         return {}
 
-    # Build similarity matrix
-    similarity_matrix: Dict[Tuple[Path, Path], float] = {}
-    duplicate_pairs: List[Tuple[Path, Path]] = []
-
-    # Compare all pairs
-    for i, file1 in enumerate(files):
-        for file2 in files[i + 1 :]:
-            is_dup, similarity = compare_audio_files(
-                file1, file2, threshold=threshold, use_cache=use_cache
+    if use_cache and store is None:
+        store = get_fingerprint_store()
+    try:
+        fingerprints = _fingerprint_files(files, store, max_duration)
+        groups = group_duplicate_fingerprints(fingerprints, threshold=threshold)
+        if max_duration is not None and groups:
+            # Prefix matches are only candidates: confirm them on whole files
+            candidates = [file for group in groups.values() for file in group]
+            fingerprints = _fingerprint_files(candidates, store, None)
+            groups = group_duplicate_fingerprints(fingerprints, threshold=threshold)
+    finally:
+        if store is not None:
+            store.save()
+    return groups
+
+
+def _fingerprint_files(
+    files: Sequence[Path],
+    store: Optional[FingerprintStore],
+    max_duration: Optional[float],
+) -> Dict[Path, np.ndarray]:
+    fingerprints: Dict[Path, np.ndarray] = {}
+    for n, file in enumerate(files, start=1):
+        if store is not None:
+            fp = store.fingerprint(file, max_duration=max_duration)
+        else:
+            fp = compute_audio_fingerprint(
+                file, use_cache=False, max_duration=max_duration
             )
-            similarity_matrix[(file1, file2)] = similarity
-
-            if is_dup:
-                duplicate_pairs.append((file1, file2))
-
-    # Build duplicate groups using union-find approach
-    # Each file maps to its "representative" (root of its group)
-    parent: Dict[Path, Path] = {f: f for f in files}
-
-    def find_root(file: Path) -> Path:
-        """Find the root representative of a file's group."""
-        if parent[file] != file:
-            parent[file] = find_root(parent[file])  # Path compression
-        return parent[file]
-
-    def union(file1: Path, file2: Path):
-        """Merge two files into the same group."""
-        root1 = find_root(file1)
-        root2 = find_root(file2)
-        if root1 != root2:
-            parent[root2] = root1
-
-    # Union all duplicate pairs
-    for file1, file2 in duplicate_pairs:
-        union(file1, file2)
-
-    # Build result: group files by their root representative
-    groups: Dict[Path, List[Path]] = {}
-    for file in files:
-        root = find_root(file)
-        if root not in groups:
-            groups[root] = []
-        groups[root].append(file)
-
-    # Only return groups with 2+ files (actual duplicates)
-    duplicate_groups: Dict[Path, List[Path]] = {}
-    for root, group_files in groups.items():
-        if len(group_files) > 1:
-            # Use the first file as the key (arbitrary but consistent)
-            duplicate_groups[group_files[0]] = group_files
-
-    return duplicate_groups
+        if fp is not None:
+            fingerprints[file] = fp
+        if store is not None and n % 100 == 0:
+            # Long scans keep their progress if interrupted
+            store.save()
+    return fingerprints
 
 
 def clear_fingerprint_cache():
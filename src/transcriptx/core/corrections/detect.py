@@ -6,6 +6,7 @@ from hashlib import sha1
 from typing import Dict, Iterable, List, Optional, Tuple
 
 from transcriptx.core.corrections.models import Candidate, CorrectionRule, Occurrence
+from transcriptx.core.corrections.similarity import TokenSimilarityIndex
 from transcriptx.utils.text_utils import is_named_speaker
 
 
@@ -46,23 +47,6 @@ def _build_snippet(text: str, span: Tuple[int, int], window: int = 40) -> str:
     return text[start:end].strip()
 
 
-def _iter_matches(text: str, pattern: re.Pattern) -> Iterable[Tuple[int, int, str]]:
-    for match in pattern.finditer(text):
-        yield match.start(), match.end(), match.group(0)
-
-
-def _compile_pattern(
-    wrong: str, case_sensitive: bool, word_boundary: bool
-) -> re.Pattern:
-    flags = 0 if case_sensitive else re.IGNORECASE
-    escaped = re.escape(wrong)
-    if word_boundary:
-        regex = rf"\b{escaped}\b"
-    else:
-        regex = escaped
-    return re.compile(regex, flags=flags)
-
-
 def _acronym_variants(value: str) -> List[str]:
     letters = re.sub(r"[^A-Za-z]", "", value)
     if not letters:
@@ -77,54 +61,45 @@ def detect_memory_hits(
     transcript_key: str,
     rules: Iterable[CorrectionRule],
 ) -> List[Candidate]:
-    candidates: List[Candidate] = []
-    for rule in rules:
-        occurrences: List[Occurrence] = []
-        for wrong in rule.wrong:
-            if rule.type == "regex":
-                flags = (
-                    0
-                    if rule.conditions and rule.conditions.case_sensitive
-                    else re.IGNORECASE
-                )
-                pattern = re.compile(wrong, flags=flags)
-                match_iter = _iter_matches
-            elif rule.type == "acronym":
-                variants = _acronym_variants(wrong)
-                if not variants:
-                    continue
-                flags = re.IGNORECASE
-                pattern = re.compile(
-                    "|".join(re.escape(v) for v in variants), flags=flags
-                )
-                match_iter = _iter_matches
-            else:
-                case_sensitive = (
-                    rule.conditions.case_sensitive if rule.conditions else False
-                )
-                word_boundary = (
-                    rule.conditions.word_boundary if rule.conditions else True
+    from transcriptx.core.corrections.matcher import get_correction_matcher
+
+    rules = list(rules)
+    if not rules:
+        return []
+    matcher = get_correction_matcher(rules)
+
+    # Group id -> occurrences, in segment then text order
+    hits: Dict[int, List[Occurrence]] = {}
+    for seg_idx, segment in enumerate(segments):
+        text = segment.get("text", "")
+        spans_by_group = matcher.scan(text)
+        if not spans_by_group:
+            continue
+        segment_id = resolve_segment_id(segment, transcript_key, segment_index=seg_idx)
+        speaker = segment.get("speaker")
+        time_start = segment.get("start", segment.get("start_time"))
+        time_end = segment.get("end", segment.get("end_time"))
+        for group, spans in spans_by_group.items():
+            hits.setdefault(group, []).extend(
+                Occurrence(
+                    segment_id=segment_id,
+                    speaker=speaker,
+                    time_start=time_start,
+                    time_end=time_end,
+                    span=span,
+                    snippet=_build_snippet(text, span),
                 )
-                pattern = _compile_pattern(wrong, case_sensitive, word_boundary)
-                match_iter = _iter_matches
-
-            for seg_idx, segment in enumerate(segments):
-                text = segment.get("text", "")
-                for start, end, matched in match_iter(text, pattern):
-                    segment_id = resolve_segment_id(
-                        segment, transcript_key, segment_index=seg_idx
-                    )
-                    occurrences.append(
-                        Occurrence(
-                            segment_id=segment_id,
-                            speaker=segment.get("speaker"),
-                            time_start=segment.get("start", segment.get("start_time")),
-                            time_end=segment.get("end", segment.get("end_time")),
-                            span=(start, end),
-                            snippet=_build_snippet(text, (start, end)),
-                        )
-                    )
+                for span in spans
+            )
+
+    occurrences_by_rule: Dict[int, List[Occurrence]] = {}
+    for group, (rule_idx, _wrong_idx) in enumerate(matcher.groups):
+        if group in hits:
+            occurrences_by_rule.setdefault(rule_idx, []).extend(hits[group])
 
+    candidates: List[Candidate] = []
+    for rule_idx, rule in enumerate(rules):
+        occurrences = occurrences_by_rule.get(rule_idx)
         if occurrences:
             candidates.append(
                 Candidate(
@@ -296,35 +271,30 @@ def detect_consistency_candidates(
         return True
 
     tokens = [t for t in counts.keys() if keep_token(t)]
-    # Bucket by length for cheaper comparison
-    by_len: Dict[int, List[str]] = {}
-    for t in tokens:
-        by_len.setdefault(len(t), []).append(t)
+    # Only pairs within ±2 characters that can reach the threshold
+    index = TokenSimilarityIndex(
+        [t.lower() for t in tokens], similarity_threshold, max_length_difference=2
+    )
 
     candidates: List[Candidate] = []
-    for i, token in enumerate(tokens):
-        for other in tokens[i + 1 :]:  # halve: one direction per pair
-            if token == other:
-                continue
-            dominant = token if counts[token] >= counts[other] else other
-            minority = other if dominant == token else token
-            if counts[dominant] < 3 or counts[minority] < 1:
-                continue
-            # Optional: only compare within length bucket ±2
-            if abs(len(dominant) - len(minority)) > 2:
-                continue
-            score = SequenceMatcher(None, dominant.lower(), minority.lower()).ratio()
-            if score < similarity_threshold:
-                continue
-            candidates.append(
-                Candidate(
-                    proposed_wrong=minority,
-                    proposed_right=dominant,
-                    kind="consistency",
-                    confidence=score,
-                    occurrences=occurrences_map.get(minority, []),
-                )
+    for i, j in index.pairs():  # i < j: one direction per pair
+        token, other = tokens[i], tokens[j]
+        dominant = token if counts[token] >= counts[other] else other
+        minority = other if dominant == token else token
+        if counts[dominant] < 3 or counts[minority] < 1:
+            continue
+        score = SequenceMatcher(None, dominant.lower(), minority.lower()).ratio()
+        if score < similarity_threshold:
+            continue
+        candidates.append(
+            Candidate(
+                proposed_wrong=minority,
+                proposed_right=dominant,
+                kind="consistency",
+                confidence=score,
+                occurrences=occurrences_map.get(minority, []),
             )
+        )
     return candidates
 
 
@@ -340,6 +310,11 @@ def detect_fuzzy_candidates(
 
     candidates: List[Candidate] = []
     names = [name for name in speaker_names if is_named_speaker(name)]
+    # Names within ±2 characters that can reach the threshold, per token
+    index = TokenSimilarityIndex(
+        [name.lower() for name in names], similarity_threshold, max_length_difference=2
+    )
+    matches_by_token: Dict[str, List[Tuple[str, float]]] = {}
     for seg_idx, segment in enumerate(segments):
         text = segment.get("text", "")
         segment_id = resolve_segment_id(segment, transcript_key, segment_index=seg_idx)
@@ -348,16 +323,21 @@ def detect_fuzzy_candidates(
             token = match.group(0)
             start, end = match.start(), match.end()
             token_lower = token.lower()
-            # Prune: compare only to names with same first letter and length ±2
-            for name in names:
-                name_lower = name.lower()
-                if abs(len(token_lower) - len(name_lower)) > 2:
-                    continue
-                if token_lower[0] != name_lower[0]:
-                    continue
-                score = SequenceMatcher(None, token_lower, name_lower).ratio()
-                if score < similarity_threshold or token_lower == name_lower:
-                    continue
+            matches = matches_by_token.get(token_lower)
+            if matches is None:
+                matches = []
+                for name_idx in sorted(index.candidates(token_lower)):
+                    name = names[name_idx]
+                    name_lower = name.lower()
+                    # Prune: compare only to names with the same first letter
+                    if token_lower[0] != name_lower[0]:
+                        continue
+                    score = SequenceMatcher(None, token_lower, name_lower).ratio()
+                    if score < similarity_threshold or token_lower == name_lower:
+                        continue
+                    matches.append((name, score))
+                matches_by_token[token_lower] = matches
+            for name, score in matches:
                 occurrences = [
                     Occurrence(
                         segment_id=segment_id,
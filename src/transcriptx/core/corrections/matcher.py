@@ -0,0 +1,459 @@
+"""
+Compiled matcher for correction-memory rules.
+
+``detect_memory_hits`` used to compile one pattern per rule and wrong variant
+and run it over every segment, so a memory of R variants cost R regex scans
+of the whole transcript. A ``CorrectionMatcher`` is compiled once per rule
+set instead:
+
+- token, phrase and acronym variants are literals and go into Aho-Corasick
+  automata (one over lowercased text for case-insensitive rules, one over the
+  raw text for case-sensitive rules), so each segment is walked once and every
+  hit is attributed back to its rule and wrong variant;
+- regex rules are gated by one combined alternation; only segments where it
+  matches run the individual rule patterns.
+
+Hits are then filtered to what the per-rule patterns would have returned:
+``\\b`` word boundaries where the rule asks for them and leftmost,
+non-overlapping matches per wrong variant (earlier acronym variants win ties,
+as in the original alternation).
+
+Matchers are cached in memory and as JSON under ``DATA_DIR/cache/corrections``,
+keyed by a hash of the rules' matching fields (the rule-set version), so a
+memory is compiled once and later runs load it. Every edit to a memory makes
+a new version, so only the ``_MAX_CACHED_MATCHERS`` most recently used files
+are kept on disk.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from transcriptx.core.corrections.models import CorrectionRule
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+MATCHER_VERSION = 1
+
+# Characters that re.IGNORECASE folds onto ASCII letters but str.lower() does
+# not (or not length-preserving); segments containing them use the regexes.
+_UNSAFE_FOLDS = frozenset("\u0130\u0131\u017f\u212a")
+
+# Regex features that change meaning once patterns share one alternation
+_GROUP_REFERENCE = re.compile(r"\\[1-9]|\(\?P=|\(\?\(")
+
+_MAX_CACHED_MATCHERS = 8
+
+
+def get_corrections_cache_root() -> Path:
+    from transcriptx.core.utils.paths import DATA_DIR
+
+    root = Path(DATA_DIR) / "cache" / "corrections"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def _evict_matcher_files(root: Path, keep: int = _MAX_CACHED_MATCHERS) -> None:
+    """Delete all but the ``keep`` most recently used matcher files."""
+    files = []
+    for path in root.glob("matcher-*.json"):
+        try:
+            files.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue  # Evicted by another process
+    files.sort(reverse=True)
+    for _, path in files[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _is_word(char: str) -> bool:
+    # Same definition as \w for str patterns
+    return char.isalnum() or char == "_"
+
+
+def _is_boundary(text: str, pos: int) -> bool:
+    before = pos > 0 and _is_word(text[pos - 1])
+    after = pos < len(text) and _is_word(text[pos])
+    return before != after
+
+
+class _Automaton:
+    """Aho-Corasick automaton over a list of non-empty keys."""
+
+    def __init__(
+        self,
+        goto: List[Dict[str, int]],
+        fail: List[int],
+        out: List[List[int]],
+        lengths: List[int],
+    ) -> None:
+        self.goto = goto
+        self.fail = fail
+        self.out = out
+        self.lengths = lengths
+
+    @classmethod
+    def build(cls, keys: Sequence[str]) -> "_Automaton":
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for key_id, key in enumerate(keys):
+            state = 0
+            for char in key:
+                nxt = goto[state].get(char)
+                if nxt is None:
+                    nxt = goto[state][char] = len(goto)
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(key_id)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, nxt in goto[state].items():
+                queue.append(nxt)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                fail[nxt] = goto[link].get(char, 0) if state else 0
+                out[nxt] = out[nxt] + out[fail[nxt]]
+        return cls(goto, fail, out, [len(key) for key in keys])
+
+    def __bool__(self) -> bool:
+        return bool(self.lengths)
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int]]:
+        """Yield (key id, start) for every occurrence, overlaps included."""
+        goto, fail, out, lengths = self.goto, self.fail, self.out, self.lengths
+        state = 0
+        for pos, char in enumerate(text):
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            for key_id in out[state]:
+                yield key_id, pos + 1 - lengths[key_id]
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "goto": self.goto,
+            "fail": self.fail,
+            "out": self.out,
+            "lengths": self.lengths,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "_Automaton":
+        return cls(data["goto"], data["fail"], data["out"], data["lengths"])
+
+
+def _literal_regex(wrong: str, word_boundary: bool) -> str:
+    escaped = re.escape(wrong)
+    return rf"\b{escaped}\b" if word_boundary else escaped
+
+
+def rule_set_version(rules: Sequence[CorrectionRule]) -> str:
+    """Hash of everything about ``rules`` that affects matching."""
+    payload = [
+        rule.model_dump(include={"id", "type", "wrong", "conditions"}, mode="json")
+        for rule in rules
+    ]
+    encoded = json.dumps([MATCHER_VERSION, payload], sort_keys=True)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+class CorrectionMatcher:
+    """
+    All wrong variants of a rule set, matched in one pass per segment.
+
+    Each (rule, wrong variant) pair is a group; ``scan`` returns the spans per
+    group that the variant's own pattern would have found.
+    """
+
+    def __init__(
+        self,
+        version: str,
+        groups: List[Tuple[int, int]],
+        literals: List[Tuple[int, int, bool]],
+        sensitive: _Automaton,
+        sensitive_literals: List[int],
+        insensitive: _Automaton,
+        insensitive_literals: List[int],
+        group_regexes: Dict[int, Tuple[str, int]],
+        regex_groups: List[int],
+    ) -> None:
+        self.version = version
+        # group id -> (rule index, wrong index)
+        self.groups = groups
+        # literal id -> (group id, variant order, word boundary)
+        self.literals = literals
+        self._sensitive = sensitive
+        self._sensitive_literals = sensitive_literals
+        self._insensitive = insensitive
+        self._insensitive_literals = insensitive_literals
+        # group id -> (pattern, flags) the group is equivalent to
+        self._group_regexes = group_regexes
+        # Groups always scanned with their regex (regex rules, odd literals)
+        self._regex_groups = regex_groups
+        self._insensitive_groups = sorted(
+            {literals[i][0] for i in insensitive_literals}
+        )
+        # Compiled on first use; most literal groups never need their regex
+        self._compiled: Dict[int, re.Pattern] = {}
+
+        # Regex-rule groups that can share one alternation as a gate
+        gated = [
+            group
+            for group in regex_groups
+            if not _GROUP_REFERENCE.search(group_regexes[group][0])
+        ]
+        self._gate: Optional[re.Pattern] = None
+        if gated:
+            try:
+                self._gate = re.compile(
+                    "|".join(
+                        f"(?i:{pattern})" if flags & re.IGNORECASE else f"(?:{pattern})"
+                        for pattern, flags in (group_regexes[g] for g in gated)
+                    )
+                )
+            except re.error:
+                gated = []
+        self._gated_groups = gated
+        self._ungated_groups = [g for g in regex_groups if g not in gated]
+
+    @classmethod
+    def build(cls, rules: Sequence[CorrectionRule]) -> "CorrectionMatcher":
+        # Imported here: detect.py imports this module
+        from transcriptx.core.corrections.detect import _acronym_variants
+
+        groups: List[Tuple[int, int]] = []
+        literals: List[Tuple[int, int, bool]] = []
+        sensitive_keys: List[str] = []
+        sensitive_literals: List[int] = []
+        insensitive_keys: List[str] = []
+        insensitive_literals: List[int] = []
+        group_regexes: Dict[int, Tuple[str, int]] = {}
+        regex_groups: List[int] = []
+
+        def add_literal(group: int, order: int, key: str, boundary: bool, cs: bool):
+            literals.append((group, order, boundary))
+            if cs:
+                sensitive_keys.append(key)
+                sensitive_literals.append(len(literals) - 1)
+            else:
+                insensitive_keys.append(key.lower())
+                insensitive_literals.append(len(literals) - 1)
+
+        for rule_idx, rule in enumerate(rules):
+            conditions = rule.conditions
+            for wrong_idx, wrong in enumerate(rule.wrong):
+                group = len(groups)
+                if rule.type == "regex":
+                    flags = (
+                        0 if conditions and conditions.case_sensitive else re.IGNORECASE
+                    )
+                    # Compile now so invalid patterns fail like they used to
+                    re.compile(wrong, flags)
+                    groups.append((rule_idx, wrong_idx))
+                    group_regexes[group] = (wrong, flags)
+                    regex_groups.append(group)
+                elif rule.type == "acronym":
+                    variants = _acronym_variants(wrong)
+                    if not variants:
+                        continue
+                    groups.append((rule_idx, wrong_idx))
+                    group_regexes[group] = (
+                        "|".join(re.escape(v) for v in variants),
+                        re.IGNORECASE,
+                    )
+                    for order, variant in enumerate(variants):
+                        add_literal(group, order, variant, False, False)
+                else:
+                    case_sensitive = conditions.case_sensitive if conditions else False
+                    word_boundary = conditions.word_boundary if conditions else True
+                    groups.append((rule_idx, wrong_idx))
+                    group_regexes[group] = (
+                        _literal_regex(wrong, word_boundary),
+                        0 if case_sensitive else re.IGNORECASE,
+                    )
+                    if not wrong or not (case_sensitive or wrong.isascii()):
+                        # Empty patterns and non-ASCII case folding stay regexes
+                        regex_groups.append(group)
+                    else:
+                        add_literal(group, 0, wrong, word_boundary, case_sensitive)
+
+        return cls(
+            rule_set_version(rules),
+            groups,
+            literals,
+            _Automaton.build(sensitive_keys),
+            sensitive_literals,
+            _Automaton.build(insensitive_keys),
+            insensitive_literals,
+            group_regexes,
+            regex_groups,
+        )
+
+    # ------------------------------------------------------------------
+
+    def scan(self, text: str) -> Dict[int, List[Tuple[int, int]]]:
+        """
+        Match every group against one segment text.
+
+        Returns:
+            Group id -> (start, end) spans, in text order
+        """
+        hits: Dict[int, List[Tuple[int, int, int]]] = {}
+        literals = self.literals
+
+        def collect(automaton, literal_ids, haystack):
+            for key_id, start in automaton.iter_matches(haystack):
+                literal = literal_ids[key_id]
+                group, order, boundary = literals[literal]
+                end = start + automaton.lengths[key_id]
+                if boundary and not (
+                    _is_boundary(text, start) and _is_boundary(text, end)
+                ):
+                    continue
+                hits.setdefault(group, []).append((start, order, end))
+
+        if self._sensitive:
+            collect(self._sensitive, self._sensitive_literals, text)
+
+        spans: Dict[int, List[Tuple[int, int]]] = {}
+        if self._insensitive:
+            lowered = text.lower()
+            if len(lowered) == len(text) and _UNSAFE_FOLDS.isdisjoint(text):
+                collect(self._insensitive, self._insensitive_literals, lowered)
+            else:
+                for group in self._insensitive_groups:
+                    self._scan_regex(group, text, spans)
+
+        for group, found in hits.items():
+            # Leftmost non-overlapping, like finditer over the group's pattern
+            found.sort()
+            kept: List[Tuple[int, int]] = []
+            last_end = 0
+            for start, _order, end in found:
+                if start >= last_end:
+                    kept.append((start, end))
+                    last_end = end
+            spans[group] = kept
+
+        for group in self._ungated_groups:
+            self._scan_regex(group, text, spans)
+        if self._gate is not None and self._gate.search(text):
+            for group in self._gated_groups:
+                self._scan_regex(group, text, spans)
+        return spans
+
+    def _scan_regex(
+        self, group: int, text: str, spans: Dict[int, List[Tuple[int, int]]]
+    ) -> None:
+        pattern = self._compiled.get(group)
+        if pattern is None:
+            pattern = self._compiled[group] = re.compile(*self._group_regexes[group])
+        found = [m.span() for m in pattern.finditer(text)]
+        if found:
+            spans[group] = found
+
+    # ------------------------------------------------------------------
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "matcher_version": MATCHER_VERSION,
+            "version": self.version,
+            "groups": self.groups,
+            "literals": self.literals,
+            "sensitive": self._sensitive.to_dict(),
+            "sensitive_literals": self._sensitive_literals,
+            "insensitive": self._insensitive.to_dict(),
+            "insensitive_literals": self._insensitive_literals,
+            "group_regexes": [[g, p, f] for g, (p, f) in self._group_regexes.items()],
+            "regex_groups": self._regex_groups,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CorrectionMatcher":
+        return cls(
+            data["version"],
+            [tuple(group) for group in data["groups"]],
+            [tuple(literal) for literal in data["literals"]],
+            _Automaton.from_dict(data["sensitive"]),
+            data["sensitive_literals"],
+            _Automaton.from_dict(data["insensitive"]),
+            data["insensitive_literals"],
+            {g: (p, f) for g, p, f in data["group_regexes"]},
+            data["regex_groups"],
+        )
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp")
+        tmp_path.write_text(json.dumps(self.to_dict()), encoding="utf-8")
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["CorrectionMatcher"]:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("matcher_version") != MATCHER_VERSION:
+                return None
+            return cls.from_dict(data)
+        except (OSError, KeyError, TypeError, ValueError, re.error) as e:
+            logger.debug(f"Ignoring unreadable correction matcher {path}: {e}")
+            return None
+
+
+_matchers: Dict[str, CorrectionMatcher] = {}
+_matchers_lock = threading.Lock()
+
+
+def get_correction_matcher(rules: Sequence[CorrectionRule]) -> CorrectionMatcher:
+    """
+    Compiled matcher for ``rules``, from memory, disk or a fresh build.
+
+    The matcher refers to rules by position, so callers must pass the same
+    sequence (in the same order) when reading its groups.
+    """
+    version = rule_set_version(rules)
+    with _matchers_lock:
+        matcher = _matchers.get(version)
+        if matcher is not None:
+            return matcher
+
+        path = None
+        try:
+            path = get_corrections_cache_root() / f"matcher-{version[:32]}.json"
+        except OSError as e:
+            logger.debug(f"Correction matcher cache unavailable: {e}")
+        if path is not None and path.exists():
+            matcher = CorrectionMatcher.load(path)
+            if matcher is not None:
+                try:
+                    os.utime(path)  # Most recently used
+                except OSError:
+                    pass
+        if matcher is None or matcher.version != version:
+            matcher = CorrectionMatcher.build(rules)
+            if path is not None:
+                try:
+                    matcher.save(path)
+                    _evict_matcher_files(path.parent)
+                except OSError as e:
+                    logger.debug(f"Could not save correction matcher: {e}")
+
+        if len(_matchers) >= _MAX_CACHED_MATCHERS:
+            _matchers.pop(next(iter(_matchers)))
+        _matchers[version] = matcher
+        return matcher
@@ -0,0 +1,132 @@
+"""
+Candidate generation for near-duplicate tokens.
+
+The consistency and fuzzy detectors keep pairs whose
+``SequenceMatcher.ratio()`` reaches a threshold. Comparing every pair is
+quadratic in the vocabulary, so ``TokenSimilarityIndex`` only proposes pairs
+that can reach it, and callers verify those with ``SequenceMatcher``.
+
+The filter is exact (it never drops a qualifying pair):
+
+- ``ratio = 2M / (la + lb)`` and the matched characters M are a common
+  subsequence, so ``ratio >= t`` implies an insert/delete distance of at most
+  ``tau = floor((1 - t) * (la + lb))``.
+- Cut a token of length ``ls`` into ``tau + 1`` segments. ``tau`` edits touch
+  at most ``tau`` of them, so one segment reappears unchanged in the other
+  token. For some such segment i (0-based) at most i edits fall to its left
+  and at most ``tau - i`` to its right, which bounds where it can start
+  (pigeonhole partitioning with PassJoin's multi-match-aware windows).
+- Survivors must also pass the character-multiset bound (M is at most the
+  number of characters the two tokens share), which is what
+  ``SequenceMatcher.quick_ratio`` computes.
+
+Segments are indexed per (length, tau), built lazily for the length buckets a
+query can reach (``max_length_difference``), so a lookup is a handful of dict
+probes instead of a scan over the vocabulary.
+"""
+
+from __future__ import annotations
+
+import math
+from collections import Counter
+from typing import Dict, Iterator, List, Sequence, Set, Tuple
+
+
+def max_indel_distance(len_a: int, len_b: int, threshold: float) -> int:
+    """Largest insert/delete distance at which the ratio can reach threshold."""
+    # Epsilon keeps float error from rounding a reachable distance down
+    return max(0, math.floor((1.0 - threshold) * (len_a + len_b) + 1e-9))
+
+
+def _segments(length: int, parts: int) -> List[Tuple[int, int]]:
+    """Even partition of ``length`` into ``parts`` (start, length) segments."""
+    short, extra = divmod(length, parts)
+    segments = []
+    start = 0
+    for i in range(parts):
+        size = short + (1 if i >= parts - extra else 0)
+        segments.append((start, size))
+        start += size
+    return segments
+
+
+class TokenSimilarityIndex:
+    """Exact candidate filter for ``SequenceMatcher.ratio() >= threshold``."""
+
+    def __init__(
+        self,
+        tokens: Sequence[str],
+        threshold: float,
+        max_length_difference: int = 2,
+    ) -> None:
+        self.tokens = list(tokens)
+        self.threshold = threshold
+        self.max_length_difference = max_length_difference
+        self._by_length: Dict[int, List[int]] = {}
+        for token_id, token in enumerate(self.tokens):
+            self._by_length.setdefault(len(token), []).append(token_id)
+        self._char_counts: Dict[int, Counter] = {}
+        # (length, tau) -> segment index -> segment text -> token ids
+        self._partitions: Dict[Tuple[int, int], List[Dict[str, List[int]]]] = {}
+
+    def _partition(self, length: int, tau: int) -> List[Dict[str, List[int]]]:
+        key = (length, tau)
+        partition = self._partitions.get(key)
+        if partition is None:
+            segments = _segments(length, tau + 1)
+            partition = [{} for _ in segments]
+            for token_id in self._by_length[length]:
+                token = self.tokens[token_id]
+                for table, (start, size) in zip(partition, segments):
+                    table.setdefault(token[start : start + size], []).append(token_id)
+            self._partitions[key] = partition
+        return partition
+
+    def _shares_enough(self, token_id: int, query: str, counts: Counter) -> bool:
+        token_counts = self._char_counts.get(token_id)
+        if token_counts is None:
+            token_counts = self._char_counts[token_id] = Counter(self.tokens[token_id])
+        total = len(self.tokens[token_id]) + len(query)
+        shared = sum((token_counts & counts).values())
+        return 2.0 * shared >= self.threshold * total - 1e-9
+
+    def candidates(self, query: str) -> Set[int]:
+        """Ids of indexed tokens that may reach the threshold against ``query``."""
+        found: Set[int] = set()
+        query_length = len(query)
+        for length in range(
+            max(0, query_length - self.max_length_difference),
+            query_length + self.max_length_difference + 1,
+        ):
+            if length not in self._by_length:
+                continue
+            tau = max_indel_distance(length, query_length, self.threshold)
+            if length <= tau:
+                # Too short to partition; every token of this length qualifies
+                found.update(self._by_length[length])
+                continue
+            shift = query_length - length
+            partition = self._partition(length, tau)
+            for i, (table, (start, size)) in enumerate(
+                zip(partition, _segments(length, tau + 1))
+            ):
+                first = max(0, start - i, start + shift - (tau - i))
+                last = min(query_length - size, start + i, start + shift + (tau - i))
+                for pos in range(first, last + 1):
+                    ids = table.get(query[pos : pos + size])
+                    if ids:
+                        found.update(ids)
+        if not found:
+            return found
+        counts = Counter(query)
+        return {i for i in found if self._shares_enough(i, query, counts)}
+
+    def pairs(self) -> Iterator[Tuple[int, int]]:
+        """Candidate pairs ``(i, j)`` with ``i < j`` among the indexed tokens."""
+        pairs = [
+            (i, j)
+            for j, token in enumerate(self.tokens)
+            for i in self.candidates(token)
+            if i < j
+        ]
+        return iter(sorted(pairs))
@@ -266,19 +266,12 @@ class SemanticDataExtractor(BaseDataExtractor):
         if len(texts) < 2:
             return None
 
-        # Use the shared similarity calculator for consistency
-        total_similarity = 0.0
-        comparisons = 0
-
-        for i in range(len(texts)):
-            for j in range(i + 1, len(texts)):
-                similarity = similarity_calculator.calculate_text_similarity(
-                    texts[i], texts[j], method="tfidf"
-                )
-                total_similarity += similarity
-                comparisons += 1
-
-        return total_similarity / comparisons if comparisons > 0 else None
+        # Use the shared similarity calculator for consistency (one batch call)
+        pairs = [(i, j) for i in range(len(texts)) for j in range(i + 1, len(texts))]
+        similarities = similarity_calculator.calculate_pair_similarities(
+            texts, pairs, method="tfidf"
+        )
+        return sum(similarities) / len(similarities) if similarities else None
 
     def _analyze_agreement_patterns(self, agreements: List[str]) -> Dict[str, Any]:
         """Analyze agreement patterns."""
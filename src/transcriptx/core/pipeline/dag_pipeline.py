@@ -49,6 +49,8 @@ class DAGNode:
     timeout_seconds: int = 600
     requirements: List[Any] = None
     enhancements: List[Any] = None
+    resource_class: str = "cpu"  # cpu, model, io (parallel scheduling class)
+    shares_segments: bool = False  # mutates/reads shared segment dicts in place
     executed: bool = False
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
@@ -80,7 +82,7 @@ class DAGPipeline:
     - Deterministic execution ordering
     - Preflight dependency checks
     - Execution plan logging
-    - Read-only context for parallel execution
+    - Dependency-aware parallel execution (ready-queue scheduling)
     """
 
     def __init__(self):
@@ -102,6 +104,8 @@ class DAGPipeline:
         timeout_seconds: int = 600,
         requirements: Optional[List[Any]] = None,
         enhancements: Optional[List[Any]] = None,
+        resource_class: str = "cpu",
+        shares_segments: bool = False,
     ):
         """Add a module to the DAG."""
         self.nodes[name] = DAGNode(
@@ -113,6 +117,8 @@ class DAGPipeline:
             timeout_seconds=timeout_seconds,
             requirements=requirements or [],
             enhancements=enhancements or [],
+            resource_class=resource_class,
+            shares_segments=shares_segments,
         )
 
     def resolve_dependencies(self, selected_modules: List[str]) -> List[str]:
@@ -699,7 +705,8 @@ class DAGPipeline:
             transcript_path: Path to transcript file
             selected_modules: List of modules to run
             skip_speaker_mapping: Skip speaker mapping if already done (deprecated, kept for compatibility)
-            parallel: If True, execute modules in parallel where possible
+            parallel: If True, dispatch independent modules to a worker pool as
+                soon as their dependencies finish
             max_workers: Maximum parallel workers (if parallel=True)
             event_collector: Optional list that receives structured event dicts (legacy).
             on_event: Optional callable(event_dict) invoked synchronously on each
@@ -733,12 +740,6 @@ class DAGPipeline:
 
             output_dir = get_transcript_dir(transcript_path)
 
-        if parallel:
-            self.logger.warning(
-                "Parallel execution disabled; falling back to sequential execution"
-            )
-            parallel = False
-
         # Initialize results early to allow graceful validation failures
         results: Dict[str, Any] = {
             "transcript_path": transcript_path,
@@ -871,35 +872,8 @@ class DAGPipeline:
             )
             return results
 
-        # Use parallel execution if requested
-        if parallel:
-            from transcriptx.core.pipeline.parallel_executor import ParallelExecutor
-
-            executor = ParallelExecutor(max_workers=max_workers)
-            parallel_results = executor.execute_parallel(
-                self,
-                transcript_path,
-                selected_modules,
-                speaker_map,
-                skip_speaker_mapping,
-            )
-            # Merge parallel results
-            results.update(parallel_results)
-            self.logger.info(
-                f"Parallel pipeline completed. Ran {len(results['modules_run'])} modules with {len(results['errors'])} errors"
-            )
-
-            # Clean up context
-            if context:
-                try:
-                    context.close()
-                except Exception as e:
-                    self.logger.warning(f"Error closing PipelineContext: {e}")
-
-            return results
-
         # ------------------------------------------------------------------
-        # Sequential execution
+        # Module execution (sequential, or ready-queue parallel)
         # ------------------------------------------------------------------
         total_modules = len(execution_order)
 
@@ -907,6 +881,7 @@ class DAGPipeline:
         ev_completed = 0
         ev_skipped = 0
         ev_failed = 0
+        module_seconds_total = 0.0
 
         _emit(
             {
@@ -917,67 +892,8 @@ class DAGPipeline:
         )
 
         aborted = False
-        for idx_0, module_name in enumerate(execution_order):
-            index = idx_0 + 1  # 1-based display index
-
-            if module_name not in self.nodes:
-                self.logger.warning(f"Unknown module: {module_name}")
-                continue
-
-            node = self.nodes[module_name]
-
-            # Check if dependencies are satisfied
-            missing_deps = self._check_missing_dependencies(
-                node, results["modules_run"]
-            )
-            if missing_deps:
-                ev_skipped += 1
-                _emit(
-                    {
-                        "event": "module_skipped",
-                        "module_name": module_name,
-                        "index": index,
-                        "total": total_modules,
-                        "completed": ev_completed,
-                        "skipped": ev_skipped,
-                        "failed": ev_failed,
-                        "pct": (
-                            (ev_completed + ev_skipped + ev_failed)
-                            / total_modules
-                            * 100
-                            if total_modules
-                            else 0.0
-                        ),
-                        "message": "missing_dependencies",
-                    }
-                )
-                # Check if any missing dependencies themselves have missing dependencies
-                dep_chain = []
-                for dep in missing_deps:
-                    if dep in self.nodes:
-                        dep_node = self.nodes[dep]
-                        missing_dep_deps = self._check_missing_dependencies(
-                            dep_node, results["modules_run"]
-                        )
-                        if missing_dep_deps:
-                            dep_chain.append(
-                                f"{dep} (which requires {missing_dep_deps})"
-                            )
-                        else:
-                            dep_chain.append(dep)
-                    else:
-                        dep_chain.append(dep)
-
-                error_msg = f"{module_name}: Missing dependencies {missing_deps}"
-                if dep_chain != missing_deps:
-                    error_msg += f" ({', '.join(dep_chain)})"
-
-                self.logger.warning(
-                    f"Module '{module_name}' missing dependencies: {missing_deps}"
-                )
-                results["errors"].append(error_msg)
-                continue
-
+        phase_start = time.perf_counter()
+        if parallel:
             if named_speaker_count is None and context is not None:
                 try:
                     from transcriptx.core.utils.speaker_extraction import (
@@ -988,58 +904,84 @@ class DAGPipeline:
                 except Exception:
                     named_speaker_count = None
 
-            _emit(
-                {
-                    "event": "module_started",
-                    "module_name": module_name,
-                    "index": index,
-                    "total": total_modules,
-                    "completed": ev_completed,
-                    "skipped": ev_skipped,
-                    "failed": ev_failed,
-                    "pct": (
-                        (ev_completed + ev_skipped + ev_failed) / total_modules * 100
-                        if total_modules
-                        else 0.0
-                    ),
-                }
-            )
-            outcome = self._execute_single_module(
-                module_name=module_name,
-                node=node,
+            summary = self._execute_modules_parallel(
+                execution_order=execution_order,
+                selected_modules=selected_modules,
                 transcript_path=transcript_path,
                 context=context,
                 db_coordinator=db_coordinator,
                 run_report=run_report,
                 requirements_resolver=requirements_resolver,
                 named_speaker_count=named_speaker_count,
+                results=results,
+                max_workers=max_workers,
+                emit=_emit,
             )
-            if outcome.status == "success":
-                ev_completed += 1
-                _emit(
-                    {
-                        "event": "module_completed",
-                        "module_name": module_name,
-                        "index": index,
-                        "total": total_modules,
-                        "completed": ev_completed,
-                        "skipped": ev_skipped,
-                        "failed": ev_failed,
-                        "pct": (
-                            (ev_completed + ev_skipped + ev_failed)
-                            / total_modules
-                            * 100
-                            if total_modules
-                            else 0.0
-                        ),
-                        "duration_ms": outcome.duration_ms,
-                    }
+            ev_completed = summary["completed"]
+            ev_skipped = summary["skipped"]
+            ev_failed = summary["failed"]
+            aborted = summary["aborted"]
+            module_seconds_total = summary["module_seconds_total"]
+        else:
+            for idx_0, module_name in enumerate(execution_order):
+                index = idx_0 + 1  # 1-based display index
+
+                if module_name not in self.nodes:
+                    self.logger.warning(f"Unknown module: {module_name}")
+                    continue
+
+                node = self.nodes[module_name]
+
+                # Check if dependencies are satisfied
+                missing_deps = self._check_missing_dependencies(
+                    node, results["modules_run"]
                 )
-            elif outcome.status == "skipped":
-                ev_skipped += 1
+                if missing_deps:
+                    ev_skipped += 1
+                    _emit(
+                        {
+                            "event": "module_skipped",
+                            "module_name": module_name,
+                            "index": index,
+                            "total": total_modules,
+                            "completed": ev_completed,
+                            "skipped": ev_skipped,
+                            "failed": ev_failed,
+                            "pct": (
+                                (ev_completed + ev_skipped + ev_failed)
+                                / total_modules
+                                * 100
+                                if total_modules
+                                else 0.0
+                            ),
+                            "message": "missing_dependencies",
+                        }
+                    )
+                    self.logger.warning(
+                        f"Module '{module_name}' missing dependencies: {missing_deps}"
+                    )
+                    results["errors"].append(
+                        self._missing_dependencies_error(
+                            module_name, missing_deps, results["modules_run"]
+                        )
+                    )
+                    continue
+
+                if named_speaker_count is None and context is not None:
+                    try:
+                        from transcriptx.core.utils.speaker_extraction import (
+                            count_named_speakers,
+                        )
+
+                        named_speaker_count = count_named_speakers(
+                            context.get_segments()
+                        )
+                    except Exception:
+                        named_speaker_count = None
+
                 _emit(
                     {
-                        "event": "module_skipped",
+                        "event": "module_started",
                         "module_name": module_name,
                         "index": index,
                         "total": total_modules,
@@ -1053,56 +995,110 @@ class DAGPipeline:
                             if total_modules
                             else 0.0
                         ),
-                        "message": outcome.skip_reason or "unknown",
                     }
                 )
-            else:
-                ev_failed += 1
-                _emit(
-                    {
-                        "event": "module_failed",
-                        "module_name": module_name,
-                        "index": index,
-                        "total": total_modules,
-                        "completed": ev_completed,
-                        "skipped": ev_skipped,
-                        "failed": ev_failed,
-                        "pct": (
-                            (ev_completed + ev_skipped + ev_failed)
-                            / total_modules
-                            * 100
-                            if total_modules
-                            else 0.0
-                        ),
-                        "error": outcome.error,
-                    }
+                outcome = self._execute_single_module(
+                    module_name=module_name,
+                    node=node,
+                    transcript_path=transcript_path,
+                    context=context,
+                    db_coordinator=db_coordinator,
+                    run_report=run_report,
+                    requirements_resolver=requirements_resolver,
+                    named_speaker_count=named_speaker_count,
                 )
+                module_seconds_total += outcome.duration_ms / 1000.0
+                if outcome.status == "success":
+                    ev_completed += 1
+                    _emit(
+                        {
+                            "event": "module_completed",
+                            "module_name": module_name,
+                            "index": index,
+                            "total": total_modules,
+                            "completed": ev_completed,
+                            "skipped": ev_skipped,
+                            "failed": ev_failed,
+                            "pct": (
+                                (ev_completed + ev_skipped + ev_failed)
+                                / total_modules
+                                * 100
+                                if total_modules
+                                else 0.0
+                            ),
+                            "duration_ms": outcome.duration_ms,
+                        }
+                    )
+                elif outcome.status == "skipped":
+                    ev_skipped += 1
+                    _emit(
+                        {
+                            "event": "module_skipped",
+                            "module_name": module_name,
+                            "index": index,
+                            "total": total_modules,
+                            "completed": ev_completed,
+                            "skipped": ev_skipped,
+                            "failed": ev_failed,
+                            "pct": (
+                                (ev_completed + ev_skipped + ev_failed)
+                                / total_modules
+                                * 100
+                                if total_modules
+                                else 0.0
+                            ),
+                            "message": outcome.skip_reason or "unknown",
+                        }
+                    )
+                else:
+                    ev_failed += 1
+                    _emit(
+                        {
+                            "event": "module_failed",
+                            "module_name": module_name,
+                            "index": index,
+                            "total": total_modules,
+                            "completed": ev_completed,
+                            "skipped": ev_skipped,
+                            "failed": ev_failed,
+                            "pct": (
+                                (ev_completed + ev_skipped + ev_failed)
+                                / total_modules
+                                * 100
+                                if total_modules
+                                else 0.0
+                            ),
+                            "error": outcome.error,
+                        }
+                    )
 
-            self._record_module_outcome(
-                module_name=module_name,
-                node=node,
-                outcome=outcome,
-                results=results,
-                transcript_path=transcript_path,
-                db_coordinator=db_coordinator,
-                run_report=run_report,
-            )
-            if outcome.status == "failed" and self._should_abort_pipeline(
-                outcome, results
-            ):
-                aborted = True
-                _emit(
-                    {
-                        "event": "run_failed",
-                        "error": outcome.error,
-                        "total": total_modules,
-                        "completed": ev_completed,
-                        "skipped": ev_skipped,
-                        "failed": ev_failed,
-                        "message": f"Pipeline aborted: {outcome.error}",
-                    }
+                self._record_module_outcome(
+                    module_name=module_name,
+                    node=node,
+                    outcome=outcome,
+                    results=results,
+                    transcript_path=transcript_path,
+                    db_coordinator=db_coordinator,
+                    run_report=run_report,
                 )
-                break
+                if outcome.status == "failed" and self._should_abort_pipeline(
+                    outcome, results
+                ):
+                    aborted = True
+                    _emit(
+                        {
+                            "event": "run_failed",
+                            "error": outcome.error,
+                            "total": total_modules,
+                            "completed": ev_completed,
+                            "skipped": ev_skipped,
+                            "failed": ev_failed,
+                            "message": f"Pipeline aborted: {outcome.error}",
+                        }
+                    )
+                    break
+        results["wall_clock_seconds"] = time.perf_counter() - phase_start
+        results["module_seconds_total"] = module_seconds_total
 
         # Add execution metadata
         results["end_time"] = time.time()
@@ -1468,6 +1464,176 @@ class DAGPipeline:
                 module_started_at=module_started_at,
             )
 
+    def _missing_dependencies_error(
+        self, module_name: str, missing_deps: List[str], executed_modules: List[str]
+    ) -> str:
+        """Build the error message for a module skipped over missing dependencies."""
+        # Check if any missing dependencies themselves have missing dependencies
+        dep_chain = []
+        for dep in missing_deps:
+            if dep in self.nodes:
+                dep_node = self.nodes[dep]
+                missing_dep_deps = self._check_missing_dependencies(
+                    dep_node, executed_modules
+                )
+                if missing_dep_deps:
+                    dep_chain.append(f"{dep} (which requires {missing_dep_deps})")
+                else:
+                    dep_chain.append(dep)
+            else:
+                dep_chain.append(dep)
+
+        error_msg = f"{module_name}: Missing dependencies {missing_deps}"
+        if dep_chain != missing_deps:
+            error_msg += f" ({', '.join(dep_chain)})"
+        return error_msg
+
+    def _execute_modules_parallel(
+        self,
+        execution_order: List[str],
+        selected_modules: List[str],
+        transcript_path: str,
+        context: Optional[Any],
+        db_coordinator: Optional[Any],
+        run_report: Optional[Any],
+        requirements_resolver: Optional[Any],
+        named_speaker_count: Optional[int],
+        results: Dict[str, Any],
+        max_workers: int,
+        emit: Any,
+    ) -> Dict[str, Any]:
+        """
+        Run modules through the ready-queue ParallelExecutor.
+
+        Modules execute on worker threads; outcomes are recorded on the calling
+        thread through the same _record_module_outcome path as sequential runs,
+        and the same progress events are emitted (in completion order).
+
+        Returns:
+            Counters, abort flag and timing for the execution phase
+        """
+        from transcriptx.core.pipeline.parallel_executor import (
+            ParallelExecutor,
+            SerializedProxy,
+        )
+
+        total_modules = len(execution_order)
+        index_of = {name: idx + 1 for idx, name in enumerate(execution_order)}
+        counters = {"completed": 0, "skipped": 0, "failed": 0}
+        # The coordinator's DB session is not thread-safe; serialize access
+        coordinator = SerializedProxy(db_coordinator) if db_coordinator else None
+
+        def _module_event(event: str, module_name: str, **extra: Any) -> None:
+            done = counters["completed"] + counters["skipped"] + counters["failed"]
+            event_dict = {
+                "event": event,
+                "module_name": module_name,
+                "index": index_of.get(module_name, 0),
+                "total": total_modules,
+                "completed": counters["completed"],
+                "skipped": counters["skipped"],
+                "failed": counters["failed"],
+                "pct": done / total_modules * 100 if total_modules else 0.0,
+            }
+            event_dict.update(extra)
+            emit(event_dict)
+
+        def _run_module(module_name: str, node: DAGNode) -> ModuleExecOutcome:
+            return self._execute_single_module(
+                module_name=module_name,
+                node=node,
+                transcript_path=transcript_path,
+                context=context,
+                db_coordinator=coordinator,
+                run_report=run_report,
+                requirements_resolver=requirements_resolver,
+                named_speaker_count=named_speaker_count,
+            )
+
+        def _on_start(module_name: str, node: DAGNode) -> None:
+            _module_event("module_started", module_name)
+
+        def _on_blocked(module_name: str, node: DAGNode, missing: List[str]) -> None:
+            counters["skipped"] += 1
+            _module_event("module_skipped", module_name, message="missing_dependencies")
+            self.logger.warning(
+                f"Module '{module_name}' missing dependencies: {missing}"
+            )
+            results["errors"].append(
+                self._missing_dependencies_error(
+                    module_name, missing, results["modules_run"]
+                )
+            )
+
+        def _on_done(
+            module_name: str, node: DAGNode, outcome: ModuleExecOutcome
+        ) -> bool:
+            if outcome.status == "success":
+                counters["completed"] += 1
+                _module_event(
+                    "module_completed", module_name, duration_ms=outcome.duration_ms
+                )
+            elif outcome.status == "skipped":
+                counters["skipped"] += 1
+                _module_event(
+                    "module_skipped",
+                    module_name,
+                    message=outcome.skip_reason or "unknown",
+                )
+            else:
+                counters["failed"] += 1
+                _module_event("module_failed", module_name, error=outcome.error)
+
+            self._record_module_outcome(
+                module_name=module_name,
+                node=node,
+                outcome=outcome,
+                results=results,
+                transcript_path=transcript_path,
+                db_coordinator=coordinator,
+                run_report=run_report,
+            )
+            if outcome.status == "failed" and self._should_abort_pipeline(
+                outcome, results
+            ):
+                emit(
+                    {
+                        "event": "run_failed",
+                        "error": outcome.error,
+                        "total": total_modules,
+                        "completed": counters["completed"],
+                        "skipped": counters["skipped"],
+                        "failed": counters["failed"],
+                        "message": f"Pipeline aborted: {outcome.error}",
+                    }
+                )
+                return True
+            return False
+
+        executor = ParallelExecutor(max_workers=max_workers)
+        parallel_results = executor.execute_parallel(
+            self,
+            transcript_path,
+            selected_modules,
+            execution_order=execution_order,
+            run_module=_run_module,
+            on_module_start=_on_start,
+            on_module_done=_on_done,
+            on_module_blocked=_on_blocked,
+        )
+        results["errors"].extend(parallel_results["errors"])
+        results["module_durations"] = parallel_results["module_durations"]
+        self.logger.info(
+            f"Parallel execution: {parallel_results['wall_clock_seconds']:.2f}s wall clock, "
+            f"{parallel_results['module_seconds_total']:.2f}s summed module time "
+            f"(max_workers={max_workers})"
+        )
+        return {
+            **counters,
+            "aborted": parallel_results["aborted"],
+            "module_seconds_total": parallel_results["module_seconds_total"],
+        }
+
     def _check_missing_dependencies(
         self, node: DAGNode, executed_modules: List[str]
     ) -> List[str]:
@@ -1523,6 +1689,8 @@ def create_dag_pipeline() -> DAGPipeline:
                 timeout_seconds=module_info.timeout_seconds,
                 requirements=module_info.requirements,
                 enhancements=module_info.enhancements,
+                resource_class=module_info.resource_class,
+                shares_segments=module_info.shares_segments,
             )
 
     return dag
@@ -69,6 +69,10 @@ class ModuleInfo:
     output_namespace: Optional[str] = None
     output_version: Optional[str] = None
     cost_tier: str = "normal"
+    resource_class: str = "cpu"  # cpu, model, io (parallel scheduling class)
+    shares_segments: bool = (
+        False  # Reads/writes fields on the shared segment dicts in place
+    )
     required_extras: Set[str] = field(
         default_factory=set
     )  # e.g. {"voice"}, {"emotion"}, {"nlp"}
@@ -111,6 +115,8 @@ class ModuleRegistry:
                 "description": "Dialogue Act Classification",
                 "dependencies": [],
                 "category": "medium",
+                "resource_class": "model",
+                "shares_segments": True,
                 "determinism_tier": "T0",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -128,6 +134,7 @@ class ModuleRegistry:
                 "description": "Emotional Contagion Detection",
                 "dependencies": ["emotion"],
                 "category": "heavy",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -138,6 +145,8 @@ class ModuleRegistry:
                 "description": "Emotion Analysis",
                 "dependencies": [],
                 "category": "medium",
+                "resource_class": "model",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -147,6 +156,8 @@ class ModuleRegistry:
                 "description": "Entity-based Sentiment Analysis",
                 "dependencies": ["ner", "sentiment"],
                 "category": "heavy",
+                "resource_class": "model",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -156,6 +167,7 @@ class ModuleRegistry:
                 "description": "Emotion + Sentiment mismatch and tension indices",
                 "dependencies": ["emotion", "sentiment"],
                 "category": "medium",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -174,6 +186,7 @@ class ModuleRegistry:
                 "description": "Named Entity Recognition",
                 "dependencies": [],
                 "category": "medium",
+                "resource_class": "model",
                 "determinism_tier": "T1",
                 "requirements": default_requirements,
                 "enhancements": [],
@@ -183,6 +196,7 @@ class ModuleRegistry:
                 "description": "Semantic Similarity Analysis",
                 "dependencies": [],
                 "category": "heavy",
+                "resource_class": "model",
                 "determinism_tier": "T1",
                 "requirements": default_requirements,
                 "enhancements": [],
@@ -192,6 +206,7 @@ class ModuleRegistry:
                 "description": "Advanced Semantic Similarity with Analysis Integration",
                 "dependencies": [],
                 "category": "heavy",
+                "resource_class": "model",
                 "determinism_tier": "T1",
                 "requirements": default_requirements,
                 "enhancements": [],
@@ -201,6 +216,8 @@ class ModuleRegistry:
                 "description": "Sentiment Analysis",
                 "dependencies": [],
                 "category": "medium",
+                "resource_class": "model",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -225,6 +242,7 @@ class ModuleRegistry:
                 "description": "Generate human readable transcripts",
                 "dependencies": [],
                 "category": "light",
+                "resource_class": "io",
                 "determinism_tier": "T0",
                 "requirements": default_requirements,
                 "enhancements": [Enhancement.SPEAKER_DISPLAY_NAMES],
@@ -233,6 +251,7 @@ class ModuleRegistry:
                 "description": "Simplified transcript (tics, agreements, repetitions removed)",
                 "dependencies": [],
                 "category": "light",
+                "resource_class": "io",
                 "determinism_tier": "T0",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -249,6 +268,7 @@ class ModuleRegistry:
                 "description": "Word Cloud Generation",
                 "dependencies": [],
                 "category": "light",
+                "resource_class": "io",
                 "determinism_tier": "T1",
                 "requirements": default_requirements,
                 "enhancements": [],
@@ -257,6 +277,7 @@ class ModuleRegistry:
                 "description": "Verbal Tics Analysis",
                 "dependencies": [],
                 "category": "light",
+                "shares_segments": True,
                 "determinism_tier": "T0",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -265,6 +286,7 @@ class ModuleRegistry:
                 "description": "Temporal Dynamics Analysis",
                 "dependencies": [],
                 "category": "medium",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -277,6 +299,7 @@ class ModuleRegistry:
                 "description": "Question-Answer Pairing and Response Quality",
                 "dependencies": ["acts"],
                 "category": "medium",
+                "shares_segments": True,
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -286,6 +309,7 @@ class ModuleRegistry:
                 "description": "Silence and Timing Analysis",
                 "dependencies": [],
                 "category": "light",
+                "shares_segments": True,
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -298,6 +322,7 @@ class ModuleRegistry:
                 "description": "Quote/Echo/Paraphrase Detection",
                 "dependencies": [],
                 "category": "medium",
+                "resource_class": "model",
                 "determinism_tier": "T1",
                 "requirements": [Requirement.SEGMENTS, Requirement.SPEAKER_LABELS],
                 "enhancements": [],
@@ -307,6 +332,7 @@ class ModuleRegistry:
                 "description": "Stall/Flow Index Analysis",
                 "dependencies": ["pauses"],
                 "category": "medium",
+                "shares_segments": True,
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -330,6 +356,7 @@ class ModuleRegistry:
                 "description": "Highlights and conflict moments (quote-forward)",
                 "dependencies": [],
                 "category": "light",
+                "shares_segments": True,
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -354,6 +381,7 @@ class ModuleRegistry:
                 "description": "Voice feature extraction and caching",
                 "dependencies": [],
                 "category": "heavy",
+                "resource_class": "io",
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -370,6 +398,7 @@ class ModuleRegistry:
                 "description": "Tone–Text mismatch detection (sarcasm/discord moments)",
                 "dependencies": ["voice_features"],
                 "category": "medium",
+                "shares_segments": True,
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -420,6 +449,7 @@ class ModuleRegistry:
                 "description": "Prosody dashboard charts from voice features",
                 "dependencies": ["voice_features"],
                 "category": "medium",
+                "resource_class": "io",
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -436,6 +466,7 @@ class ModuleRegistry:
                 "description": "Voice charts core: pauses + rhythm indices",
                 "dependencies": ["voice_features"],
                 "category": "medium",
+                "resource_class": "io",
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -454,6 +485,7 @@ class ModuleRegistry:
                 "description": "Voice contours (slow; needs audio decode + pitch tracking)",
                 "dependencies": ["voice_features"],
                 "category": "medium",
+                "resource_class": "io",
                 "determinism_tier": "T0",
                 "requirements": [
                     Requirement.SEGMENTS,
@@ -495,6 +527,8 @@ class ModuleRegistry:
                 output_namespace=info.get("output_namespace"),
                 output_version=info.get("output_version"),
                 cost_tier=info.get("cost_tier", "normal"),
+                resource_class=info.get("resource_class", "cpu"),
+                shares_segments=bool(info.get("shares_segments", False)),
                 timeout_seconds=600,
                 required_extras=set(req_extras),
             )
@@ -777,6 +811,11 @@ class ModuleRegistry:
         module_info = self._modules.get(module_name)
         return module_info.category if module_info else None
 
+    def get_resource_class(self, module_name: str) -> Optional[str]:
+        """Get parallel scheduling resource class for a module."""
+        module_info = self._modules.get(module_name)
+        return module_info.resource_class if module_info else None
+
     def get_description(self, module_name: str) -> Optional[str]:
         """Get description for a module."""
         module_info = self._modules.get(module_name)
@@ -839,6 +878,11 @@ def get_category(module_name: str) -> Optional[str]:
     return _module_registry.get_category(module_name)
 
 
+def get_resource_class(module_name: str) -> Optional[str]:
+    """Get parallel scheduling resource class for a module."""
+    return _module_registry.get_resource_class(module_name)
+
+
 def get_description(module_name: str) -> Optional[str]:
     """Get description for a module."""
     return _module_registry.get_description(module_name)
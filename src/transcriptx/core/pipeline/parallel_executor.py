@@ -1,28 +1,91 @@
 """
 Parallel execution of analysis modules with dependency awareness.
+
+Modules are scheduled from a ready queue: a node is dispatched to the worker
+pool as soon as every dependency in the plan has settled, instead of waiting
+for a whole dependency "level" to finish. Each module also carries a resource
+class (``cpu``, ``model`` or ``io``) from the module registry, and the number
+of concurrently running modules per class is capped so that, for example, two
+transformer-backed modules do not fight over the same cores and memory.
+
+Modules flagged ``shares_segments`` read or write fields on the shared segment
+dicts in place (e.g. sentiment writes ``seg["sentiment"]`` that
+temporal_dynamics reads). They run one at a time, in execution order, so their
+results match a sequential run.
+
+Workers are threads: modules share the already-loaded PipelineContext, and the
+heavy lifting (numpy, torch, spaCy, file I/O) releases the GIL.
 """
 
-from concurrent.futures import ThreadPoolExecutor, as_completed
-from typing import List, Dict, Any, Set
-from transcriptx.core.pipeline.dag_pipeline import DAGPipeline, DAGNode
+import contextvars
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, List, Optional, Set
+
+from transcriptx.core.pipeline.dag_pipeline import (
+    DAGPipeline,
+    DAGNode,
+    ModuleExecOutcome,
+)
 from transcriptx.core.utils.logger import get_logger
 
 logger = get_logger()
 
+# Per-class concurrency caps; classes not listed are bounded only by max_workers.
+DEFAULT_RESOURCE_LIMITS: Dict[str, int] = {
+    "model": 2,
+}
+
+
+class SerializedProxy:
+    """
+    Serialize method calls on a shared, non-thread-safe object.
+
+    Used to share a single DB coordinator (and its SQLAlchemy session) between
+    worker threads during parallel execution.
+    """
+
+    def __init__(self, target: Any, lock: Optional[threading.RLock] = None):
+        self._target = target
+        self._lock = lock or threading.RLock()
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._target, name)
+        if not callable(attr):
+            return attr
+        lock = self._lock
+
+        def _locked(*args: Any, **kwargs: Any) -> Any:
+            with lock:
+                return attr(*args, **kwargs)
+
+        return _locked
+
 
 class ParallelExecutor:
     """
     Execute analysis modules in parallel while respecting dependencies.
     """
 
-    def __init__(self, max_workers: int = 4):
+    def __init__(
+        self,
+        max_workers: int = 4,
+        resource_limits: Optional[Dict[str, int]] = None,
+    ):
         """
         Initialize parallel executor.
 
         Args:
             max_workers: Maximum number of parallel workers
+            resource_limits: Optional per-resource-class concurrency caps
+                (merged over DEFAULT_RESOURCE_LIMITS)
         """
         self.max_workers = max_workers
+        self.resource_limits = dict(DEFAULT_RESOURCE_LIMITS)
+        if resource_limits:
+            self.resource_limits.update(resource_limits)
 
     def execute_parallel(
         self,
@@ -31,108 +94,218 @@ class ParallelExecutor:
         selected_modules: List[str],
         speaker_map: Dict[str, str] = None,
         skip_speaker_mapping: bool = False,
+        execution_order: Optional[List[str]] = None,
+        run_module: Optional[Callable[[str, DAGNode], ModuleExecOutcome]] = None,
+        on_module_start: Optional[Callable[[str, DAGNode], None]] = None,
+        on_module_done: Optional[
+            Callable[[str, DAGNode, ModuleExecOutcome], bool]
+        ] = None,
+        on_module_blocked: Optional[Callable[[str, DAGNode, List[str]], None]] = None,
     ) -> Dict[str, Any]:
         """
         Execute modules in parallel where dependencies allow.
 
+        Without callbacks the executor records successes and errors in its own
+        results dict. DAGPipeline passes callbacks instead so that outcomes are
+        recorded (DB, run report, events) exactly as in sequential execution;
+        callbacks always run on the scheduling thread.
+
         Args:
             dag: DAG pipeline instance
             transcript_path: Path to transcript
             selected_modules: Modules to execute
             speaker_map: Speaker mapping
             skip_speaker_mapping: Skip speaker mapping
+            execution_order: Pre-resolved execution order (resolved if None)
+            run_module: Worker function returning a ModuleExecOutcome
+            on_module_start: Called when a module is dispatched
+            on_module_done: Called with each outcome; return True to abort
+            on_module_blocked: Called when a dependency did not succeed
 
         Returns:
-            Execution results
+            Execution results, including wall-clock and summed module time
         """
-        # Resolve dependencies and get execution order
-        execution_order = dag.resolve_dependencies(selected_modules)
+        if execution_order is None:
+            execution_order = dag.resolve_dependencies(selected_modules)
+        if run_module is None:
 
-        import time
+            def run_module(module_name: str, node: DAGNode) -> ModuleExecOutcome:
+                return self._run_legacy_module(node, transcript_path)
 
-        results = {
+        results: Dict[str, Any] = {
             "transcript_path": transcript_path,
             "modules_requested": selected_modules,
             "modules_run": [],
             "errors": [],
             "execution_order": execution_order,
             "start_time": time.time(),
+            "module_durations": {},
+            "aborted": False,
         }
+        order_index = {name: idx for idx, name in enumerate(execution_order)}
+        segment_turn = self._segment_turns(dag, execution_order)
 
-        # Track executed modules
-        executed_modules: Set[str] = set()
+        pending: List[str] = list(execution_order)
+        settled: Set[str] = set()
+        succeeded: Set[str] = set()
+        running: Dict[Future, tuple[str, str]] = {}
+        in_use: Dict[str, int] = defaultdict(int)
+        aborted = False
+        wall_start = time.perf_counter()
 
         with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Execute modules level by level (respecting dependencies)
-            remaining_modules = set(execution_order)
-
-            while remaining_modules:
-                # Find modules ready to execute (dependencies satisfied)
-                ready_modules = [
-                    mod
-                    for mod in remaining_modules
-                    if self._can_execute(dag, mod, executed_modules)
-                ]
-
-                if not ready_modules:
-                    # No modules ready, check for circular dependencies
-                    logger.warning(
-                        "No modules ready to execute, possible circular dependency"
-                    )
-                    # Add remaining modules to errors
-                    for mod in remaining_modules:
-                        results["errors"].append(f"{mod}: Dependencies not satisfied")
+            while pending or running:
+                if not aborted:
+                    for module_name in list(pending):
+                        if len(running) >= self.max_workers:
+                            break
+                        if module_name not in dag.nodes:
+                            logger.warning(f"Unknown module: {module_name}")
+                            pending.remove(module_name)
+                            continue
+                        if not self._can_execute(dag, module_name, settled):
+                            continue
+                        previous = segment_turn.get(module_name)
+                        if previous is not None and previous not in settled:
+                            continue
+
+                        node = dag.nodes[module_name]
+                        missing = [
+                            dep for dep in node.dependencies if dep not in succeeded
+                        ]
+                        if missing:
+                            pending.remove(module_name)
+                            settled.add(module_name)
+                            if on_module_blocked is not None:
+                                on_module_blocked(module_name, node, missing)
+                            else:
+                                results["errors"].append(
+                                    f"{module_name}: Dependencies not satisfied"
+                                )
+                            continue
+
+                        resource_class = self._resource_class(node)
+                        if in_use[resource_class] >= self._limit(resource_class):
+                            continue
+
+                        pending.remove(module_name)
+                        in_use[resource_class] += 1
+                        if on_module_start is not None:
+                            on_module_start(module_name, node)
+                        # Copy contextvars so performance spans keep their parent trace
+                        ctx = contextvars.copy_context()
+                        future = executor.submit(
+                            ctx.run, self._timed_run, run_module, module_name, node
+                        )
+                        running[future] = (module_name, resource_class)
+
+                if not running:
+                    if pending and not aborted:
+                        logger.warning(
+                            "No modules ready to execute, possible circular dependency"
+                        )
+                        for module_name in pending:
+                            results["errors"].append(
+                                f"{module_name}: Dependencies not satisfied"
+                            )
                     break
 
-                # Execute ready modules in parallel
-                futures = {}
-                for module_name in ready_modules:
-                    if module_name not in dag.nodes:
-                        logger.warning(f"Unknown module: {module_name}")
-                        remaining_modules.remove(module_name)
-                        continue
+                done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                for future in sorted(
+                    done, key=lambda f: order_index.get(running[f][0], 0)
+                ):
+                    module_name, resource_class = running.pop(future)
+                    in_use[resource_class] -= 1
+                    outcome, elapsed = future.result()
+                    settled.add(module_name)
+                    results["module_durations"][module_name] = elapsed
+                    if outcome.status == "success":
+                        succeeded.add(module_name)
 
                     node = dag.nodes[module_name]
-                    future = executor.submit(
-                        self._execute_module, node, transcript_path
-                    )
-                    futures[future] = module_name
-
-                # Collect results
-                for future in as_completed(futures):
-                    module_name = futures[future]
-                    try:
-                        future.result()  # Wait for completion
-                        executed_modules.add(module_name)
+                    if on_module_done is not None:
+                        if on_module_done(module_name, node, outcome):
+                            aborted = True
+                    elif outcome.status == "success":
                         results["modules_run"].append(module_name)
-                        remaining_modules.remove(module_name)
-                    except Exception as e:
-                        error_msg = f"Error in {module_name}: {str(e)}"
+                    elif outcome.status == "failed":
+                        error_msg = f"Error in {module_name}: {outcome.error}"
                         results["errors"].append(error_msg)
-                        if module_name in dag.nodes:
-                            dag.nodes[module_name].error = str(e)
-                        remaining_modules.remove(module_name)
+                        node.error = outcome.error
 
-        # Add execution metadata
-        import time
+                if aborted and pending:
+                    logger.warning(
+                        f"Pipeline aborted; not starting {len(pending)} pending module(s)"
+                    )
+                    pending.clear()
 
+        results["aborted"] = aborted
         results["end_time"] = time.time()
-        results["duration"] = results["end_time"] - results.get(
-            "start_time", results["end_time"]
-        )
+        results["duration"] = results["end_time"] - results["start_time"]
+        results["wall_clock_seconds"] = time.perf_counter() - wall_start
+        results["module_seconds_total"] = sum(results["module_durations"].values())
 
         return results
 
+    def _timed_run(
+        self,
+        run_module: Callable[[str, DAGNode], ModuleExecOutcome],
+        module_name: str,
+        node: DAGNode,
+    ) -> tuple[ModuleExecOutcome, float]:
+        """Run a module in a worker thread; never raises."""
+        start = time.perf_counter()
+        try:
+            outcome = run_module(module_name, node)
+        except Exception as e:
+            outcome = ModuleExecOutcome(status="failed", error=str(e))
+        return outcome, time.perf_counter() - start
+
+    def _segment_turns(
+        self, dag: DAGPipeline, execution_order: List[str]
+    ) -> Dict[str, str]:
+        """Map each segment-sharing module to the one it must run after."""
+        turns: Dict[str, str] = {}
+        previous: Optional[str] = None
+        for module_name in execution_order:
+            node = dag.nodes.get(module_name)
+            if node is None or getattr(node, "shares_segments", False) is not True:
+                continue
+            if previous is not None:
+                turns[module_name] = previous
+            previous = module_name
+        return turns
+
+    def _resource_class(self, node: DAGNode) -> str:
+        resource_class = getattr(node, "resource_class", None)
+        return resource_class if isinstance(resource_class, str) else "cpu"
+
+    def _limit(self, resource_class: str) -> int:
+        limit = self.resource_limits.get(resource_class)
+        if limit is None:
+            return self.max_workers
+        return max(1, min(int(limit), self.max_workers))
+
     def _can_execute(
         self, dag: DAGPipeline, module_name: str, executed: Set[str]
     ) -> bool:
-        """Check if module can execute (dependencies satisfied)."""
+        """Check if module can execute (dependencies settled)."""
         if module_name not in dag.nodes:
             return False
 
         node = dag.nodes[module_name]
         return all(dep in executed for dep in node.dependencies)
 
+    def _run_legacy_module(
+        self, node: DAGNode, transcript_path: str
+    ) -> ModuleExecOutcome:
+        """Adapt _execute_module (raise on failure) to a ModuleExecOutcome."""
+        try:
+            self._execute_module(node, transcript_path)
+        except Exception as e:
+            return ModuleExecOutcome(status="failed", error=str(e))
+        return ModuleExecOutcome(status="success")
+
     def _execute_module(self, node: DAGNode, transcript_path: str) -> None:
         """Execute a single module."""
         from transcriptx.core.utils.logger import (
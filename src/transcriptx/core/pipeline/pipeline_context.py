@@ -9,15 +9,24 @@ Key Features:
 - Single transcript load per pipeline execution
 - Cached speaker maps
 - Shared analysis results
+- Precomputed speaker index for O(1) speaker resolution
+- Shared parse-once spaCy Doc layer (DocBin-cached)
+- Columnar segment timeline for windowed metrics
 - Efficient data access
 """
 
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from transcriptx.core.utils.logger import get_logger
 from transcriptx.utils.text_utils import is_eligible_named_speaker
 from transcriptx.io.transcript_service import TranscriptService
 
+if TYPE_CHECKING:
+    from transcriptx.core.utils.doc_layer import SegmentDocLayer
+    from transcriptx.core.utils.speaker_extraction import SpeakerIndex
+    from transcriptx.core.utils.tfidf_index import SegmentTfidfIndex
+    from transcriptx.core.utils.timeline_index import SegmentTimeline
+
 logger = get_logger()
 
 
@@ -105,15 +114,20 @@ class PipelineContext:
         # Extract speaker information from segments
         # Speaker info comes directly from segments via speaker_db_id
         from transcriptx.core.utils.speaker_extraction import (
-            get_unique_speakers,
+            SpeakerIndex,
             set_speaker_display_map,
+            set_speaker_index,
         )
         from transcriptx.io.transcript_loader import (
             extract_ignored_speakers_from_transcript,
             extract_speaker_map_from_transcript,
         )
 
-        self.speaker_map = get_unique_speakers(self.segments)
+        # Immutable speaker index, built once; speaker_extraction helpers
+        # consult it instead of scanning every segment per lookup
+        self.speaker_index = SpeakerIndex.build(self.segments)
+        set_speaker_index(self.speaker_index)
+        self.speaker_map = dict(self.speaker_index.display_names)
         logger.debug(f"Extracted {len(self.speaker_map)} speakers from segments")
 
         self.ignored_speaker_ids = set(
@@ -134,6 +148,14 @@ class PipelineContext:
         if self._speaker_map_metadata:
             set_speaker_display_map(self._speaker_map_metadata)
 
+        # Parse-once spaCy annotations, shared by NER, POS word clouds and
+        # speaker profiling; parsing happens on first use
+        self.segment_doc_layer = self._build_segment_doc_layer(self.segments)
+        # Fit-once TF-IDF matrix for lexical similarity (fitted on first use)
+        self.segment_tfidf_index = self._build_segment_tfidf_index(self.segments)
+        # Start-sorted time, speaker and word-count columns for windowed modules
+        self.segment_timeline = self._build_segment_timeline(self.segments)
+
         # Cache for analysis results (keyed by module name)
         self._analysis_results: Dict[str, Any] = {}
         self.runtime_flags: Dict[str, Any] = {
@@ -212,9 +234,47 @@ class PipelineContext:
         try:
             from transcriptx.core.utils.speaker_extraction import (
                 clear_speaker_display_map,
+                clear_speaker_index,
             )
 
             clear_speaker_display_map()
+            speaker_index = getattr(self, "speaker_index", None)
+            if speaker_index is not None:
+                clear_speaker_index(speaker_index)
+        except Exception:
+            pass
+
+        try:
+            from transcriptx.core.utils.doc_layer import clear_segment_doc_layer
+
+            doc_layer = getattr(self, "segment_doc_layer", None)
+            if doc_layer is not None:
+                clear_segment_doc_layer(doc_layer)
+        except Exception:
+            pass
+
+        try:
+            from transcriptx.core.utils.tfidf_index import clear_segment_tfidf_index
+
+            tfidf_index = getattr(self, "segment_tfidf_index", None)
+            if tfidf_index is not None:
+                clear_segment_tfidf_index(tfidf_index)
+        except Exception:
+            pass
+
+        try:
+            from transcriptx.core.utils.timeline_index import clear_segment_timeline
+
+            timeline = getattr(self, "segment_timeline", None)
+            if timeline is not None:
+                clear_segment_timeline(timeline)
+        except Exception:
+            pass
+
+        try:
+            from transcriptx.core.utils.embedding_store import flush_embedding_stores
+
+            flush_embedding_stores()
         except Exception:
             pass
 
@@ -249,6 +309,92 @@ class PipelineContext:
         """
         return self.segments
 
+    def get_speaker_index(self) -> "SpeakerIndex":
+        """
+        Get the precomputed speaker index for the loaded segments.
+
+        Returns:
+            Immutable SpeakerIndex (grouping key -> display name, named flags,
+            disambiguation flags and segment positions)
+        """
+        return self.speaker_index
+
+    def get_segment_doc_layer(self) -> "SegmentDocLayer":
+        """
+        Get the shared spaCy Doc layer for the loaded segments.
+
+        Returns:
+            SegmentDocLayer that parses every segment once (or loads the
+            DocBin cache) and serves tokens, POS, lemmas, entities and
+            sentence boundaries to all modules
+        """
+        return self.segment_doc_layer
+
+    def _build_segment_doc_layer(
+        self, segments: List[Dict[str, Any]]
+    ) -> "SegmentDocLayer":
+        from transcriptx.core.utils.config import get_config
+        from transcriptx.core.utils.doc_layer import (
+            SegmentDocLayer,
+            set_segment_doc_layer,
+        )
+
+        analysis_config = get_config().analysis
+        layer = SegmentDocLayer(
+            segments,
+            self.transcript_key,
+            use_cache=bool(getattr(analysis_config, "nlp_doc_cache", True)),
+            batch_size=max(1, getattr(analysis_config, "ner_batch_size", 100)),
+            n_process=getattr(analysis_config, "ner_n_process", 1),
+        )
+        set_segment_doc_layer(layer)
+        return layer
+
+    def get_segment_tfidf_index(self) -> "SegmentTfidfIndex":
+        """
+        Get the shared TF-IDF index for the loaded segments.
+
+        Returns:
+            SegmentTfidfIndex whose vectorizer is fitted once on all segment
+            texts; lexical similarity scores pairs as sparse row dot products
+        """
+        return self.segment_tfidf_index
+
+    def _build_segment_tfidf_index(
+        self, segments: List[Dict[str, Any]]
+    ) -> "SegmentTfidfIndex":
+        from transcriptx.core.utils.tfidf_index import (
+            SegmentTfidfIndex,
+            set_segment_tfidf_index,
+        )
+
+        index = SegmentTfidfIndex(segments)
+        set_segment_tfidf_index(index)
+        return index
+
+    def get_segment_timeline(self) -> "SegmentTimeline":
+        """
+        Get the columnar timeline for the loaded segments.
+
+        Returns:
+            SegmentTimeline with start-sorted start/end times, speaker codes,
+            word counts and token-set ids, answering window queries by binary
+            search and window totals by prefix sums
+        """
+        return self.segment_timeline
+
+    def _build_segment_timeline(
+        self, segments: List[Dict[str, Any]]
+    ) -> "SegmentTimeline":
+        from transcriptx.core.utils.timeline_index import (
+            SegmentTimeline,
+            set_segment_timeline,
+        )
+
+        timeline = SegmentTimeline(segments)
+        set_segment_timeline(timeline)
+        return timeline
+
     def get_speaker_map(self) -> Dict[str, str]:
         """
         Get speaker map derived from transcript metadata or segments.
@@ -391,7 +537,28 @@ class PipelineContext:
         """
         if self._frozen:
             raise RuntimeError("Cannot modify frozen PipelineContext")
+        from transcriptx.core.utils.speaker_extraction import (
+            SpeakerIndex,
+            clear_speaker_index,
+            set_speaker_index,
+        )
+
         self.segments = segments
+        clear_speaker_index(self.speaker_index)
+        self.speaker_index = SpeakerIndex.build(segments)
+        set_speaker_index(self.speaker_index)
+        from transcriptx.core.utils.doc_layer import clear_segment_doc_layer
+
+        clear_segment_doc_layer(self.segment_doc_layer)
+        self.segment_doc_layer = self._build_segment_doc_layer(segments)
+        from transcriptx.core.utils.tfidf_index import clear_segment_tfidf_index
+
+        clear_segment_tfidf_index(self.segment_tfidf_index)
+        self.segment_tfidf_index = self._build_segment_tfidf_index(segments)
+        from transcriptx.core.utils.timeline_index import clear_segment_timeline
+
+        clear_segment_timeline(self.segment_timeline)
+        self.segment_timeline = self._build_segment_timeline(segments)
         logger.debug(f"Updated segments in context: {len(segments)} segments")
 
     def store_analysis_result(self, module_name: str, result: Any) -> None:
@@ -506,6 +673,22 @@ class ReadOnlyPipelineContext:
         """Get transcript segments."""
         return self._context.get_segments()
 
+    def get_speaker_index(self):
+        """Get precomputed speaker index."""
+        return self._context.get_speaker_index()
+
+    def get_segment_doc_layer(self):
+        """Get shared spaCy Doc layer."""
+        return self._context.get_segment_doc_layer()
+
+    def get_segment_tfidf_index(self):
+        """Get shared TF-IDF index."""
+        return self._context.get_segment_tfidf_index()
+
+    def get_segment_timeline(self):
+        """Get columnar segment timeline."""
+        return self._context.get_segment_timeline()
+
     def get_speaker_map(self) -> Dict[str, str]:
         """Get speaker map."""
         return self._context.get_speaker_map()
@@ -0,0 +1,455 @@
+"""
+On-disk inverted index over transcript segments, for file-backed search.
+
+Each transcript gets a shard directory under ``DATA_DIR/cache/search_index``
+(named by a hash of its resolved path) holding:
+
+- ``text.bin`` / ``offsets.npy``: UTF-8 segment texts and their byte
+  offsets, memory-mapped on read;
+- ``times.npy`` / ``speakers.npy``: segment start/end and speaker codes;
+- ``terms.txt`` / ``postings.npy`` / ``posting_offsets.npy``: sorted
+  lowercase word terms and, per term, the segment indices containing it;
+- ``meta.json``: transcript mtime, size and content hash, plus the speaker
+  table (label and database id per speaker code).
+
+``TranscriptStore`` refreshes a transcript's shard whenever it writes the
+file. Transcripts written by other means are indexed on first query: a shard
+is reused while the transcript's mtime and size match, or its content hash
+does, and rebuilt otherwise. Queries never load transcript JSON once a shard
+is fresh. Shards of transcripts that no longer exist are pruned when the
+process-wide index is first opened.
+"""
+
+from __future__ import annotations
+
+import bisect
+import hashlib
+import json
+import os
+import re
+import shutil
+import threading
+import uuid
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+INDEX_VERSION = 1
+META_FILE = "meta.json"
+
+_TERM_RE = re.compile(r"\w+")
+
+TranscriptLoader = Callable[[str], Dict[str, Any]]
+
+
+def get_search_index_root() -> Path:
+    from transcriptx.core.utils.paths import DATA_DIR
+
+    root = Path(DATA_DIR) / "cache" / "search_index"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def _file_sha256(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+
+def _load_array(path: Path) -> np.ndarray:
+    try:
+        return np.load(path, mmap_mode="r")
+    except ValueError:
+        # Zero-length arrays cannot be mapped
+        return np.load(path)
+
+
+def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _write_json(path: Path, data: Dict[str, Any]) -> None:
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+    os.replace(tmp_path, path)
+
+
+class TranscriptSearchShard:
+    """Read side of one transcript's index; arrays are memory-mapped."""
+
+    def __init__(self, directory: Path, meta: Dict[str, Any]) -> None:
+        self.directory = directory
+        self.meta = meta
+        self.speakers: List[Dict[str, Any]] = list(meta.get("speakers") or [])
+        self._offsets = _load_array(directory / "offsets.npy")
+        text_path = directory / "text.bin"
+        self._text = (
+            np.memmap(text_path, dtype=np.uint8, mode="r")
+            if text_path.stat().st_size
+            else np.zeros(0, dtype=np.uint8)
+        )
+        self._times = _load_array(directory / "times.npy")
+        self._speaker_codes = _load_array(directory / "speakers.npy")
+        self._postings = _load_array(directory / "postings.npy")
+        self._posting_offsets = _load_array(directory / "posting_offsets.npy")
+        self._terms = (directory / "terms.txt").read_text(encoding="utf-8")
+        self._term_list = self._terms.split("\n") if self._terms else []
+        # Offset of each term in the newline-joined terms text
+        lengths = np.fromiter(
+            (len(term) + 1 for term in self._term_list),
+            dtype=np.int64,
+            count=len(self._term_list),
+        )
+        self._term_starts = np.concatenate(([0], np.cumsum(lengths)[:-1])).astype(
+            np.int64
+        )
+
+    @property
+    def segment_count(self) -> int:
+        return int(self.meta.get("segment_count", 0))
+
+    @property
+    def original_path(self) -> Optional[str]:
+        return self.meta.get("original_path")
+
+    def text(self, idx: int) -> str:
+        start, end = int(self._offsets[idx]), int(self._offsets[idx + 1])
+        return bytes(self._text[start:end]).decode("utf-8")
+
+    def segment(self, idx: int) -> Dict[str, Any]:
+        """Segment fields kept in the index: text, speaker, speaker_db_id, start, end."""
+        code = int(self._speaker_codes[idx])
+        speaker = self.speakers[code] if code >= 0 else {}
+        return {
+            "text": self.text(idx),
+            "speaker": speaker.get("speaker"),
+            "speaker_db_id": speaker.get("speaker_db_id"),
+            "start": float(self._times[idx, 0]),
+            "end": float(self._times[idx, 1]),
+        }
+
+    def _term_ids(self, token: str, mode: str) -> np.ndarray:
+        """Ids of terms equal to, starting with, ending with or containing token."""
+        terms = self._term_list
+        if mode == "exact":
+            pos = bisect.bisect_left(terms, token)
+            found = pos < len(terms) and terms[pos] == token
+            return np.array([pos] if found else [], dtype=np.int64)
+        if mode == "prefix":
+            lo = bisect.bisect_left(terms, token)
+            hi = bisect.bisect_left(terms, token + "\U0010ffff")
+            return np.arange(lo, hi, dtype=np.int64)
+        positions = np.fromiter(
+            (m.start() for m in re.finditer(re.escape(token), self._terms)),
+            dtype=np.int64,
+        )
+        if not len(positions):
+            return positions
+        ids = np.searchsorted(self._term_starts, positions, side="right") - 1
+        if mode == "suffix":
+            ends = self._term_starts[ids] + np.fromiter(
+                (len(terms[i]) for i in ids), dtype=np.int64, count=len(ids)
+            )
+            ids = ids[positions + len(token) == ends]
+        return np.unique(ids)
+
+    def _segments_with_terms(self, term_ids: np.ndarray) -> np.ndarray:
+        if not len(term_ids):
+            return np.zeros(0, dtype=np.int32)
+        parts = [
+            self._postings[self._posting_offsets[t] : self._posting_offsets[t + 1]]
+            for t in term_ids
+        ]
+        return np.unique(np.concatenate(parts))
+
+    def has_term_containing(self, token: str) -> bool:
+        """True if any segment contains token (case-insensitive, within a word)."""
+        return token.lower() in self._terms
+
+    def find_substring(self, query: str) -> List[int]:
+        """
+        Segment indices whose lowercased text contains the lowercased query.
+
+        Postings narrow the candidates; each candidate's text is then checked
+        so results equal a plain substring scan.
+        """
+        needle = query.lower()
+        tokens = _TERM_RE.findall(needle)
+        if not tokens:
+            candidates = range(self.segment_count)
+        else:
+            if len(tokens) == 1:
+                modes = ["contains"]
+            else:
+                # Interior words are whole terms; the ends may be partial words
+                modes = ["suffix"] + ["exact"] * (len(tokens) - 2) + ["prefix"]
+            segment_ids: Optional[np.ndarray] = None
+            for token, mode in zip(tokens, modes):
+                found = self._segments_with_terms(self._term_ids(token, mode))
+                segment_ids = (
+                    found
+                    if segment_ids is None
+                    else np.intersect1d(segment_ids, found, assume_unique=True)
+                )
+                if not len(segment_ids):
+                    return []
+            candidates = [int(i) for i in segment_ids]
+        return [i for i in candidates if needle in self.text(i).lower()]
+
+
+def _build_shard_files(
+    directory: Path, segments: List[Any], meta: Dict[str, Any]
+) -> None:
+    """Write a shard's arrays and meta.json into an empty directory."""
+    texts: List[str] = []
+    times = np.zeros((len(segments), 2), dtype=np.float64)
+    speaker_codes = np.full(len(segments), -1, dtype=np.int32)
+    speakers: List[Dict[str, Any]] = []
+    speaker_ids: Dict[Any, int] = {}
+    postings: Dict[str, List[int]] = {}
+    for idx, segment in enumerate(segments):
+        if not isinstance(segment, dict):
+            segment = {}
+        text = segment.get("text", "")
+        if not isinstance(text, str):
+            text = ""
+        texts.append(text)
+        times[idx] = (_as_float(segment.get("start")), _as_float(segment.get("end")))
+        label = segment.get("speaker")
+        if label is not None:
+            code = speaker_ids.get(label)
+            if code is None:
+                code = speaker_ids[label] = len(speakers)
+                speakers.append(
+                    {"speaker": label, "speaker_db_id": segment.get("speaker_db_id")}
+                )
+            speaker_codes[idx] = code
+        for term in set(_TERM_RE.findall(text.lower())):
+            postings.setdefault(term, []).append(idx)
+
+    encoded = [text.encode("utf-8") for text in texts]
+    offsets = np.zeros(len(encoded) + 1, dtype=np.int64)
+    offsets[1:] = np.cumsum([len(b) for b in encoded])
+    (directory / "text.bin").write_bytes(b"".join(encoded))
+    np.save(directory / "offsets.npy", offsets)
+    np.save(directory / "times.npy", times)
+    np.save(directory / "speakers.npy", speaker_codes)
+
+    terms = sorted(postings)
+    posting_offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+    posting_offsets[1:] = np.cumsum([len(postings[t]) for t in terms])
+    flat = np.fromiter(
+        (i for t in terms for i in postings[t]),
+        dtype=np.int32,
+        count=int(posting_offsets[-1]),
+    )
+    (directory / "terms.txt").write_text("\n".join(terms), encoding="utf-8")
+    np.save(directory / "postings.npy", flat)
+    np.save(directory / "posting_offsets.npy", posting_offsets)
+
+    meta = dict(meta)
+    meta.update(
+        {
+            "version": INDEX_VERSION,
+            "segment_count": len(segments),
+            "term_count": len(terms),
+            "speakers": speakers,
+        }
+    )
+    _write_json(directory / META_FILE, meta)
+
+
+class TranscriptSearchIndex:
+    """Shards for every indexed transcript, refreshed by mtime/content hash."""
+
+    def __init__(self, root: Optional[Path] = None) -> None:
+        self.root = Path(root) if root is not None else get_search_index_root()
+        self._lock = threading.RLock()
+        self._shards: Dict[str, TranscriptSearchShard] = {}
+
+    def shard_dir(self, transcript_path: str | Path) -> Path:
+        key = str(Path(transcript_path).resolve())
+        return self.root / hashlib.sha1(key.encode("utf-8")).hexdigest()
+
+    def get(
+        self,
+        transcript_path: str | Path,
+        loader: Optional[TranscriptLoader] = None,
+    ) -> Optional[TranscriptSearchShard]:
+        """
+        Fresh shard for a transcript, (re)building it with loader if needed.
+
+        Args:
+            transcript_path: Transcript JSON path
+            loader: Loads transcript data when the shard must be rebuilt;
+                defaults to reading the JSON file
+
+        Returns:
+            The shard, or None if the transcript is missing or unreadable
+        """
+        path = Path(transcript_path)
+        try:
+            stat = path.stat()
+        except OSError:
+            return None
+        key = str(path.resolve())
+        with self._lock:
+            shard = self._shards.get(key) or self._open(self.shard_dir(path))
+            if shard is not None:
+                meta = shard.meta
+                if (
+                    meta.get("mtime_ns") == stat.st_mtime_ns
+                    and meta.get("size") == stat.st_size
+                ):
+                    self._shards[key] = shard
+                    return shard
+                if meta.get("sha256") == _file_sha256(path):
+                    # Touched but unchanged: keep the shard, record the new stat
+                    meta.update({"mtime_ns": stat.st_mtime_ns, "size": stat.st_size})
+                    _write_json(shard.directory / META_FILE, meta)
+                    self._shards[key] = shard
+                    return shard
+            try:
+                data = (loader or _read_transcript)(str(path))
+            except Exception as e:
+                logger.warning(f"Could not index transcript {path}: {e}")
+                return None
+            return self.update(path, data)
+
+    def update(
+        self, transcript_path: str | Path, data: Dict[str, Any]
+    ) -> Optional[TranscriptSearchShard]:
+        """Rebuild a transcript's shard from its (just written) data."""
+        path = Path(transcript_path)
+        segments = data.get("segments") if isinstance(data, dict) else None
+        if not isinstance(segments, list):
+            return None
+        source = data.get("source")
+        original_path = (
+            source.get("original_path") if isinstance(source, dict) else None
+        )
+        stat = path.stat()
+        meta = {
+            "transcript_path": str(path.resolve()),
+            "original_path": original_path,
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": _file_sha256(path),
+        }
+        directory = self.shard_dir(path)
+        with self._lock:
+            tmp_dir = directory.with_name(f"{directory.name}.tmp-{uuid.uuid4().hex}")
+            tmp_dir.mkdir(parents=True)
+            try:
+                _build_shard_files(tmp_dir, segments, meta)
+                self._replace_dir(tmp_dir, directory)
+            finally:
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+            shard = self._open(directory)
+            if shard is not None:
+                self._shards[meta["transcript_path"]] = shard
+            return shard
+
+    def remove(self, transcript_path: str | Path) -> None:
+        with self._lock:
+            self._shards.pop(str(Path(transcript_path).resolve()), None)
+            shutil.rmtree(self.shard_dir(transcript_path), ignore_errors=True)
+
+    def prune(self) -> int:
+        """
+        Delete shards whose transcript no longer exists (or that are unreadable).
+
+        Returns:
+            Number of shard directories removed
+        """
+        removed = 0
+        with self._lock:
+            for directory in self.root.iterdir():
+                # Skip files and in-flight ".tmp-"/".old-" directories
+                if not directory.is_dir() or "." in directory.name:
+                    continue
+                meta = _read_json(directory / META_FILE)
+                transcript_path = (meta or {}).get("transcript_path")
+                if (
+                    meta
+                    and meta.get("version") == INDEX_VERSION
+                    and transcript_path
+                    and os.path.exists(transcript_path)
+                ):
+                    continue
+                self._shards.pop(str(transcript_path), None)
+                shutil.rmtree(directory, ignore_errors=True)
+                removed += 1
+        if removed:
+            logger.debug(f"Pruned {removed} stale search index shards")
+        return removed
+
+    @staticmethod
+    def _replace_dir(new_dir: Path, directory: Path) -> None:
+        # Open memory maps keep the replaced files alive until released
+        old_dir = directory.with_name(f"{directory.name}.old-{uuid.uuid4().hex}")
+        if directory.exists():
+            os.replace(directory, old_dir)
+        os.replace(new_dir, directory)
+        shutil.rmtree(old_dir, ignore_errors=True)
+
+    @staticmethod
+    def _open(directory: Path) -> Optional[TranscriptSearchShard]:
+        meta = _read_json(directory / META_FILE)
+        if not meta or meta.get("version") != INDEX_VERSION:
+            return None
+        try:
+            return TranscriptSearchShard(directory, meta)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Discarding unreadable search shard {directory}: {e}")
+            return None
+
+
+def _read_transcript(path: str) -> Dict[str, Any]:
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+_index: Optional[TranscriptSearchIndex] = None
+_index_lock = threading.Lock()
+
+
+def get_search_index() -> TranscriptSearchIndex:
+    """Process-wide search index under DATA_DIR/cache/search_index."""
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = TranscriptSearchIndex()
+            try:
+                _index.prune()
+            except OSError as e:
+                logger.debug(f"Search index prune skipped: {e}")
+        return _index
+
+
+def index_transcript(transcript_path: str | Path, data: Dict[str, Any]) -> None:
+    """Refresh a transcript's shard after a write. Best-effort: never raises."""
+    try:
+        get_search_index().update(transcript_path, data)
+    except Exception as e:
+        logger.debug(f"Search index update skipped for {transcript_path}: {e}")
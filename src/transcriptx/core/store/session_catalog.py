@@ -0,0 +1,292 @@
+"""
+Persistent catalog of analysis runs under ``OUTPUTS_DIR/<slug>/<run_id>``.
+
+Listing runs used to re-read the slug index, resolve the transcript and load
+it for stats on every call. The catalog keeps one entry per run in
+``OUTPUTS_DIR/.transcriptx_sessions.json`` together with the stat signature
+it was built from (run directory, run manifest and transcript mtimes), so a
+listing only stats files and rebuilds the entries whose signature changed:
+
+- the slug index is re-read only when its file changes;
+- slug and run directories are re-listed only when their mtime changes;
+- entries are built by a caller-supplied function (the web FileService).
+
+Listings within ``revalidate_seconds`` of the last check are served from
+memory. ``save_run_manifest`` calls ``invalidate_session`` so a run written
+in this process shows up on the next listing.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+CATALOG_FILE = ".transcriptx_sessions.json"
+CATALOG_VERSION = 1
+DEFAULT_REVALIDATE_SECONDS = 2.0
+
+# (session_id, run_dir, transcript_key) -> session info, or None to skip the run
+EntryBuilder = Callable[[str, Path, str], Optional[Dict[str, Any]]]
+
+
+def _mtime_ns(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _file_signature(path: Optional[str]) -> Optional[List[int]]:
+    if not path:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def _child_dirs(directory: Path) -> List[str]:
+    try:
+        return sorted(
+            item.name
+            for item in directory.iterdir()
+            if item.is_dir() and not item.name.startswith(".")
+        )
+    except OSError:
+        return []
+
+
+class SessionCatalog:
+    """Cached run listing for one outputs directory."""
+
+    def __init__(
+        self,
+        outputs_dir: Path,
+        catalog_path: Optional[Path] = None,
+        revalidate_seconds: float = DEFAULT_REVALIDATE_SECONDS,
+    ) -> None:
+        self.outputs_dir = Path(outputs_dir)
+        self.catalog_path = catalog_path or self.outputs_dir / CATALOG_FILE
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.RLock()
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._loaded_mtime: Optional[int] = None
+        self._checked_at: Optional[float] = None
+        # Directory listings keyed by directory: (mtime_ns, child names)
+        self._listings: Dict[str, Tuple[Optional[int], List[str]]] = {}
+        self._slug_keys: Dict[str, str] = {}
+        self._slug_index_mtime: Optional[int] = None
+
+    def sessions(self, build_entry: EntryBuilder) -> List[Dict[str, Any]]:
+        """All runs with a resolvable transcript, most recently updated first."""
+        with self._lock:
+            self._refresh(build_entry)
+            sessions = [
+                self._public(entry)
+                for entry in self._entries.values()
+                if not entry.get("missing")
+            ]
+        return sorted(sessions, key=lambda x: x.get("last_updated") or "", reverse=True)
+
+    def query(
+        self,
+        build_entry: EntryBuilder,
+        *,
+        slug: Optional[str] = None,
+        text: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Filter and paginate the catalog.
+
+        Args:
+            build_entry: Builds entries for new or changed runs
+            slug: Only runs of this transcript slug
+            text: Case-insensitive substring of the session name
+            offset: Number of matching sessions to skip
+            limit: Page size (None for all remaining)
+
+        Returns:
+            (page of sessions, total matching sessions)
+        """
+        sessions = self.sessions(build_entry)
+        if slug is not None:
+            sessions = [s for s in sessions if s.get("slug") == slug]
+        if text:
+            needle = text.lower()
+            sessions = [s for s in sessions if needle in s.get("name", "").lower()]
+        end = None if limit is None else offset + limit
+        return sessions[offset:end], len(sessions)
+
+    def invalidate(self, run_dir: Optional[Path | str] = None) -> None:
+        """Drop a run's entry (or all entries) and revalidate on next listing."""
+        with self._lock:
+            if run_dir is None:
+                self._entries.clear()
+                self._listings.clear()
+            else:
+                run_dir = Path(run_dir)
+                self._entries.pop(f"{run_dir.parent.name}/{run_dir.name}", None)
+                self._listings.pop(str(run_dir.parent), None)
+                self._listings.pop(str(self.outputs_dir), None)
+            self._checked_at = None
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _public(entry: Dict[str, Any]) -> Dict[str, Any]:
+        public = {k: v for k, v in entry.items() if not k.startswith("_")}
+        if isinstance(public.get("modules"), list):
+            public["modules"] = list(public["modules"])
+        return public
+
+    def _refresh(self, build_entry: EntryBuilder) -> None:
+        now = time.monotonic()
+        if (
+            self._checked_at is not None
+            and now - self._checked_at < self.revalidate_seconds
+        ):
+            return
+        self._load_if_changed()
+        seen: set[str] = set()
+        dirty = False
+        slug_keys = self._current_slug_keys()
+        for slug in self._list_dirs(self.outputs_dir):
+            transcript_key = slug_keys.get(slug)
+            if transcript_key is None:
+                continue
+            slug_dir = self.outputs_dir / slug
+            for run_id in self._list_dirs(slug_dir):
+                session_id = f"{slug}/{run_id}"
+                seen.add(session_id)
+                run_dir = slug_dir / run_id
+                entry = self._entries.get(session_id)
+                if (
+                    entry is not None
+                    and entry.get("transcript_key") == transcript_key
+                    and entry.get("_sig") == self._signature(run_dir, entry)
+                ):
+                    continue
+                self._entries[session_id] = self._build(
+                    build_entry, session_id, run_dir, transcript_key
+                )
+                dirty = True
+        for session_id in set(self._entries) - seen:
+            del self._entries[session_id]
+            dirty = True
+        if dirty:
+            self._save()
+        self._checked_at = time.monotonic()
+
+    @staticmethod
+    def _signature(run_dir: Path, entry: Optional[Dict[str, Any]]) -> List[Any]:
+        transcript_path = entry.get("transcript_path") if entry else None
+        return [
+            _mtime_ns(run_dir),
+            _mtime_ns(run_dir / ".transcriptx" / "manifest.json"),
+            _file_signature(transcript_path),
+        ]
+
+    def _build(
+        self,
+        build_entry: EntryBuilder,
+        session_id: str,
+        run_dir: Path,
+        transcript_key: str,
+    ) -> Dict[str, Any]:
+        try:
+            info = build_entry(session_id, run_dir, transcript_key)
+        except Exception as e:
+            logger.warning(f"Failed to load session {run_dir.name}: {e}")
+            info = None
+        entry: Dict[str, Any] = (
+            dict(info)
+            if info
+            else {"name": session_id, "transcript_key": transcript_key, "missing": True}
+        )
+        entry["_sig"] = self._signature(run_dir, entry)
+        return entry
+
+    def _list_dirs(self, directory: Path) -> List[str]:
+        mtime = _mtime_ns(directory)
+        cached = self._listings.get(str(directory))
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        names = _child_dirs(directory) if mtime is not None else []
+        self._listings[str(directory)] = (mtime, names)
+        return names
+
+    def _current_slug_keys(self) -> Dict[str, str]:
+        from transcriptx.core.utils import slug_manager
+
+        mtime = _mtime_ns(Path(slug_manager.INDEX_FILE))
+        if mtime != self._slug_index_mtime or mtime is None:
+            self._slug_keys = dict(slug_manager.load_index().get("slug_to_key", {}))
+            self._slug_index_mtime = mtime
+        return self._slug_keys
+
+    def _load_if_changed(self) -> None:
+        """Pick up entries written by other processes."""
+        mtime = _mtime_ns(self.catalog_path)
+        if mtime is None or mtime == self._loaded_mtime:
+            return
+        try:
+            with open(self.catalog_path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable session catalog: {e}")
+            return
+        if data.get("version") == CATALOG_VERSION and isinstance(
+            data.get("sessions"), dict
+        ):
+            self._entries = data["sessions"]
+        self._loaded_mtime = mtime
+
+    def _save(self) -> None:
+        tmp_path = self.catalog_path.with_suffix(
+            f"{self.catalog_path.suffix}.{os.getpid()}.tmp"
+        )
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump({"version": CATALOG_VERSION, "sessions": self._entries}, f)
+            os.replace(tmp_path, self.catalog_path)
+            self._loaded_mtime = _mtime_ns(self.catalog_path)
+        except OSError as e:
+            logger.debug(f"Could not save session catalog: {e}")
+
+
+_catalogs: Dict[str, SessionCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_session_catalog(outputs_dir: Optional[Path | str] = None) -> SessionCatalog:
+    """Process-wide catalog for an outputs directory (default OUTPUTS_DIR)."""
+    if outputs_dir is None:
+        from transcriptx.core.utils.paths import OUTPUTS_DIR
+
+        outputs_dir = OUTPUTS_DIR
+    key = str(Path(outputs_dir).resolve())
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = _catalogs[key] = SessionCatalog(Path(outputs_dir))
+        return catalog
+
+
+def invalidate_session(run_dir: Path | str) -> None:
+    """Mark a run as changed (e.g. after its manifest is written). Never raises."""
+    try:
+        run_dir = Path(run_dir)
+        get_session_catalog(run_dir.parent.parent).invalidate(run_dir)
+    except Exception as e:
+        logger.debug(f"Session catalog invalidation skipped for {run_dir}: {e}")
@@ -1,6 +1,7 @@
 """
 TranscriptStore: sole writer for transcript JSON files.
 Uses lockfile + atomic write (.tmp then os.replace) + schema stamps.
+Every write also refreshes the transcript's search index shard.
 """
 
 from __future__ import annotations
@@ -11,6 +12,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Callable, Dict
 
+from transcriptx.core.store.search_index import index_transcript
 from transcriptx.core.utils.file_lock import FileLock
 from transcriptx.core.utils.logger import get_logger
 
@@ -33,6 +35,7 @@ def _stamp_and_write(path: Path, data: Dict[str, Any], reason: str) -> None:
         f.flush()
         os.fsync(f.fileno())
     os.replace(tmp_path, path)
+    index_transcript(path, data)
 
 
 class TranscriptStore:
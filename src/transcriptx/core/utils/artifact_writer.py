@@ -1,16 +1,98 @@
 """
 Atomic file writer utilities for TranscriptX artifacts.
+
+Writers hash content while writing it (the same buffer, or the stream for
+CSV) and record the SHA-256 with the file's size and mtime in an in-memory
+manifest. ArtifactRegistry uses ``recorded_hash`` so files written here are
+registered without being read back; files written by other means, or changed
+since, are hashed from disk as before.
 """
 
 from __future__ import annotations
 
 import csv
+import hashlib
 import json
 import os
 import tempfile
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable, List, Optional
 
+# Oldest entries are dropped past this (files nobody registered)
+_MAX_MANIFEST_ENTRIES = 50_000
+
+
+@dataclass(frozen=True)
+class WrittenArtifact:
+    """Content hash of a file as its writer left it."""
+
+    content_hash: str
+    size: int
+    mtime_ns: int
+
+
+_manifest: "OrderedDict[str, WrittenArtifact]" = OrderedDict()
+_manifest_lock = threading.Lock()
+
+
+def _manifest_key(path: str | Path) -> str:
+    return os.path.abspath(path)
+
+
+def _record_written(path: Path, content_hash: str) -> None:
+    stat = path.stat()
+    entry = WrittenArtifact(content_hash, stat.st_size, stat.st_mtime_ns)
+    key = _manifest_key(path)
+    with _manifest_lock:
+        _manifest[key] = entry
+        _manifest.move_to_end(key)
+        while len(_manifest) > _MAX_MANIFEST_ENTRIES:
+            _manifest.popitem(last=False)
+
+
+def recorded_hash(path: str | Path) -> Optional[str]:
+    """
+    SHA-256 recorded when ``path`` was written here.
+
+    Returns None when the file was not written through this module or its
+    size or mtime changed since.
+    """
+    with _manifest_lock:
+        entry = _manifest.get(_manifest_key(path))
+    if entry is None:
+        return None
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    if stat.st_size != entry.size or stat.st_mtime_ns != entry.mtime_ns:
+        return None
+    return entry.content_hash
+
+
+def forget_written_artifacts(root: str | Path) -> None:
+    """Drop manifest entries for files under ``root`` (once registered)."""
+    prefix = os.path.join(_manifest_key(root), "")
+    with _manifest_lock:
+        for key in [k for k in _manifest if k.startswith(prefix)]:
+            del _manifest[key]
+
+
+class _HashingWriter:
+    """Text stream wrapper that hashes the encoded text passing through it."""
+
+    def __init__(self, handle: Any, encoding: str) -> None:
+        self._handle = handle
+        self._encoding = encoding
+        self.hash = hashlib.sha256()
+
+    def write(self, text: str) -> int:
+        self.hash.update(text.encode(self._encoding))
+        return self._handle.write(text)
+
 
 def _ensure_parent_dir(path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
@@ -33,6 +115,7 @@ def write_bytes(path: str | Path, data: bytes) -> Path:
         os.fsync(tmp.fileno())
         tmp_path = Path(tmp.name)
     _atomic_replace(tmp_path, target)
+    _record_written(target, hashlib.sha256(data).hexdigest())
     return target
 
 
@@ -72,7 +155,8 @@ def write_csv(
         newline=newline,
         encoding="utf-8",
     ) as tmp:
-        writer = csv.writer(tmp)
+        stream = _HashingWriter(tmp, "utf-8")
+        writer = csv.writer(stream)
         if header:
             writer.writerow(header)
         for row in rows:
@@ -81,4 +165,7 @@ def write_csv(
         os.fsync(tmp.fileno())
         tmp_path = Path(tmp.name)
     _atomic_replace(tmp_path, target)
+    # Other newline modes translate line endings after the hash saw them
+    if newline in ("", "\n"):
+        _record_written(target, stream.hash.hexdigest())
     return target
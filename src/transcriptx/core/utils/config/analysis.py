@@ -224,6 +224,12 @@ class AnalysisConfig:
     sentiment_backend: str = "vader"  # "vader" | "transformers"
     sentiment_model_name: str = "cardiffnlp/twitter-roberta-base-sentiment-latest"
 
+    # Transformer inference settings (transformers sentiment backend, emotion)
+    transformer_batch_size: int = 32  # texts per forward pass
+    transformer_device: str = "auto"  # "auto" | "cpu" | "cuda"
+    transformer_num_threads: int = 0  # torch intra-op threads; 0 = torch default
+    transformer_quantize: bool = False  # int8 dynamic quantization (CPU only)
+
     # NER analysis settings
     # Control which entities to extract and how to process them
     ner_labels: list[str] = field(default_factory=lambda: DEFAULT_NER_LABELS)
@@ -231,7 +237,13 @@ class AnalysisConfig:
     ner_include_geocoding: bool = True
     ner_use_light_model: bool = False
     ner_max_segments: int = 5000
-    ner_batch_size: int = 100
+    ner_batch_size: int = 100  # texts per spaCy nlp.pipe batch
+    ner_n_process: int = 1  # spaCy worker processes (-1 = all CPUs)
+    nlp_doc_cache: bool = True  # persist parsed spaCy Docs under DATA_DIR/cache/nlp
+    embedding_cache: bool = (
+        True  # persist text embeddings under DATA_DIR/cache/embeddings
+    )
+    embedding_cache_max_mb: int = 512  # per-model size bound (LRU eviction)
 
     # Word clouds settings
     # Control the generation and appearance of word clouds
@@ -781,6 +793,9 @@ class AnalysisConfig:
     semantic_batch_size: int = (
         64  # Batch size for processing (increased from 32 for better performance)
     )
+    semantic_matrix_max_elements: int = (
+        4_000_000  # Max floats per similarity tile (bounds memory on long transcripts)
+    )
 
     # General
     output_formats: list[str] = field(default_factory=lambda: ["json", "csv", "png"])
@@ -874,6 +889,13 @@ class TopicModelingConfig:
     # Search settings
     k_range: tuple[int, int] = (3, 15)  # Topic count search range
     test_size: float = 0.2  # Train/test split
+    # k values fitted in parallel processes (1 = in-process, -1 = all CPUs).
+    # Opt-in: the pipeline may already run other modules in parallel.
+    k_sweep_workers: int = 1
+    # Stop once coherence has not improved by k_plateau_tolerance for this
+    # many consecutive k (0 = always sweep the whole range)
+    k_plateau_patience: int = 3
+    k_plateau_tolerance: float = 0.01
 
 
 @dataclass
@@ -1090,9 +1112,14 @@ class VoiceConfig:
     # Feature extraction
     sample_rate: int = 16000
     vad_mode: int = 2
+    vad_backend: str = "numpy"  # numpy|webrtcvad (optional, higher accuracy)
     pad_s: float = 0.15
     max_seconds_for_pitch: float = 20.0
     max_segments_considered: int | None = None
+    # Segment chunks featurized in parallel processes (1 = in-process, -1 = all
+    # CPUs). Opt-in: the pipeline may already run other modules in parallel.
+    feature_workers: int = 1
+    feature_chunk_size: int = 64  # segments per worker task
 
     # openSMILE eGeMAPS extraction
     egemaps_enabled: bool = True
@@ -31,6 +31,9 @@ class DatabaseConfig:
     db_first: bool = False  # Prefer DB reads for transcripts
     auto_import: bool = False  # Auto-import transcripts into DB on miss
     strict_db: bool = False  # Fail if DB read/write fails
+    sqlite_pool_size: int = 8  # Pooled SQLite connections; 0 = one shared connection
+    sqlite_busy_timeout_ms: int = 30000  # Wait for SQLite locks before SQLITE_BUSY
+    sqlite_write_retries: int = 5  # Retries with backoff after SQLITE_BUSY
 
 
 @dataclass
@@ -360,6 +363,13 @@ class TranscriptXConfig:
             val = db_strict.strip().lower()
             self.database.strict_db = val in ("1", "true", "yes", "on")
 
+        db_pool_size = os.getenv("TRANSCRIPTX_DB_SQLITE_POOL_SIZE")
+        if db_pool_size is not None:
+            try:
+                self.database.sqlite_pool_size = max(0, int(db_pool_size))
+            except ValueError:
+                pass
+
         # Audio preprocessing configuration from environment
         # Global preprocessing mode
         if os.getenv("TRANSCRIPTX_AUDIO_PREPROCESSING_MODE"):
@@ -718,12 +728,20 @@ class TranscriptXConfig:
                 "emotion_score_threshold": self.analysis.emotion_score_threshold,
                 "sentiment_backend": self.analysis.sentiment_backend,
                 "sentiment_model_name": self.analysis.sentiment_model_name,
+                "transformer_batch_size": self.analysis.transformer_batch_size,
+                "transformer_device": self.analysis.transformer_device,
+                "transformer_num_threads": self.analysis.transformer_num_threads,
+                "transformer_quantize": self.analysis.transformer_quantize,
                 "ner_labels": self.analysis.ner_labels,
                 "ner_min_confidence": self.analysis.ner_min_confidence,
                 "ner_include_geocoding": self.analysis.ner_include_geocoding,
                 "ner_use_light_model": self.analysis.ner_use_light_model,
                 "ner_max_segments": self.analysis.ner_max_segments,
                 "ner_batch_size": self.analysis.ner_batch_size,
+                "ner_n_process": self.analysis.ner_n_process,
+                "nlp_doc_cache": self.analysis.nlp_doc_cache,
+                "embedding_cache": self.analysis.embedding_cache,
+                "embedding_cache_max_mb": self.analysis.embedding_cache_max_mb,
                 "wordcloud_max_words": self.analysis.wordcloud_max_words,
                 "wordcloud_min_font_size": self.analysis.wordcloud_min_font_size,
                 "wordcloud_stopwords": self.analysis.wordcloud_stopwords,
@@ -765,6 +783,7 @@ class TranscriptXConfig:
                 "max_semantic_comparisons": self.analysis.max_semantic_comparisons,
                 "semantic_timeout_seconds": self.analysis.semantic_timeout_seconds,
                 "semantic_batch_size": self.analysis.semantic_batch_size,
+                "semantic_matrix_max_elements": self.analysis.semantic_matrix_max_elements,
                 "output_formats": self.analysis.output_formats,
                 # Parallel processing removed - using DAG pipeline instead
                 # Max workers removed - using DAG pipeline instead
@@ -1103,6 +1122,8 @@ def initialize_default_profiles():
             "timeout_full_seconds": 7200,
             "update_interval": 10.0,
             "max_size_mb": 30,
+            "batch_workers": 1,
+            "batch_worker_memory_mb": 0,
             "subprocess_timeout": 5,
             "mp3_bitrate": "192k",
             "conversion_time_factor": 0.5,
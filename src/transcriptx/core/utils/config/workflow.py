@@ -102,6 +102,10 @@ class WorkflowConfig:
 
     # Batch processing
     max_size_mb: int = 30  # File size filter threshold
+    # Batch analysis worker processes (-1 = all CPUs; 1 = one transcript at a time)
+    batch_workers: int = 1
+    # Recycle a batch worker after a transcript once its RSS exceeds this (0 = no limit)
+    batch_worker_memory_mb: int = 0
 
     # Audio processing
     subprocess_timeout: int = 5  # seconds
@@ -0,0 +1,261 @@
+"""
+Parse-once spaCy annotation layer for a transcript.
+
+NER, POS word clouds and speaker profiling all need spaCy annotations for the
+same segment texts. PipelineContext creates one SegmentDocLayer per transcript
+and registers it here; the first consumer triggers a single ``nlp.pipe`` pass
+over every segment, and later consumers reuse the parsed Docs (tokens, POS,
+lemmas, entities, sentence boundaries).
+
+Parsed Docs are persisted as a spaCy DocBin under ``DATA_DIR/cache/nlp``, keyed
+by transcript identity hash and model name/version, so re-runs never re-parse.
+
+A segment's Doc depends only on its text, so lookups are by text: any list of
+segments (the context's own, a per-speaker subset, or segments re-loaded from
+disk) can be served as long as every text was parsed.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional
+
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+_ACTIVE_LAYER: Optional["SegmentDocLayer"] = None
+
+
+def get_nlp_cache_root() -> Path:
+    from transcriptx.core.utils.paths import DATA_DIR
+
+    root = Path(DATA_DIR) / "cache" / "nlp"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def set_segment_doc_layer(layer: "SegmentDocLayer") -> None:
+    """Register the doc layer for the transcript currently being analyzed."""
+    global _ACTIVE_LAYER
+    _ACTIVE_LAYER = layer
+
+
+def get_segment_doc_layer() -> Optional["SegmentDocLayer"]:
+    """Return the registered doc layer, if any."""
+    return _ACTIVE_LAYER
+
+
+def clear_segment_doc_layer(layer: Optional["SegmentDocLayer"] = None) -> None:
+    """Clear the registered doc layer (only if it is ``layer``, when given)."""
+    global _ACTIVE_LAYER
+    if layer is None or _ACTIVE_LAYER is layer:
+        _ACTIVE_LAYER = None
+
+
+def docs_for_texts(texts: Iterable[str], nlp: Any = None) -> Optional[List[Any]]:
+    """
+    Parsed Docs for segment ``texts`` from the registered layer.
+
+    Returns None when no layer is registered, it was parsed with a pipeline
+    other than ``nlp`` (when given), a text was not parsed, or parsing failed;
+    callers then fall back to running spaCy themselves.
+    """
+    layer = _ACTIVE_LAYER
+    if layer is None or (nlp is not None and not layer.parses_with(nlp)):
+        return None
+    try:
+        return layer.docs_for_texts(texts)
+    except Exception as e:
+        logger.warning(f"spaCy doc layer unavailable: {e}")
+        return None
+
+
+def docs_for_segments(
+    segments: Iterable[Dict[str, Any]], nlp: Any = None
+) -> Optional[List[Any]]:
+    """Parsed Docs for ``segments`` from the registered layer (see docs_for_texts)."""
+    return docs_for_texts((_segment_text(seg) for seg in segments), nlp)
+
+
+def _segment_text(segment: Dict[str, Any]) -> str:
+    text = segment.get("text")
+    return text if isinstance(text, str) else ""
+
+
+def _model_slug(nlp: Any) -> str:
+    meta = getattr(nlp, "meta", None) or {}
+    name = f"{meta.get('lang', 'xx')}_{meta.get('name', 'pipeline')}"
+    slug = f"{name}-{meta.get('version', '0.0.0')}"
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", slug)
+
+
+class SegmentDocLayer:
+    """
+    Lazily parsed spaCy Docs for one transcript's segments.
+
+    Docs are produced on first access (thread-safe) from the DocBin cache when
+    available, otherwise by one ``nlp.pipe`` pass over the unique segment texts.
+    """
+
+    def __init__(
+        self,
+        segments: List[Dict[str, Any]],
+        transcript_key: str,
+        *,
+        nlp: Any = None,
+        cache_dir: Optional[Path] = None,
+        use_cache: bool = True,
+        batch_size: int = 100,
+        n_process: int = 1,
+    ):
+        """
+        Args:
+            segments: Transcript segments to annotate
+            transcript_key: Transcript identity hash (cache key)
+            nlp: spaCy Language (shared runtime model when None)
+            cache_dir: DocBin cache directory (DATA_DIR/cache/nlp when None)
+            use_cache: Read/write the DocBin cache
+            batch_size: nlp.pipe batch size
+            n_process: nlp.pipe worker processes
+        """
+        self.transcript_key = transcript_key
+        self._texts = [_segment_text(seg) for seg in segments]
+        self._text_set = frozenset(self._texts)
+        self._nlp = nlp
+        self._cache_dir = cache_dir
+        self._use_cache = use_cache
+        self._batch_size = batch_size
+        self._n_process = n_process
+        self._docs_by_text: Optional[Dict[str, Any]] = None
+        self._lock = threading.Lock()
+        self.cache_hit = False
+
+    # -- loading -----------------------------------------------------------
+
+    @property
+    def nlp(self) -> Any:
+        """spaCy Language the Docs are (or will be) parsed with."""
+        if self._nlp is None:
+            from transcriptx.core.utils.nlp_runtime import get_nlp_model
+
+            self._nlp = get_nlp_model()
+        return self._nlp
+
+    def parses_with(self, nlp: Any) -> bool:
+        """True if Docs come from ``nlp``; never loads the shared model."""
+        if self._nlp is None:
+            from transcriptx.core.utils.nlp_runtime import (
+                get_nlp_model,
+                get_nlp_model_name,
+            )
+
+            if get_nlp_model_name() is None:
+                return False
+            return get_nlp_model() is nlp
+        return self._nlp is nlp
+
+    def cache_path(self) -> Optional[Path]:
+        """DocBin path for this transcript and model, or None if not cached."""
+        nlp = self.nlp
+        if not self._use_cache or not getattr(nlp, "pipe_names", None):
+            return None
+        key = self.transcript_key.split(":", 1)[-1]
+        cache_dir = self._cache_dir or get_nlp_cache_root()
+        return Path(cache_dir) / f"{key}-{_model_slug(nlp)}.spacy"
+
+    def _unique_texts(self) -> List[str]:
+        return list(dict.fromkeys(self._texts))
+
+    def _load_cached(self, path: Path, texts: List[str]) -> Optional[List[Any]]:
+        from spacy.tokens import DocBin
+
+        try:
+            docs = list(DocBin().from_disk(path).get_docs(self.nlp.vocab))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable spaCy doc cache {path}: {e}")
+            return None
+        if [doc.text for doc in docs] != texts:
+            return None
+        return docs
+
+    def _save_cached(self, path: Path, docs: List[Any]) -> None:
+        from spacy.tokens import DocBin
+
+        tmp_path = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            DocBin(docs=docs).to_disk(tmp_path)
+            os.replace(tmp_path, path)
+        except Exception as e:
+            logger.warning(f"Could not write spaCy doc cache {path}: {e}")
+            tmp_path.unlink(missing_ok=True)
+
+    def _parse(self) -> Dict[str, Any]:
+        texts = self._unique_texts()
+        path = self.cache_path()
+        docs = self._load_cached(path, texts) if path and path.exists() else None
+        if docs is not None:
+            self.cache_hit = True
+        else:
+            from transcriptx.core.utils.nlp_runtime import pipe_docs
+
+            docs = list(
+                pipe_docs(
+                    self.nlp,
+                    texts,
+                    batch_size=self._batch_size,
+                    n_process=self._n_process,
+                )
+            )
+            if path is not None:
+                self._save_cached(path, docs)
+        return dict(zip(texts, docs))
+
+    def _ensure_docs(self) -> Dict[str, Any]:
+        if self._docs_by_text is None:
+            with self._lock:
+                if self._docs_by_text is None:
+                    self._docs_by_text = self._parse()
+        return self._docs_by_text
+
+    # -- access ------------------------------------------------------------
+
+    def covers_text(self, text: str) -> bool:
+        """True if ``text`` is one of this transcript's segment texts."""
+        return text in self._text_set
+
+    def doc_for_text(self, text: str) -> Optional[Any]:
+        """Parsed Doc for a segment text, or None if it is not in the transcript."""
+        if text not in self._text_set:
+            return None
+        return self._ensure_docs().get(text)
+
+    def docs_for_texts(self, texts: Iterable[str]) -> Optional[List[Any]]:
+        """One Doc per text, in order; None if any text is unknown."""
+        wanted = list(texts)
+        # Check membership before parsing so foreign texts never trigger a parse
+        if not all(text in self._text_set for text in wanted):
+            return None
+        docs_by_text = self._ensure_docs()
+        return [docs_by_text[text] for text in wanted]
+
+    def docs_for_segments(
+        self, segments: Iterable[Dict[str, Any]]
+    ) -> Optional[List[Any]]:
+        """One Doc per segment, in order; None if any text is unknown."""
+        return self.docs_for_texts(_segment_text(seg) for seg in segments)
+
+    @staticmethod
+    def iter_tokens(
+        docs: Iterable[Any], pos_tags: Optional[Iterable[str]] = None
+    ) -> Iterator[Any]:
+        """Tokens across docs, optionally restricted to coarse POS tags."""
+        allowed = set(pos_tags) if pos_tags is not None else None
+        for doc in docs:
+            for token in doc:
+                if allowed is None or token.pos_ in allowed:
+                    yield token
@@ -0,0 +1,474 @@
+"""
+Persistent, cross-run store for text embeddings.
+
+Echoes and semantic similarity both embed segment texts, and re-runs on the
+same transcript embed the same sentences again. ``EmbeddingStore`` keeps every
+vector it has computed on disk, keyed by ``(model id, normalized text hash)``:
+
+- vectors live in float32 ``.npy`` shards that are memory-mapped on read, so
+  looking up thousands of cached rows never loads the whole store;
+- a small JSON index maps each text hash to its shard and row, plus a
+  last-used tick for LRU eviction;
+- new vectors are buffered and written one shard per ``flush`` (or per
+  ``buffer_rows`` rows), under a file lock that also covers index merges and
+  shard deletion, since concurrent runs and batch workers share the directory;
+- when the live vectors exceed ``max_bytes``, least recently used entries are
+  dropped and shards that no longer hold enough live rows are compacted.
+
+Consumers call ``get_or_compute(texts, compute_fn)``: cached texts are read
+from disk, the rest are passed to ``compute_fn`` in batches and stored.
+
+Stores live under ``DATA_DIR/cache/embeddings/<model id>``; one store per model
+is shared process-wide (see ``get_embedding_store``). With
+``embedding_cache`` disabled, the store keeps vectors in memory for the run only.
+"""
+
+from __future__ import annotations
+
+import atexit
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+import numpy as np
+
+from transcriptx.core.utils.file_lock import FileLock
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+DEFAULT_BUFFER_ROWS = 1024
+LOCK_TIMEOUT = 30
+INDEX_FILE = "index.json"
+INDEX_VERSION = 1
+
+_STORES: Dict[str, "EmbeddingStore"] = {}
+_STORES_LOCK = threading.Lock()
+
+ComputeFn = Callable[[List[str]], Sequence[Optional[np.ndarray]]]
+
+
+def get_embedding_cache_root() -> Path:
+    from transcriptx.core.utils.paths import DATA_DIR
+
+    root = Path(DATA_DIR) / "cache" / "embeddings"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def normalize_text(text: str) -> str:
+    """Collapse whitespace so trivially different copies share one entry."""
+    return " ".join(text.split())
+
+
+def text_key(text: str) -> str:
+    """Hash of the normalized text (the per-model store key)."""
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def _safe_model_dir(model_id: str) -> str:
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", model_id).strip("_") or "model"
+
+
+class EmbeddingStore:
+    """Disk-backed embedding vectors for one model, with LRU eviction by size."""
+
+    def __init__(
+        self,
+        model_id: str,
+        root: Optional[Path] = None,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        buffer_rows: int = DEFAULT_BUFFER_ROWS,
+    ) -> None:
+        """
+        Args:
+            model_id: Identifies the model (and pooling) that produced vectors
+            root: Parent cache directory; None keeps vectors in memory only
+            max_bytes: Upper bound on live vector bytes before LRU eviction
+            buffer_rows: New rows kept in memory before they are written out
+        """
+        self.model_id = model_id
+        self.max_bytes = max(0, int(max_bytes))
+        self.buffer_rows = max(1, int(buffer_rows))
+        self.directory = Path(root) / _safe_model_dir(model_id) if root else None
+        self._lock = threading.RLock()
+        self._tick = 0
+        self._saved_tick = 0
+        self._dim: Optional[int] = None
+        # key -> [shard, row, last_used ns]; shard is None for in-memory entries
+        self._entries: Dict[str, list] = {}
+        # Vectors not (yet) in a shard: all of them without a directory
+        self._memory: Dict[str, np.ndarray] = {}
+        self._pending: List[str] = []
+        self._shards: Dict[str, np.ndarray] = {}
+        self._next_shard = 0
+        self.hits = 0
+        self.misses = 0
+        if self.directory is not None:
+            self._load_index()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def live_bytes(self) -> int:
+        return len(self._entries) * (self._dim or 0) * 4
+
+    def get_many(self, texts: Sequence[str]) -> List[Optional[np.ndarray]]:
+        """Cached vector per text (None for misses)."""
+        with self._lock:
+            results: List[Optional[np.ndarray]] = []
+            for text in texts:
+                key = text_key(text)
+                entry = self._entries.get(key)
+                vector = None
+                if entry is not None:
+                    try:
+                        vector = self._read(key, entry)
+                    except (OSError, ValueError, IndexError) as e:
+                        # Shard removed or truncated by another process
+                        logger.debug(f"Dropping unreadable embedding {key}: {e}")
+                        del self._entries[key]
+                    else:
+                        entry[2] = self._next_tick()
+                results.append(vector)
+            return results
+
+    def put_many(
+        self, texts: Sequence[str], vectors: Sequence[Optional[np.ndarray]]
+    ) -> None:
+        """
+        Store vectors for texts; None vectors are skipped.
+
+        On disk, new rows are buffered and written as one shard by ``flush``
+        (called automatically once ``buffer_rows`` rows are pending).
+        """
+        with self._lock:
+            added = False
+            for text, vector in zip(texts, vectors, strict=True):
+                if vector is None:
+                    continue
+                row = np.asarray(vector, dtype=np.float32).ravel()
+                if self._dim is None:
+                    self._dim = len(row)
+                if len(row) != self._dim:
+                    continue
+                key = text_key(text)
+                if key in self._entries:
+                    continue
+                self._memory[key] = row
+                self._entries[key] = [None, 0, self._next_tick()]
+                if self.directory is not None:
+                    self._pending.append(key)
+                added = True
+            if not added:
+                return
+            if self.directory is None:
+                self._evict()
+            elif len(self._pending) >= self.buffer_rows:
+                self._sync()
+
+    def get_or_compute(
+        self,
+        texts: Sequence[str],
+        compute_fn: ComputeFn,
+        batch_size: int = 64,
+    ) -> List[Optional[np.ndarray]]:
+        """
+        One vector (or None) per text, computing and storing only misses.
+
+        ``compute_fn`` receives lists of at most ``batch_size`` unique texts and
+        returns one vector (or None when a text cannot be embedded) per text.
+        """
+        results = self.get_many(texts)
+        missing: Dict[str, List[int]] = {}
+        for idx, (text, vector) in enumerate(zip(texts, results)):
+            if vector is None:
+                missing.setdefault(text, []).append(idx)
+        self.hits += len(texts) - sum(len(v) for v in missing.values())
+        self.misses += len(missing)
+
+        pending = list(missing)
+        batch_size = max(1, int(batch_size))
+        for start in range(0, len(pending), batch_size):
+            batch = pending[start : start + batch_size]
+            computed = list(compute_fn(batch))
+            vectors = [
+                None if v is None else np.asarray(v, dtype=np.float32).ravel()
+                for v in computed
+            ]
+            self.put_many(batch, vectors)
+            for text, vector in zip(batch, vectors, strict=True):
+                for idx in missing[text]:
+                    results[idx] = vector
+        if pending:
+            self.flush()
+        return results
+
+    def flush(self) -> None:
+        """Write buffered rows as one shard and persist the index."""
+        with self._lock:
+            if self._pending or self._tick != self._saved_tick:
+                self._sync()
+
+    def _next_tick(self) -> int:
+        # Wall-clock based so last-used ticks from other processes compare
+        self._tick = max(self._tick + 1, time.time_ns())
+        return self._tick
+
+    def _read(self, key: str, entry: list) -> np.ndarray:
+        shard, row = entry[0], entry[1]
+        if shard is None:
+            return self._memory[key]
+        return np.array(self._shard(shard)[row])
+
+    def _shard(self, name: str) -> np.ndarray:
+        data = self._shards.get(name)
+        if data is None:
+            data = np.load(self.directory / name, mmap_mode="r")
+            self._shards[name] = data
+        return data
+
+    def _sync(self) -> None:
+        """
+        Merge with the on-disk index, write pending rows, evict and save.
+
+        Runs under a file lock on the index: other processes (concurrent runs,
+        batch workers) share the directory, so shard names are picked, and
+        unreferenced shards deleted, only against the merged index.
+        """
+        if self.directory is None:
+            return
+        self.directory.mkdir(parents=True, exist_ok=True)
+        lock = FileLock(self.directory / INDEX_FILE, timeout=LOCK_TIMEOUT)
+        if not lock.acquire():
+            logger.warning(
+                f"Embedding store {self.directory} is locked; "
+                f"keeping {len(self._pending)} rows buffered"
+            )
+            return
+        try:
+            self._merge_index()
+            if self._pending:
+                keys = [
+                    key
+                    for key in self._pending
+                    if key in self._entries and self._entries[key][0] is None
+                ]
+                if keys:
+                    shard = self._write_shard(
+                        np.vstack([self._memory[key] for key in keys])
+                    )
+                    for row_idx, key in enumerate(keys):
+                        self._entries[key][0] = shard
+                        self._entries[key][1] = row_idx
+                        del self._memory[key]
+                self._pending = []
+            self._evict()
+            self._save_index()
+        finally:
+            lock.release()
+
+    def _write_shard(self, matrix: np.ndarray) -> str:
+        # Caller holds the index lock, so the name cannot be taken concurrently
+        while True:
+            name = f"shard-{self._next_shard:06d}.npy"
+            self._next_shard += 1
+            if not (self.directory / name).exists():
+                break
+        tmp = self.directory / f".{name}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as handle:
+            np.save(handle, matrix)
+        os.replace(tmp, self.directory / name)
+        return name
+
+    def _evict(self) -> None:
+        if not self.max_bytes or self.live_bytes <= self.max_bytes:
+            return
+        row_bytes = (self._dim or 0) * 4
+        keep = self.max_bytes // row_bytes if row_bytes else len(self._entries)
+        by_age = sorted(self._entries, key=lambda k: self._entries[k][2])
+        for key in by_age[: max(0, len(self._entries) - keep)]:
+            del self._entries[key]
+            self._memory.pop(key, None)
+        if self.directory is not None:
+            self._compact()
+
+    def _compact(self) -> None:
+        """Delete unreferenced shards; rewrite shards that are mostly dead."""
+        live: Dict[str, List[str]] = {}
+        for key, entry in self._entries.items():
+            live.setdefault(entry[0], []).append(key)
+        for path in self.directory.glob("shard-*.npy"):
+            name = path.name
+            keys = live.get(name)
+            if keys:
+                total = len(self._shard(name))
+                if len(keys) * 2 >= total:
+                    continue
+                rows = np.vstack([self._read(k, self._entries[k]) for k in keys])
+                new_name = self._write_shard(rows)
+                for row_idx, key in enumerate(keys):
+                    self._entries[key][0] = new_name
+                    self._entries[key][1] = row_idx
+            self._shards.pop(name, None)
+            try:
+                path.unlink()
+            except OSError as e:
+                logger.debug(f"Could not remove embedding shard {path}: {e}")
+
+    def _read_index(self) -> Optional[dict]:
+        path = self.directory / INDEX_FILE
+        if not path.exists():
+            return None
+        try:
+            payload = json.loads(path.read_text(encoding="utf-8"))
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable embedding index {path}: {e}")
+            return None
+        if payload.get("version") != INDEX_VERSION:
+            return None
+        if payload.get("model_id") != self.model_id:
+            return None
+        return payload
+
+    def _shard_exists_cache(self) -> Callable[[str], bool]:
+        known: Dict[str, bool] = {}
+
+        def exists(name: str) -> bool:
+            if name not in known:
+                known[name] = (self.directory / name).exists()
+            return known[name]
+
+        return exists
+
+    def _load_index(self) -> None:
+        payload = self._read_index()
+        if payload is None:
+            return
+        exists = self._shard_exists_cache()
+        for key, entry in payload.get("entries", {}).items():
+            if exists(entry[0]):
+                self._entries[key] = list(entry)
+        self._dim = payload.get("dim")
+        self._tick = max((e[2] for e in self._entries.values()), default=0)
+        self._saved_tick = self._tick
+        self._next_shard = int(payload.get("next_shard", 0))
+
+    def _merge_index(self) -> None:
+        """Fold in entries other processes saved since this store last synced."""
+        payload = self._read_index()
+        if payload is None:
+            return
+        if self._dim is None:
+            self._dim = payload.get("dim")
+        elif payload.get("dim") not in (None, self._dim):
+            return
+        exists = self._shard_exists_cache()
+        for key, theirs in payload.get("entries", {}).items():
+            ours = self._entries.get(key)
+            if ours is not None and ours[0] is not None:
+                if exists(ours[0]):
+                    ours[2] = max(ours[2], theirs[2])
+                    continue
+            if not exists(theirs[0]):
+                continue
+            if ours is not None:
+                # Another process already stored this pending row
+                self._memory.pop(key, None)
+                theirs = [theirs[0], theirs[1], max(ours[2], theirs[2])]
+            self._entries[key] = list(theirs)
+        # Rows another process evicted and compacted away
+        for key in [
+            key
+            for key, entry in self._entries.items()
+            if entry[0] is not None and not exists(entry[0])
+        ]:
+            del self._entries[key]
+        self._tick = max([self._tick] + [entry[2] for entry in self._entries.values()])
+        self._next_shard = max(self._next_shard, int(payload.get("next_shard", 0)))
+
+    def _save_index(self) -> None:
+        if self.directory is None:
+            return
+        payload = {
+            "version": INDEX_VERSION,
+            "model_id": self.model_id,
+            "dim": self._dim,
+            "next_shard": self._next_shard,
+            "entries": {
+                key: entry
+                for key, entry in self._entries.items()
+                if entry[0] is not None
+            },
+        }
+        path = self.directory / INDEX_FILE
+        tmp = self.directory / f".{INDEX_FILE}.{os.getpid()}.tmp"
+        try:
+            tmp.write_text(json.dumps(payload), encoding="utf-8")
+            os.replace(tmp, path)
+            self._saved_tick = self._tick
+        except OSError as e:
+            logger.warning(f"Could not write embedding index {path}: {e}")
+
+
+def get_embedding_store(model_id: str) -> EmbeddingStore:
+    """Process-wide store for ``model_id``, configured from analysis settings."""
+    with _STORES_LOCK:
+        store = _STORES.get(model_id)
+        if store is None:
+            root: Optional[Path] = None
+            max_bytes = DEFAULT_MAX_BYTES
+            try:
+                from transcriptx.core.utils.config import get_config
+
+                analysis = get_config().analysis
+                if getattr(analysis, "embedding_cache", True):
+                    root = get_embedding_cache_root()
+                max_mb = getattr(analysis, "embedding_cache_max_mb", None)
+                if max_mb is not None:
+                    max_bytes = int(max_mb) * 1024 * 1024
+            except Exception as e:
+                logger.warning(f"Embedding cache disabled: {e}")
+                root = None
+            store = EmbeddingStore(model_id, root=root, max_bytes=max_bytes)
+            _STORES[model_id] = store
+        return store
+
+
+def flush_embedding_stores() -> None:
+    """Write buffered rows of every process-wide store (stores stay loaded)."""
+    with _STORES_LOCK:
+        stores = list(_STORES.values())
+    for store in stores:
+        store.flush()
+
+
+# Rows buffered outside a pipeline run (which flushes on close)
+atexit.register(flush_embedding_stores)
+
+
+def clear_embedding_stores() -> None:
+    """Forget process-wide stores (flushing their indexes first)."""
+    with _STORES_LOCK:
+        for store in _STORES.values():
+            store.flush()
+        _STORES.clear()
+
+
+def embed_with_store(
+    model_id: str,
+    texts: Sequence[str],
+    compute_fn: ComputeFn,
+    batch_size: int = 64,
+) -> List[Optional[np.ndarray]]:
+    """``get_or_compute`` on the shared store for ``model_id``."""
+    return get_embedding_store(model_id).get_or_compute(
+        texts, compute_fn, batch_size=batch_size
+    )
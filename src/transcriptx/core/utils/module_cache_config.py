@@ -11,10 +11,12 @@ MODULE_CONFIG_ALLOWLIST = {
     "sentiment": [
         "analysis.sentiment_window_size",
         "analysis.sentiment_min_confidence",
+        "analysis.transformer_quantize",
     ],
     "emotion": [
         "analysis.emotion_min_confidence",
         "analysis.emotion_model_name",
+        "analysis.transformer_quantize",
     ],
     "ner": [
         "analysis.ner_labels",
@@ -81,6 +83,7 @@ MODULE_CONFIG_ALLOWLIST = {
         "analysis.voice.enabled",
         "analysis.voice.sample_rate",
         "analysis.voice.vad_mode",
+        "analysis.voice.vad_backend",
         "analysis.voice.pad_s",
         "analysis.voice.max_seconds_for_pitch",
         "analysis.voice.egemaps_enabled",
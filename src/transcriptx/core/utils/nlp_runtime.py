@@ -11,7 +11,7 @@ from __future__ import annotations
 import logging
 import os
 import threading
-from typing import Optional, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -254,3 +254,60 @@ def get_nlp_model(model_name: Optional[str] = None):
 
 def get_nlp_model_name() -> Optional[str]:
     return _nlp_model_name
+
+
+# Components the NER path targets; their embedding sources are added per model.
+NER_COMPONENTS = ("ner",)
+
+
+def required_components(nlp: Any, targets: Iterable[str]) -> List[str]:
+    """
+    Names of ``targets`` plus every component they listen to, in pipeline order.
+
+    Shared embedding layers (``tok2vec`` in the CNN models, ``transformer`` in
+    ``en_core_web_trf``) feed downstream components through listeners; a
+    listened-to layer must stay enabled or its listeners get no input.
+    """
+    keep = set(targets)
+    for name, component in getattr(nlp, "pipeline", []):
+        listeners = getattr(component, "listening_components", None) or []
+        if keep.intersection(listeners):
+            keep.add(name)
+    return [name for name in getattr(nlp, "pipe_names", []) if name in keep]
+
+
+def disabled_components(nlp: Any, keep: Iterable[str]) -> List[str]:
+    """Names of pipeline components not in ``keep``."""
+    keep = set(keep)
+    return [name for name in getattr(nlp, "pipe_names", []) if name not in keep]
+
+
+def pipe_docs(
+    nlp: Any,
+    texts: Iterable[Any],
+    *,
+    batch_size: int = 100,
+    n_process: int = 1,
+    keep: Optional[Iterable[str]] = None,
+    as_tuples: bool = False,
+) -> Iterator[Any]:
+    """
+    Stream texts through ``nlp.pipe``.
+
+    Components outside ``keep`` (and the layers ``keep`` listens to, see
+    required_components) are skipped per call (the shared model is not
+    modified, so concurrent callers are unaffected). With ``as_tuples=True``,
+    ``texts`` yields ``(text, context)`` pairs and ``(doc, context)`` pairs are
+    returned. ``n_process`` > 1 (or -1 for all CPUs) uses spaCy multiprocessing.
+    """
+    kwargs: Dict[str, Any] = {
+        "batch_size": max(1, int(batch_size)),
+        "as_tuples": as_tuples,
+    }
+    if keep is not None:
+        disable = disabled_components(nlp, required_components(nlp, keep))
+        if disable:
+            kwargs["disable"] = disable
+    if n_process and n_process != 1:
+        kwargs["n_process"] = n_process
+    return nlp.pipe(texts, **kwargs)
@@ -290,6 +290,10 @@ def save_run_manifest(manifest: RunManifest, output_dir: Optional[str] = None) -
     manifest_path = manifest_dir / "manifest.json"
     write_json(manifest_path, manifest.to_dict(), indent=2, ensure_ascii=False)
 
+    from transcriptx.core.store.session_catalog import invalidate_session
+
+    invalidate_session(output_dir)
+
     logger.info(f"Saved run manifest to {manifest_path}")
     return manifest_path
 
@@ -8,7 +8,7 @@ consistent similarity metrics throughout the codebase.
 
 import re
 from collections import Counter
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Sequence, Tuple
 
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -85,6 +85,62 @@ class SimilarityCalculator:
             logger.warning(f"Unknown similarity method: {method}, using TF-IDF")
             return self._tfidf_similarity(text1, text2)
 
+    def calculate_pair_similarities(
+        self,
+        texts: Sequence[str],
+        pairs: Sequence[Tuple[int, int]],
+        method: str = "tfidf",
+    ) -> List[float]:
+        """
+        Similarity of ``texts[i]`` and ``texts[j]`` for every ``(i, j)`` pair.
+
+        For 'tfidf', one vectorizer is fitted for all texts (or the transcript's
+        registered TF-IDF index is reused) and pairs are scored as sparse row
+        dot products; other methods score each pair as calculate_text_similarity.
+
+        Args:
+            texts: Text strings indexed by the pairs
+            pairs: (i, j) index pairs into ``texts``
+            method: Similarity method ('tfidf', 'jaccard', 'cosine', 'overlap')
+
+        Returns:
+            One similarity score between 0 and 1 per pair
+        """
+        if method != "tfidf" or not self.tfidf_vectorizer:
+            return [
+                self.calculate_text_similarity(texts[i], texts[j], method=method)
+                for i, j in pairs
+            ]
+
+        stripped = [(text or "").strip() for text in texts]
+        scores = [0.0] * len(pairs)
+        scored: List[int] = []
+        for k, (i, j) in enumerate(pairs):
+            if not stripped[i] or not stripped[j]:
+                continue
+            if stripped[i] == stripped[j]:
+                scores[k] = 1.0
+            else:
+                scored.append(k)
+        if not scored:
+            return scores
+
+        from transcriptx.core.utils.tfidf_index import index_for_texts
+
+        index = index_for_texts([t for t in stripped if t])
+        if index is None:
+            for k in scored:
+                i, j = pairs[k]
+                scores[k] = self._jaccard_similarity(stripped[i], stripped[j])
+            return scores
+
+        rows = index.rows(stripped)
+        left = np.array([rows[pairs[k][0]] for k in scored], dtype=np.intp)
+        right = np.array([rows[pairs[k][1]] for k in scored], dtype=np.intp)
+        for k, value in zip(scored, index.pair_similarities(left, right)):
+            scores[k] = float(value)
+        return scores
+
     def _tfidf_similarity(self, text1: str, text2: str) -> float:
         """Calculate TF-IDF based similarity."""
         try:
@@ -7,11 +7,14 @@ for grouping and distinguishing speakers with the same name.
 """
 
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, Union
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple, Union
 
 from transcriptx.utils.text_utils import is_named_speaker
 
 _SPEAKER_DISPLAY_MAP: Optional[Dict[str, str]] = None
+_SPEAKER_INDEX: Optional["SpeakerIndex"] = None
+_MISS = object()
 
 
 def set_speaker_display_map(mapping: Dict[str, str]) -> None:
@@ -24,6 +27,22 @@ def clear_speaker_display_map() -> None:
     _SPEAKER_DISPLAY_MAP = None
 
 
+def set_speaker_index(index: "SpeakerIndex") -> None:
+    global _SPEAKER_INDEX
+    _SPEAKER_INDEX = index
+
+
+def get_speaker_index() -> Optional["SpeakerIndex"]:
+    return _SPEAKER_INDEX
+
+
+def clear_speaker_index(index: Optional["SpeakerIndex"] = None) -> None:
+    """Clear the active speaker index (only if it is ``index``, when given)."""
+    global _SPEAKER_INDEX
+    if index is None or _SPEAKER_INDEX is index:
+        _SPEAKER_INDEX = None
+
+
 @dataclass
 class SpeakerInfo:
     """Speaker information extracted from segment."""
@@ -48,6 +67,14 @@ def extract_speaker_info(segment: Dict[str, Any]) -> Optional[SpeakerInfo]:
     Returns:
         SpeakerInfo if speaker found, None otherwise
     """
+    if _SPEAKER_INDEX is not None:
+        cached = _SPEAKER_INDEX.lookup_info(segment)
+        if cached is not _MISS:
+            return cached
+    return _extract_speaker_info_uncached(segment)
+
+
+def _extract_speaker_info_uncached(segment: Dict[str, Any]) -> Optional[SpeakerInfo]:
     # Check for speaker_db_id first (canonical identifier)
     db_id = segment.get("speaker_db_id")
     if db_id is not None:
@@ -131,6 +158,10 @@ def get_unique_speakers(segments: List[Dict[str, Any]]) -> Dict[Union[str, int],
     Returns:
         Dictionary mapping grouping_key -> display_name
     """
+    index = _SPEAKER_INDEX
+    if index is not None and index.covers(segments):
+        return dict(index.display_names)
+
     # First pass: collect all speakers with their info
     speaker_infos: Dict[Union[str, int], SpeakerInfo] = {}
     name_counts: Dict[str, int] = {}
@@ -182,6 +213,10 @@ def group_segments_by_speaker(
     Returns:
         Dictionary mapping grouping_key -> list of segments
     """
+    index = _SPEAKER_INDEX
+    if index is not None and index.covers(segments):
+        return {key: index.segments_for(key) for key in index.segment_indices}
+
     grouped: Dict[Union[str, int], List[Dict[str, Any]]] = {}
 
     for segment in segments:
@@ -197,6 +232,121 @@ def group_segments_by_speaker(
     return grouped
 
 
+def _speaker_fields(segment: Dict[str, Any]) -> Tuple[Any, Any, Any]:
+    """The segment fields that fully determine its SpeakerInfo."""
+    return (
+        segment.get("speaker_db_id"),
+        segment.get("speaker", _MISS),
+        segment.get("original_speaker_id"),
+    )
+
+
+class SpeakerIndex:
+    """
+    Immutable per-transcript speaker index.
+
+    Built once from a transcript's segments (PipelineContext does this at load
+    time) so that speaker resolution is a dictionary lookup instead of a scan
+    over every segment. All mappings are read-only views.
+
+    Attributes:
+        display_names: grouping_key -> display name (as get_unique_speakers)
+        disambiguated_keys: grouping keys whose display name carries an ID suffix
+        named_keys: grouping keys whose speaker is a human-annotated name
+        segment_indices: grouping_key -> tuple of segment positions
+    """
+
+    __slots__ = (
+        "_segments",
+        "_segment_count",
+        "display_names",
+        "disambiguated_keys",
+        "named_keys",
+        "segment_indices",
+        "_db_ids_by_name",
+        "_info_by_fields",
+    )
+
+    def __init__(self, segments: List[Dict[str, Any]]):
+        speaker_infos: Dict[Union[str, int], SpeakerInfo] = {}
+        segment_indices: Dict[Union[str, int], List[int]] = {}
+        db_ids_by_name: Dict[Any, set] = {}
+        info_by_fields: Dict[Tuple[Any, Any, Any], Optional[SpeakerInfo]] = {}
+
+        for position, segment in enumerate(segments):
+            fields = _speaker_fields(segment)
+            try:
+                info = info_by_fields.get(fields, _MISS)
+                if info is _MISS:
+                    info = _extract_speaker_info_uncached(segment)
+                    info_by_fields[fields] = info
+                db_ids_by_name.setdefault(segment.get("speaker"), set()).add(fields[0])
+            except TypeError:
+                # Unhashable speaker fields: leave this segment to the slow path
+                info = _extract_speaker_info_uncached(segment)
+            if info is None:
+                continue
+            speaker_infos.setdefault(info.grouping_key, info)
+            segment_indices.setdefault(info.grouping_key, []).append(position)
+
+        keys_by_name: Dict[str, List[Union[str, int]]] = {}
+        for key, info in speaker_infos.items():
+            keys_by_name.setdefault(info.display_name, []).append(key)
+
+        display_names: Dict[Union[str, int], str] = {}
+        disambiguated: set = set()
+        for key, info in speaker_infos.items():
+            if len(keys_by_name[info.display_name]) > 1 and info.db_id:
+                display_names[key] = f"{info.display_name} (ID: {info.db_id})"
+                disambiguated.add(key)
+            else:
+                display_names[key] = info.display_name
+
+        self._segments = segments
+        self._segment_count = len(segments)
+        self.display_names: Mapping[Union[str, int], str] = MappingProxyType(
+            display_names
+        )
+        self.disambiguated_keys = frozenset(disambiguated)
+        self.named_keys = frozenset(
+            key
+            for key, info in speaker_infos.items()
+            if is_named_speaker(info.display_name)
+        )
+        self.segment_indices: Mapping[Union[str, int], Tuple[int, ...]] = (
+            MappingProxyType({key: tuple(idx) for key, idx in segment_indices.items()})
+        )
+        self._db_ids_by_name = MappingProxyType(
+            {name: frozenset(ids) for name, ids in db_ids_by_name.items()}
+        )
+        self._info_by_fields = MappingProxyType(info_by_fields)
+
+    @classmethod
+    def build(cls, segments: List[Dict[str, Any]]) -> "SpeakerIndex":
+        return cls(segments)
+
+    def covers(self, segments: Optional[List[Dict[str, Any]]]) -> bool:
+        """True if ``segments`` is the (unchanged-length) list this index was built from."""
+        return segments is self._segments and len(segments) == self._segment_count
+
+    def lookup_info(self, segment: Dict[str, Any]) -> Any:
+        """Cached SpeakerInfo for a segment, or _MISS if not indexed."""
+        try:
+            return self._info_by_fields.get(_speaker_fields(segment), _MISS)
+        except TypeError:
+            return _MISS
+
+    def needs_disambiguation(self, speaker_name: Any, db_id: Any) -> bool:
+        """True if another speaker_db_id uses ``speaker_name`` in the transcript."""
+        db_ids = self._db_ids_by_name.get(speaker_name)
+        if not db_ids:
+            return False
+        return len(db_ids) > 1 or db_id not in db_ids
+
+    def segments_for(self, grouping_key: Union[str, int]) -> List[Dict[str, Any]]:
+        return [self._segments[i] for i in self.segment_indices.get(grouping_key, ())]
+
+
 def get_speaker_display_name(
     grouping_key: Union[str, int],
     segments: List[Dict[str, Any]],
@@ -229,15 +379,22 @@ def get_speaker_display_name(
     if all_segments is None:
         all_segments = segments
 
-    # Count how many speakers have the same name
-    same_name_count = sum(
-        1
-        for seg in all_segments
-        if seg.get("speaker") == base_name and seg.get("speaker_db_id") != db_id
-    )
+    index = _SPEAKER_INDEX
+    needs_disambiguation: Optional[bool] = None
+    if index is not None and index.covers(all_segments):
+        try:
+            needs_disambiguation = index.needs_disambiguation(base_name, db_id)
+        except TypeError:
+            needs_disambiguation = None
+    if needs_disambiguation is None:
+        # Count how many speakers have the same name
+        needs_disambiguation = any(
+            seg.get("speaker") == base_name and seg.get("speaker_db_id") != db_id
+            for seg in all_segments
+        )
 
     # Disambiguate if multiple speakers have same name and we have db_id
-    if same_name_count > 0 and db_id is not None:
+    if needs_disambiguation and db_id is not None:
         return f"{base_name} (ID: {db_id})"
 
     return base_name if base_name and is_named_speaker(base_name) else str(grouping_key)
@@ -48,7 +48,9 @@ import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 
 from transcriptx.core.analysis.emotion import compute_nrc_emotions
-from transcriptx.core.analysis.ner import extract_named_entities
+from transcriptx.core.analysis.ner import extract_named_entities_batch
+from transcriptx.core.utils.doc_layer import SegmentDocLayer, docs_for_texts
+from transcriptx.core.utils.nlp_runtime import get_nlp_model
 from transcriptx.core.utils.nlp_utils import ALL_STOPWORDS, extract_tics_from_text, nlp
 from transcriptx.core.analysis.sentiment import score_sentiment
 
@@ -359,11 +361,15 @@ class SpeakerRegistry:
         tics = extract_tics_from_text(all_text)
         tic_counts = dict(Counter(tics).most_common(10))
 
+        # Parsed Docs from the transcript's shared layer, when it covers these
+        # segments with the same pipeline; otherwise spaCy runs below as before
+        docs = docs_for_texts(texts, nlp=get_nlp_model()) if texts else None
+
         # Analyze part-of-speech distribution
         pos_counts = Counter()
         if texts:
-            doc = nlp(all_text)
-            for token in doc:
+            tokens = SegmentDocLayer.iter_tokens(docs) if docs else nlp(all_text)
+            for token in tokens:
                 pos_counts[token.pos_] += 1
             total_pos = sum(pos_counts.values())
             pos_dist = (
@@ -423,10 +429,13 @@ class SpeakerRegistry:
 
         # Extract and count named entities
         entities = []
-        for seg in segments:
-            entities.extend(
-                [ent for ent, label in extract_named_entities(seg.get("text", ""))]
-            )
+        if docs is not None:
+            entities = [ent.text for doc in docs for ent in doc.ents]
+        else:
+            for seg_entities in extract_named_entities_batch(
+                [seg.get("text", "") for seg in segments]
+            ):
+                entities.extend(ent for ent, label in seg_entities)
         entity_counts = dict(Counter(entities).most_common(10))
 
         # Build comprehensive fingerprint
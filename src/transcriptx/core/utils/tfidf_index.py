@@ -0,0 +1,165 @@
+"""
+Fit-once TF-IDF matrix over a transcript's segment texts.
+
+Lexical similarity used to fit a fresh TfidfVectorizer on every pair of texts.
+``TfidfIndex`` fits one vectorizer on all unique segment texts and keeps the
+L2-normalised sparse matrix, so the cosine similarity of any two segments is a
+sparse row dot product and many pairs can be scored in one call.
+
+PipelineContext creates one ``SegmentTfidfIndex`` per transcript and registers
+it here; the matrix is fitted on first use.
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+_ACTIVE_INDEX: Optional["SegmentTfidfIndex"] = None
+
+
+def set_segment_tfidf_index(index: "SegmentTfidfIndex") -> None:
+    """Register the TF-IDF index for the transcript currently being analyzed."""
+    global _ACTIVE_INDEX
+    _ACTIVE_INDEX = index
+
+
+def get_segment_tfidf_index() -> Optional["SegmentTfidfIndex"]:
+    """Return the registered TF-IDF index, if any."""
+    return _ACTIVE_INDEX
+
+
+def clear_segment_tfidf_index(index: Optional["SegmentTfidfIndex"] = None) -> None:
+    """Clear the registered index (only if it is ``index``, when given)."""
+    global _ACTIVE_INDEX
+    if index is None or _ACTIVE_INDEX is index:
+        _ACTIVE_INDEX = None
+
+
+def default_vectorizer() -> Any:
+    """TfidfVectorizer configured from the shared vectorization settings."""
+    from sklearn.feature_extraction.text import TfidfVectorizer
+
+    from transcriptx.core.utils.config import get_config
+
+    vector_config = get_config().analysis.vectorization
+    return TfidfVectorizer(
+        lowercase=True,
+        stop_words="english",
+        ngram_range=vector_config.ngram_range,
+        max_features=vector_config.max_features,
+        min_df=vector_config.min_df,
+        max_df=vector_config.max_df,
+    )
+
+
+class TfidfIndex:
+    """L2-normalised TF-IDF rows for a fixed set of texts, one per unique text."""
+
+    def __init__(
+        self,
+        texts: Iterable[str],
+        vectorizer_factory: Callable[[], Any] = default_vectorizer,
+    ) -> None:
+        """
+        Args:
+            texts: Corpus the vectorizer is fitted on (stripped, deduplicated)
+            vectorizer_factory: Returns an unfitted TfidfVectorizer
+
+        Raises:
+            ValueError: If the corpus has no usable terms (empty vocabulary)
+        """
+        unique = list(
+            dict.fromkeys(text.strip() for text in texts if text and text.strip())
+        )
+        self._row_of: Dict[str, int] = {text: row for row, text in enumerate(unique)}
+        self.vectorizer = vectorizer_factory()
+        self.matrix = self.vectorizer.fit_transform(unique).tocsr()
+
+    def __len__(self) -> int:
+        return len(self._row_of)
+
+    def covers(self, texts: Iterable[str]) -> bool:
+        """True if every (stripped) text has a row."""
+        return all(text.strip() in self._row_of for text in texts if text)
+
+    def rows(self, texts: Sequence[str]) -> np.ndarray:
+        """Row index per text (-1 for texts outside the corpus)."""
+        return np.fromiter(
+            (self._row_of.get((text or "").strip(), -1) for text in texts),
+            dtype=np.intp,
+            count=len(texts),
+        )
+
+    def pair_similarities(
+        self, left_rows: np.ndarray, right_rows: np.ndarray
+    ) -> np.ndarray:
+        """Cosine similarity of ``left_rows[k]`` and ``right_rows[k]`` for each k."""
+        if not len(left_rows):
+            return np.zeros(0)
+        left = self.matrix[np.asarray(left_rows)]
+        right = self.matrix[np.asarray(right_rows)]
+        return np.asarray(left.multiply(right).sum(axis=1), dtype=float).ravel()
+
+    def similarity(self, text1: str, text2: str) -> Optional[float]:
+        """Cosine similarity of two corpus texts (None if either is unknown)."""
+        rows = self.rows([text1, text2])
+        if (rows < 0).any():
+            return None
+        return float(self.pair_similarities(rows[:1], rows[1:])[0])
+
+
+class SegmentTfidfIndex:
+    """Lazily fitted TfidfIndex for one transcript's segment texts."""
+
+    def __init__(self, segments: List[Dict[str, Any]]) -> None:
+        self._texts = [
+            text.strip()
+            for text in (seg.get("text") for seg in segments)
+            if isinstance(text, str) and text.strip()
+        ]
+        self._text_set = frozenset(self._texts)
+        self._index: Optional[TfidfIndex] = None
+        self._failed = False
+        self._lock = threading.Lock()
+
+    def covers(self, texts: Iterable[str]) -> bool:
+        """True if every non-empty text is one of this transcript's segments."""
+        return all(text.strip() in self._text_set for text in texts if text)
+
+    def index(self) -> Optional[TfidfIndex]:
+        """The fitted index (fitted on first call); None if fitting failed."""
+        if self._index is None and not self._failed:
+            with self._lock:
+                if self._index is None and not self._failed:
+                    try:
+                        self._index = TfidfIndex(self._texts)
+                    except ValueError as e:
+                        logger.debug(f"Transcript TF-IDF index unavailable: {e}")
+                        self._failed = True
+        return self._index
+
+
+def index_for_texts(texts: Sequence[str]) -> Optional[TfidfIndex]:
+    """
+    TF-IDF index covering ``texts``.
+
+    Uses the registered transcript index when it covers every text, otherwise
+    fits one on ``texts``. Returns None when no vocabulary can be built.
+    """
+    registered = _ACTIVE_INDEX
+    if registered is not None and registered.covers(texts):
+        index = registered.index()
+        if index is not None:
+            return index
+    try:
+        return TfidfIndex(texts)
+    except ValueError as e:
+        logger.debug(f"TF-IDF index unavailable: {e}")
+        return None
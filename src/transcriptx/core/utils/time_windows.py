@@ -0,0 +1,100 @@
+"""
+Sliding-window queries over sorted event times.
+
+Dynamics modules repeatedly ask "which events fall in this time window?".
+Scanning every event per window is quadratic; with times sorted once, each
+question is a pair of binary searches:
+
+- ``forward_window_ends`` gives, for every event, the end of the window that
+  starts at that event (``starts[i] + window_seconds``, inclusive);
+- ``count_in_windows`` counts times in many half-open ``[start, end)`` windows;
+- ``IntervalIndex`` finds intervals (events, segments) overlapping a span.
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+def forward_window_ends(starts: Sequence[float], window_seconds: float) -> np.ndarray:
+    """
+    Exclusive end index of the window opened by each event.
+
+    For sorted ``starts``, events ``i .. ends[i] - 1`` satisfy
+    ``starts[i] <= starts[j] <= starts[i] + window_seconds``, so the window
+    count is ``ends[i] - i``.
+    """
+    times = np.asarray(starts, dtype=float)
+    return np.searchsorted(times, times + float(window_seconds), side="right")
+
+
+def count_in_windows(
+    sorted_times: Sequence[float],
+    window_starts: Sequence[float],
+    window_ends: Sequence[float],
+) -> np.ndarray:
+    """Number of ``sorted_times`` in each half-open window ``[start, end)``."""
+    times = np.asarray(sorted_times, dtype=float)
+    lo = np.searchsorted(times, np.asarray(window_starts, dtype=float), side="left")
+    hi = np.searchsorted(times, np.asarray(window_ends, dtype=float), side="left")
+    return np.maximum(hi - lo, 0)
+
+
+def sorted_times(times: Iterable[Optional[float]]) -> np.ndarray:
+    """Sorted float array of the non-None times."""
+    return np.sort(np.fromiter((t for t in times if t is not None), dtype=float))
+
+
+class IntervalIndex:
+    """Intervals sorted by start, answering overlap queries by binary search."""
+
+    def __init__(
+        self,
+        starts: Sequence[Optional[float]],
+        ends: Sequence[Optional[float]],
+    ) -> None:
+        """
+        Args:
+            starts: Interval start per item (None skips the item)
+            ends: Interval end per item (None skips the item)
+        """
+        items = [
+            (float(start), float(end), idx)
+            for idx, (start, end) in enumerate(zip(starts, ends, strict=True))
+            if start is not None and end is not None
+        ]
+        items.sort()
+        self.starts = np.array([item[0] for item in items], dtype=float)
+        self.ends = np.array([item[1] for item in items], dtype=float)
+        self.positions = np.array([item[2] for item in items], dtype=np.intp)
+        durations = self.ends - self.starts
+        self.max_duration = float(durations.max()) if len(durations) else 0.0
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def _candidates(self, t0: float, t1: float) -> Tuple[int, int]:
+        # An interval ending after t0 starts no earlier than t0 - max_duration;
+        # the small slack keeps float rounding from dropping a boundary item.
+        floor = t0 - self.max_duration - 1e-6
+        lo = int(np.searchsorted(self.starts, floor, side="left"))
+        hi = int(np.searchsorted(self.starts, t1, side="left"))
+        return lo, hi
+
+    def overlapping(self, t0: float, t1: float) -> np.ndarray:
+        """Original positions (ascending) of intervals with ``start < t1`` and ``end > t0``."""
+        lo, hi = self._candidates(t0, t1)
+        if hi <= lo:
+            return np.zeros(0, dtype=np.intp)
+        mask = self.ends[lo:hi] > t0
+        return np.sort(self.positions[lo:hi][mask])
+
+    def overlap_seconds(self, t0: float, t1: float) -> float:
+        """Total length of every interval clipped to ``[t0, t1]``."""
+        lo, hi = self._candidates(t0, t1)
+        if hi <= lo:
+            return 0.0
+        overlap = np.minimum(self.ends[lo:hi], t1) - np.maximum(self.starts[lo:hi], t0)
+        return float(overlap[overlap > 0].sum())
@@ -0,0 +1,210 @@
+"""
+Columnar timeline over a transcript's segments.
+
+Windowed dynamics modules used to rescan every segment for every window.
+``SegmentTimeline`` stores segment times, speaker codes, word counts and
+token-set ids as NumPy columns sorted by start time, so a window becomes a
+pair of binary searches and per-window speaker changes come from prefix sums.
+
+PipelineContext builds one ``SegmentTimeline`` per transcript and registers it
+here; ``timeline_for_segments`` returns it for the context's segment list and
+builds a fresh one for any other list.
+"""
+
+from __future__ import annotations
+
+import re
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from transcriptx.core.utils.time_windows import IntervalIndex
+
+_ACTIVE_TIMELINE: Optional["SegmentTimeline"] = None
+
+_WORD_RE = re.compile(r"\b\w+\b")
+
+
+def set_segment_timeline(timeline: "SegmentTimeline") -> None:
+    """Register the timeline for the transcript currently being analyzed."""
+    global _ACTIVE_TIMELINE
+    _ACTIVE_TIMELINE = timeline
+
+
+def get_segment_timeline() -> Optional["SegmentTimeline"]:
+    """Return the registered timeline, if any."""
+    return _ACTIVE_TIMELINE
+
+
+def clear_segment_timeline(timeline: Optional["SegmentTimeline"] = None) -> None:
+    """Clear the registered timeline (only if it is ``timeline``, when given)."""
+    global _ACTIVE_TIMELINE
+    if timeline is None or _ACTIVE_TIMELINE is timeline:
+        _ACTIVE_TIMELINE = None
+
+
+def timeline_for_segments(segments: List[Dict[str, Any]]) -> "SegmentTimeline":
+    """Registered timeline when it covers ``segments``, otherwise a new one."""
+    registered = _ACTIVE_TIMELINE
+    if registered is not None and registered.covers(segments):
+        return registered
+    return SegmentTimeline(segments)
+
+
+def content_tokens(text: str) -> List[str]:
+    """Lowercased word tokens longer than two characters, stop words removed."""
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
+
+    tokens = _WORD_RE.findall((text or "").lower())
+    return [tok for tok in tokens if tok not in ENGLISH_STOP_WORDS and len(tok) > 2]
+
+
+def _as_time(value: Any, default: float) -> float:
+    if value is None:
+        return default
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+class SegmentTimeline:
+    """Start-sorted columns for one segment list with window and prefix-sum queries."""
+
+    def __init__(self, segments: List[Dict[str, Any]]) -> None:
+        """
+        Args:
+            segments: Transcript segments; 'start' defaults to 0 and 'end' to
+                the segment's start when missing
+        """
+        self._segments = segments
+        self._segment_count = len(segments)
+
+        starts = np.array(
+            [_as_time(seg.get("start"), 0.0) for seg in segments], dtype=float
+        )
+        ends = np.array(
+            [
+                _as_time(seg.get("end"), start)
+                for seg, start in zip(segments, starts, strict=True)
+            ],
+            dtype=float,
+        )
+        speaker_codes: Dict[Any, int] = {}
+        codes = np.array(
+            [
+                (
+                    -1
+                    if seg.get("speaker") is None
+                    else speaker_codes.setdefault(
+                        seg.get("speaker"), len(speaker_codes)
+                    )
+                )
+                for seg in segments
+            ],
+            dtype=np.intp,
+        )
+        words = np.array(
+            [len((seg.get("text") or "").split()) for seg in segments], dtype=np.int64
+        )
+
+        # Stable sort keeps list order for equal starts (and for sorted input)
+        self.order = np.argsort(starts, kind="stable")
+        self.starts = starts[self.order]
+        self.ends = ends[self.order]
+        self.speaker_codes = codes[self.order]
+        self.speakers: List[Any] = list(speaker_codes)
+        self.word_counts = words[self.order]
+
+        changes = np.zeros(len(segments), dtype=np.int64)
+        if len(segments) > 1:
+            changes[1:] = self.speaker_codes[1:] != self.speaker_codes[:-1]
+        self._change_prefix = np.concatenate(([0], np.cumsum(changes)))
+
+        self._intervals = IntervalIndex(starts, ends)
+        self._token_set_ids: Optional[np.ndarray] = None
+        self._token_sets: List[frozenset] = []
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return self._segment_count
+
+    def covers(self, segments: Optional[List[Dict[str, Any]]]) -> bool:
+        """True if ``segments`` is the (unchanged-length) list this timeline was built from."""
+        return segments is self._segments and len(segments) == self._segment_count
+
+    def start_bounds(
+        self, window_starts: Sequence[float], window_ends: Sequence[float]
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Sorted-order bounds ``[lo, hi)`` of segments starting in each window.
+
+        A segment belongs to window ``[start, end)`` when
+        ``start <= segment start < end``.
+        """
+        lo = np.searchsorted(
+            self.starts, np.asarray(window_starts, dtype=float), side="left"
+        )
+        hi = np.searchsorted(
+            self.starts, np.asarray(window_ends, dtype=float), side="left"
+        )
+        return lo, np.maximum(hi, lo)
+
+    def segments_in(self, lo: int, hi: int) -> List[Dict[str, Any]]:
+        """Segments at sorted positions ``lo .. hi - 1``, in start order."""
+        return [self._segments[pos] for pos in self.order[lo:hi]]
+
+    def list_order(self, column: np.ndarray) -> np.ndarray:
+        """A start-sorted column (e.g. ``word_counts``) rearranged into list order."""
+        values = np.empty_like(column)
+        values[self.order] = column
+        return values
+
+    def speaker_changes(self, lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+        """Adjacent speaker changes (in start order) within each ``[lo, hi)`` range."""
+        lo = np.asarray(lo)
+        hi = np.asarray(hi)
+        inner = np.minimum(lo + 1, hi)
+        return self._change_prefix[hi] - self._change_prefix[inner]
+
+    def overlapping(self, t0: float, t1: float) -> np.ndarray:
+        """List positions (ascending) of segments with ``start < t1`` and ``end > t0``."""
+        return self._intervals.overlapping(t0, t1)
+
+    def token_set_ids(self) -> np.ndarray:
+        """Id into ``token_sets()`` of each segment's content tokens, in sorted order."""
+        if self._token_set_ids is None:
+            with self._lock:
+                if self._token_set_ids is None:
+                    ids_by_set: Dict[frozenset, int] = {}
+                    ids = np.fromiter(
+                        (
+                            ids_by_set.setdefault(
+                                frozenset(
+                                    content_tokens(self._segments[pos].get("text", ""))
+                                ),
+                                len(ids_by_set),
+                            )
+                            for pos in self.order
+                        ),
+                        dtype=np.intp,
+                        count=self._segment_count,
+                    )
+                    self._token_sets = list(ids_by_set)
+                    self._token_set_ids = ids
+        return self._token_set_ids
+
+    def token_sets(self) -> List[frozenset]:
+        """Distinct content-token sets referenced by ``token_set_ids()``."""
+        self.token_set_ids()
+        return self._token_sets
+
+    def window_tokens(self, lo: int, hi: int) -> set:
+        """Union of the content tokens of segments at sorted positions ``lo .. hi - 1``."""
+        ids = self.token_set_ids()
+        sets = self._token_sets
+        tokens: set = set()
+        for set_id in np.unique(ids[lo:hi]):
+            tokens.update(sets[set_id])
+        return tokens
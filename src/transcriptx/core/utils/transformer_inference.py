@@ -0,0 +1,204 @@
+"""
+Batched, device-aware inference helpers for transformers text-classification.
+
+Sentiment (transformers backend) and contextual emotion both run a Hugging Face
+``text-classification`` pipeline over every segment. Calling the pipeline once
+per text leaves most of the model's throughput unused; these helpers:
+
+- pick the pipeline device from config (``auto`` prefers CUDA when available),
+- apply torch intra-op thread tuning and optional int8 dynamic quantization
+  (CPU only) once, at load time,
+- run texts through the already-loaded pipeline in length-sorted batches, so
+  each batch pads to a similar length, and return results in input order.
+
+Loaded pipelines are kept for the life of the process, so later runs in the
+same process (e.g. batch analysis workers) reuse them instead of reloading.
+
+Settings are read from ``AnalysisConfig`` (``transformer_*`` fields).
+"""
+
+from __future__ import annotations
+
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from transcriptx.core.utils.lazy_imports import lazy_import
+from transcriptx.core.utils.logger import get_logger, log_info, log_warning
+
+logger = get_logger()
+
+DEFAULT_BATCH_SIZE = 32
+
+_VALID_DEVICES = {"auto", "cpu", "cuda"}
+
+# (model name, device, quantized) -> loaded pipeline
+_PIPELINES: Dict[Tuple[str, int, bool], Any] = {}
+_PIPELINES_LOCK = threading.Lock()
+
+
+def _as_int(value: Any, default: int) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        return default
+    return value
+
+
+def _analysis_config() -> Any:
+    from transcriptx.core.utils.config import get_config
+
+    return get_config().analysis
+
+
+def get_batch_size(analysis_config: Any = None) -> int:
+    """Configured transformer batch size (at least 1)."""
+    cfg = analysis_config if analysis_config is not None else _analysis_config()
+    size = _as_int(
+        getattr(cfg, "transformer_batch_size", DEFAULT_BATCH_SIZE), DEFAULT_BATCH_SIZE
+    )
+    return max(1, size)
+
+
+def resolve_device(analysis_config: Any = None) -> int:
+    """
+    Resolve the pipeline device index from ``transformer_device``.
+
+    Returns:
+        0 for the first CUDA device, -1 for CPU (transformers convention)
+    """
+    cfg = analysis_config if analysis_config is not None else _analysis_config()
+    device = getattr(cfg, "transformer_device", "auto")
+    if not isinstance(device, str) or device not in _VALID_DEVICES:
+        device = "auto"
+    if device == "cpu":
+        return -1
+    try:
+        cuda_available = bool(lazy_import("torch").cuda.is_available())
+    except Exception:
+        cuda_available = False
+    if device == "cuda" and not cuda_available:
+        log_warning("TRANSFORMERS", "CUDA requested but not available; using CPU")
+    return 0 if cuda_available else -1
+
+
+def configure_torch_threads(num_threads: int) -> None:
+    """Set torch intra-op threads (0 keeps the torch default)."""
+    if num_threads <= 0:
+        return
+    try:
+        torch = lazy_import("torch")
+        if torch.get_num_threads() != num_threads:
+            torch.set_num_threads(num_threads)
+    except Exception as e:
+        log_warning("TRANSFORMERS", f"Could not set torch threads: {e}")
+
+
+def quantize_pipeline(pipe: Any) -> Any:
+    """Apply int8 dynamic quantization to the pipeline's Linear layers (CPU)."""
+    try:
+        torch = lazy_import("torch")
+        pipe.model = torch.quantization.quantize_dynamic(
+            pipe.model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+        log_info("TRANSFORMERS", "Applied int8 dynamic quantization")
+    except Exception as e:
+        log_warning("TRANSFORMERS", f"Could not quantize model: {e}")
+    return pipe
+
+
+def load_text_classification_pipeline(
+    model_name: str, analysis_config: Any = None
+) -> Any:
+    """
+    Load a ``text-classification`` pipeline (all scores) with device, thread
+    and quantization settings applied. Raises on load failure.
+
+    Pipelines are cached per process by (model, device, quantization).
+    """
+    from transcriptx.core.utils.lazy_imports import get_transformers
+
+    cfg = analysis_config if analysis_config is not None else _analysis_config()
+    device = resolve_device(cfg)
+    quantize = device < 0 and getattr(cfg, "transformer_quantize", False) is True
+    key = (model_name, device, quantize)
+    with _PIPELINES_LOCK:
+        cached = _PIPELINES.get(key)
+        if cached is not None:
+            return cached
+        configure_torch_threads(_as_int(getattr(cfg, "transformer_num_threads", 0), 0))
+
+        transformers = get_transformers()
+        pipe = transformers.pipeline(
+            "text-classification",
+            model=model_name,
+            top_k=None,
+            device=device,
+        )
+        if quantize:
+            pipe = quantize_pipeline(pipe)
+        _PIPELINES[key] = pipe
+        return pipe
+
+
+def clear_pipeline_cache() -> None:
+    """Drop cached pipelines (frees model memory)."""
+    with _PIPELINES_LOCK:
+        _PIPELINES.clear()
+
+
+def _token_lengths(pipe: Any, texts: Sequence[str]) -> List[int]:
+    """Token length per text, falling back to character length."""
+    tokenizer = getattr(pipe, "tokenizer", None)
+    if tokenizer is not None:
+        try:
+            encoded = tokenizer(list(texts), add_special_tokens=False, truncation=True)
+            lengths = [len(ids) for ids in encoded["input_ids"]]
+            if len(lengths) == len(texts):
+                return lengths
+        except Exception:
+            pass
+    return [len(text) for text in texts]
+
+
+def _as_score_list(item: Any) -> List[Dict[str, Any]]:
+    if isinstance(item, dict):
+        return [item]
+    return list(item) if item else []
+
+
+def classify_batched(
+    pipe: Any,
+    texts: Sequence[str],
+    batch_size: Optional[int] = None,
+) -> List[List[Dict[str, Any]]]:
+    """
+    Classify texts with a loaded pipeline in length-sorted batches.
+
+    Args:
+        pipe: Loaded ``text-classification`` pipeline (``top_k=None``)
+        texts: Texts to classify
+        batch_size: Texts per forward pass (config default when None)
+
+    Returns:
+        One list of ``{"label", "score"}`` dicts per input text, in input order
+    """
+    if not texts:
+        return []
+    if batch_size is None:
+        batch_size = get_batch_size()
+    batch_size = max(1, batch_size)
+
+    lengths = _token_lengths(pipe, texts)
+    order = sorted(range(len(texts)), key=lengths.__getitem__)
+    results: List[Optional[List[Dict[str, Any]]]] = [None] * len(texts)
+
+    for start in range(0, len(order), batch_size):
+        positions = order[start : start + batch_size]
+        batch = [texts[i] for i in positions]
+        outputs = pipe(batch, batch_size=len(batch), truncation=True)
+        if len(outputs) != len(batch):
+            raise ValueError(
+                f"Pipeline returned {len(outputs)} results for {len(batch)} texts"
+            )
+        for position, output in zip(positions, outputs):
+            results[position] = _as_score_list(output)
+
+    return results  # type: ignore[return-value]
@@ -269,15 +269,16 @@ def plot_understandability_charts(
             )
             return
 
-        plt.figure(figsize=(12, 6))
+        fig, ax = plt.subplots(figsize=(12, 6))
         try:
-            ax = sns.barplot(
+            sns.barplot(
                 data=melted,
                 x="speaker",
                 y="score",
                 hue="metric",
                 palette="muted",
                 edgecolor="black",
+                ax=ax,
             )
         except ValueError as e:
             if "empty sequence" in str(e) or "empty" in str(e).lower():
@@ -286,7 +287,7 @@ def plot_understandability_charts(
                     technical=True,
                     section="analyze",
                 )
-                plt.close()
+                plt.close(fig)
                 return
             raise
 
@@ -313,20 +314,20 @@ def plot_understandability_charts(
                 section="analyze",
             )
 
-        plt.title(title)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
+        ax.set_title(title)
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+        fig.tight_layout()
 
         if output_service:
             output_service.save_chart(
                 chart_id=filename_suffix,
                 scope="global",
-                static_fig=plt.gcf(),
+                static_fig=fig,
                 chart_type=chart_type,
                 viz_id=f"understandability.{filename_suffix}.global",
                 title=title,
             )
-        plt.close()
+        plt.close(fig)
         notify_user(
             f"📊 Chart saved for {filename_suffix}", technical=True, section="analyze"
         )
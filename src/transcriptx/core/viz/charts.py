@@ -6,9 +6,11 @@ This module centralizes Plotly availability checks and warning-once behavior.
 
 from __future__ import annotations
 
+import io
 from pathlib import Path
 from typing import Any, Optional
 
+from transcriptx.core.utils.artifact_writer import write_bytes, write_text
 from transcriptx.core.utils.lazy_imports import optional_import
 from transcriptx.core.utils.logger import get_logger
 from transcriptx.core.viz.specs import (
@@ -72,8 +74,10 @@ def save_static_chart(fig: Any, chart_path: Path, dpi: int = 300) -> Path:
     """Save a matplotlib figure to a resolved path."""
     if chart_path.suffix.lower() != ".png":
         raise ValueError("Static chart paths must end with .png")
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    fig.savefig(str(chart_path), dpi=dpi, bbox_inches="tight")
+    # Render to memory so the artifact writer hashes the bytes it writes
+    buffer = io.BytesIO()
+    fig.savefig(buffer, format="png", dpi=dpi, bbox_inches="tight")
+    write_bytes(chart_path, buffer.getvalue())
     return chart_path
 
 
@@ -86,15 +90,9 @@ def save_dynamic_chart(fig: Any, chart_path: Path) -> Optional[Path]:
     if not is_plotly_available():
         _warn_missing_plotly_once()
         return None
-    chart_path.parent.mkdir(parents=True, exist_ok=True)
-    from plotly.io import write_html
-
-    write_html(
-        fig,
-        file=str(chart_path),
-        include_plotlyjs=True,
-        full_html=True,
-    )
+    from plotly.io import to_html
+
+    write_text(chart_path, to_html(fig, include_plotlyjs=True, full_html=True))
     return chart_path
 
 
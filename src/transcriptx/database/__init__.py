@@ -27,6 +27,7 @@ from .models import (
     AnalysisResult,
     SpeakerProfile,
     BehavioralFingerprint,
+    FingerprintVector,
     EntityMention,
     TopicModel,
     SentimentAnalysis,
@@ -120,6 +121,7 @@ __all__ = [
     "AnalysisResult",
     "SpeakerProfile",
     "BehavioralFingerprint",
+    "FingerprintVector",
     "EntityMention",
     "TopicModel",
     "SentimentAnalysis",
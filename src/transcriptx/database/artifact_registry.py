@@ -1,5 +1,10 @@
 """
 Artifact registry for module outputs.
+
+Content hashes come from the artifact writer's manifest when the file was
+written through ``core.utils.artifact_writer`` and is unchanged since; other
+files are hashed from disk. A module's artifacts are inserted in one bulk
+insert.
 """
 
 from __future__ import annotations
@@ -8,6 +13,10 @@ import hashlib
 from pathlib import Path
 from typing import Any, Dict, List
 
+from transcriptx.core.utils.artifact_writer import (
+    forget_written_artifacts,
+    recorded_hash,
+)
 from transcriptx.core.utils.logger import get_logger
 from transcriptx.core.utils.path_utils import get_transcript_dir
 from transcriptx.database import get_session
@@ -24,6 +33,10 @@ def _file_hash(path: Path) -> str:
     return hash_obj.hexdigest()
 
 
+def _content_hash(path: Path) -> str:
+    return recorded_hash(path) or _file_hash(path)
+
+
 def _artifact_role(relative_path: str) -> str:
     normalized = relative_path.replace("\\", "/")
     if "/data/global/" in normalized or "/charts/global/" in normalized:
@@ -70,18 +83,7 @@ class ArtifactRegistry:
                 file_path.suffix.replace(".", "") if file_path.suffix else None
             )
             artifact_role = _artifact_role(artifact_key)
-            content_hash = _file_hash(file_path)
-
-            self.repo.create_artifact(
-                module_run_id=module_run_id,
-                transcript_file_id=transcript_file_id,
-                artifact_key=artifact_key,
-                relative_path=str(relative_path),
-                artifact_root=str(output_root),
-                artifact_type=artifact_type,
-                artifact_role=artifact_role,
-                content_hash=content_hash,
-            )
+            content_hash = _content_hash(file_path)
 
             artifacts.append(
                 {
@@ -94,7 +96,9 @@ class ArtifactRegistry:
                 }
             )
 
+        self.repo.create_artifacts(module_run_id, transcript_file_id, artifacts)
         self.session.commit()
+        forget_written_artifacts(module_dir)
         logger.info(f"✅ Registered {len(artifacts)} artifacts for {module_name}")
         return artifacts
 
@@ -110,7 +114,7 @@ class ArtifactRegistry:
             return {}
         relative_path = file_path.relative_to(output_root)
         artifact_key = str(relative_path).replace("\\", "/")
-        content_hash = _file_hash(file_path)
+        content_hash = _content_hash(file_path)
         self.repo.create_artifact(
             module_run_id=None,
             transcript_file_id=transcript_file_id,
@@ -40,10 +40,17 @@ from transcriptx.database import (
     BehavioralFingerprint,
 )
 from transcriptx.database.database import get_session
+from transcriptx.database.fingerprint_index import get_fingerprint_index
 from transcriptx.database.speaker_profiling import SpeakerProfilingService
 
 logger = get_logger()
 
+# Nearest fingerprints considered per behavioral lookup
+BEHAVIORAL_MATCH_LIMIT = 20
+
+# Above MAX_SCORE_WITHOUT_VOCABULARY (0.7), so a match needs shared vocabulary
+BEHAVIORAL_MATCH_THRESHOLD = 0.8
+
 
 class CrossSessionTrackingService:
     """
@@ -498,27 +505,26 @@ class CrossSessionTrackingService:
         self, session: DBSession, fingerprint: Dict[str, Any]
     ) -> List[Tuple[Speaker, float]]:
         """Find speakers with similar behavioral patterns."""
-        # Get all current fingerprints
-        fingerprints = (
-            session.query(BehavioralFingerprint)
-            .filter(BehavioralFingerprint.is_current)
-            .all()
+        hits = get_fingerprint_index(session).search(
+            session,
+            fingerprint,
+            k=BEHAVIORAL_MATCH_LIMIT,
+            min_score=BEHAVIORAL_MATCH_THRESHOLD,
         )
+        if not hits:
+            return []
 
-        matches = []
-
-        for fp in fingerprints:
-            confidence = self._calculate_behavioral_similarity(
-                fingerprint, fp.fingerprint_data
-            )
-            if confidence > 0.5:  # Minimum threshold for behavioral matching
-                speaker = (
-                    session.query(Speaker).filter(Speaker.id == fp.speaker_id).first()
-                )
-                if speaker:
-                    matches.append((speaker, confidence))
-
-        return matches
+        speakers = {
+            speaker.id: speaker
+            for speaker in session.query(Speaker)
+            .filter(Speaker.id.in_([speaker_id for speaker_id, _ in hits]))
+            .all()
+        }
+        return [
+            (speakers[speaker_id], score)
+            for speaker_id, score in hits
+            if speaker_id in speakers
+        ]
 
     def _combine_matches(
         self,
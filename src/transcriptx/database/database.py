@@ -26,7 +26,6 @@ from typing import Optional
 from urllib.parse import urlparse
 
 from sqlalchemy import create_engine, event, inspect, text
-from sqlalchemy.engine import Engine
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 
@@ -68,6 +67,7 @@ class DatabaseManager:
         self.database_url = database_url or self._get_database_url()
         self.engine = None
         self.SessionLocal = None
+        self.pool_metrics = None
         self._initialized = False
 
         logger.info(
@@ -164,24 +164,63 @@ class DatabaseManager:
         logger.info("✅ Database initialization completed")
 
     def _initialize_sqlite(self) -> None:
-        """Initialize SQLite engine with optimizations."""
+        """
+        Initialize SQLite engine with optimizations.
+
+        File databases use a pool of connections (see sqlite_pool) so readers
+        run concurrently under WAL while writers take turns. In-memory
+        databases, or ``sqlite_pool_size`` 0, keep a single shared connection.
+        """
         logger.info("🔧 Configuring SQLite engine...")
 
+        from transcriptx.database.sqlite_pool import (
+            DEFAULT_BUSY_TIMEOUT_MS,
+            DEFAULT_POOL_SIZE,
+            DEFAULT_WRITE_RETRIES,
+            MeteredQueuePool,
+            SQLitePoolMetrics,
+            is_memory_database,
+            make_connection_factory,
+        )
+
+        db_config = getattr(get_config(), "database", None)
+        pool_size = getattr(db_config, "sqlite_pool_size", DEFAULT_POOL_SIZE)
+        busy_timeout_ms = getattr(
+            db_config, "sqlite_busy_timeout_ms", DEFAULT_BUSY_TIMEOUT_MS
+        )
+        retries = getattr(db_config, "sqlite_write_retries", DEFAULT_WRITE_RETRIES)
+
         # SQLite-specific configuration
         connect_args = {
             "check_same_thread": False,
-            "timeout": 30,
+            "timeout": busy_timeout_ms / 1000,
         }
 
-        self.engine = create_engine(
-            self.database_url,
-            connect_args=connect_args,
-            poolclass=StaticPool,  # SQLite doesn't need connection pooling
-            echo=False,  # Set to True for SQL debugging
-        )
+        if pool_size > 0 and not is_memory_database(self.database_url):
+            self.pool_metrics = SQLitePoolMetrics()
+            connect_args["factory"] = make_connection_factory(
+                self.pool_metrics, busy_timeout_ms=busy_timeout_ms, retries=retries
+            )
+            self.engine = create_engine(
+                self.database_url,
+                connect_args=connect_args,
+                poolclass=MeteredQueuePool,
+                pool_size=pool_size,
+                max_overflow=pool_size,
+                pool_timeout=busy_timeout_ms / 1000,
+                echo=False,  # Set to True for SQL debugging
+            )
+            self.engine.pool.metrics = self.pool_metrics
+        else:
+            self.engine = create_engine(
+                self.database_url,
+                connect_args=connect_args,
+                poolclass=StaticPool,  # One connection shared by all threads
+                echo=False,  # Set to True for SQL debugging
+            )
 
         # Configure SQLite optimizations
-        @event.listens_for(Engine, "connect")
+        @event.listens_for(self.engine, "connect")
         def set_sqlite_pragma(dbapi_connection, connection_record):
             cursor = dbapi_connection.cursor()
             cursor.execute("PRAGMA foreign_keys=ON")
@@ -189,6 +228,7 @@ class DatabaseManager:
             cursor.execute("PRAGMA synchronous=NORMAL")
             cursor.execute("PRAGMA cache_size=10000")
             cursor.execute("PRAGMA temp_store=MEMORY")
+            cursor.execute(f"PRAGMA busy_timeout={int(busy_timeout_ms)}")
             cursor.close()
 
         logger.info("✅ SQLite engine configured with optimizations")
@@ -267,6 +307,7 @@ class DatabaseManager:
             Base.metadata.create_all(bind=self.engine)
             self._ensure_transcript_file_columns()
             self._ensure_transcript_speaker_columns()
+            self._ensure_segment_search_index()
             logger.info("✅ Database tables created successfully")
         except Exception as e:
             logger.error(f"❌ Failed to create database tables: {e}")
@@ -391,6 +432,20 @@ class DatabaseManager:
                     )
                 )
 
+    def _ensure_segment_search_index(self) -> None:
+        """
+        Ensure the segment full-text index exists.
+
+        Search falls back to substring scans when the index cannot be created
+        (for example an SQLite build without FTS5), so failures only warn.
+        """
+        from .segment_search import ensure_segment_search_index
+
+        try:
+            ensure_segment_search_index(self.engine)
+        except Exception as e:
+            logger.warning(f"⚠️ Segment full-text index unavailable: {e}")
+
     def drop_tables(self) -> None:
         """
         Drop all database tables.
@@ -403,6 +458,9 @@ class DatabaseManager:
         logger.warning("⚠️ Dropping all database tables...")
 
         try:
+            from .segment_search import drop_segment_search_index
+
+            drop_segment_search_index(self.engine)
             Base.metadata.drop_all(bind=self.engine)
             logger.info("✅ Database tables dropped successfully")
         except Exception as e:
@@ -437,6 +495,7 @@ class DatabaseManager:
             - Connection status
             - Table counts
             - Database size (if available)
+            - Pool checkout/writer-lock waits and busy retries (pooled SQLite)
         """
         info = {
             "database_url": self._mask_database_url(),
@@ -459,6 +518,12 @@ class DatabaseManager:
                     if self.database_url.startswith("sqlite"):
                         info["database_size"] = self._get_sqlite_size()
 
+                if self.pool_metrics is not None:
+                    info["pool"] = {
+                        "status": self.engine.pool.status(),
+                        **self.pool_metrics.snapshot(),
+                    }
+
             except Exception as e:
                 info["connection_status"] = f"error: {e}"
 
@@ -0,0 +1,408 @@
+"""
+Nearest-neighbour index over behavioral fingerprints.
+
+Speaker identification used to load every current fingerprint, compare it to
+the query with nested-dict similarity code and fetch each matching Speaker
+separately. Fingerprints are now projected into fixed-length float32 vectors
+(``project_fingerprint``) stored in ``fingerprint_vectors``:
+
+- vocabulary terms and emotions are hashed into fixed buckets;
+- speaking rate, segment duration and sentiment are soft-binned and
+  mean-centred, so distant values score below zero instead of sharing the
+  tails of their bins;
+- each block is unit-normalised and scaled by the same weights the dict
+  similarity used (vocabulary 0.3, emotion 0.25, speech 0.25, sentiment 0.2).
+
+The cosine of two full vectors is therefore the weighted sum of per-block
+cosines. Speakers without any vocabulary overlap score at most
+``1 - 0.3 = 0.7`` (``MAX_SCORE_WITHOUT_VOCABULARY``), so match thresholds
+must sit above it for vocabulary to be required evidence.
+
+``FingerprintIndex`` loads the vectors of current fingerprints once into a
+NumPy matrix and answers top-k cosine queries with one matrix-vector product.
+``ProfileRepository.create_behavioral_fingerprint`` stores the new vector and
+updates the loaded index in place; a cheap count/max-id signature check
+reloads the matrix when another process changed the table.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+import zlib
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import func, insert, or_, select
+from sqlalchemy.orm import Session
+
+from transcriptx.core.utils.logger import get_logger
+from .models import BehavioralFingerprint, FingerprintVector
+
+logger = get_logger()
+
+# Bump when the projection changes; stale vectors are recomputed on load
+PROJECTION_VERSION = 2
+
+_VOCABULARY_BUCKETS = 64
+_EMOTION_BUCKETS = 16
+_SCALAR_BINS = 8
+
+_BLOCK_WEIGHTS = {
+    "vocabulary": 0.3,
+    "emotion": 0.25,
+    "speech": 0.25,
+    "sentiment": 0.2,
+}
+
+# Best score two fingerprints can reach with disjoint vocabularies
+MAX_SCORE_WITHOUT_VOCABULARY = 1.0 - _BLOCK_WEIGHTS["vocabulary"]
+
+VECTOR_DIMENSION = _VOCABULARY_BUCKETS + _EMOTION_BUCKETS + 3 * _SCALAR_BINS
+
+# (stored key, alternative keys) for each fingerprint section
+_SECTION_KEYS = {
+    "vocabulary": ("vocabulary_patterns", "vocabulary_fingerprint"),
+    "emotion": ("emotion_patterns", "emotion_signature"),
+    "speech": ("speech_patterns", "speech_rhythm"),
+    "sentiment": ("sentiment_patterns",),
+}
+
+
+def _bucket(term: str, buckets: int) -> int:
+    # crc32 is stable across processes, unlike hash()
+    return zlib.crc32(term.encode("utf-8")) % buckets
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        return None
+    return number if np.isfinite(number) else None
+
+
+def _weights(section: Dict[str, Any], keys: Sequence[str]) -> Dict[str, float]:
+    """Term -> weight from the first of ``keys`` present in a section."""
+    for key in keys:
+        value = section.get(key)
+        if isinstance(value, dict) and value:
+            return {
+                str(term): weight
+                for term, weight in (
+                    (term, _number(raw)) for term, raw in value.items()
+                )
+                if weight is not None
+            }
+        if isinstance(value, (list, tuple)) and value:
+            return {str(term): 1.0 for term in value}
+    return {}
+
+
+def _hashed(weights: Dict[str, float], buckets: int) -> np.ndarray:
+    block = np.zeros(buckets, dtype=np.float32)
+    for term, weight in weights.items():
+        block[_bucket(term.lower(), buckets)] += abs(weight)
+    return block
+
+
+def _soft_bins(value: Optional[float], low: float, high: float) -> np.ndarray:
+    """Mean-centred Gaussian soft-binning so nearby values share bins."""
+    block = np.zeros(_SCALAR_BINS, dtype=np.float32)
+    if value is None:
+        return block
+    centres = np.linspace(low, high, _SCALAR_BINS)
+    width = (high - low) / (_SCALAR_BINS - 1)
+    value = min(max(value, low), high)
+    block[:] = np.exp(-0.5 * ((value - centres) / width) ** 2)
+    # Without centring every pair of values shares the bins' tails
+    block -= block.mean()
+    return block
+
+
+def _sections(data: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+    behavioral = data.get("behavioral_data")
+    sources = [behavioral, data] if isinstance(behavioral, dict) else [data]
+    sections = {}
+    for name, keys in _SECTION_KEYS.items():
+        for source in sources:
+            section = next(
+                (source[key] for key in keys if isinstance(source.get(key), dict)),
+                None,
+            )
+            if section:
+                sections[name] = section
+                break
+    return sections
+
+
+def project_fingerprint(data: Optional[Dict[str, Any]]) -> np.ndarray:
+    """
+    Project fingerprint data into a unit-length float32 vector.
+
+    Accepts the profiling shape (``{"behavioral_data": {...}}``), the
+    cross-session shape (``vocabulary_patterns``/``speech_patterns``/...)
+    and the stored column names (``vocabulary_fingerprint``/...). Missing
+    sections contribute zeros; an empty fingerprint projects to zeros.
+    """
+    sections = _sections(data or {})
+    vocabulary = sections.get("vocabulary", {})
+    emotion = sections.get("emotion", {})
+    speech = sections.get("speech", {})
+    sentiment = sections.get("sentiment", {})
+
+    rate = _number(speech.get("average_speaking_rate"))
+    duration = _number(speech.get("average_segment_duration"))
+    speech_block = np.concatenate(
+        [
+            _soft_bins(np.log1p(max(rate, 0.0)) if rate is not None else None, 0, 2),
+            _soft_bins(
+                np.log1p(max(duration, 0.0)) if duration is not None else None, 0, 3.5
+            ),
+        ]
+    )
+    blocks = {
+        "vocabulary": _hashed(
+            _weights(vocabulary, ("top_features", "word_frequencies", "common_words")),
+            _VOCABULARY_BUCKETS,
+        ),
+        "emotion": _hashed(
+            _weights(
+                emotion,
+                ("average_emotion_scores", "dominant_emotions", "emotion_distribution"),
+            ),
+            _EMOTION_BUCKETS,
+        ),
+        "speech": speech_block,
+        "sentiment": _soft_bins(_number(sentiment.get("average_sentiment")), -1.0, 1.0),
+    }
+
+    parts = []
+    for name in ("vocabulary", "emotion", "speech", "sentiment"):
+        block = blocks[name]
+        norm = float(np.linalg.norm(block))
+        if norm > 0:
+            block = block / norm * np.sqrt(_BLOCK_WEIGHTS[name])
+        parts.append(block)
+    vector = np.concatenate(parts).astype(np.float32)
+    norm = float(np.linalg.norm(vector))
+    return vector / norm if norm > 0 else vector
+
+
+def project_behavioral_fingerprint(fingerprint: BehavioralFingerprint) -> np.ndarray:
+    """Project a stored fingerprint, falling back to its section columns."""
+    data = dict(fingerprint.fingerprint_data or {})
+    for key in ("vocabulary_fingerprint", "speech_rhythm", "emotion_signature"):
+        if not data.get(key):
+            data[key] = getattr(fingerprint, key, None) or {}
+    return project_fingerprint(data)
+
+
+def store_fingerprint_vector(
+    session: Session, fingerprint: BehavioralFingerprint
+) -> np.ndarray:
+    """
+    Write the vector row for a (flushed) fingerprint without committing.
+
+    Vectors of the speaker's other fingerprints are removed so the table
+    only holds current fingerprints.
+    """
+    vector = project_behavioral_fingerprint(fingerprint)
+    session.query(FingerprintVector).filter(
+        FingerprintVector.speaker_id == fingerprint.speaker_id,
+        FingerprintVector.fingerprint_id != fingerprint.id,
+    ).delete(synchronize_session=False)
+    row = (
+        session.query(FingerprintVector)
+        .filter(FingerprintVector.fingerprint_id == fingerprint.id)
+        .first()
+    )
+    if row is None:
+        row = FingerprintVector(
+            fingerprint_id=fingerprint.id, speaker_id=fingerprint.speaker_id
+        )
+        session.add(row)
+    row.projection_version = PROJECTION_VERSION
+    row.dimension = VECTOR_DIMENSION
+    row.vector = vector.tobytes()
+    session.flush()
+    return vector
+
+
+class FingerprintIndex:
+    """In-memory matrix of current fingerprint vectors for one database."""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._matrix = np.zeros((0, VECTOR_DIMENSION), dtype=np.float32)
+        self._speaker_ids = np.zeros(0, dtype=np.int64)
+        self._signature: Optional[Tuple[int, Optional[int]]] = None
+        self._synced = False
+
+    def __len__(self) -> int:
+        return len(self._speaker_ids)
+
+    def search(
+        self,
+        session: Session,
+        query: Dict[str, Any] | np.ndarray,
+        k: int = 10,
+        min_score: float = 0.0,
+    ) -> List[Tuple[int, float]]:
+        """
+        Top-k speakers by cosine similarity to a fingerprint.
+
+        Args:
+            session: Database session used to (re)load the index
+            query: Fingerprint data or a projected vector
+            k: Maximum number of speakers returned
+            min_score: Minimum cosine similarity
+
+        Returns:
+            (speaker_id, score) pairs, best first
+        """
+        vector = query if isinstance(query, np.ndarray) else project_fingerprint(query)
+        if k <= 0 or not vector.any():
+            return []
+        with self._lock:
+            self._ensure_loaded(session)
+            if not len(self._speaker_ids):
+                return []
+            scores = self._matrix @ vector.astype(np.float32)
+            speaker_ids = self._speaker_ids
+        if k < len(scores):
+            top = np.argpartition(-scores, k - 1)[:k]
+        else:
+            top = np.arange(len(scores))
+        top = top[np.argsort(-scores[top], kind="stable")]
+        return [
+            (int(speaker_ids[i]), float(scores[i]))
+            for i in top
+            if scores[i] >= min_score
+        ]
+
+    def apply(self, session: Session, speaker_id: int, vector: np.ndarray) -> None:
+        """Replace a speaker's vector after its new fingerprint is committed."""
+        with self._lock:
+            if self._signature is None:
+                return  # Not loaded yet; the first search reads the table
+            rows = np.flatnonzero(self._speaker_ids == speaker_id)
+            if len(rows):
+                self._matrix[rows[0]] = vector
+                if len(rows) > 1:
+                    keep = np.ones(len(self._speaker_ids), dtype=bool)
+                    keep[rows[1:]] = False
+                    self._matrix = self._matrix[keep]
+                    self._speaker_ids = self._speaker_ids[keep]
+            else:
+                self._matrix = np.vstack([self._matrix, vector[None, :]])
+                self._speaker_ids = np.append(self._speaker_ids, speaker_id)
+            self._signature = self._read_signature(session)
+
+    def invalidate(self) -> None:
+        """Reload from the database on the next search."""
+        with self._lock:
+            self._signature = None
+
+    # ------------------------------------------------------------------
+
+    @staticmethod
+    def _read_signature(session: Session) -> Tuple[int, Optional[int]]:
+        count, max_id = session.query(
+            func.count(FingerprintVector.id), func.max(FingerprintVector.id)
+        ).one()
+        return int(count), max_id
+
+    def _ensure_loaded(self, session: Session) -> None:
+        if not self._synced:
+            self._sync_vectors(session)
+            self._synced = True
+        signature = self._read_signature(session)
+        if signature == self._signature:
+            return
+        rows = (
+            session.query(FingerprintVector.speaker_id, FingerprintVector.vector)
+            .join(
+                BehavioralFingerprint,
+                BehavioralFingerprint.id == FingerprintVector.fingerprint_id,
+            )
+            .filter(
+                BehavioralFingerprint.is_current,
+                FingerprintVector.projection_version == PROJECTION_VERSION,
+            )
+            .all()
+        )
+        if rows:
+            self._matrix = np.vstack(
+                [np.frombuffer(vector, dtype=np.float32) for _, vector in rows]
+            )
+            self._speaker_ids = np.array([row[0] for row in rows], dtype=np.int64)
+        else:
+            self._matrix = np.zeros((0, VECTOR_DIMENSION), dtype=np.float32)
+            self._speaker_ids = np.zeros(0, dtype=np.int64)
+        self._signature = signature
+        logger.debug(f"Loaded {len(rows)} fingerprint vectors")
+
+    @staticmethod
+    def _sync_vectors(session: Session) -> None:
+        """Backfill vectors for current fingerprints stored before the index."""
+        stored = dict(
+            session.query(
+                FingerprintVector.fingerprint_id, FingerprintVector.projection_version
+            ).all()
+        )
+        missing = [
+            fingerprint
+            for fingerprint in session.query(BehavioralFingerprint)
+            .filter(BehavioralFingerprint.is_current)
+            .all()
+            if stored.get(fingerprint.id) != PROJECTION_VERSION
+        ]
+        if not missing:
+            return
+        rows = [
+            {
+                "fingerprint_id": fingerprint.id,
+                "speaker_id": fingerprint.speaker_id,
+                "projection_version": PROJECTION_VERSION,
+                "dimension": VECTOR_DIMENSION,
+                "vector": project_behavioral_fingerprint(fingerprint).tobytes(),
+            }
+            for fingerprint in missing
+        ]
+        try:
+            # Drop stale-version rows and rows of superseded fingerprints
+            session.query(FingerprintVector).filter(
+                or_(
+                    FingerprintVector.projection_version != PROJECTION_VERSION,
+                    ~FingerprintVector.fingerprint_id.in_(
+                        select(BehavioralFingerprint.id).where(
+                            BehavioralFingerprint.is_current
+                        )
+                    ),
+                )
+            ).delete(synchronize_session=False)
+            session.execute(insert(FingerprintVector), rows)
+            session.commit()
+            logger.info(f"Indexed {len(rows)} behavioral fingerprints")
+        except Exception as e:
+            session.rollback()
+            logger.warning(f"Could not backfill fingerprint vectors: {e}")
+
+
+# Keyed by engine so separate databases (and in-memory test databases with
+# the same URL) never share a matrix
+_indexes: "weakref.WeakKeyDictionary[Any, FingerprintIndex]" = (
+    weakref.WeakKeyDictionary()
+)
+_indexes_lock = threading.Lock()
+
+
+def get_fingerprint_index(session: Session) -> FingerprintIndex:
+    """Process-wide index for the database behind a session."""
+    engine = session.get_bind()
+    with _indexes_lock:
+        index = _indexes.get(engine)
+        if index is None:
+            index = _indexes[engine] = FingerprintIndex()
+        return index
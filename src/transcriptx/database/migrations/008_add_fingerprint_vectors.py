@@ -0,0 +1,42 @@
+"""
+Migration: Add fingerprint_vectors table for nearest-neighbour speaker
+identification.
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision = "008_add_fingerprint_vectors"
+down_revision = "007_add_corrections"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_table(
+        "fingerprint_vectors",
+        sa.Column("id", sa.Integer(), primary_key=True, autoincrement=True),
+        sa.Column(
+            "fingerprint_id",
+            sa.Integer(),
+            sa.ForeignKey("behavioral_fingerprints.id", ondelete="CASCADE"),
+            nullable=False,
+            unique=True,
+        ),
+        sa.Column(
+            "speaker_id", sa.Integer(), sa.ForeignKey("speakers.id"), nullable=False
+        ),
+        sa.Column("projection_version", sa.Integer(), nullable=False),
+        sa.Column("dimension", sa.Integer(), nullable=False),
+        sa.Column("vector", sa.LargeBinary(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now()),
+    )
+    op.create_index(
+        "idx_fingerprint_vector_speaker", "fingerprint_vectors", ["speaker_id"]
+    )
+
+
+def downgrade():
+    op.drop_index("idx_fingerprint_vector_speaker", table_name="fingerprint_vectors")
+    op.drop_table("fingerprint_vectors")
@@ -8,6 +8,7 @@ from sqlalchemy import (
     ForeignKey,
     Index,
     Integer,
+    LargeBinary,
     String,
     Text,
     UniqueConstraint,
@@ -39,6 +40,7 @@ __all__ = [
     "relationship",
     "Column",
     "Integer",
+    "LargeBinary",
     "String",
     "Text",
     "Float",
@@ -6,6 +6,7 @@ from .base import (
     relationship,
     Column,
     Integer,
+    LargeBinary,
     String,
     Text,
     Float,
@@ -256,6 +257,38 @@ class BehavioralFingerprint(Base):
         return f"<BehavioralFingerprint(id={self.id}, speaker_id={self.speaker_id}, version={self.fingerprint_version})>"
 
 
+class FingerprintVector(Base):
+    """
+    Fixed-length numeric projection of a behavioral fingerprint.
+
+    One row per current fingerprint, used to build the in-memory
+    nearest-neighbour index for speaker identification (see
+    transcriptx.database.fingerprint_index). Vectors are float32 bytes.
+    """
+
+    __tablename__ = "fingerprint_vectors"
+
+    id: Mapped[int] = Column(Integer, primary_key=True, autoincrement=True)
+    fingerprint_id: Mapped[int] = Column(
+        Integer,
+        ForeignKey("behavioral_fingerprints.id", ondelete="CASCADE"),
+        nullable=False,
+        unique=True,
+    )
+    speaker_id: Mapped[int] = Column(Integer, ForeignKey("speakers.id"), nullable=False)
+    projection_version: Mapped[int] = Column(Integer, nullable=False)
+    dimension: Mapped[int] = Column(Integer, nullable=False)
+    vector: Mapped[bytes] = Column(LargeBinary, nullable=False)
+    updated_at: Mapped[datetime] = Column(
+        DateTime, default=func.now(), onupdate=func.now()
+    )
+
+    __table_args__ = (Index("idx_fingerprint_vector_speaker", "speaker_id"),)
+
+    def __repr__(self) -> str:
+        return f"<FingerprintVector(fingerprint_id={self.fingerprint_id}, speaker_id={self.speaker_id})>"
+
+
 class SpeakerStats(Base):
     """
     Speaker statistics entity storing aggregated statistical data.
@@ -5,6 +5,7 @@ Repository classes for TranscriptX database operations.
 from datetime import datetime
 from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert
 
 from transcriptx.core.utils.logger import get_logger
 from ..models import PipelineRun, ModuleRun, ArtifactIndex, PerformanceSpan
@@ -491,6 +492,42 @@ class ArtifactIndexRepository(BaseRepository):
         except Exception as e:
             self._handle_error("create_artifact", e)
 
+    def create_artifacts(
+        self,
+        module_run_id: Optional[int],
+        transcript_file_id: int,
+        artifacts: List[Dict[str, Any]],
+    ) -> int:
+        """
+        Insert artifact rows with one executemany.
+
+        Args:
+            module_run_id: Module run the artifacts belong to
+            transcript_file_id: Transcript the artifacts belong to
+            artifacts: Rows with artifact_key, relative_path, artifact_root,
+                artifact_type, artifact_role and content_hash
+
+        Returns:
+            Number of rows inserted
+        """
+        if not artifacts:
+            return 0
+        try:
+            self.session.execute(
+                insert(ArtifactIndex),
+                [
+                    {
+                        **artifact,
+                        "module_run_id": module_run_id,
+                        "transcript_file_id": transcript_file_id,
+                    }
+                    for artifact in artifacts
+                ],
+            )
+            return len(artifacts)
+        except Exception as e:
+            self._handle_error("create_artifacts", e)
+
     def get_primary_artifacts(self, module_run_id: int) -> List[ArtifactIndex]:
         try:
             return (
@@ -8,6 +8,7 @@ from typing import Any, Dict, List, Optional
 from sqlalchemy import and_
 
 from transcriptx.core.utils.logger import get_logger
+from ..fingerprint_index import get_fingerprint_index, store_fingerprint_vector
 from ..models import SpeakerProfile, BehavioralFingerprint
 
 logger = get_logger()
@@ -162,7 +163,10 @@ class ProfileRepository(BaseRepository):
             )
 
             self.session.add(fingerprint)
+            self.session.flush()
+            vector = store_fingerprint_vector(self.session, fingerprint)
             self.session.commit()
+            get_fingerprint_index(self.session).apply(self.session, speaker_id, vector)
 
             logger.info(
                 f"✅ Created behavioral fingerprint version {fingerprint.fingerprint_version} for speaker {speaker_id}"
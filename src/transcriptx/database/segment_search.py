@@ -0,0 +1,336 @@
+"""
+Full-text segment index for TranscriptX.
+
+SQLite databases get an FTS5 external-content table over
+``transcript_segments.text``. Insert, update and delete triggers keep it in
+sync, so every write path (segment storage, transcript ingestion,
+corrections, cascading deletes) maintains the index without extra calls.
+PostgreSQL gets the equivalent GIN index on ``to_tsvector('simple', text)``.
+
+Queries are phrase queries whose last word is a prefix, so "ship the rel"
+matches "Ship the release" while the user is still typing. Results are
+ranked (BM25 on SQLite, ``ts_rank_cd`` on PostgreSQL) and paginated in the
+database; only the requested page is read back.
+"""
+
+from __future__ import annotations
+
+import re
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from sqlalchemy import inspect, text
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+SEGMENT_FTS_TABLE = "transcript_segments_fts"
+POSTGRES_TSV_INDEX = "idx_transcript_segments_text_tsv"
+
+# Highlight markers; control characters never appear in transcript text
+_MARK_OPEN = "\x02"
+_MARK_CLOSE = "\x03"
+
+# FTS5 unicode61 token characters: letters and digits, not underscore
+_TOKEN_RE = re.compile(r"[^\W_]+")
+
+_SQLITE_DDL = (
+    f"""
+    CREATE VIRTUAL TABLE IF NOT EXISTS {SEGMENT_FTS_TABLE} USING fts5(
+        text,
+        content='transcript_segments',
+        content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2',
+        prefix='2 3'
+    )
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEGMENT_FTS_TABLE}_ai
+    AFTER INSERT ON transcript_segments BEGIN
+        INSERT INTO {SEGMENT_FTS_TABLE}(rowid, text) VALUES (new.id, new.text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEGMENT_FTS_TABLE}_ad
+    AFTER DELETE ON transcript_segments BEGIN
+        INSERT INTO {SEGMENT_FTS_TABLE}({SEGMENT_FTS_TABLE}, rowid, text)
+        VALUES ('delete', old.id, old.text);
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS {SEGMENT_FTS_TABLE}_au
+    AFTER UPDATE OF text ON transcript_segments BEGIN
+        INSERT INTO {SEGMENT_FTS_TABLE}({SEGMENT_FTS_TABLE}, rowid, text)
+        VALUES ('delete', old.id, old.text);
+        INSERT INTO {SEGMENT_FTS_TABLE}(rowid, text) VALUES (new.id, new.text);
+    END
+    """,
+)
+
+
+@dataclass(frozen=True)
+class SegmentSearchHit:
+    """One ranked match: segment id, score (higher is better) and match spans."""
+
+    segment_id: int
+    score: float
+    match_spans: List[Tuple[int, int]] = field(default_factory=list)
+
+
+@dataclass
+class SegmentSearchPage:
+    """A page of ranked hits plus the total number of matching segments."""
+
+    hits: List[SegmentSearchHit]
+    total: int
+
+
+def query_tokens(query: str) -> List[str]:
+    """Lowercased index tokens of a search query."""
+    return _TOKEN_RE.findall(query.lower())
+
+
+def build_fts_query(query: str) -> Optional[str]:
+    """FTS5 MATCH expression: the query as a phrase with a prefix last token."""
+    tokens = query_tokens(query)
+    if not tokens:
+        return None
+    # Tokens are alphanumeric, so they need no quoting inside the phrase
+    return '"' + " ".join(tokens) + '"*'
+
+
+def build_tsquery(query: str) -> Optional[str]:
+    """PostgreSQL to_tsquery expression equivalent to build_fts_query."""
+    tokens = query_tokens(query)
+    if not tokens:
+        return None
+    return " <-> ".join(tokens[:-1] + [f"{tokens[-1]}:*"])
+
+
+def _dialect(bind: Engine | Session) -> str:
+    engine = bind.get_bind() if isinstance(bind, Session) else bind
+    return engine.dialect.name
+
+
+def ensure_segment_search_index(engine: Engine) -> bool:
+    """
+    Create the segment full-text index if it is missing.
+
+    A newly created SQLite index is backfilled from existing segments.
+
+    Returns:
+        True if the index is available after the call
+    """
+    inspector = inspect(engine)
+    if not inspector.has_table("transcript_segments"):
+        return False
+    dialect = engine.dialect.name
+    if dialect == "sqlite":
+        created = not inspector.has_table(SEGMENT_FTS_TABLE)
+        with engine.begin() as connection:
+            for statement in _SQLITE_DDL:
+                connection.execute(text(statement))
+            if created:
+                connection.execute(
+                    text(
+                        f"INSERT INTO {SEGMENT_FTS_TABLE}({SEGMENT_FTS_TABLE}) "
+                        "VALUES ('rebuild')"
+                    )
+                )
+        if created:
+            logger.info("✅ Created segment full-text index")
+        return True
+    if dialect == "postgresql":
+        with engine.begin() as connection:
+            connection.execute(
+                text(
+                    f"CREATE INDEX IF NOT EXISTS {POSTGRES_TSV_INDEX} "
+                    "ON transcript_segments USING GIN (to_tsvector('simple', text))"
+                )
+            )
+        return True
+    return False
+
+
+def rebuild_segment_search_index(engine: Optional[Engine] = None) -> int:
+    """
+    Rebuild the segment full-text index from transcript_segments.
+
+    Use after restoring a database or when the index is suspected to be out of
+    sync. Creates the index first if needed.
+
+    Returns:
+        Number of segments in the rebuilt index
+    """
+    if engine is None:
+        from transcriptx.database.database import get_database_manager
+
+        engine = get_database_manager().engine
+    if not ensure_segment_search_index(engine):
+        raise RuntimeError(
+            f"Full-text segment search is not supported on {engine.dialect.name}"
+        )
+    with engine.begin() as connection:
+        if engine.dialect.name == "sqlite":
+            connection.execute(
+                text(
+                    f"INSERT INTO {SEGMENT_FTS_TABLE}({SEGMENT_FTS_TABLE}) "
+                    "VALUES ('rebuild')"
+                )
+            )
+        else:
+            connection.execute(text(f"REINDEX INDEX {POSTGRES_TSV_INDEX}"))
+        count = connection.execute(
+            text("SELECT count(*) FROM transcript_segments")
+        ).scalar()
+    logger.info(f"✅ Rebuilt segment full-text index ({count} segments)")
+    return int(count or 0)
+
+
+def drop_segment_search_index(engine: Engine) -> None:
+    """Drop the SQLite index table; its triggers go with transcript_segments."""
+    if engine.dialect.name == "sqlite":
+        with engine.begin() as connection:
+            connection.execute(text(f"DROP TABLE IF EXISTS {SEGMENT_FTS_TABLE}"))
+
+
+def segment_search_available(session: Session) -> bool:
+    """True if full-text segment search can run on this session's database."""
+    dialect = _dialect(session)
+    if dialect == "postgresql":
+        return True
+    if dialect != "sqlite":
+        return False
+    row = session.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = :name"),
+        {"name": SEGMENT_FTS_TABLE},
+    ).first()
+    return row is not None
+
+
+def search_segments(
+    session: Session,
+    query: str,
+    *,
+    limit: int = 50,
+    offset: int = 0,
+) -> SegmentSearchPage:
+    """
+    Ranked, paginated full-text search over segment text.
+
+    Args:
+        session: Database session
+        query: User query; words are matched as a phrase, the last as a prefix
+        limit: Page size
+        offset: Number of ranked hits to skip
+
+    Returns:
+        SegmentSearchPage with hits best-first and the total match count
+    """
+    if _dialect(session) == "postgresql":
+        return _search_postgresql(session, query, limit, offset)
+    return _search_sqlite(session, query, limit, offset)
+
+
+def _search_sqlite(
+    session: Session, query: str, limit: int, offset: int
+) -> SegmentSearchPage:
+    match = build_fts_query(query)
+    if match is None:
+        return SegmentSearchPage(hits=[], total=0)
+    rows = session.execute(
+        text(
+            f"SELECT rowid, rank, highlight({SEGMENT_FTS_TABLE}, 0, :open, :close) "
+            f"FROM {SEGMENT_FTS_TABLE} WHERE {SEGMENT_FTS_TABLE} MATCH :match "
+            "ORDER BY rank LIMIT :limit OFFSET :offset"
+        ),
+        {
+            "open": _MARK_OPEN,
+            "close": _MARK_CLOSE,
+            "match": match,
+            "limit": limit,
+            "offset": offset,
+        },
+    ).all()
+    total = session.execute(
+        text(
+            f"SELECT count(*) FROM {SEGMENT_FTS_TABLE} "
+            f"WHERE {SEGMENT_FTS_TABLE} MATCH :match"
+        ),
+        {"match": match},
+    ).scalar()
+    hits = [
+        # bm25 rank is lower-is-better; negate so scores sort like ts_rank_cd
+        SegmentSearchHit(
+            segment_id=int(rowid),
+            score=-float(rank),
+            match_spans=spans_from_highlight(marked or ""),
+        )
+        for rowid, rank, marked in rows
+    ]
+    return SegmentSearchPage(hits=hits, total=int(total or 0))
+
+
+def _search_postgresql(
+    session: Session, query: str, limit: int, offset: int
+) -> SegmentSearchPage:
+    tsquery = build_tsquery(query)
+    if tsquery is None:
+        return SegmentSearchPage(hits=[], total=0)
+    params = {"tsquery": tsquery, "limit": limit, "offset": offset}
+    rows = session.execute(
+        text(
+            "SELECT id, ts_rank_cd(to_tsvector('simple', text), q) AS score, text "
+            "FROM transcript_segments, to_tsquery('simple', :tsquery) AS q "
+            "WHERE to_tsvector('simple', text) @@ q "
+            "ORDER BY score DESC, id LIMIT :limit OFFSET :offset"
+        ),
+        params,
+    ).all()
+    total = session.execute(
+        text(
+            "SELECT count(*) FROM transcript_segments "
+            "WHERE to_tsvector('simple', text) @@ to_tsquery('simple', :tsquery)"
+        ),
+        {"tsquery": tsquery},
+    ).scalar()
+    tokens = query_tokens(query)
+    hits = [
+        SegmentSearchHit(
+            segment_id=int(segment_id),
+            score=float(score),
+            match_spans=phrase_spans(segment_text, tokens),
+        )
+        for segment_id, score, segment_text in rows
+    ]
+    return SegmentSearchPage(hits=hits, total=int(total or 0))
+
+
+def spans_from_highlight(marked: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets in the unmarked text of each highlighted run."""
+    spans: List[Tuple[int, int]] = []
+    removed = 0
+    start = 0
+    for position, char in enumerate(marked):
+        if char == _MARK_OPEN:
+            start = position - removed
+            removed += 1
+        elif char == _MARK_CLOSE:
+            spans.append((start, position - removed))
+            removed += 1
+    return spans
+
+
+def phrase_spans(segment_text: str, tokens: List[str]) -> List[Tuple[int, int]]:
+    """Spans of the query phrase in text, matched on word boundaries."""
+    if not tokens:
+        return []
+    words = [re.escape(token) for token in tokens]
+    pattern = r"(?<![^\W_])" + r"[\W_]+".join(words) + r"[^\W_]*"
+    return [
+        match.span()
+        for match in re.finditer(pattern, segment_text, flags=re.IGNORECASE)
+    ]
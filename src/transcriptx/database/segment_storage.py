@@ -260,11 +260,9 @@ class SegmentStorageService:
             # Store sentences from segments
             sentence_service = SentenceStorageService()
             try:
-                sentences = sentence_service.store_sentences_from_segments(
-                    segments=stored_segments
-                )
+                sentence_ids = sentence_service.bulk_store_sentences(stored_segments)
                 logger.info(
-                    f"✅ Stored {len(sentences)} sentences from {len(stored_segments)} segments"
+                    f"✅ Stored {len(sentence_ids)} sentences from {len(stored_segments)} segments"
                 )
             except Exception as e:
                 logger.warning(f"⚠️ Failed to store sentences: {e}")
@@ -4,10 +4,23 @@ Sentence Storage Service for TranscriptX Database Integration.
 This module provides a service class for storing transcript sentences
 in the database, handling sentence splitting, timestamp interpolation,
 and speaker identity assignment.
+
+``bulk_store_sentences`` is the ingestion path: it consumes segments from any
+iterable (including a generator) in fixed-size chunks, computes sentence
+timestamps for a whole chunk with numpy, and inserts rows with a Core
+executemany insert, so no ORM sentence objects are built or kept in the
+session's identity map. ``store_sentences_from_segments`` remains for callers
+that need the ORM objects back.
 """
 
-from typing import List, Optional
-from uuid import uuid4
+import os
+from itertools import islice
+from typing import Any, Iterable, List, Optional
+from uuid import UUID, uuid4
+
+import numpy as np
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
 
 from transcriptx.core.utils.logger import get_logger
 from transcriptx.database import get_session
@@ -16,6 +29,9 @@ from transcriptx.utils.text_utils import extract_sentences
 
 logger = get_logger()
 
+# Segments split and inserted per executemany batch
+DEFAULT_CHUNK_SIZE = 2000
+
 
 class SentenceStorageService:
     """
@@ -28,9 +44,17 @@ class SentenceStorageService:
     - Storing provenance information (split_method, provenance_version)
     """
 
-    def __init__(self):
-        """Initialize the sentence storage service."""
-        self.session = get_session()
+    def __init__(self, session: Optional[Session] = None):
+        """
+        Initialize the sentence storage service.
+
+        Args:
+            session: Session to write through. When given, the caller owns the
+                transaction: sentences are flushed, not committed, and close()
+                leaves the session open.
+        """
+        self._owns_session = session is None
+        self.session = session if session is not None else get_session()
 
     def store_sentences_from_segments(
         self, segments: List[TranscriptSegment], analysis_run_id: Optional[str] = None
@@ -118,7 +142,7 @@ class SentenceStorageService:
                 self.session.add_all(sentences_data)
                 all_sentences.extend(sentences_data)
 
-            self.session.commit()
+            self._finish()
             logger.info(
                 f"✅ Stored {len(all_sentences)} sentences from {len(segments)} segments"
             )
@@ -130,7 +154,167 @@ class SentenceStorageService:
                 self.session.rollback()
             raise
 
+    def bulk_store_sentences(
+        self,
+        segments: Iterable[Any],
+        analysis_run_id: Optional[str] = None,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+    ) -> List[int]:
+        """
+        Split segments into sentences and bulk-insert them in chunks.
+
+        Produces the same rows as store_sentences_from_segments. Segments are
+        read lazily, ``chunk_size`` at a time; each needs ``id``, ``text``,
+        ``start_time``, ``end_time``, ``speaker_id`` and
+        ``transcript_speaker_id`` attributes (ORM segments or any object with
+        them).
+
+        Args:
+            segments: Iterable of segments; may be a generator
+            analysis_run_id: Optional UUID linking sentences to analysis run
+            chunk_size: Segments per executemany insert
+
+        Returns:
+            Ids of the inserted sentences, in segment and sentence order
+
+        Raises:
+            Exception: For database errors
+        """
+        table = TranscriptSentence.__table__
+        statement = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        iterator = iter(segments)
+        sentence_ids: List[int] = []
+        segment_count = 0
+        try:
+            while True:
+                chunk = list(islice(iterator, chunk_size))
+                if not chunk:
+                    break
+                segment_count += len(chunk)
+                rows = _sentence_rows(chunk, analysis_run_id)
+                if rows:
+                    result = self.session.execute(statement, rows)
+                    sentence_ids.extend(result.scalars().all())
+            self._finish()
+            logger.info(
+                f"✅ Stored {len(sentence_ids)} sentences from {segment_count} segments"
+            )
+            return sentence_ids
+        except Exception as e:
+            logger.error(f"❌ Failed to store sentences: {e}")
+            if self.session:
+                self.session.rollback()
+            raise
+
+    def _finish(self) -> None:
+        if self._owns_session:
+            self.session.commit()
+        else:
+            self.session.flush()
+
     def close(self):
-        """Close the database session."""
-        if self.session:
+        """Close the database session (unless it was passed in)."""
+        if self.session and self._owns_session:
             self.session.close()
+
+
+def _split_segment(text: Optional[str]) -> List[str]:
+    """Sentences of a segment, or the whole text when none are found."""
+    text = text or ""
+    sentence_texts = extract_sentences(text)
+    if not sentence_texts:
+        sentence_texts = [text] if text.strip() else []
+    return sentence_texts
+
+
+def _sentence_rows(segments: List[Any], analysis_run_id: Optional[str]) -> List[dict]:
+    """Insert rows for a chunk of segments, timestamps computed in one pass."""
+    texts: List[str] = []
+    counts = np.zeros(len(segments), dtype=np.int64)
+    for i, segment in enumerate(segments):
+        sentence_texts = _split_segment(segment.text)
+        counts[i] = len(sentence_texts)
+        texts.extend(sentence_texts)
+    if not texts:
+        return []
+
+    words = np.fromiter(
+        (len(t.split()) for t in texts), dtype=np.float64, count=len(texts)
+    )
+    starts, ends = _proportional_times(
+        np.array([s.start_time for s in segments], dtype=np.float64),
+        np.array([s.end_time for s in segments], dtype=np.float64),
+        counts,
+        words,
+    )
+    owner = np.repeat(np.arange(len(segments)), counts).tolist()
+    index = (
+        np.arange(len(texts)) - np.repeat(np.cumsum(counts) - counts, counts)
+    ).tolist()
+    random = os.urandom(16 * len(texts))
+
+    rows = []
+    for k, (sentence_text, start, end, word_count) in enumerate(
+        zip(texts, starts.tolist(), ends.tolist(), words.astype(np.int64).tolist())
+    ):
+        segment = segments[owner[k]]
+        rows.append(
+            {
+                "uuid": str(UUID(bytes=random[16 * k : 16 * k + 16], version=4)),
+                "transcript_segment_id": segment.id,
+                "speaker_id": segment.speaker_id,
+                "transcript_speaker_id": segment.transcript_speaker_id,
+                "sentence_index": index[k],
+                "text": sentence_text.strip(),
+                "start_time": start,
+                "end_time": end,
+                "word_count": word_count,
+                "timestamp_estimated": True,
+                "split_method": "punctuation",
+                "provenance_version": 1,
+                "analysis_run_id": analysis_run_id,
+            }
+        )
+    return rows
+
+
+def _proportional_times(
+    segment_starts: np.ndarray,
+    segment_ends: np.ndarray,
+    counts: np.ndarray,
+    words: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Sentence start/end times, splitting each segment by word share.
+
+    Segments whose sentences have no words are split evenly.
+
+    Args:
+        segment_starts: Start time per segment
+        segment_ends: End time per segment
+        counts: Number of sentences per segment
+        words: Word count per sentence, segments concatenated in order
+
+    Returns:
+        (starts, ends) per sentence
+    """
+    owner = np.repeat(np.arange(len(counts)), counts)
+    first = np.cumsum(counts) - counts
+    cumulative = np.cumsum(words)
+    # Words in the same segment before each sentence
+    before = cumulative - words
+    before -= before[first[counts > 0]].repeat(counts[counts > 0])
+    totals = np.add.reduceat(words, first[counts > 0]).repeat(counts[counts > 0])
+
+    position = np.arange(len(words)) - first[owner]
+    per_sentence = counts[owner].astype(np.float64)
+    has_words = totals > 0
+    safe_totals = np.where(has_words, totals, 1.0)
+    start_share = np.where(has_words, before / safe_totals, position / per_sentence)
+    end_share = np.where(
+        has_words, (before + words) / safe_totals, (position + 1) / per_sentence
+    )
+
+    duration = (segment_ends - segment_starts)[owner]
+    offset = segment_starts[owner]
+    return offset + start_share * duration, offset + end_share * duration
@@ -33,10 +33,18 @@ from transcriptx.core.analysis.ner import extract_named_entities
 from transcriptx.core.utils.nlp_utils import extract_tics_from_text
 from transcriptx.core.analysis.sentiment import score_sentiment
 from .database import get_session
+from .fingerprint_index import get_fingerprint_index
+from .models import Speaker
 from .repositories import SpeakerRepository, ProfileRepository
 
 logger = get_logger()
 
+# Nearest fingerprints fetched per identification
+IDENTIFICATION_CANDIDATES = 10
+
+# Above MAX_SCORE_WITHOUT_VOCABULARY (0.7), so a match needs shared vocabulary
+IDENTIFICATION_THRESHOLD = 0.85
+
 
 class SpeakerProfilingService:
     """
@@ -338,14 +346,16 @@ class SpeakerProfilingService:
             raise
 
     def identify_speaker_by_behavior(
-        self, segments_data: List[Dict[str, Any]], threshold: float = 0.7
+        self,
+        segments_data: List[Dict[str, Any]],
+        threshold: float = IDENTIFICATION_THRESHOLD,
     ) -> Optional[Tuple[Any, float]]:
         """
         Identify speaker by behavioral patterns.
 
         Args:
             segments_data: List of speaker segments with text and metadata
-            threshold: Similarity threshold for identification
+            threshold: Minimum cosine similarity of the fingerprint vectors
 
         Returns:
             Tuple of (speaker, confidence_score) or None if no match
@@ -359,25 +369,32 @@ class SpeakerProfilingService:
                 " ".join(segment.get("text", "") for segment in segments_data),
             )
 
-            # Get all speakers with fingerprints
-            speakers = self.speaker_repo.find_speakers(active_only=True)
+            # Nearest current fingerprints, then one fetch for their speakers
+            hits = get_fingerprint_index(self.session).search(
+                self.session,
+                current_fingerprint,
+                k=IDENTIFICATION_CANDIDATES,
+                min_score=threshold,
+            )
+            speakers = {}
+            if hits:
+                speakers = {
+                    speaker.id: speaker
+                    for speaker in self.session.query(Speaker)
+                    .filter(
+                        Speaker.id.in_([speaker_id for speaker_id, _ in hits]),
+                        Speaker.is_active,
+                    )
+                    .all()
+                }
 
             best_match = None
             best_score = 0.0
-
-            for speaker in speakers:
-                fingerprint = self.profile_repo.get_current_fingerprint(speaker.id)
-                if not fingerprint:
-                    continue
-
-                # Calculate similarity
-                similarity = self._calculate_fingerprint_similarity(
-                    current_fingerprint, fingerprint.fingerprint_data
-                )
-
-                if similarity > best_score and similarity >= threshold:
-                    best_match = speaker
+            for speaker_id, similarity in hits:
+                if speaker_id in speakers:
+                    best_match = speakers[speaker_id]
                     best_score = similarity
+                    break
 
             if best_match:
                 logger.info(
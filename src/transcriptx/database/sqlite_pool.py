@@ -0,0 +1,282 @@
+"""
+SQLite connection pooling for TranscriptX.
+
+File-backed SQLite databases get a bounded pool of connections instead of a
+single shared one, so the web UI, performance span logging and the pipeline
+read concurrently under WAL. SQLite still allows one writer at a time:
+
+- Writers in this process queue on a per-database lock, taken at a
+  connection's first write statement and released once it commits or rolls
+  back, instead of spinning in SQLite's busy handler.
+- Every connection sets ``busy_timeout``; statements that still fail with
+  SQLITE_BUSY or SQLITE_LOCKED (e.g. another process is writing) are
+  retried with exponential backoff.
+
+Pool checkout waits, writer-lock waits and busy retries are counted in
+``SQLitePoolMetrics``; ``DatabaseManager.get_database_info()`` reports them
+under ``"pool"``.
+"""
+
+from __future__ import annotations
+
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Optional, Type
+
+from sqlalchemy.pool import QueuePool
+
+from transcriptx.core.utils.logger import get_logger
+
+logger = get_logger()
+
+DEFAULT_POOL_SIZE = 8
+DEFAULT_BUSY_TIMEOUT_MS = 30000
+DEFAULT_WRITE_RETRIES = 5
+
+# Backoff between busy retries: 50ms doubling up to 1s
+_RETRY_BASE_SECONDS = 0.05
+_RETRY_MAX_SECONDS = 1.0
+
+_SQLITE_BUSY = 5
+_SQLITE_LOCKED = 6
+# Stale WAL read snapshot; retrying the statement cannot succeed
+_SQLITE_BUSY_SNAPSHOT = 517
+
+_WRITE_RE = re.compile(
+    r"^\s*(INSERT|UPDATE|DELETE|REPLACE|CREATE|DROP|ALTER|"
+    r"BEGIN\s+(IMMEDIATE|EXCLUSIVE))\b",
+    re.IGNORECASE,
+)
+
+
+def is_memory_database(database_url: str) -> bool:
+    """True for in-memory SQLite URLs, which must share a single connection."""
+    path = database_url.split("://", 1)[-1].lstrip("/")
+    return not path or ":memory:" in path or "mode=memory" in path
+
+
+def is_write_statement(statement: str) -> bool:
+    """True if the SQL statement needs SQLite's write lock."""
+    return bool(_WRITE_RE.match(statement))
+
+
+def _is_busy_error(err: sqlite3.OperationalError) -> bool:
+    code = getattr(err, "sqlite_errorcode", None)
+    if code is not None:
+        return code != _SQLITE_BUSY_SNAPSHOT and code & 0xFF in (
+            _SQLITE_BUSY,
+            _SQLITE_LOCKED,
+        )
+    message = str(err).lower()
+    return "database is locked" in message or "database table is locked" in message
+
+
+class SQLitePoolMetrics:
+    """Thread-safe counters for pool checkouts, writer-lock waits and retries."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_wait_ms_total = 0.0
+        self.checkout_wait_ms_max = 0.0
+        self.write_locks = 0
+        self.write_lock_wait_ms_total = 0.0
+        self.write_lock_wait_ms_max = 0.0
+        self.write_lock_timeouts = 0
+        self.busy_retries = 0
+        self.busy_failures = 0
+
+    def record_checkout(self, wait_seconds: float) -> None:
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            self.checkouts += 1
+            self.checkout_wait_ms_total += wait_ms
+            self.checkout_wait_ms_max = max(self.checkout_wait_ms_max, wait_ms)
+
+    def record_write_lock(self, wait_seconds: float, acquired: bool) -> None:
+        wait_ms = wait_seconds * 1000
+        with self._lock:
+            self.write_locks += 1
+            self.write_lock_wait_ms_total += wait_ms
+            self.write_lock_wait_ms_max = max(self.write_lock_wait_ms_max, wait_ms)
+            if not acquired:
+                self.write_lock_timeouts += 1
+
+    def record_busy(self, retried: bool) -> None:
+        with self._lock:
+            if retried:
+                self.busy_retries += 1
+            else:
+                self.busy_failures += 1
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters as a dict, with mean waits in milliseconds."""
+        with self._lock:
+            return {
+                "checkouts": self.checkouts,
+                "checkout_wait_ms_total": round(self.checkout_wait_ms_total, 3),
+                "checkout_wait_ms_mean": (
+                    round(self.checkout_wait_ms_total / self.checkouts, 3)
+                    if self.checkouts
+                    else 0.0
+                ),
+                "checkout_wait_ms_max": round(self.checkout_wait_ms_max, 3),
+                "write_locks": self.write_locks,
+                "write_lock_wait_ms_total": round(self.write_lock_wait_ms_total, 3),
+                "write_lock_wait_ms_mean": (
+                    round(self.write_lock_wait_ms_total / self.write_locks, 3)
+                    if self.write_locks
+                    else 0.0
+                ),
+                "write_lock_wait_ms_max": round(self.write_lock_wait_ms_max, 3),
+                "write_lock_timeouts": self.write_lock_timeouts,
+                "busy_retries": self.busy_retries,
+                "busy_failures": self.busy_failures,
+            }
+
+
+class _WriterLock:
+    """One writer per database in this process; owners are DBAPI connections."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.owner: Optional[int] = None
+        self.owner_thread: Optional[int] = None
+
+    def acquire(self, connection_id: int, timeout: float) -> bool:
+        if self._lock.acquire(timeout=timeout):
+            self.owner = connection_id
+            self.owner_thread = threading.get_ident()
+            return True
+        return False
+
+    def release(self, connection_id: int) -> None:
+        if self.owner == connection_id:
+            self.owner = None
+            self.owner_thread = None
+            self._lock.release()
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool that records how long each checkout waited."""
+
+    metrics: Optional[SQLitePoolMetrics] = None
+
+    def _do_get(self) -> Any:
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            if self.metrics is not None:
+                self.metrics.record_checkout(time.perf_counter() - start)
+
+    def recreate(self) -> QueuePool:
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class _PooledConnection(sqlite3.Connection):
+    """sqlite3 connection that serializes writers and retries busy statements."""
+
+    writer_lock: _WriterLock
+    metrics: SQLitePoolMetrics
+    busy_timeout: float
+    retries: int
+
+    def cursor(self, factory: Type[sqlite3.Cursor] = None) -> sqlite3.Cursor:  # type: ignore[assignment]
+        return super().cursor(factory or _PooledCursor)
+
+    def _run(self, operation: Any, *args: Any, retry: bool = True) -> Any:
+        attempt = 0
+        retries = self.retries if retry else 0
+        while True:
+            try:
+                return operation(*args)
+            except sqlite3.OperationalError as e:
+                if not _is_busy_error(e) or attempt >= retries:
+                    if _is_busy_error(e):
+                        self.metrics.record_busy(retried=False)
+                    raise
+                self.metrics.record_busy(retried=True)
+                time.sleep(min(_RETRY_BASE_SECONDS * 2**attempt, _RETRY_MAX_SECONDS))
+                attempt += 1
+
+    def _begin_write(self) -> bool:
+        """Take the writer lock; False if this thread holds it elsewhere."""
+        lock = self.writer_lock
+        if lock.owner == id(self):
+            return True
+        if lock.owner_thread == threading.get_ident():
+            # This thread has an uncommitted write on another connection;
+            # waiting on the lock (or retrying) would deadlock on ourselves
+            logger.warning(
+                "Nested SQLite write while this thread holds an uncommitted "
+                "write on another connection; commit the outer session first"
+            )
+            return False
+        start = time.perf_counter()
+        acquired = lock.acquire(id(self), self.busy_timeout)
+        self.metrics.record_write_lock(time.perf_counter() - start, acquired)
+        return True
+
+    def _end_write(self) -> None:
+        if not self.in_transaction:
+            self.writer_lock.release(id(self))
+
+    def commit(self) -> None:
+        try:
+            self._run(sqlite3.Connection.commit, self)
+        finally:
+            self._end_write()
+
+    def rollback(self) -> None:
+        try:
+            sqlite3.Connection.rollback(self)
+        finally:
+            self._end_write()
+
+    def close(self) -> None:
+        try:
+            sqlite3.Connection.close(self)
+        finally:
+            self.writer_lock.release(id(self))
+
+
+class _PooledCursor(sqlite3.Cursor):
+    def _execute(self, method: Any, sql: str, parameters: Any) -> sqlite3.Cursor:
+        connection: _PooledConnection = self.connection  # type: ignore[assignment]
+        write = is_write_statement(sql)
+        retry = connection._begin_write() if write else True
+        try:
+            return connection._run(method, self, sql, parameters, retry=retry)
+        finally:
+            if write:
+                # Autocommit writes leave no transaction behind
+                connection._end_write()
+
+    def execute(self, sql: str, parameters: Any = ()) -> sqlite3.Cursor:  # type: ignore[override]
+        return self._execute(sqlite3.Cursor.execute, sql, parameters)
+
+    def executemany(self, sql: str, parameters: Any) -> sqlite3.Cursor:  # type: ignore[override]
+        return self._execute(sqlite3.Cursor.executemany, sql, parameters)
+
+
+def make_connection_factory(
+    metrics: SQLitePoolMetrics,
+    busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+    retries: int = DEFAULT_WRITE_RETRIES,
+) -> Type[sqlite3.Connection]:
+    """sqlite3 ``factory`` sharing one writer lock across a pool's connections."""
+    return type(
+        "PooledSQLiteConnection",
+        (_PooledConnection,),
+        {
+            "writer_lock": _WriterLock(),
+            "metrics": metrics,
+            "busy_timeout": busy_timeout_ms / 1000,
+            "retries": max(0, retries),
+        },
+    )
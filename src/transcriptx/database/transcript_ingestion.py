@@ -145,12 +145,10 @@ class TranscriptIngestionService:
             self.session.add_all(stored_segments)
             self.session.flush()
 
-            # Store sentences deterministically from segments
-            sentence_service = SentenceStorageService()
-            try:
-                sentence_service.store_sentences_from_segments(stored_segments)
-            finally:
-                sentence_service.close()
+            # Store sentences deterministically from segments, in this transaction
+            SentenceStorageService(session=self.session).bulk_store_sentences(
+                stored_segments
+            )
 
         self.session.commit()
         if store_segments:
@@ -0,0 +1,364 @@
+"""
+Sparse speaker x term index over stored vocabulary snapshots.
+
+``find_speakers_by_vocabulary`` used to load every ``SpeakerVocabularyWord``
+row, rebuild per-speaker dicts and fit a fresh TfidfVectorizer on the input
+for each lookup. The index instead holds one CSR matrix (speakers x shared
+vocabulary) built from each speaker's latest snapshot per transcript, so a
+lookup is one sparse transform of the input plus sparse matrix products.
+
+Indexes are built per ``vectorizer_params_hash`` (or across all hashes) and
+transcript filter, cached in memory and as ``.npz`` files under
+``DATA_DIR/cache/vocabulary_index``. Both are keyed by a signature over the
+matching rows (count, max id, max snapshot version), so storing a new
+snapshot invalidates them. Only the ``MAX_CACHE_FILES`` most recently used
+files are kept on disk; each database URL (e.g. every temporary test
+database) gets its own files, which would otherwise accumulate forever.
+
+Scores keep the original definition: cosine similarity restricted to the
+terms the input and the speaker vocabulary have in common.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import weakref
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import CountVectorizer
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from transcriptx.core.utils.logger import get_logger
+from .models import SpeakerVocabularyWord
+from .sqlite_pool import is_memory_database
+
+logger = get_logger()
+
+INDEX_VERSION = 1
+
+# Index files kept under the cache root, least recently used evicted first
+MAX_CACHE_FILES = 32
+
+# (row count, max row id, max snapshot version) of the indexed rows
+Signature = Tuple[int, int, int]
+
+
+def get_vocabulary_index_root() -> Path:
+    from transcriptx.core.utils.paths import DATA_DIR
+
+    root = Path(DATA_DIR) / "cache" / "vocabulary_index"
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def _evict_cache_files(root: Path, keep: int = MAX_CACHE_FILES) -> None:
+    """Delete all but the ``keep`` most recently used index files."""
+    files = []
+    for path in root.glob("*.npz"):
+        try:
+            files.append((path.stat().st_mtime_ns, path))
+        except OSError:
+            continue  # Evicted by another process
+    files.sort(reverse=True)
+    for _, path in files[keep:]:
+        try:
+            path.unlink()
+        except OSError:
+            pass
+
+
+def _filtered(query: Any, params_hash: Optional[str], transcript_file_id: Any) -> Any:
+    if params_hash:
+        query = query.filter(
+            SpeakerVocabularyWord.vectorizer_params_hash == params_hash
+        )
+    if transcript_file_id:
+        query = query.filter(
+            SpeakerVocabularyWord.source_transcript_file_id == transcript_file_id
+        )
+    return query
+
+
+class SpeakerVocabularyIndex:
+    """CSR matrix of speaker vocabularies over a shared term list."""
+
+    def __init__(
+        self,
+        matrix: sparse.csr_matrix,
+        speaker_ids: np.ndarray,
+        terms: Sequence[str],
+        signature: Signature,
+    ) -> None:
+        self.matrix = matrix.tocsr()
+        self.speaker_ids = np.asarray(speaker_ids, dtype=np.int64)
+        self.terms = list(terms)
+        self.signature = signature
+        # Pattern and squared scores for the restricted-support norms
+        self._pattern = self.matrix.copy()
+        self._pattern.data = np.ones_like(self._pattern.data)
+        self._squared = self.matrix.multiply(self.matrix).tocsr()
+        self._vectorizer = CountVectorizer(
+            vocabulary={term: i for i, term in enumerate(self.terms)},
+            stop_words="english",
+            ngram_range=(1, 2),
+        )
+
+    def __len__(self) -> int:
+        return len(self.speaker_ids)
+
+    @classmethod
+    def build(
+        cls,
+        session: Session,
+        params_hash: Optional[str] = None,
+        transcript_file_id: Optional[int] = None,
+        signature: Optional[Signature] = None,
+    ) -> "SpeakerVocabularyIndex":
+        """Build from the latest snapshot per speaker and transcript."""
+        latest = _filtered(
+            session.query(
+                SpeakerVocabularyWord.speaker_id.label("speaker_id"),
+                SpeakerVocabularyWord.source_transcript_file_id.label("transcript_id"),
+                func.max(SpeakerVocabularyWord.snapshot_version).label("version"),
+            ),
+            params_hash,
+            transcript_file_id,
+        ).group_by(
+            SpeakerVocabularyWord.speaker_id,
+            SpeakerVocabularyWord.source_transcript_file_id,
+        )
+        latest = latest.subquery()
+        rows = _filtered(
+            session.query(
+                SpeakerVocabularyWord.speaker_id,
+                SpeakerVocabularyWord.word,
+                SpeakerVocabularyWord.tfidf_score,
+            ).join(
+                latest,
+                (SpeakerVocabularyWord.speaker_id == latest.c.speaker_id)
+                & (SpeakerVocabularyWord.snapshot_version == latest.c.version)
+                & (
+                    func.coalesce(SpeakerVocabularyWord.source_transcript_file_id, -1)
+                    == func.coalesce(latest.c.transcript_id, -1)
+                ),
+            ),
+            params_hash,
+            transcript_file_id,
+        ).all()
+
+        speakers: Dict[int, int] = {}
+        terms: Dict[str, int] = {}
+        cells: Dict[Tuple[int, int], float] = {}
+        for speaker_id, word, score in rows:
+            key = (
+                speakers.setdefault(speaker_id, len(speakers)),
+                terms.setdefault(word, len(terms)),
+            )
+            # A term in several transcripts' snapshots keeps its highest score
+            cells[key] = max(cells.get(key, 0.0), float(score or 0.0))
+
+        if cells:
+            (row_idx, col_idx), data = zip(*cells.keys()), list(cells.values())
+        else:
+            row_idx, col_idx, data = (), (), []
+        matrix = sparse.csr_matrix(
+            (np.asarray(data, dtype=np.float64), (row_idx, col_idx)),
+            shape=(len(speakers), len(terms)),
+        )
+        return cls(
+            matrix,
+            np.fromiter(speakers.keys(), dtype=np.int64, count=len(speakers)),
+            list(terms.keys()),
+            signature or read_signature(session, params_hash, transcript_file_id),
+        )
+
+    def search_many(
+        self, texts: Sequence[str], top_n: int = 5, min_confidence: float = 0.3
+    ) -> List[List[Tuple[int, float]]]:
+        """
+        Rank speakers for several texts at once.
+
+        Returns:
+            One list of (speaker_id, confidence) per text, best first
+        """
+        if not len(self) or not self.terms:
+            return [[] for _ in texts]
+        counts = self._vectorizer.transform(list(texts)).astype(np.float64)
+        # Cosine over the common support of input i and speaker j:
+        # (x_i . s_j) / (|x_i on supp(s_j)| * |s_j on supp(x_i)|)
+        dots = (counts @ self.matrix.T).toarray()
+        counts_pattern = counts.copy()
+        counts_pattern.data = np.ones_like(counts_pattern.data)
+        input_norms = np.sqrt((counts.multiply(counts) @ self._pattern.T).toarray())
+        speaker_norms = np.sqrt((counts_pattern @ self._squared.T).toarray())
+        with np.errstate(divide="ignore", invalid="ignore"):
+            scores = np.where(
+                (input_norms > 0) & (speaker_norms > 0),
+                dots / (input_norms * speaker_norms),
+                0.0,
+            )
+
+        results = []
+        for row in scores:
+            hits = np.flatnonzero((row >= min_confidence) & (row > 0))
+            hits = hits[np.argsort(-row[hits], kind="stable")][:top_n]
+            results.append([(int(self.speaker_ids[i]), float(row[i])) for i in hits])
+        return results
+
+    def search(
+        self, text: str, top_n: int = 5, min_confidence: float = 0.3
+    ) -> List[Tuple[int, float]]:
+        """Rank speakers for one text."""
+        return self.search_many([text], top_n, min_confidence)[0]
+
+    # ------------------------------------------------------------------
+
+    def save(self, path: Path) -> None:
+        tmp_path = path.with_name(f"{path.stem}.{os.getpid()}.tmp.npz")
+        np.savez(
+            tmp_path,
+            version=np.array([INDEX_VERSION]),
+            signature=np.array(self.signature, dtype=np.int64),
+            data=self.matrix.data,
+            indices=self.matrix.indices,
+            indptr=self.matrix.indptr,
+            shape=np.array(self.matrix.shape, dtype=np.int64),
+            speaker_ids=self.speaker_ids,
+            terms=np.array(self.terms, dtype=str),
+        )
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(cls, path: Path) -> Optional["SpeakerVocabularyIndex"]:
+        try:
+            with np.load(path, allow_pickle=False) as data:
+                if int(data["version"][0]) != INDEX_VERSION:
+                    return None
+                matrix = sparse.csr_matrix(
+                    (data["data"], data["indices"], data["indptr"]),
+                    shape=tuple(int(n) for n in data["shape"]),
+                )
+                return cls(
+                    matrix,
+                    data["speaker_ids"],
+                    data["terms"].tolist(),
+                    tuple(int(n) for n in data["signature"]),
+                )
+        except (OSError, KeyError, ValueError) as e:
+            logger.debug(f"Ignoring unreadable vocabulary index {path}: {e}")
+            return None
+
+
+def read_signature(
+    session: Session,
+    params_hash: Optional[str] = None,
+    transcript_file_id: Optional[int] = None,
+) -> Signature:
+    """Cheap change marker for the rows an index is built from."""
+    count, max_id, max_version = _filtered(
+        session.query(
+            func.count(SpeakerVocabularyWord.id),
+            func.max(SpeakerVocabularyWord.id),
+            func.max(SpeakerVocabularyWord.snapshot_version),
+        ),
+        params_hash,
+        transcript_file_id,
+    ).one()
+    return int(count), int(max_id or 0), int(max_version or 0)
+
+
+class _IndexCache:
+    """Indexes of one database, in memory and on disk."""
+
+    def __init__(self, database_url: str) -> None:
+        self._lock = threading.Lock()
+        self._indexes: Dict[
+            Tuple[Optional[str], Optional[int]], SpeakerVocabularyIndex
+        ] = {}
+        self._database_key = (
+            None
+            if is_memory_database(database_url)
+            else hashlib.sha256(database_url.encode("utf-8")).hexdigest()[:16]
+        )
+
+    def _path(self, params_hash: Optional[str], transcript_file_id: Any) -> Path:
+        name = f"{params_hash or 'all'}:{transcript_file_id or 'all'}"
+        digest = hashlib.sha256(name.encode("utf-8")).hexdigest()[:16]
+        return get_vocabulary_index_root() / f"{self._database_key}-{digest}.npz"
+
+    def get(
+        self,
+        session: Session,
+        params_hash: Optional[str],
+        transcript_file_id: Optional[int],
+    ) -> SpeakerVocabularyIndex:
+        key = (params_hash, transcript_file_id)
+        signature = read_signature(session, params_hash, transcript_file_id)
+        with self._lock:
+            index = self._indexes.get(key)
+            if index is not None and index.signature == signature:
+                return index
+
+            path = None
+            if self._database_key is not None:
+                try:
+                    path = self._path(params_hash, transcript_file_id)
+                except OSError as e:
+                    logger.debug(f"Vocabulary index cache unavailable: {e}")
+            if path is not None and path.exists():
+                index = SpeakerVocabularyIndex.load(path)
+                if index is not None:
+                    try:
+                        os.utime(path)  # Most recently used
+                    except OSError:
+                        pass
+            if index is None or index.signature != signature:
+                index = SpeakerVocabularyIndex.build(
+                    session, params_hash, transcript_file_id, signature
+                )
+                logger.debug(
+                    f"Built vocabulary index: {len(index)} speakers, "
+                    f"{len(index.terms)} terms"
+                )
+                if path is not None:
+                    try:
+                        index.save(path)
+                        _evict_cache_files(path.parent)
+                    except OSError as e:
+                        logger.debug(f"Could not save vocabulary index: {e}")
+            self._indexes[key] = index
+            return index
+
+
+_caches: "weakref.WeakKeyDictionary[Any, _IndexCache]" = weakref.WeakKeyDictionary()
+_caches_lock = threading.Lock()
+
+
+def get_vocabulary_index(
+    session: Session,
+    params_hash: Optional[str] = None,
+    transcript_file_id: Optional[int] = None,
+) -> SpeakerVocabularyIndex:
+    """
+    Current index for the database behind a session.
+
+    Args:
+        session: Database session
+        params_hash: Only snapshots stored with this vectorizer_params_hash
+        transcript_file_id: Only snapshots from this transcript
+
+    Returns:
+        Index matching the stored snapshots (rebuilt if they changed)
+    """
+    engine = session.get_bind().engine
+    with _caches_lock:
+        cache = _caches.get(engine)
+        if cache is None:
+            cache = _caches[engine] = _IndexCache(str(engine.url))
+    return cache.get(session, params_hash, transcript_file_id)
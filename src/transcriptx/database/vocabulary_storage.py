@@ -17,6 +17,7 @@ from sklearn.feature_extraction.text import TfidfVectorizer
 from transcriptx.core.utils.logger import get_logger
 from transcriptx.database import get_session
 from transcriptx.database.models import Speaker, SpeakerVocabularyWord
+from transcriptx.database.vocabulary_index import get_vocabulary_index
 
 logger = get_logger()
 
@@ -209,11 +210,13 @@ class VocabularyStorageService:
         top_n: int = 5,
         min_confidence: float = 0.3,
         transcript_file_id: Optional[int] = None,
+        vectorizer_params_hash: Optional[str] = None,
     ) -> List[Tuple[Speaker, float]]:
         """
         Identify speaker based on vocabulary similarity.
 
-        Computes TF-IDF for input text and matches against stored speaker vocabularies.
+        Matches the input's term counts against the latest stored speaker
+        vocabularies through the cached sparse vocabulary index.
         Returns ranked list of potential speakers with confidence scores.
 
         Args:
@@ -221,97 +224,80 @@ class VocabularyStorageService:
             top_n: Number of top matches to return
             min_confidence: Minimum confidence threshold
             transcript_file_id: Optional transcript file ID to limit search
+            vectorizer_params_hash: Optional hash to only match snapshots
+                stored with the same vectorizer parameters
 
         Returns:
             List of (speaker, confidence_score) tuples, sorted by confidence descending
         """
-        try:
-            if not text or not text.strip():
-                return []
-
-            # Get all vocabulary words (from most recent snapshots)
-            query = self.session.query(SpeakerVocabularyWord).join(Speaker)
+        if not text or not text.strip():
+            return []
+        return self.find_speakers_by_vocabulary_batch(
+            [text],
+            top_n=top_n,
+            min_confidence=min_confidence,
+            transcript_file_id=transcript_file_id,
+            vectorizer_params_hash=vectorizer_params_hash,
+        )[0]
+
+    def find_speakers_by_vocabulary_batch(
+        self,
+        texts: List[str],
+        top_n: int = 5,
+        min_confidence: float = 0.3,
+        transcript_file_id: Optional[int] = None,
+        vectorizer_params_hash: Optional[str] = None,
+    ) -> List[List[Tuple[Speaker, float]]]:
+        """
+        Identify speakers for many texts (e.g. unknown segments) at once.
 
-            if transcript_file_id:
-                query = query.filter(
-                    SpeakerVocabularyWord.source_transcript_file_id
-                    == transcript_file_id
-                )
+        All texts are transformed together and scored with one sparse
+        matrix product; matched speakers are fetched in a single query.
 
-            # Get most recent snapshot for each speaker
-            # This is a simplified approach - in production, you might want to
-            # explicitly select which snapshot version to use
-            vocab_words = query.all()
+        Args:
+            texts: Input texts to match against speaker vocabularies
+            top_n: Number of top matches to return per text
+            min_confidence: Minimum confidence threshold
+            transcript_file_id: Optional transcript file ID to limit search
+            vectorizer_params_hash: Optional vectorizer parameters hash filter
 
-            if not vocab_words:
+        Returns:
+            One list of (speaker, confidence_score) tuples per input text
+        """
+        try:
+            if not texts:
                 return []
-
-            # Group vocabulary by speaker
-            speaker_vocabs: Dict[int, Dict[str, float]] = {}
-            for vocab in vocab_words:
-                if vocab.speaker_id not in speaker_vocabs:
-                    speaker_vocabs[vocab.speaker_id] = {}
-                speaker_vocabs[vocab.speaker_id][vocab.word] = vocab.tfidf_score
-
-            # Compute TF-IDF for input text using same parameters
-            # For simplicity, use default parameters - in production, you'd want to
-            # match the vectorizer_params_hash
-            # For single document, adjust max_df
-            vectorizer = TfidfVectorizer(
-                max_features=1000,
-                stop_words="english",
-                ngram_range=(1, 2),
-                min_df=1,
-                max_df=1.0,  # Use 1.0 for single document to avoid errors
+            index = get_vocabulary_index(
+                self.session, vectorizer_params_hash, transcript_file_id
+            )
+            # Blank texts match nothing (as in the single-text lookup)
+            ranked = index.search_many(
+                [text if text and text.strip() else "" for text in texts],
+                top_n=top_n,
+                min_confidence=min_confidence,
             )
 
-            # Fit on input text
-            input_tfidf = vectorizer.fit_transform([text])
-            input_features = vectorizer.get_feature_names_out()
-            input_scores = np.array(input_tfidf.toarray()[0])
-
-            # Create feature dict for input
-            input_vocab = {
-                input_features[i]: input_scores[i] for i in range(len(input_features))
-            }
-
-            # Compute cosine similarity with each speaker's vocabulary
-            similarities = []
-            for speaker_id, speaker_vocab in speaker_vocabs.items():
-                # Get common words
-                common_words = set(input_vocab.keys()) & set(speaker_vocab.keys())
-
-                if not common_words:
-                    continue
-
-                # Compute cosine similarity
-                input_vec = np.array([input_vocab.get(w, 0) for w in common_words])
-                speaker_vec = np.array([speaker_vocab.get(w, 0) for w in common_words])
-
-                # Cosine similarity
-                dot_product = np.dot(input_vec, speaker_vec)
-                input_norm = np.linalg.norm(input_vec)
-                speaker_norm = np.linalg.norm(speaker_vec)
-
-                if input_norm > 0 and speaker_norm > 0:
-                    similarity = dot_product / (input_norm * speaker_norm)
-                    if similarity >= min_confidence:
-                        speaker = (
-                            self.session.query(Speaker)
-                            .filter(Speaker.id == speaker_id)
-                            .first()
-                        )
-                        if speaker:
-                            similarities.append((speaker, float(similarity)))
-
-            # Sort by confidence descending
-            similarities.sort(key=lambda x: x[1], reverse=True)
-
-            return similarities[:top_n]
+            speaker_ids = {speaker_id for hits in ranked for speaker_id, _ in hits}
+            speakers = {}
+            if speaker_ids:
+                speakers = {
+                    speaker.id: speaker
+                    for speaker in self.session.query(Speaker)
+                    .filter(Speaker.id.in_(speaker_ids))
+                    .all()
+                }
+            return [
+                [
+                    (speakers[speaker_id], confidence)
+                    for speaker_id, confidence in hits
+                    if speaker_id in speakers
+                ]
+                for hits in ranked
+            ]
 
         except Exception as e:
             logger.error(f"❌ Failed to find speakers by vocabulary: {e}")
-            return []
+            return [[] for _ in texts]
 
     def close(self):
         """Close the database session."""
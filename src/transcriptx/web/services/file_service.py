@@ -258,102 +258,127 @@ class FileService:
 
         return charts
 
+    @staticmethod
+    def _build_session_info(
+        session_id: str, run_dir: Path, transcript_key: str
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Build the catalog entry for one run (see list_available_sessions).
+
+        Returns:
+            Session dictionary, or None if the run has no resolvable transcript
+        """
+        from datetime import datetime
+
+        from transcriptx.web.module_registry import (
+            get_analysis_modules as _get_analysis_modules,
+            get_total_module_count,
+        )
+
+        # Only list sessions that have a resolvable transcript (avoids log spam and stale runs)
+        transcript_path = FileService.resolve_transcript_path(session_id)
+        if transcript_path is None:
+            return None
+        total_modules = get_total_module_count()
+        modules = _get_analysis_modules(session_id)
+        module_count = len(modules)
+        analysis_completion = (
+            int((module_count / total_modules) * 100) if total_modules > 0 else 0
+        )
+        try:
+            mtime = run_dir.stat().st_mtime
+            last_updated = datetime.fromtimestamp(mtime).isoformat()
+        except Exception:
+            last_updated = None
+        slug, run_id = session_id.split("/", 1)
+        session_info = {
+            "name": session_id,
+            "slug": slug,  # Human-readable slug
+            "transcript_key": transcript_key,  # Hash for identity
+            "run_id": run_id,
+            "path": str(run_dir),
+            "transcript_path": str(transcript_path),
+            "modules": modules,
+            "module_count": module_count,
+            "duration_seconds": 0,
+            "duration_minutes": 0,
+            "speaker_count": 0,
+            "word_count": 0,
+            "segment_count": 0,
+            "last_updated": last_updated,
+            "analysis_completion": analysis_completion,
+        }
+        # Populate stats from transcript (path already verified above)
+        transcript_data = FileService.load_transcript_by_session(session_id)
+        if transcript_data:
+            segments = transcript_data.get("segments", [])
+            session_info["segment_count"] = len(segments)
+            if segments:
+                duration_sec = max(seg.get("end", 0) for seg in segments) - min(
+                    seg.get("start", 0) for seg in segments
+                )
+                session_info["duration_seconds"] = duration_sec
+                session_info["duration_minutes"] = round(duration_sec / 60, 1)
+                speakers = set(
+                    seg.get("speaker") for seg in segments if seg.get("speaker")
+                )
+                session_info["speaker_count"] = len(speakers)
+                session_info["word_count"] = sum(
+                    len(seg.get("text", "").split()) for seg in segments
+                )
+        return session_info
+
     @staticmethod
     def list_available_sessions() -> List[Dict[str, Any]]:
         """
-        Scan data/outputs/<slug>/<run_id> for available runs.
+        List available runs under data/outputs/<slug>/<run_id>.
+
+        Served from the session catalog: runs whose directory, manifest and
+        transcript are unchanged are not re-read.
 
         Returns:
-            List of session dictionaries with metadata
+            List of session dictionaries with metadata, most recent first
         """
-        sessions: List[Dict[str, Any]] = []
         outputs_dir = Path(OUTPUTS_DIR)
-
         if not outputs_dir.exists():
             logger.warning(f"Outputs directory does not exist: {outputs_dir}")
-            return sessions
+            return []
 
-        # Load index to get transcript_key for slug-based folders
-        from datetime import datetime
+        from transcriptx.core.store.session_catalog import get_session_catalog
 
-        from transcriptx.core.utils.slug_manager import get_transcript_key_for_slug
-        from transcriptx.web.module_registry import (
-            get_analysis_modules as _get_analysis_modules,
-            get_total_module_count,
+        return get_session_catalog(outputs_dir).sessions(
+            FileService._build_session_info
         )
 
-        for transcript_dir in outputs_dir.iterdir():
-            if not transcript_dir.is_dir() or transcript_dir.name.startswith("."):
-                continue
+    @staticmethod
+    def query_sessions(
+        slug: Optional[str] = None,
+        text: Optional[str] = None,
+        offset: int = 0,
+        limit: Optional[int] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Filter and paginate available runs.
 
-            # Get transcript_key from index (slug-based format)
-            transcript_key = get_transcript_key_for_slug(transcript_dir.name)
-            if transcript_key is None:
-                # Skip if not in index (shouldn't happen for valid slug-based folders)
-                continue
+        Args:
+            slug: Only runs of this transcript slug
+            text: Case-insensitive substring of the session name
+            offset: Number of matching sessions to skip
+            limit: Page size (None for all remaining)
 
-            total_modules = get_total_module_count()
-            for run_dir in transcript_dir.iterdir():
-                if not run_dir.is_dir() or run_dir.name.startswith("."):
-                    continue
-                try:
-                    session_id = f"{transcript_dir.name}/{run_dir.name}"
-                    # Only list sessions that have a resolvable transcript (avoids log spam and stale runs)
-                    if FileService.resolve_transcript_path(session_id) is None:
-                        continue
-                    modules = _get_analysis_modules(session_id)
-                    module_count = len(modules)
-                    analysis_completion = (
-                        int((module_count / total_modules) * 100)
-                        if total_modules > 0
-                        else 0
-                    )
-                    try:
-                        mtime = run_dir.stat().st_mtime
-                        last_updated = datetime.fromtimestamp(mtime).isoformat()
-                    except Exception:
-                        last_updated = None
-                    session_info = {
-                        "name": session_id,
-                        "slug": transcript_dir.name,  # Human-readable slug
-                        "transcript_key": transcript_key,  # Hash for identity
-                        "run_id": run_dir.name,
-                        "path": str(run_dir),
-                        "modules": modules,
-                        "module_count": module_count,
-                        "duration_seconds": 0,
-                        "duration_minutes": 0,
-                        "speaker_count": 0,
-                        "word_count": 0,
-                        "segment_count": 0,
-                        "last_updated": last_updated,
-                        "analysis_completion": analysis_completion,
-                    }
-                    # Populate stats from transcript (path already verified above)
-                    transcript_data = FileService.load_transcript_by_session(session_id)
-                    if transcript_data:
-                        segments = transcript_data.get("segments", [])
-                        session_info["segment_count"] = len(segments)
-                        if segments:
-                            duration_sec = max(
-                                seg.get("end", 0) for seg in segments
-                            ) - min(seg.get("start", 0) for seg in segments)
-                            session_info["duration_seconds"] = duration_sec
-                            session_info["duration_minutes"] = round(
-                                duration_sec / 60, 1
-                            )
-                            speakers = set(
-                                seg.get("speaker")
-                                for seg in segments
-                                if seg.get("speaker")
-                            )
-                            session_info["speaker_count"] = len(speakers)
-                            session_info["word_count"] = sum(
-                                len(seg.get("text", "").split()) for seg in segments
-                            )
-                    sessions.append(session_info)
-                except Exception as e:
-                    logger.warning(f"Failed to load session {run_dir.name}: {e}")
-                    continue
+        Returns:
+            (page of session dictionaries, total matching sessions)
+        """
+        outputs_dir = Path(OUTPUTS_DIR)
+        if not outputs_dir.exists():
+            return [], 0
 
-        return sorted(sessions, key=lambda x: x.get("last_updated") or "", reverse=True)
+        from transcriptx.core.store.session_catalog import get_session_catalog
+
+        return get_session_catalog(outputs_dir).query(
+            FileService._build_session_info,
+            slug=slug,
+            text=text,
+            offset=offset,
+            limit=limit,
+        )
@@ -5,11 +5,15 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, List, Optional, Protocol, Tuple
+from typing import Any, Dict, List, Optional, Protocol, Tuple
 import re
 
 import streamlit as st
 
+from transcriptx.core.store.search_index import (
+    TranscriptSearchShard,
+    get_search_index,
+)
 from transcriptx.core.utils.config import get_config
 from transcriptx.core.utils.logger import get_logger
 from transcriptx.web.models.search import (
@@ -26,6 +30,9 @@ logger = get_logger()
 
 _WORD_BOUNDARY_RE = re.compile(r"\w")
 
+# Substring results returned per search (one page)
+DEFAULT_PAGE_SIZE = 200
+
 
 def _normalize(text: str) -> str:
     return text.lower()
@@ -73,45 +80,56 @@ def _is_phrase_match(text: str, query: str) -> bool:
 class _TranscriptIndex:
     session_name: str
     transcript_slug: str
-    segments: List[Dict[str, object]]
-    text_blob: str
-    vocab: set[str]
+    shard: TranscriptSearchShard
+
+    def speaker_names(self) -> Dict[Any, str]:
+        """Display name per speaker label, resolved once per speaker."""
+        # Lazy import to avoid circular dependency
+        from transcriptx.web.utils import resolve_speaker_names_from_db
+
+        speakers = [
+            {k: v for k, v in speaker.items() if v is not None}
+            for speaker in self.shard.speakers
+        ]
+        resolved = resolve_speaker_names_from_db(speakers, self.session_name)
+        return {
+            speaker.get("speaker"): speaker.get("speaker_display")
+            for speaker in resolved
+        }
+
+
+def _load_transcript_for_index(transcript_path: str) -> Dict[str, Any]:
+    from transcriptx.io.transcript_service import get_transcript_service
+
+    return get_transcript_service().load_transcript(transcript_path)
 
 
-@st.cache_data(show_spinner=False)
 def _build_transcript_index(
-    session_name: str,
-    transcript_path: str,
-    transcript_mtime: Optional[float],
+    session_name: str, transcript_path: Optional[str] = None
 ) -> Optional[_TranscriptIndex]:
-    transcript_data = FileService.load_transcript_by_session(session_name)
-    if not transcript_data:
+    """
+    Search index for a session's transcript; JSON is read only to (re)build it.
+
+    ``transcript_path`` is the catalog's resolved path; when absent it is
+    resolved from the run manifest.
+    """
+    if transcript_path is None:
+        transcript_path = FileService.resolve_transcript_path(session_name)
+    if transcript_path is None:
         return None
-    segments = transcript_data.get("segments", [])
-    if not isinstance(segments, list):
+    shard = get_search_index().get(transcript_path, loader=_load_transcript_for_index)
+    if shard is None:
         return None
-    source = transcript_data.get("source", {})
-    if not isinstance(source, dict):
-        source = {}
-    original_path = source.get("original_path") or transcript_path
+    original_path = (
+        shard.original_path or _resolve_transcript_path(session_name) or session_name
+    )
     transcript_slug = (
         Path(original_path).stem if original_path else session_name.split("/")[-1]
     )
-    text_parts: List[str] = []
-    vocab: set[str] = set()
-    for segment in segments:
-        text = segment.get("text", "")
-        if not isinstance(text, str):
-            continue
-        lower_text = _normalize(text)
-        text_parts.append(lower_text)
-        vocab.update(_tokenize(lower_text))
     return _TranscriptIndex(
         session_name=session_name,
         transcript_slug=transcript_slug,
-        segments=segments,
-        text_blob=" ".join(text_parts),
-        vocab=vocab,
+        shard=shard,
     )
 
 
@@ -131,18 +149,6 @@ def _resolve_transcript_path(session_name: str) -> Optional[str]:
     return None
 
 
-def _resolve_transcript_mtime(session_name: str) -> Optional[float]:
-    transcript_data = FileService.load_transcript_by_session(session_name)
-    if not transcript_data:
-        return None
-    source = transcript_data.get("source", {})
-    if isinstance(source, dict):
-        mtime = source.get("file_mtime")
-        if isinstance(mtime, (int, float)):
-            return float(mtime)
-    return None
-
-
 @st.cache_data(ttl=60, show_spinner=False)
 def get_speakers_from_transcripts(
     session_slugs: Optional[Tuple[str, ...]] = None,
@@ -162,24 +168,56 @@ def get_speakers_from_transcripts(
         session_name = session_info.get("name", "")
         if not session_name:
             continue
-        transcript_path = _resolve_transcript_path(session_name) or session_name
-        transcript_mtime = _resolve_transcript_mtime(session_name)
-        index = _build_transcript_index(session_name, transcript_path, transcript_mtime)
+        index = _build_transcript_index(
+            session_name, session_info.get("transcript_path")
+        )
         if not index:
             continue
-        from transcriptx.web.utils import resolve_speaker_names_from_db
-
-        segments = resolve_speaker_names_from_db(index.segments, session_name)
-        for seg in segments:
-            n = seg.get("speaker_display") or seg.get("speaker") or ""
+        for label, display in index.speaker_names().items():
+            n = display or label or ""
             if n and str(n).strip():
                 names.add(str(n).strip())
     return sorted(names)
 
 
+def _rank_results(results: List[SearchResult], query: str) -> List[SearchResult]:
+    tokens = _tokenize(query)
+    _normalize(query)
+
+    def sort_key(result: SearchResult) -> Tuple[int, int, int, int, int, int]:
+        text = result.segment_text
+        boundary_match = _is_word_boundary_match(text, query)
+        substring_match = _is_phrase_match(text, query)
+        match_count = len(result.match_spans)
+        first_pos = result.match_spans[0][0] if result.match_spans else len(text)
+        length = len(text)
+        speaker_bonus = 1 if result.speaker_is_named else 0
+        meta_bonus = 0
+        for token in tokens:
+            token_re = re.compile(rf"(?<!\w){re.escape(token)}(?!\w)")
+            if token_re.search(_normalize(result.speaker_name or "")):
+                meta_bonus = 1
+            if token_re.search(_normalize(result.transcript_title or "")):
+                meta_bonus = 1
+        return (
+            0 if boundary_match else 1,
+            0 if substring_match else 1,
+            -match_count,
+            first_pos,
+            length,
+            -(speaker_bonus + meta_bonus),
+        )
+
+    return sorted(results, key=sort_key)
+
+
 class SearchBackend(Protocol):
     def search_substring(
-        self, query: str, filters: Optional[SearchFilters] = None
+        self,
+        query: str,
+        filters: Optional[SearchFilters] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Tuple[List[SearchResult], int]: ...
 
 
@@ -198,9 +236,7 @@ class DbSearchBackend:
         self._TranscriptSegment = TranscriptSegment
         self._TranscriptFile = TranscriptFile
         self._Speaker = Speaker
-
-    def _build_text_query(self, query: str) -> Tuple[str, str]:
-        return f"%{query}%", "ilike"
+        self._full_text: Optional[bool] = None
 
     def resolve_session_run_map(
         self, transcript_file_ids: List[int]
@@ -231,25 +267,71 @@ class DbSearchBackend:
             resolved[item.id] = ref
         return resolved
 
+    def _full_text_available(self, session) -> bool:
+        if self._full_text is None:
+            from transcriptx.database.segment_search import segment_search_available
+
+            try:
+                self._full_text = segment_search_available(session)
+            except Exception as exc:
+                logger.warning(f"Full-text segment index unavailable: {exc}")
+                self._full_text = False
+        return self._full_text
+
+    def _rank_segment_ids(
+        self, session, query: str, limit: int, offset: int
+    ) -> Tuple[List[int], Dict[int, List[Tuple[int, int]]], int]:
+        """Ranked page of matching segment ids, their match spans, and the total."""
+        if self._full_text_available(session):
+            from transcriptx.database.segment_search import search_segments
+
+            page = search_segments(session, query, limit=limit, offset=offset)
+            spans = {hit.segment_id: hit.match_spans for hit in page.hits}
+            return [hit.segment_id for hit in page.hits], spans, page.total
+
+        # Substring scan for databases without the full-text index
+        text_filter = self._TranscriptSegment.text.ilike(f"%{query}%")
+        total = session.query(self._TranscriptSegment.id).filter(text_filter).count()
+        rows = (
+            session.query(self._TranscriptSegment.id)
+            .filter(text_filter)
+            .order_by(self._TranscriptSegment.id)
+            .limit(limit)
+            .offset(offset)
+            .all()
+        )
+        return [row[0] for row in rows], {}, total
+
     def search_substring(
-        self, query: str, filters: Optional[SearchFilters] = None
+        self,
+        query: str,
+        filters: Optional[SearchFilters] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Tuple[List[SearchResult], int]:
+        if limit is None:
+            limit = DEFAULT_PAGE_SIZE
         session = self._get_session()
         try:
-            like_query, mode = self._build_text_query(query)
-            q = (
+            segment_ids, spans_by_id, total = self._rank_segment_ids(
+                session, query, limit, offset
+            )
+            rows = (
                 session.query(
                     self._TranscriptSegment, self._TranscriptFile, self._Speaker
                 )
                 .join(self._TranscriptFile)
                 .outerjoin(self._Speaker)
+                .filter(self._TranscriptSegment.id.in_(segment_ids))
+                .all()
+                if segment_ids
+                else []
             )
-            if mode == "ilike":
-                q = q.filter(self._TranscriptSegment.text.ilike(like_query))
-            segments = q.all()
         finally:
             session.close()
 
+        by_id = {row[0].id: row for row in rows}
+        segments = [by_id[i] for i in segment_ids if i in by_id]
         transcript_ids = list({item[1].id for item in segments})
         ref_map = self.resolve_session_run_map(transcript_ids)
         results: List[SearchResult] = []
@@ -267,7 +349,9 @@ class DbSearchBackend:
                 timecode=segment.start_time,
             )
             speaker_name = speaker.name if speaker and speaker.name else "Unknown"
-            match_spans = _find_spans(segment.text, query)
+            match_spans = spans_by_id.get(segment.id) or _find_spans(
+                segment.text, query
+            )
             results.append(
                 SearchResult(
                     segment_ref=segment_ref,
@@ -288,14 +372,18 @@ class DbSearchBackend:
                     ),
                 )
             )
-        return results, len(results)
+        return results, total
 
 
 class FileSearchBackend:
     """File-based search fallback."""
 
     def search_substring(
-        self, query: str, filters: Optional[SearchFilters] = None
+        self,
+        query: str,
+        filters: Optional[SearchFilters] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
     ) -> Tuple[List[SearchResult], int]:
         sessions = FileService.list_available_sessions()
         results: List[SearchResult] = []
@@ -303,27 +391,22 @@ class FileSearchBackend:
             session_name = session_info.get("name", "")
             if not session_name:
                 continue
-            transcript_path = _resolve_transcript_path(session_name) or session_name
-            transcript_mtime = _resolve_transcript_mtime(session_name)
             index = _build_transcript_index(
-                session_name, transcript_path, transcript_mtime
+                session_name, session_info.get("transcript_path")
             )
             if not index:
                 continue
-            # Lazy import to avoid circular dependency
-            from transcriptx.web.utils import resolve_speaker_names_from_db
-
-            segments = resolve_speaker_names_from_db(index.segments, session_name)
-            for idx, segment in enumerate(segments):
-                text = segment.get("text", "")
-                if not isinstance(text, str):
-                    continue
-                if _normalize(query) not in _normalize(text):
-                    continue
+            matches = index.shard.find_substring(query)
+            if not matches:
+                continue
+            speaker_names = index.speaker_names()
+            for idx in matches:
+                segment = index.shard.segment(idx)
+                text = segment["text"]
                 match_spans = _find_spans(text, query)
                 speaker_name = (
-                    segment.get("speaker_display")
-                    or segment.get("speaker")
+                    speaker_names.get(segment["speaker"])
+                    or segment["speaker"]
                     or "Unknown"
                 )
                 session_slug, run_id = session_name.split("/", 1)
@@ -356,7 +439,9 @@ class FileSearchBackend:
                         context_indices=(max(0, idx - 1), idx + 1),
                     )
                 )
-        return results, len(results)
+        ranked = _rank_results(results, query)
+        end = None if limit is None else offset + limit
+        return ranked[offset:end], len(ranked)
 
 
 @st.cache_data(show_spinner=False)
@@ -426,10 +511,11 @@ class SearchService:
         enable_fuzzy: bool = True,
     ) -> SearchResponse:
         backend = self._select_backend()
-        substring_results, total_found = backend.search_substring(query, filters)
+        cap = DEFAULT_PAGE_SIZE
+        substring_results, substring_total = backend.search_substring(
+            query, filters, limit=cap
+        )
         ranked = self._rank_results(substring_results, query)
-        total_found = len(ranked)
-        cap = 200
         shown = ranked[:cap]
         total_shown = len(shown)
 
@@ -439,14 +525,14 @@ class SearchService:
         if enable_fuzzy:
             if len(query) < 4:
                 fuzzy_reason = "query too short"
-            elif len(ranked) >= 10:
+            elif substring_total >= 10:
                 fuzzy_reason = "sufficient substring results"
             else:
                 fuzzy_ran = True
                 fuzzy_reason = "few substring results"
                 candidates = self._select_candidate_transcripts(query)
                 fuzzy_results = self._fuzzy_search(candidates, query)
-        total_found = len(ranked) + len(fuzzy_results)
+        total_found = substring_total + len(fuzzy_results)
         remaining = max(0, cap - total_shown)
         fuzzy_results = fuzzy_results[:remaining]
         total_shown = len(shown) + len(fuzzy_results)
@@ -469,16 +555,12 @@ class SearchService:
             session_name = session_info.get("name", "")
             if not session_name:
                 continue
-            transcript_path = _resolve_transcript_path(session_name) or session_name
-            transcript_mtime = _resolve_transcript_mtime(session_name)
             index = _build_transcript_index(
-                session_name, transcript_path, transcript_mtime
+                session_name, session_info.get("transcript_path")
             )
             if not index:
                 continue
-            if any(
-                token in index.text_blob or token in index.vocab for token in tokens
-            ):
+            if any(index.shard.has_term_containing(token) for token in tokens):
                 candidates.append(index)
         return candidates
 
@@ -493,22 +575,18 @@ class SearchService:
         except Exception:
             return []
         results: List[SearchResult] = []
-        # Lazy import to avoid circular dependency
-        from transcriptx.web.utils import resolve_speaker_names_from_db
-
         for index in candidates:
             session_slug, run_id = index.session_name.split("/", 1)
-            segments = resolve_speaker_names_from_db(index.segments, index.session_name)
-            for idx, segment in enumerate(segments):
-                text = segment.get("text", "")
-                if not isinstance(text, str):
-                    continue
+            speaker_names = index.speaker_names()
+            for idx in range(index.shard.segment_count):
+                text = index.shard.text(idx)
                 score = fuzz.partial_ratio(_normalize(query), _normalize(text))
                 if score < threshold:
                     continue
+                segment = index.shard.segment(idx)
                 speaker_name = (
-                    segment.get("speaker_display")
-                    or segment.get("speaker")
+                    speaker_names.get(segment["speaker"])
+                    or segment["speaker"]
                     or "Unknown"
                 )
                 segment_ref = SegmentRef(
@@ -545,31 +623,4 @@ class SearchService:
     def _rank_results(
         self, results: List[SearchResult], query: str
     ) -> List[SearchResult]:
-        tokens = _tokenize(query)
-        _normalize(query)
-
-        def sort_key(result: SearchResult) -> Tuple[int, int, int, int, int, int]:
-            text = result.segment_text
-            boundary_match = _is_word_boundary_match(text, query)
-            substring_match = _is_phrase_match(text, query)
-            match_count = len(result.match_spans)
-            first_pos = result.match_spans[0][0] if result.match_spans else len(text)
-            length = len(text)
-            speaker_bonus = 1 if result.speaker_is_named else 0
-            meta_bonus = 0
-            for token in tokens:
-                token_re = re.compile(rf"(?<!\w){re.escape(token)}(?!\w)")
-                if token_re.search(_normalize(result.speaker_name or "")):
-                    meta_bonus = 1
-                if token_re.search(_normalize(result.transcript_title or "")):
-                    meta_bonus = 1
-            return (
-                0 if boundary_match else 1,
-                0 if substring_match else 1,
-                -match_count,
-                first_pos,
-                length,
-                -(speaker_bonus + meta_bonus),
-            )
-
-        return sorted(results, key=sort_key)
+        return _rank_results(results, query)
@@ -22,3 +22,43 @@ def test_echoes_detect_explicit_quote_and_echo() -> None:
     kinds = {event.kind for event in results["events"]}
     assert "explicit_quote" in kinds
     # Lexical echo threshold/config may change; explicit_quote is the stable contract here.
+
+
+def test_echoes_paraphrase_embeds_each_text_once(monkeypatch) -> None:
+    import numpy as np
+
+    from transcriptx.core.analysis.dynamics import echoes
+    from transcriptx.core.utils import embedding_store
+
+    encoded = []
+
+    class FakeModel:
+        def encode(self, texts, show_progress_bar=False):
+            encoded.extend(texts)
+            return np.array([[1.0, len(text) / 100] for text in texts])
+
+    store = embedding_store.EmbeddingStore("test", root=None)
+    monkeypatch.setitem(
+        embedding_store._STORES,
+        f"sentence-transformers:{echoes.PARAPHRASE_MODEL}",
+        store,
+    )
+    analysis = EchoesAnalysis()
+    monkeypatch.setattr(analysis.config, "enable_semantic_paraphrase", True)
+    monkeypatch.setattr(analysis, "_get_embedding_model", lambda: FakeModel())
+    speakers = ["Alice", "Bob", "Carol"]
+    segments = [
+        {
+            "speaker": speakers[i % 3],
+            "text": f"Point number {i} about the quarterly roadmap review.",
+            "start": float(i),
+            "end": float(i) + 0.5,
+        }
+        for i in range(12)
+    ]
+
+    results = analysis.analyze(segments)
+    analysis.analyze(segments)
+
+    assert sorted(encoded) == sorted(seg["text"] for seg in segments)
+    assert any(event.kind == "paraphrase" for event in results["events"])
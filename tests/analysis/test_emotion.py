@@ -13,10 +13,10 @@ from transcriptx.core.analysis.emotion import EmotionAnalysis
 
 
 def _emotion_module_with_mock_model(emotion_list):
-    """Create EmotionAnalysis with mocked _load_emotion_model. emotion_list is the list of label/score dicts; pipeline(text)[0] is used."""
+    """Create EmotionAnalysis with mocked _load_emotion_model. emotion_list is the list of label/score dicts returned for every text."""
     mock_model = MagicMock()
-    # pipeline(text) returns list of sequences; code uses pipeline(text)[0] -> one sequence of label/score dicts
-    mock_model.return_value = [emotion_list]
+    # pipeline(texts) returns one sequence of label/score dicts per input text
+    mock_model.side_effect = lambda texts, **kwargs: [emotion_list for _ in texts]
     cfg = MagicMock()
     cfg.analysis.emotion_model_name = "test/model"
     cfg.analysis.emotion_output_mode = "top1"
@@ -145,3 +145,27 @@ class TestEmotionAnalysisModule:
         assert (
             len(result.get("segments", [])) == 0 or len(result.get("emotions", [])) == 0
         )
+
+    def test_emotion_analysis_batches_model_calls(self, sample_speaker_map):
+        """Segments are classified in batches and written back in order."""
+        labels = {"calm": "neutral", "great news everyone": "joy", "awful": "anger"}
+        calls = []
+
+        def fake_pipeline(texts, **kwargs):
+            calls.append(list(texts))
+            return [[{"label": labels[text], "score": 0.9}] for text in texts]
+
+        emotion_module = _emotion_module_with_mock_model([])
+        emotion_module.emotion_model.side_effect = fake_pipeline
+        emotion_module.emotion_batch_size = 2
+        segments = [
+            {"speaker": "Alice", "speaker_db_id": 1, "text": text, "start": i}
+            for i, text in enumerate(labels)
+        ]
+
+        emotion_module.analyze(segments, sample_speaker_map)
+
+        assert [len(batch) for batch in calls] == [2, 1]
+        assert [seg["context_emotion_primary"] for seg in segments] == list(
+            labels.values()
+        )
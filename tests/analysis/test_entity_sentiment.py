@@ -53,7 +53,7 @@ class TestEntitySentimentAnalysis:
         """Fixture for sample speaker map (deprecated, kept for backward compatibility)."""
         return {}
 
-    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities")
+    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities_batch")
     @patch("transcriptx.core.analysis.entity_sentiment.score_sentiment")
     def test_entity_sentiment_basic(
         self,
@@ -66,7 +66,9 @@ class TestEntitySentimentAnalysis:
         """Test basic entity sentiment analysis."""
         # Mock NER to return entities
         # Core implementation expects list[tuple[text, label]]
-        mock_ner.return_value = [("Python", "ORG"), ("Java", "ORG"), ("Python", "ORG")]
+        mock_ner.side_effect = lambda texts: [
+            [("Python", "ORG"), ("Java", "ORG"), ("Python", "ORG")] for _ in texts
+        ]
 
         # Mock sentiment scoring
         # score_sentiment() returns a VADER-like dict contract
@@ -85,7 +87,7 @@ class TestEntitySentimentAnalysis:
         # Python should be included because it is mentioned >= 2 times
         assert "Python" in result["entities"]
 
-    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities")
+    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities_batch")
     def test_entity_sentiment_with_ner_data(
         self,
         mock_ner: Any,
@@ -101,8 +103,10 @@ class TestEntitySentimentAnalysis:
             "segments": sample_segments,
         }
 
-        # When compute is used, extract_named_entities returns tuples; cached ner_data is not parsed yet.
-        mock_ner.return_value = [("Python", "ORG"), ("Python", "ORG")]
+        # When compute is used, extract_named_entities_batch returns tuples per text; cached ner_data is not parsed yet.
+        mock_ner.side_effect = lambda texts: [
+            [("Python", "ORG"), ("Python", "ORG")] for _ in texts
+        ]
 
         result = entity_sentiment_module.analyze(
             sample_segments, sample_speaker_map, ner_data=ner_data
@@ -111,7 +115,7 @@ class TestEntitySentimentAnalysis:
         assert result is not None
         assert "entity_sentiment" in result
 
-    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities")
+    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities_batch")
     @patch("transcriptx.core.analysis.entity_sentiment.score_sentiment")
     def test_entity_sentiment_speaker_aggregation(
         self,
@@ -122,7 +126,9 @@ class TestEntitySentimentAnalysis:
         sample_speaker_map: dict[str, str],
     ) -> None:
         """Test entity sentiment aggregation by speaker."""
-        mock_ner.return_value = [("Python", "ORG"), ("Python", "ORG")]
+        mock_ner.side_effect = lambda texts: [
+            [("Python", "ORG"), ("Python", "ORG")] for _ in texts
+        ]
         mock_sentiment.return_value = {
             "compound": 0.5,
             "pos": 0.6,
@@ -135,7 +141,7 @@ class TestEntitySentimentAnalysis:
         # Should include speaker-level entity sentiment
         assert "speaker_entity_sentiment" in result
 
-    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities")
+    @patch("transcriptx.core.analysis.entity_sentiment.extract_named_entities_batch")
     def test_entity_sentiment_no_entities(
         self,
         mock_ner: Any,
@@ -144,7 +150,7 @@ class TestEntitySentimentAnalysis:
         sample_speaker_map: dict[str, str],
     ) -> None:
         """Test entity sentiment analysis with no entities found."""
-        mock_ner.return_value = []
+        mock_ner.side_effect = lambda texts: [[] for _ in texts]
 
         result = entity_sentiment_module.analyze(sample_segments, sample_speaker_map)
 
@@ -6,6 +6,7 @@ This module tests NER logic and geocoding integration.
 
 from __future__ import annotations
 
+import copy
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -174,3 +175,29 @@ class TestNERAnalysisModule:
         assert (
             len(result.get("entities", [])) == 0 or len(result.get("segments", [])) == 0
         )
+
+
+def test_zero_batch_size_is_clamped(monkeypatch):
+    """ner_batch_size=0 is treated as 1 instead of dividing by zero."""
+    from transcriptx.core.analysis import ner
+    from transcriptx.core.utils import nlp_runtime
+
+    seen = []
+
+    def fake_pipe_docs(nlp, texts, batch_size, n_process, keep, as_tuples=False):
+        seen.append(batch_size)
+        texts = list(texts)
+        if as_tuples:
+            return [(MagicMock(text=text, ents=[]), ctx) for text, ctx in texts]
+        return [MagicMock(text=text, ents=[]) for text in texts]
+
+    monkeypatch.setattr(ner, "_get_ner_nlp", MagicMock)
+    monkeypatch.setattr(nlp_runtime, "pipe_docs", fake_pipe_docs)
+    module = NERAnalysis()
+    module.config = copy.deepcopy(module.config)
+    module.config.analysis.ner_batch_size = 0
+    segments = [{"speaker": "Alice", "text": "Hello there.", "start": 0, "end": 1}]
+
+    module.analyze(segments)
+    assert ner.extract_named_entities_batch(["Hi."], batch_size=0) == [[]]
+    assert seen == [1, 1]
@@ -0,0 +1,290 @@
+"""
+Tests for matrix-based repetition detection.
+
+The matrix path must find the same repetitions as the pairwise
+``similarity_fn`` loops; these tests run both on the same inputs.
+"""
+
+import zlib
+
+import numpy as np
+import pytest
+
+from transcriptx.core.analysis.semantic_similarity import repetition_detection
+from transcriptx.core.analysis.semantic_similarity.analyzers import ComparisonState
+from transcriptx.core.analysis.semantic_similarity.repetition_detection import (
+    detect_cross_speaker_repetitions_advanced,
+    detect_cross_speaker_repetitions_basic,
+    detect_speaker_repetitions_advanced,
+    detect_speaker_repetitions_basic,
+)
+from transcriptx.core.analysis.semantic_similarity.similarity_matrix import (
+    EmbeddingMatrix,
+)
+from transcriptx.core.utils.speaker_extraction import clear_speaker_index
+
+TOPICS = [
+    "budget planning for the next quarter",
+    "hiring new engineers for the platform team",
+    "customer feedback about the mobile application",
+    "security review of the payment service",
+]
+
+
+def _segments(n=60):
+    segments = []
+    for i in range(n):
+        speaker = ["Alice", "Bob", "Carol"][i % 3]
+        topic = TOPICS[(i * 7) % len(TOPICS)]
+        segments.append(
+            {
+                "speaker": speaker,
+                "speaker_db_id": i % 3 + 1,
+                "text": f"We discussed {topic} again today, item {i % 5}.",
+                "start": float(i * 12),
+                "end": float(i * 12 + 10),
+            }
+        )
+    return segments
+
+
+def _embed(text):
+    """Deterministic embedding: topic direction plus a little per-text noise."""
+    rng = np.random.default_rng(zlib.crc32(text.encode()))
+    base = np.zeros(16)
+    for k, topic in enumerate(TOPICS):
+        if topic in text:
+            base[k] = 1.0
+    return (base + rng.normal(scale=0.2, size=16))[np.newaxis, :]
+
+
+def _cosine(text1, text2):
+    a, b = _embed(text1).ravel(), _embed(text2).ravel()
+    return float(a @ b / (np.linalg.norm(a) * np.linalg.norm(b)))
+
+
+def _fallback(text1, text2):
+    """Stand-in for TF-IDF similarity: word-set overlap."""
+    words1, words2 = set(text1.split()), set(text2.split())
+    return len(words1 & words2) / len(words1 | words2)
+
+
+def _matrix(segments, max_block_elements=64, missing=()):
+    texts = [seg["text"].strip() for seg in segments]
+    embeddings = [None if t in missing else _embed(t) for t in texts]
+    return EmbeddingMatrix(
+        texts, embeddings, _fallback, max_block_elements=max_block_elements
+    )
+
+
+def _without_similarity(reps):
+    return [{**rep, "similarity": None} for rep in reps]
+
+
+def _assert_same(fast, legacy):
+    """Same repetitions; similarities equal up to float32 rounding."""
+    assert _without_similarity(fast) == _without_similarity(legacy)
+    assert [rep["similarity"] for rep in fast] == pytest.approx(
+        [rep["similarity"] for rep in legacy], abs=1e-5
+    )
+
+
+@pytest.fixture(autouse=True)
+def _no_speaker_index():
+    clear_speaker_index()
+    yield
+
+
+@pytest.fixture(autouse=True)
+def _simple_content_check(monkeypatch):
+    """Avoid loading a spaCy model for the content filter."""
+    monkeypatch.setattr(
+        repetition_detection,
+        "has_meaningful_content",
+        lambda text: len(text.split()) >= 3,
+    )
+
+
+class TestMatrixRepetitionDetection:
+    """Matrix and pairwise paths agree."""
+
+    def _pairwise_fn(self, state, missing=()):
+        """Mirror of calculate_semantic_similarity: fallback past the limit."""
+
+        def similarity_fn(text1, text2):
+            state.comparison_count += 1
+            if state.comparison_count > state.max_comparisons:
+                return _fallback(text1, text2)
+            if text1 in missing or text2 in missing:
+                return _fallback(text1, text2)
+            return _cosine(text1, text2)
+
+        return similarity_fn
+
+    def test_advanced_self_repetitions_match(self):
+        """Advanced self-repetition results and comparison counts match."""
+        segments = _segments()
+        legacy_state = ComparisonState(0, 50_000)
+        legacy = detect_speaker_repetitions_advanced(
+            "Alice", segments, self._pairwise_fn(legacy_state), legacy_state, "T"
+        )
+        state = ComparisonState(0, 50_000)
+        fast = detect_speaker_repetitions_advanced(
+            "Alice",
+            segments,
+            None,
+            state,
+            "T",
+            embedding_matrix=_matrix(segments),
+        )
+
+        assert legacy
+        _assert_same(fast, legacy)
+        assert state.comparison_count == legacy_state.comparison_count
+
+    def test_advanced_cross_speaker_respects_comparison_budget(self):
+        """The comparison limit stops the matrix path at the same pair."""
+        segments = _segments()
+        legacy_state = ComparisonState(0, 100)
+        legacy = detect_cross_speaker_repetitions_advanced(
+            segments, self._pairwise_fn(legacy_state), legacy_state, "T"
+        )
+        state = ComparisonState(0, 100)
+        fast = detect_cross_speaker_repetitions_advanced(
+            segments, None, state, "T", embedding_matrix=_matrix(segments)
+        )
+
+        assert legacy
+        _assert_same(fast, legacy)
+        assert state.comparison_count == legacy_state.comparison_count == 101
+
+    def test_basic_detectors_match(self):
+        """Basic self and cross-speaker detection agree, per-segment caps included."""
+        segments = _segments(90)
+        missing = {segments[4]["text"]}
+
+        legacy_state = ComparisonState(0, 50_000)
+        fn = self._pairwise_fn(legacy_state, missing)
+        legacy_self = detect_speaker_repetitions_basic(
+            "Alice", segments, fn, legacy_state, 0.8, 300, 1000, None, "T"
+        )
+        legacy_cross = detect_cross_speaker_repetitions_basic(
+            segments, fn, legacy_state, 0.8, 600, 500, "T"
+        )
+
+        state = ComparisonState(0, 50_000)
+        matrix = _matrix(segments, missing=missing)
+        fast_self = detect_speaker_repetitions_basic(
+            "Alice",
+            segments,
+            None,
+            state,
+            0.8,
+            300,
+            1000,
+            None,
+            "T",
+            embedding_matrix=matrix,
+        )
+        fast_cross = detect_cross_speaker_repetitions_basic(
+            segments, None, state, 0.8, 600, 500, "T", embedding_matrix=matrix
+        )
+
+        assert legacy_self and legacy_cross
+        _assert_same(fast_self, legacy_self)
+        _assert_same(fast_cross, legacy_cross)
+        assert state.comparison_count == legacy_state.comparison_count
+
+    def test_blocks_are_tiled(self):
+        """Similarity tiles never exceed the element budget."""
+        segments = _segments(40)
+        matrix = _matrix(segments, max_block_elements=100)
+        rows = matrix.rows([seg["text"] for seg in segments])
+
+        blocks = list(matrix.iter_blocks(rows))
+
+        assert len(blocks) > 1
+        assert all(block.size <= 100 for _, block in blocks)
+        full = np.vstack([block for _, block in blocks])
+        assert np.allclose(np.diag(full), 1.0, atol=1e-5)
+
+    def test_uncovered_texts_use_pairwise_path(self):
+        """A matrix missing some texts is ignored in favour of similarity_fn."""
+        segments = _segments(20)
+        state = ComparisonState(0, 50_000)
+        calls = []
+
+        def similarity_fn(text1, text2):
+            calls.append((text1, text2))
+            return 0.0
+
+        detect_speaker_repetitions_advanced(
+            "Alice",
+            segments,
+            similarity_fn,
+            state,
+            "T",
+            embedding_matrix=_matrix(segments[:5]),
+        )
+
+        assert calls
+
+    def test_over_budget_pairs_use_fallback(self):
+        """Pairs past the comparison limit are scored like the pairwise path."""
+        segments = _segments(90)
+        legacy_state = ComparisonState(0, 40)
+        legacy = detect_speaker_repetitions_basic(
+            "Alice",
+            segments,
+            self._pairwise_fn(legacy_state),
+            legacy_state,
+            0.1,
+            300,
+            1000,
+            None,
+            "T",
+        )
+        state = ComparisonState(0, 40)
+        fast = detect_speaker_repetitions_basic(
+            "Alice",
+            segments,
+            None,
+            state,
+            0.1,
+            300,
+            1000,
+            None,
+            "T",
+            embedding_matrix=_matrix(segments),
+        )
+
+        assert state.comparison_count == legacy_state.comparison_count > 40
+        _assert_same(fast, legacy)
+
+    def test_cross_speaker_ignores_unembedded_unnamed_speakers(self):
+        """Only named speakers' texts need rows for the cross-speaker matrix path."""
+        segments = _segments(30)
+        segments.append(
+            {
+                "speaker": "SPEAKER_07",
+                "text": "An unnamed speaker talks here.",
+                "start": 1.0,
+            }
+        )
+        matrix = _matrix(segments[:-1])
+
+        def similarity_fn(text1, text2):
+            raise AssertionError("pairwise path should not run")
+
+        reps = detect_cross_speaker_repetitions_basic(
+            segments,
+            similarity_fn,
+            ComparisonState(0, 50_000),
+            0.8,
+            600,
+            500,
+            "T",
+            embedding_matrix=matrix,
+        )
+
+        assert reps
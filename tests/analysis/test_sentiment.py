@@ -186,3 +186,41 @@ class TestSentimentAnalysisModule:
 
         assert output_service.save_data.called
         assert output_service.save_chart.called or output_service.save_summary.called
+
+    def test_transformers_backend_batches_segments(
+        self, sample_segments: list[dict[str, Any]]
+    ) -> None:
+        """Transformers backend scores all segments in batched pipeline calls."""
+        calls = []
+
+        def fake_pipeline(texts, **kwargs):
+            calls.append(list(texts))
+            return [
+                [
+                    {"label": "positive", "score": 0.8 if "love" in t else 0.1},
+                    {"label": "negative", "score": 0.1 if "love" in t else 0.8},
+                    {"label": "neutral", "score": 0.1},
+                ]
+                for t in texts
+            ]
+
+        module = SentimentAnalysis()
+        module.sentiment_backend = "transformers"
+        module._transformers_pipe = MagicMock(side_effect=fake_pipeline)
+        module.transformer_batch_size = 2
+        segments = sample_segments + [
+            {"speaker": "Bob", "speaker_db_id": 2, "text": "  ", "start": 6.0}
+        ]
+
+        module.analyze(segments)
+
+        assert sorted(len(batch) for batch in calls) == [1, 2]
+        assert segments[0]["sentiment_label"] == "positive"
+        assert segments[1]["sentiment_label"] == "negative"
+        assert segments[0]["sentiment_compound_norm"] > 0
+        assert segments[3]["sentiment"] == {
+            "compound": 0.0,
+            "pos": 0.0,
+            "neu": 1.0,
+            "neg": 0.0,
+        }
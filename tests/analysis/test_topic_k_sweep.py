@@ -0,0 +1,129 @@
+"""
+Tests for the topic-count sweep and PMI coherence in topic modeling utils.
+"""
+
+from __future__ import annotations
+
+import time
+from itertools import combinations
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import CountVectorizer
+
+from transcriptx.core.analysis.topic_modeling import utils as topic_utils
+from transcriptx.core.analysis.topic_modeling.utils import (
+    CoherenceStats,
+    calculate_topic_coherence,
+    find_optimal_k,
+)
+from transcriptx.core.utils.config import get_config
+
+VOCABULARY = {
+    "finance": "budget revenue tax invoice audit forecast margin payroll",
+    "music": "guitar drummer tour album melody chorus studio rehearsal",
+    "garden": "tomato compost seedling pruning mulch orchard harvest soil",
+    "travel": "airport passport luggage itinerary hotel ferry visa layover",
+}
+
+
+def _corpus(n: int, seed: int = 0) -> list[str]:
+    rng = np.random.default_rng(seed)
+    topics = [words.split() for words in VOCABULARY.values()]
+    return [
+        " ".join(rng.choice(topics[rng.integers(len(topics))], 8)) for _ in range(n)
+    ]
+
+
+def _naive_pmi(top_words, texts, vectorizer):
+    X = (vectorizer.transform(texts) > 0).astype(int).tocsc()
+    index = {w: i for i, w in enumerate(vectorizer.get_feature_names_out())}
+    words = [w for w in top_words if w in index]
+    scores = []
+    for w1, w2 in combinations(words, 2):
+        d1, d2 = X[:, index[w1]].sum(), X[:, index[w2]].sum()
+        co = X[:, index[w1]].multiply(X[:, index[w2]]).sum()
+        if co and d1 and d2:
+            scores.append(np.log(co * len(texts) / (d1 * d2)))
+    return float(np.mean(scores)) if scores else 0.0
+
+
+def test_coherence_stats_match_pairwise_pmi():
+    texts = _corpus(200)
+    vectorizer = CountVectorizer().fit(texts)
+    stats = CoherenceStats.from_texts(texts, vectorizer)
+
+    for top_words in (
+        VOCABULARY["finance"].split(),
+        ["budget", "guitar", "tomato", "visa", "missing-word"],
+        ["budget"],
+    ):
+        expected = _naive_pmi(top_words, texts, vectorizer)
+        assert stats.coherence(top_words) == pytest.approx(expected)
+        assert calculate_topic_coherence(top_words, texts, vectorizer) == pytest.approx(
+            expected
+        )
+
+    # Words of one topic co-occur more than words across topics
+    assert stats.coherence(VOCABULARY["music"].split()) > stats.coherence(
+        ["budget", "guitar", "tomato", "visa"]
+    )
+
+
+def test_sweep_stops_when_coherence_plateaus():
+    coherences = {3: 0.2, 4: 0.5, 5: 0.505, 6: 0.4, 7: 0.9, 8: 0.1}
+    calls = []
+
+    def evaluate(k):
+        calls.append(k)
+        return {"coherence": coherences[k]}
+
+    results = topic_utils._sweep_k(
+        list(coherences), evaluate, workers=1, patience=2, tolerance=0.01
+    )
+    assert [r["coherence"] for r in results] == [0.2, 0.5, 0.505, 0.4]
+    assert calls == [3, 4, 5, 6]
+
+    full = topic_utils._sweep_k(
+        list(coherences), evaluate, workers=1, patience=0, tolerance=0.01
+    )
+    assert len(full) == len(coherences)
+
+
+def test_find_optimal_k_reports_evaluated_range(monkeypatch):
+    topic_config = get_config().analysis.topic_modeling
+    monkeypatch.setattr(topic_config, "k_plateau_patience", 0)
+    monkeypatch.setattr(topic_config, "min_df", 1)
+
+    result = find_optimal_k(_corpus(120), k_range=(3, 6), algorithm="nmf")
+
+    diagnostics = result["diagnostics"]
+    assert diagnostics["k_values"] == [3, 4, 5, 6]
+    for key in ("held_out_likelihood", "coherence_scores", "silhouette_scores"):
+        assert len(diagnostics[key]) == 4
+    assert result["optimal_k"] in diagnostics["k_values"]
+    assert all(score > 0 for score in diagnostics["coherence_scores"])
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_parallel_sweep_on_large_transcript(monkeypatch):
+    """Benchmark: LDA k sweep over 2000 segments, parallel vs in-process."""
+    topic_config = get_config().analysis.topic_modeling
+    monkeypatch.setattr(topic_config, "min_df", 1)
+    monkeypatch.setattr(topic_config, "k_plateau_patience", 0)
+    texts = _corpus(2000)
+
+    timings = {}
+    results = {}
+    for workers in (1, 2):
+        monkeypatch.setattr(topic_config, "k_sweep_workers", workers)
+        start = time.perf_counter()
+        results[workers] = find_optimal_k(texts, k_range=(3, 5), algorithm="lda")
+        timings[workers] = time.perf_counter() - start
+
+    print(f"\nk sweep: in-process {timings[1]:.1f}s, parallel {timings[2]:.1f}s")
+    assert results[1]["optimal_k"] == results[2]["optimal_k"]
+    assert results[1]["diagnostics"]["coherence_scores"] == pytest.approx(
+        results[2]["diagnostics"]["coherence_scores"]
+    )
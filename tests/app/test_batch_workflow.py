@@ -0,0 +1,202 @@
+"""Tests for app/workflows/batch - in-process and worker-pool batch analysis."""
+
+import copy
+import itertools
+import queue
+import threading
+from pathlib import Path
+
+import pytest
+
+from transcriptx.app.models.requests import BatchAnalysisRequest
+from transcriptx.app.models.results import AnalysisResult
+from transcriptx.app.workflows import batch
+from transcriptx.app.workflows.batch import _resolve_pool_settings, run_batch_analysis
+from transcriptx.core.utils.config import get_config, set_config
+
+
+class RecordingProgress:
+    """ProgressCallback that records every call."""
+
+    def __init__(self):
+        self.stage_progress = []
+        self.logs = []
+        self.events = []
+
+    def on_stage_start(self, stage_name):
+        pass
+
+    def on_stage_progress(self, message, pct=None):
+        self.stage_progress.append((message, pct))
+
+    def on_stage_complete(self, stage_name):
+        pass
+
+    def on_log(self, message, level="info"):
+        self.logs.append((message, level))
+
+    def on_event(self, event):
+        self.events.append(event)
+
+
+def _result(success, errors=()):
+    return AnalysisResult(
+        success=success,
+        run_dir=Path(),
+        manifest_path=Path(),
+        modules_executed=[],
+        warnings=[],
+        errors=list(errors),
+    )
+
+
+def test_resolve_pool_settings_uses_request_then_config(monkeypatch):
+    """Request fields win over workflow config; workers are capped by transcripts."""
+    workflow = get_config().workflow
+    monkeypatch.setattr(workflow, "batch_workers", 3)
+    monkeypatch.setattr(workflow, "batch_worker_memory_mb", 2048)
+
+    assert _resolve_pool_settings(BatchAnalysisRequest(), 10) == (3, 2048)
+    assert _resolve_pool_settings(BatchAnalysisRequest(), 2) == (2, 2048)
+    assert _resolve_pool_settings(
+        BatchAnalysisRequest(workers=1, worker_memory_mb=0), 10
+    ) == (1, 0)
+    workers, _ = _resolve_pool_settings(BatchAnalysisRequest(workers=-1), 10_000)
+    assert workers >= 1
+
+
+def test_single_worker_runs_in_process_and_collects_errors(monkeypatch, tmp_path):
+    """workers=1 analyzes transcripts in order and prefixes errors with file names."""
+    calls = []
+
+    def fake_run_analysis(request, progress):
+        calls.append(Path(request.transcript_path).name)
+        if calls[-1] == "b.json":
+            return _result(False, ["boom"])
+        return _result(True)
+
+    monkeypatch.setattr(batch, "run_analysis", fake_run_analysis)
+    paths = [tmp_path / name for name in ("a.json", "b.json", "c.json")]
+    progress = RecordingProgress()
+
+    result = run_batch_analysis(
+        BatchAnalysisRequest(transcript_paths=paths, workers=1), progress
+    )
+
+    assert calls == ["a.json", "b.json", "c.json"]
+    assert result.transcript_count == 3
+    assert not result.success
+    assert result.errors == ["b.json: boom"]
+    assert result.message == "Processed 3 transcript(s), 2 succeeded"
+    assert len(progress.stage_progress) == 3
+
+
+def test_batch_worker_runs_nested_pools_in_process(monkeypatch, tmp_path):
+    """Inside a batch worker, voice and k-sweep pools are not started."""
+    seen = []
+
+    def fake_run_analysis(request, progress):
+        analysis = get_config().analysis
+        seen.append(
+            (analysis.voice.feature_workers, analysis.topic_modeling.k_sweep_workers)
+        )
+        return _result(True)
+
+    monkeypatch.setattr(batch, "run_analysis", fake_run_analysis)
+    monkeypatch.setattr(batch, "_warm_models", lambda modules: None)
+    original = get_config()
+    config = copy.deepcopy(original)
+    config.analysis.voice.feature_workers = 4
+    config.analysis.topic_modeling.k_sweep_workers = -1
+    tasks, messages = queue.Queue(), queue.Queue()
+    tasks.put((0, str(tmp_path / "a.json")))
+    tasks.put(None)
+
+    try:
+        batch._batch_worker(config, BatchAnalysisRequest(), tasks, messages, 0)
+    finally:
+        set_config(original)
+
+    assert seen == [(1, 1)]
+
+
+class _ThreadQueue(queue.Queue):
+    def cancel_join_thread(self):
+        pass
+
+
+class _ThreadProcess:
+    """Process stand-in running a worker function in a thread."""
+
+    _pids = itertools.count(1000)
+
+    def __init__(self, behaviour, args):
+        self.pid = next(self._pids)
+        self.exitcode = None
+        self._thread = threading.Thread(target=self._run, args=(behaviour, args))
+
+    def _run(self, behaviour, args):
+        behaviour(self.pid, *args)
+        self.exitcode = 1 if behaviour is _dies_after_taking_task else 0
+
+    def start(self):
+        self._thread.start()
+
+    def is_alive(self):
+        return self._thread.is_alive()
+
+    def join(self, timeout=None):
+        self._thread.join(timeout)
+
+    terminate = kill = lambda self: None
+
+
+def _dies_after_taking_task(pid, config, request, tasks, messages, memory_mb):
+    tasks.get()  # Exits before reporting "started"
+
+
+def _succeeds(pid, config, request, tasks, messages, memory_mb):
+    while (item := tasks.get()) is not None:
+        messages.put(("started", item[0], pid))
+        messages.put(("done", item[0], (True, [])))
+
+
+def test_worker_pool_retries_task_of_worker_that_died_before_starting(
+    monkeypatch, tmp_path
+):
+    """A task taken by a worker that exits before "started" is not lost."""
+    behaviours = iter([_dies_after_taking_task])
+
+    class FakeContext:
+        Queue = _ThreadQueue
+
+        def Process(self, target, args, daemon):
+            return _ThreadProcess(next(behaviours, _succeeds), args)
+
+    monkeypatch.setattr(batch.multiprocessing, "get_context", lambda m: FakeContext())
+    monkeypatch.setattr(batch, "_POLL_SECONDS", 0.05)
+    paths = [tmp_path / f"{name}.json" for name in "abc"]
+
+    outcomes = batch._run_worker_pool(
+        paths, BatchAnalysisRequest(), RecordingProgress(), workers=1, memory_mb=0
+    )
+
+    assert outcomes == [(True, [])] * 3
+
+
+@pytest.mark.slow
+def test_worker_pool_returns_outcomes_in_input_order(tmp_path):
+    """Worker processes report every transcript; errors keep input order."""
+    paths = [tmp_path / f"missing_{i}.json" for i in range(4)]
+    progress = RecordingProgress()
+
+    result = run_batch_analysis(
+        BatchAnalysisRequest(transcript_paths=paths, workers=2), progress
+    )
+
+    assert result.transcript_count == 4
+    assert not result.success
+    assert [e.split(":")[0] for e in result.errors] == [p.name for p in paths]
+    assert all("not found" in e for e in result.errors)
+    assert [pct for _, pct in progress.stage_progress] == [0.25, 0.5, 0.75, 1.0]
+    assert any("2 worker processes" in message for message, _ in progress.logs)
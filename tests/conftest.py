@@ -531,6 +531,45 @@ def clean_environment():
     os.environ.update(original_env)
 
 
+# Persistent caches written as a side effect of ordinary code paths:
+# (module, root function, cache directory name)
+_CACHE_ROOTS = [
+    ("transcriptx.core.store.search_index", "get_search_index_root", "search_index"),
+    (
+        "transcriptx.database.vocabulary_index",
+        "get_vocabulary_index_root",
+        "vocabulary_index",
+    ),
+    (
+        "transcriptx.core.corrections.matcher",
+        "get_corrections_cache_root",
+        "corrections",
+    ),
+]
+
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_cache_roots(tmp_path_factory):
+    """Keep persistent caches out of the real DATA_DIR for the whole run."""
+    import importlib
+
+    cache_dir = tmp_path_factory.mktemp("data_cache")
+
+    def _root(name: str):
+        def _get_root() -> Path:
+            root = cache_dir / name
+            root.mkdir(parents=True, exist_ok=True)
+            return root
+
+        return _get_root
+
+    with pytest.MonkeyPatch.context() as mp:
+        for module_name, function_name, name in _CACHE_ROOTS:
+            module = importlib.import_module(module_name)
+            mp.setattr(module, function_name, _root(name))
+        yield cache_dir
+
+
 # ============================================================================
 # Pytest Configuration
 # ============================================================================
@@ -17,8 +17,8 @@ def _emotion_module_with_mock_model(
 ) -> EmotionAnalysis:
     """Create EmotionAnalysis with mocked model and NRC lexicon."""
     mock_model = MagicMock()
-    # pipeline(text) returns list of sequences; code uses pipeline(text)[0]
-    mock_model.return_value = [emotion_list]
+    # pipeline(texts) returns one sequence of label/score dicts per input text
+    mock_model.side_effect = lambda texts, **kwargs: [emotion_list for _ in texts]
     cfg = MagicMock()
     cfg.analysis.emotion_model_name = "test/model"
     cfg.analysis.emotion_output_mode = "top1"
@@ -4,21 +4,50 @@ Contract tests for the NER analysis module (offline + deterministic).
 
 from __future__ import annotations
 
+from types import SimpleNamespace
 from typing import Any
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
 import pytest
 
 from transcriptx.core.analysis.ner import NERAnalysis
 
 
+def _entities_for(text: str) -> list[tuple[str, str]]:
+    # Deterministic entities: no spaCy required
+    if "New York" in text and "Google" in text:
+        return [("New York", "GPE"), ("Google", "ORG")]
+    if "London" in text:
+        return [("London", "GPE")]
+    return []
+
+
+class _FakeNLP:
+    """Minimal stand-in for a spaCy Language streamed via nlp.pipe."""
+
+    pipe_names = ["tok2vec", "tagger", "parser", "ner"]
+
+    def pipe(self, texts, as_tuples=False, **kwargs):
+        for item in texts:
+            text, context = item if as_tuples else (item, None)
+            ents = [
+                SimpleNamespace(text=ent, label_=label)
+                for ent, label in _entities_for(text)
+            ]
+            doc = SimpleNamespace(text=text, ents=ents)
+            yield (doc, context) if as_tuples else doc
+
+
 class TestNERContracts:
     """Contract tests for NERAnalysis output shape."""
 
     @pytest.fixture
     def ner_module(self) -> NERAnalysis:
-        """Fixture for NERAnalysis instance."""
-        return NERAnalysis()
+        """Fixture for NERAnalysis instance with a deterministic spaCy stand-in."""
+        with patch(
+            "transcriptx.core.analysis.ner._get_ner_nlp", return_value=_FakeNLP()
+        ):
+            return NERAnalysis()
 
     @pytest.fixture
     def sample_segments(self) -> list[dict[str, Any]]:
@@ -45,26 +74,13 @@ class TestNERContracts:
         """Fixture for sample speaker map (deprecated, kept for backward compatibility)."""
         return {}
 
-    @patch("transcriptx.core.analysis.ner.extract_named_entities")
     def test_ner_analysis_output_contract(
         self,
-        mock_extract: MagicMock,
         ner_module: NERAnalysis,
         sample_segments: list[dict[str, Any]],
         sample_speaker_map: dict[str, str],
     ) -> None:
         """Assert NER analyze() result has full output contract."""
-
-        # Deterministic entities: no spaCy required
-        def side_effect(text: str) -> list[tuple[str, str]]:
-            if "New York" in text and "Google" in text:
-                return [("New York", "GPE"), ("Google", "ORG")]
-            if "London" in text:
-                return [("London", "GPE")]
-            return []
-
-        mock_extract.side_effect = side_effect
-
         result = ner_module.analyze(sample_segments, sample_speaker_map)
 
         # Top-level keys (contract)
@@ -85,3 +101,8 @@ class TestNERContracts:
         assert isinstance(result["all_label_counter"], dict)
         assert isinstance(result["entities"], list)
         assert result["segments"] is sample_segments
+
+        # Speaker attribution survives streaming through nlp.pipe
+        assert result["entity_counts_per_speaker"]["Alice"]["Google"] == 1
+        assert result["location_entities_per_speaker"]["Bob"]["London"] == 1
+        assert result["segments_per_second"] >= 0
@@ -0,0 +1,183 @@
+"""
+Tests for memory-mapped, chunked voice feature extraction.
+"""
+
+import numpy as np
+import pytest
+
+sf = pytest.importorskip("soundfile")
+pytest.importorskip("librosa")
+
+from transcriptx.core.analysis.voice.audio_io import (  # noqa: E402
+    ensure_cached_wav,
+    read_audio_segment,
+    wav_layout,
+)
+from transcriptx.core.analysis.voice.extract import featurize_segments  # noqa: E402
+from transcriptx.core.analysis.voice.features import VadTrack  # noqa: E402
+
+SAMPLE_RATE = 16000
+
+PARAMS = {
+    "sample_rate": SAMPLE_RATE,
+    "vad_mode": 2,
+    "pad_s": 0.15,
+    "max_pitch": 20.0,
+    "egemaps_enabled": False,
+}
+
+
+def _tone(seconds, sample_rate=SAMPLE_RATE, channels=1):
+    t = np.arange(int(seconds * sample_rate)) / sample_rate
+    wave = 0.3 * np.sin(2 * np.pi * (120 + 40 * np.sin(t)) * t)
+    if channels > 1:
+        wave = np.stack([wave] * channels, axis=1)
+    return wave.astype(np.float32)
+
+
+def _tasks(count, spacing=0.7):
+    return [
+        (
+            i,
+            f"seg-{i}",
+            "A" if i % 2 else "B",
+            i * spacing,
+            i * spacing + 0.6,
+            "one two",
+        )
+        for i in range(count)
+    ]
+
+
+class TestWavLayout:
+    """Tests for wav_layout and memory-mapped segment reads."""
+
+    @pytest.mark.parametrize("subtype", ["PCM_16", "FLOAT"])
+    def test_segments_match_soundfile_reads(self, tmp_path, subtype):
+        """Memory-mapped segments equal read_audio_segment, edges included."""
+        path = tmp_path / "mono.wav"
+        sf.write(str(path), _tone(3.0), SAMPLE_RATE, subtype=subtype)
+
+        layout = wav_layout(str(path), sample_rate=SAMPLE_RATE)
+        samples = layout.open()
+
+        assert layout.frames == 3 * SAMPLE_RATE
+        for start, end in [(0.0, 0.5), (1.234, 1.9), (2.8, 3.5), (4.0, 5.0)]:
+            expected = read_audio_segment(
+                wav_path=str(path),
+                start_s=start,
+                end_s=end,
+                sample_rate=SAMPLE_RATE,
+                pad_s=0.15,
+            )
+            actual = layout.read_segment(samples, start_s=start, end_s=end, pad_s=0.15)
+            assert actual.dtype == np.float32
+            np.testing.assert_array_equal(actual, expected)
+
+    def test_rejects_files_that_need_conversion(self, tmp_path):
+        """Stereo, other sample rates and 24-bit PCM are not mapped."""
+        stereo = tmp_path / "stereo.wav"
+        sf.write(str(stereo), _tone(1.0, channels=2), SAMPLE_RATE)
+        rate = tmp_path / "rate.wav"
+        sf.write(str(rate), _tone(1.0, sample_rate=22050), 22050)
+        deep = tmp_path / "deep.wav"
+        sf.write(str(deep), _tone(1.0), SAMPLE_RATE, subtype="PCM_24")
+        text = tmp_path / "text.wav"
+        text.write_text("not a wav")
+
+        for path in (stereo, rate, deep, text):
+            assert wav_layout(str(path), sample_rate=SAMPLE_RATE) is None
+
+    def test_mono_pcm_converts_unmappable_wav(self, tmp_path):
+        """ensure_cached_wav(mono_pcm=True) returns a mappable mono wav."""
+        stereo = tmp_path / "stereo.wav"
+        sf.write(str(stereo), _tone(1.0, channels=2), SAMPLE_RATE)
+
+        plain, _ = ensure_cached_wav(
+            str(stereo), cache_dir=tmp_path / "cache", sample_rate=SAMPLE_RATE
+        )
+        converted, meta = ensure_cached_wav(
+            str(stereo),
+            cache_dir=tmp_path / "cache",
+            sample_rate=SAMPLE_RATE,
+            mono_pcm=True,
+        )
+
+        assert plain == str(stereo)
+        assert converted != str(stereo)
+        assert meta["cached"] is True
+        assert wav_layout(converted, sample_rate=SAMPLE_RATE) is not None
+
+
+class TestFeaturizeSegments:
+    """Tests for chunked featurization."""
+
+    @pytest.fixture
+    def wav(self, tmp_path):
+        path = tmp_path / "talk.wav"
+        sf.write(str(path), _tone(12.0), SAMPLE_RATE, subtype="PCM_16")
+        return str(path)
+
+    def test_rows_follow_task_order(self, wav):
+        """Chunked rows come back in task order with their VAD runs."""
+        tasks = _tasks(9)
+        rows = featurize_segments(
+            wav,
+            tasks,
+            PARAMS,
+            layout=wav_layout(wav, sample_rate=SAMPLE_RATE),
+            chunk_size=4,
+        )
+
+        assert [row["segment_idx"] for row, _ in rows] == list(range(9))
+        assert rows[0][0]["segment_id"] == "seg-0"
+        assert set(rows[0][1]) == {"voiced_runs_s", "silence_runs_s"}
+
+    @pytest.mark.slow
+    def test_rows_keep_task_order_across_workers(self, wav):
+        """Two worker processes give the same rows, in order, as in-process."""
+        tasks = _tasks(14)
+        layout = wav_layout(wav, sample_rate=SAMPLE_RATE)
+        vad_track = VadTrack.from_samples(
+            layout.open(), SAMPLE_RATE, PARAMS["vad_mode"]
+        )
+
+        serial = featurize_segments(
+            wav, tasks, PARAMS, layout=layout, vad_track=vad_track, chunk_size=4
+        )
+        parallel = featurize_segments(
+            wav,
+            tasks,
+            PARAMS,
+            layout=layout,
+            vad_track=vad_track,
+            workers=2,
+            chunk_size=4,
+        )
+
+        assert parallel == serial
+
+    def test_memory_map_matches_soundfile_path(self, wav):
+        """Mapped and per-segment soundfile reads give identical features."""
+        tasks = _tasks(5)
+
+        mapped = featurize_segments(
+            wav, tasks, PARAMS, layout=wav_layout(wav, sample_rate=SAMPLE_RATE)
+        )
+        unmapped = featurize_segments(wav, tasks, PARAMS, layout=None)
+
+        assert mapped == unmapped
+
+    def test_progress_reports_every_chunk(self, wav):
+        """Progress callbacks count segments up to the total."""
+        events = []
+
+        featurize_segments(
+            wav,
+            _tasks(10),
+            PARAMS,
+            chunk_size=3,
+            progress_callback=lambda done, total, _msg: events.append((done, total)),
+        )
+
+        assert events == [(3, 10), (6, 10), (9, 10), (10, 10)]
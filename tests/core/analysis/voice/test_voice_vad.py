@@ -0,0 +1,128 @@
+"""
+Tests for the NumPy frame VAD used by voice feature extraction.
+"""
+
+import numpy as np
+import pytest
+
+from transcriptx.core.analysis.voice.features import (
+    VadTrack,
+    compute_frame_features,
+    compute_frame_vad,
+    compute_vad_runs,
+    frame_view,
+    vad_runs_from_flags,
+)
+
+SAMPLE_RATE = 16000
+FRAME = 320  # 20 ms at 16 kHz
+
+
+def _bursts(pattern, seed=0):
+    """Voiced tone frames (1) and quiet hiss frames (0), one entry per 20 ms."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(len(pattern) * FRAME) / SAMPLE_RATE
+    tone = 0.3 * np.sin(2 * np.pi * 180.0 * t) + 0.1 * np.sin(2 * np.pi * 360.0 * t)
+    hiss = 0.002 * rng.standard_normal(t.size)
+    voiced = np.repeat(np.asarray(pattern, dtype=bool), FRAME)
+    return np.where(voiced, tone, hiss).astype(np.float32)
+
+
+def _loop_runs(flags, frame_ms=20):
+    voiced, silence = [], []
+    state, length = None, 0
+    for flag in flags:
+        if flag == state:
+            length += 1
+            continue
+        if state is not None:
+            (voiced if state else silence).append(length * frame_ms / 1000.0)
+        state, length = flag, 1
+    if state is not None:
+        (voiced if state else silence).append(length * frame_ms / 1000.0)
+    return voiced, silence
+
+
+class TestFrameVad:
+    """Tests for frame views, features and the vectorised classifier."""
+
+    def test_frame_view_is_a_strided_view(self):
+        """Frames share memory with the wave and drop the partial tail."""
+        wave = np.arange(1000, dtype=np.float32)
+
+        frames = frame_view(wave, FRAME)
+
+        assert frames.shape == (3, FRAME)
+        assert np.shares_memory(frames, wave)
+        np.testing.assert_array_equal(frames[2], wave[640:960])
+        assert frame_view(wave[:10], FRAME).shape == (0, FRAME)
+
+    def test_int16_and_float_input_give_same_features(self):
+        """Raw PCM (as from a memory map) is scaled like read_segment."""
+        wave = _bursts([1, 0, 1, 1, 0])
+        pcm = np.round(wave * 32768.0).astype("<i2")
+
+        from_float = compute_frame_features(
+            pcm.astype(np.float32) / 32768.0, SAMPLE_RATE
+        )
+        from_pcm = compute_frame_features(pcm, SAMPLE_RATE)
+
+        np.testing.assert_allclose(from_pcm.energy_db, from_float.energy_db)
+        np.testing.assert_allclose(from_pcm.flatness, from_float.flatness, rtol=1e-5)
+
+    @pytest.mark.parametrize("vad_mode", [0, 1, 2, 3])
+    def test_classifier_separates_tone_from_hiss(self, vad_mode):
+        """Tone frames are speech and low-level hiss is silence in every mode."""
+        pattern = [0] * 10 + [1] * 25 + [0] * 5 + [1] * 15 + [0] * 20
+
+        flags = compute_frame_vad(_bursts(pattern), SAMPLE_RATE, vad_mode)
+
+        np.testing.assert_array_equal(flags, np.asarray(pattern, dtype=bool))
+        ratio, voiced, silence = compute_vad_runs(
+            _bursts(pattern), SAMPLE_RATE, vad_mode
+        )
+        assert ratio == pytest.approx(40 / 75)
+        assert voiced == pytest.approx([0.5, 0.3])
+        assert silence == pytest.approx([0.2, 0.1, 0.4])
+
+    def test_fully_voiced_input_stays_voiced(self):
+        """Without any quiet frames the adaptive threshold does not split speech."""
+        flags = compute_frame_vad(_bursts([1] * 30), SAMPLE_RATE, 3)
+
+        assert flags.all()
+
+    def test_runs_match_frame_loop(self):
+        """Vectorised run lengths equal the frame-by-frame state machine."""
+        flags = np.random.default_rng(3).random(500) < 0.6
+
+        ratio, voiced, silence = vad_runs_from_flags(flags)
+
+        assert ratio == pytest.approx(flags.mean())
+        assert (voiced, silence) == _loop_runs(flags.tolist())
+        assert vad_runs_from_flags(np.zeros(0, dtype=bool)) == (None, [], [])
+
+    def test_webrtcvad_backend_returns_frame_flags(self):
+        """The optional webrtcvad backend yields one flag per frame."""
+        pytest.importorskip("webrtcvad")
+        wave = _bursts([0] * 10 + [1] * 20 + [0] * 10)
+
+        flags = compute_frame_vad(wave, SAMPLE_RATE, 2, backend="webrtcvad")
+
+        assert flags.dtype == bool
+        assert flags.shape == (40,)
+
+
+class TestVadTrack:
+    """Tests for whole-recording VAD sliced per segment."""
+
+    def test_segments_use_frames_inside_padded_range(self):
+        """Only frames fully inside [start - pad, end + pad) are used."""
+        pattern = [0, 1, 1, 1, 0, 0, 1, 1, 0, 0] * 5
+        track = VadTrack.from_samples(_bursts(pattern), SAMPLE_RATE, 2)
+
+        # 0.11..0.29 s padded by 0.02 -> samples 1440..4960 -> frames 5..14
+        sliced = track.segment_flags(0.11, 0.29, 0.02)
+
+        np.testing.assert_array_equal(sliced, np.asarray(pattern[5:15], dtype=bool))
+        assert track.runs(0.11, 0.29, 0.02) == vad_runs_from_flags(sliced)
+        assert track.segment_flags(5.0, 6.0, 0.0).size == 0
@@ -0,0 +1,174 @@
+"""
+Tests for indexed audio duplicate detection.
+"""
+
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from transcriptx.core.audio import fingerprinting
+from transcriptx.core.audio.fingerprinting import (
+    FingerprintStore,
+    batch_compare_audio_group,
+    compute_audio_fingerprint,
+    group_duplicate_fingerprints,
+)
+
+SAMPLE_RATE = 22050
+
+
+def _brute_force_groups(fingerprints, threshold):
+    files = list(fingerprints)
+    vectors = np.array(list(fingerprints.values()))
+    unit = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+    rows, cols = np.nonzero(np.triu(unit @ unit.T >= threshold, k=1))
+    parent = list(range(len(files)))
+
+    def root(i):
+        while parent[i] != i:
+            i = parent[i]
+        return i
+
+    for i, j in zip(rows, cols):
+        a, b = sorted((root(i), root(j)))
+        parent[b] = a
+    groups = {}
+    for i, file in enumerate(files):
+        groups.setdefault(root(i), []).append(file)
+    return {g[0]: g for g in groups.values() if len(g) > 1}
+
+
+def _chroma_like(count, seed=0):
+    """Peaky 12-bin profiles plus near-copies (noise) of some of them."""
+    rng = np.random.default_rng(seed)
+    base = rng.dirichlet(np.full(12, 0.3), size=count)
+    copies = base[: count // 4] + rng.normal(0.0, 0.01, (count // 4, 12))
+    vectors = np.clip(np.vstack([base, copies]), 0.0, None)
+    return {Path(f"rec_{i:05d}.wav"): v for i, v in enumerate(vectors)}
+
+
+class TestGroupDuplicateFingerprints:
+    """Tests for blocked exact grouping."""
+
+    def test_groups_match_all_pairs_comparison(self):
+        """Blocked grouping finds the same duplicate groups as comparing every pair."""
+        fingerprints = _chroma_like(1200)
+
+        expected = _brute_force_groups(fingerprints, 0.9)
+        assert group_duplicate_fingerprints(fingerprints, threshold=0.9) == expected
+        assert (
+            group_duplicate_fingerprints(fingerprints, threshold=0.9, block_size=7)
+            == expected
+        )
+        assert expected
+
+    def test_silent_fingerprints_are_never_duplicates(self):
+        """All-zero fingerprints compare as 0.0, as in compare_audio_files."""
+        fingerprints = {Path("a.wav"): np.zeros(12), Path("b.wav"): np.zeros(12)}
+
+        assert group_duplicate_fingerprints(fingerprints) == {}
+
+
+class TestFingerprintStore:
+    """Tests for content-hash keyed fingerprint persistence."""
+
+    def test_round_trip_by_content_hash(self, tmp_path):
+        """Copies of a file share a stored fingerprint across store instances."""
+        first = tmp_path / "a.bin"
+        first.write_bytes(b"same bytes")
+        second = tmp_path / "b.bin"
+        second.write_bytes(b"same bytes")
+        store = FingerprintStore(tmp_path / "store.json")
+        fp = np.linspace(0.0, 1.0, 12)
+
+        store.put(store.content_hash(first), 180.0, fp)
+        store.save()
+        reloaded = FingerprintStore(tmp_path / "store.json")
+
+        stored = reloaded.get(reloaded.content_hash(second), 180.0)
+        np.testing.assert_allclose(stored, fp, atol=1e-6)
+        assert reloaded.get(reloaded.content_hash(second), None) is None
+
+    def test_content_hash_follows_file_changes(self, tmp_path):
+        """A rewritten file gets a new content hash."""
+        path = tmp_path / "a.bin"
+        path.write_bytes(b"one")
+        store = FingerprintStore()
+        before = store.content_hash(path)
+
+        path.write_bytes(b"other")
+
+        assert store.content_hash(path) != before
+
+
+class TestBatchCompareAudioGroup:
+    """End-to-end duplicate detection on real audio files."""
+
+    @pytest.fixture
+    def recordings(self, tmp_path):
+        sf = pytest.importorskip("soundfile")
+        if not fingerprinting.is_librosa_available():
+            pytest.skip("librosa not available")
+        t = np.arange(int(1.5 * SAMPLE_RATE)) / SAMPLE_RATE
+        paths = {}
+        for name, hz in [("a", 261.6), ("b", 261.6), ("c", 392.0)]:
+            path = tmp_path / f"{name}.wav"
+            sf.write(str(path), 0.3 * np.sin(2 * np.pi * hz * t), SAMPLE_RATE)
+            paths[name] = path
+        return paths
+
+    def test_groups_duplicates_and_persists_fingerprints(
+        self, recordings, tmp_path, monkeypatch
+    ):
+        """Duplicates are grouped, and a second run reads the store only."""
+        files = [recordings["a"], recordings["c"], recordings["b"]]
+        store_path = tmp_path / "store.json"
+
+        groups = batch_compare_audio_group(
+            files, store=FingerprintStore(store_path), max_duration=1.0
+        )
+
+        assert groups == {recordings["a"]: [recordings["a"], recordings["b"]]}
+        # Prefix fingerprints for both contents, plus the confirmed full file
+        assert len(FingerprintStore(store_path)) == 3
+
+        def _fail(*args, **kwargs):
+            raise AssertionError("fingerprint recomputed")
+
+        monkeypatch.setattr(fingerprinting, "compute_audio_fingerprint", _fail)
+        again = batch_compare_audio_group(
+            files, store=FingerprintStore(store_path), max_duration=1.0
+        )
+        assert again == groups
+
+    def test_prefix_matches_are_confirmed_on_the_full_file(self, tmp_path):
+        """Files sharing an intro but diverging later are not duplicates."""
+        sf = pytest.importorskip("soundfile")
+        if not fingerprinting.is_librosa_available():
+            pytest.skip("librosa not available")
+        t = np.arange(int(1.0 * SAMPLE_RATE)) / SAMPLE_RATE
+        intro = 0.3 * np.sin(2 * np.pi * 261.6 * t)
+        files = []
+        for name, hz in [("talk_1", 392.0), ("talk_2", 311.1)]:
+            body = 0.3 * np.sin(
+                2 * np.pi * hz * np.arange(4 * SAMPLE_RATE) / SAMPLE_RATE
+            )
+            path = tmp_path / f"{name}.wav"
+            sf.write(str(path), np.concatenate([intro, body]), SAMPLE_RATE)
+            files.append(path)
+        store = FingerprintStore(tmp_path / "store.json")
+
+        assert group_duplicate_fingerprints(
+            {f: store.fingerprint(f, max_duration=1.0) for f in files}
+        )
+        assert batch_compare_audio_group(files, store=store, max_duration=1.0) == {}
+
+    def test_bounded_decode_matches_full_file_when_shorter(self, recordings):
+        """Files shorter than max_duration fingerprint the same as the whole file."""
+        full = compute_audio_fingerprint(recordings["c"], use_cache=False)
+        bounded = compute_audio_fingerprint(
+            recordings["c"], use_cache=False, max_duration=60.0
+        )
+
+        np.testing.assert_allclose(bounded, full)
@@ -0,0 +1,223 @@
+"""
+Tests for the compiled correction-rule matcher behind detect_memory_hits.
+"""
+
+import os
+import re
+import time
+
+import pytest
+
+from transcriptx.core.corrections import matcher as matcher_module
+from transcriptx.core.corrections.detect import (
+    _acronym_variants,
+    _build_snippet,
+    detect_memory_hits,
+    resolve_segment_id,
+)
+from transcriptx.core.corrections.matcher import (
+    CorrectionMatcher,
+    get_correction_matcher,
+)
+from transcriptx.core.corrections.models import CorrectionConditions, CorrectionRule
+
+
+@pytest.fixture(autouse=True)
+def cache_root(tmp_path, monkeypatch):
+    root = tmp_path / "corrections"
+    root.mkdir()
+    monkeypatch.setattr(matcher_module, "get_corrections_cache_root", lambda: root)
+    monkeypatch.setattr(matcher_module, "_matchers", {})
+    return root
+
+
+def _segment(text, start=0.0, end=1.0):
+    return {"text": text, "speaker": "Alice", "start": start, "end": end}
+
+
+def _rule(rule_type, wrong, right="X", **conditions):
+    return CorrectionRule(
+        type=rule_type,
+        wrong=wrong,
+        right=right,
+        scope="project",
+        confidence=0.8,
+        conditions=CorrectionConditions(**conditions) if conditions else None,
+    )
+
+
+def _reference_hits(segments, transcript_key, rules):
+    """The per-rule, per-variant regex loop the matcher replaced."""
+    result = []
+    for rule in rules:
+        occurrences = []
+        for wrong in rule.wrong:
+            case_sensitive = (
+                rule.conditions.case_sensitive if rule.conditions else False
+            )
+            if rule.type == "regex":
+                pattern = re.compile(wrong, 0 if case_sensitive else re.IGNORECASE)
+            elif rule.type == "acronym":
+                variants = _acronym_variants(wrong)
+                if not variants:
+                    continue
+                pattern = re.compile(
+                    "|".join(re.escape(v) for v in variants), re.IGNORECASE
+                )
+            else:
+                boundary = rule.conditions.word_boundary if rule.conditions else True
+                escaped = re.escape(wrong)
+                pattern = re.compile(
+                    rf"\b{escaped}\b" if boundary else escaped,
+                    0 if case_sensitive else re.IGNORECASE,
+                )
+            for seg_idx, segment in enumerate(segments):
+                text = segment["text"]
+                for match in pattern.finditer(text):
+                    occurrences.append(
+                        (
+                            resolve_segment_id(segment, transcript_key, seg_idx),
+                            match.span(),
+                            _build_snippet(text, match.span()),
+                        )
+                    )
+        if occurrences:
+            result.append((rule.id, occurrences))
+    return result
+
+
+def _summarize(candidates):
+    return [
+        (c.rule_id, [(o.segment_id, o.span, o.snippet) for o in c.occurrences])
+        for c in candidates
+    ]
+
+
+RULES = [
+    _rule("phrase", ["wren twenty one", "ren 21"], "REN21"),
+    _rule("token", ["aa"], "A"),
+    _rule("token", ["Py"], "Python", case_sensitive=True),
+    _rule("token", ["ing"], "ING", word_boundary=False),
+    _rule("token", ["c++"], "C++"),
+    _rule("token", ["café"], "Cafe"),
+    _rule("acronym", ["CSE", "A"], "CSE"),
+    _rule("acronym", ["123"], "none"),
+    _rule("regex", [r"(\w+) \1"], "dup"),
+    _rule("regex", [r"colou?r", r"\d{3}-\d{4}"], "color"),
+    _rule("regex", [r"Kelvin"], "kelvin", case_sensitive=True),
+]
+
+SEGMENTS = [
+    _segment("We met with Wren Twenty One and ren 21 today."),
+    _segment("aaa aa aa_b aa. AA"),
+    _segment("Py py Python Py."),
+    _segment("singing and ringing in c++ or C++x"),
+    _segment("C S E and c. s. e. and cse, then A. and a"),
+    _segment("the the colour COLOR 555-1234 Kelvin kelvin", start=2.0, end=3.0),
+    _segment("CAFÉ café cafés Kelvin in İstanbul with Cse"),
+    _segment(""),
+]
+
+
+def test_matches_per_rule_regex_loop():
+    expected = _reference_hits(SEGMENTS, "key", RULES)
+    assert _summarize(detect_memory_hits(SEGMENTS, "key", RULES)) == expected
+    # Every kind of rule found something
+    assert len(expected) == len(RULES) - 1
+
+
+def test_rule_order_and_variant_order_are_kept():
+    rules = [
+        _rule("phrase", ["beta", "alpha"], "B"),
+        _rule("token", ["alpha"], "A"),
+    ]
+    segments = [_segment("alpha beta"), _segment("beta alpha")]
+    candidates = detect_memory_hits(segments, "key", rules)
+
+    assert [c.rule_id for c in candidates] == [rules[0].id, rules[1].id]
+    # Variant first, then segment, then position
+    assert [o.span for o in candidates[0].occurrences] == [
+        (6, 10),
+        (0, 4),
+        (0, 5),
+        (5, 10),
+    ]
+
+
+def test_matcher_is_compiled_once_and_reloaded_from_disk(cache_root, monkeypatch):
+    first = get_correction_matcher(RULES)
+    assert get_correction_matcher(RULES) is first
+    assert len(list(cache_root.glob("matcher-*.json"))) == 1
+
+    # A new process loads the saved matcher instead of compiling it
+    monkeypatch.setattr(matcher_module, "_matchers", {})
+    monkeypatch.setattr(
+        CorrectionMatcher,
+        "build",
+        classmethod(lambda cls, rules: pytest.fail("matcher was rebuilt")),
+    )
+    reloaded = get_correction_matcher(RULES)
+    assert reloaded is not first
+    assert reloaded.version == first.version
+    assert _summarize(detect_memory_hits(SEGMENTS, "key", RULES)) == (
+        _reference_hits(SEGMENTS, "key", RULES)
+    )
+
+
+def test_changed_rules_get_a_new_matcher():
+    first = get_correction_matcher(RULES)
+    changed = RULES[:-1] + [_rule("regex", [r"Kelvin"], "kelvin")]
+    assert get_correction_matcher(changed).version != first.version
+    # Replacement text does not affect matching
+    relabeled = RULES[:-1] + [_rule("regex", [r"Kelvin"], "K", case_sensitive=True)]
+    relabeled[-1].id = RULES[-1].id
+    assert get_correction_matcher(relabeled).version == first.version
+
+
+def test_only_recent_matchers_stay_on_disk(cache_root):
+    names = []
+    for i in range(matcher_module._MAX_CACHED_MATCHERS + 2):
+        version = get_correction_matcher([_rule("token", [f"term{i}"], "T")]).version
+        names.append(f"matcher-{version[:32]}.json")
+        # Distinct, increasing mtimes even on coarse-grained filesystems
+        os.utime(cache_root / names[-1], ns=(i * 10**9, i * 10**9))
+
+    assert sorted(p.name for p in cache_root.glob("matcher-*.json")) == sorted(
+        names[2:]
+    )
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_large_memory_scans_each_segment_once():
+    """Benchmark: 1000 rules over 1000 segments, compiled vs per-rule loop."""
+    rules = [_rule("token", [f"term{i}", f"alias{i}"], f"T{i}") for i in range(900)]
+    rules += [_rule("acronym", [f"Q{chr(65 + i % 26)}{i}"], "Q") for i in range(80)]
+    rules += [_rule("regex", [rf"code-{i}\d+"], "C") for i in range(20)]
+    segments = [
+        _segment(
+            f"Segment {n} mentions term{n % 1500} and ALIAS{(n * 7) % 1200}, "
+            f"then code-{n % 40}{n} before moving on to other business.",
+            start=float(n),
+            end=float(n) + 1.0,
+        )
+        for n in range(1000)
+    ]
+
+    start = time.perf_counter()
+    expected = _reference_hits(segments, "key", rules)
+    loop_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    cold = detect_memory_hits(segments, "key", rules)
+    cold_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    detect_memory_hits(segments, "key", rules)
+    warm_seconds = time.perf_counter() - start
+
+    print(
+        f"\nper-rule loop {loop_seconds:.2f}s, compiled {cold_seconds:.2f}s cold, "
+        f"{warm_seconds:.2f}s warm"
+    )
+    assert _summarize(cold) == expected
+    assert warm_seconds < loop_seconds
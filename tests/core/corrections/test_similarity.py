@@ -0,0 +1,164 @@
+"""
+Tests for near-duplicate candidate generation in the corrections detectors.
+"""
+
+import random
+import re
+import time
+from difflib import SequenceMatcher
+
+import pytest
+
+from transcriptx.core.corrections.detect import (
+    _SENTENCE_STARTERS,
+    detect_consistency_candidates,
+    detect_fuzzy_candidates,
+)
+from transcriptx.core.corrections.similarity import TokenSimilarityIndex
+
+
+def _segment(text, start=0.0):
+    return {"text": text, "speaker": "Alice", "start": start, "end": start + 1.0}
+
+
+def _variants(rng, word, count):
+    """Random one- and two-character edits of ``word``."""
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    result = []
+    for _ in range(count):
+        chars = list(word)
+        for _ in range(rng.randint(1, 2)):
+            op = rng.choice("ids")
+            pos = rng.randrange(len(chars))
+            if op == "i":
+                chars.insert(pos, rng.choice(letters))
+            elif op == "d" and len(chars) > 3:
+                del chars[pos]
+            else:
+                chars[pos] = rng.choice(letters)
+        result.append("".join(chars))
+    return result
+
+
+@pytest.mark.parametrize("threshold", [0.6, 0.8, 0.9])
+def test_candidates_include_every_pair_above_threshold(threshold):
+    rng = random.Random(threshold)
+    words = ["partnership", "renewables", "ren21", "cse", "budget", "transcript"]
+    tokens = sorted(
+        {v for word in words for v in [word] + _variants(rng, word, 15)}
+        | {"".join(rng.choices("abcde", k=rng.randint(1, 8))) for _ in range(60)}
+    )
+    index = TokenSimilarityIndex(tokens, threshold, max_length_difference=2)
+
+    expected = {
+        (i, j)
+        for i in range(len(tokens))
+        for j in range(i + 1, len(tokens))
+        if abs(len(tokens[i]) - len(tokens[j])) <= 2
+        and SequenceMatcher(None, tokens[i], tokens[j]).ratio() >= threshold
+    }
+    found = set(index.pairs())
+    assert expected <= found
+    # The filter prunes most of the pairs it never needs to compare
+    assert len(found) < len(tokens) * (len(tokens) - 1) / 4
+
+
+def _reference_consistency(segments, similarity_threshold):
+    """The all-pairs comparison the index replaced."""
+    counts = {}
+    for segment in segments:
+        for token in re.findall(r"\b[A-Z][A-Za-z0-9]+\b", segment["text"]):
+            counts[token] = counts.get(token, 0) + 1
+    tokens = [
+        t
+        for t in counts
+        if len(t) > 2
+        and not t.isdigit()
+        and any(c.isalpha() for c in t)
+        and t.lower() not in _SENTENCE_STARTERS
+    ]
+    pairs = []
+    for i, token in enumerate(tokens):
+        for other in tokens[i + 1 :]:
+            dominant = token if counts[token] >= counts[other] else other
+            minority = other if dominant == token else token
+            if counts[dominant] < 3 or abs(len(dominant) - len(minority)) > 2:
+                continue
+            score = SequenceMatcher(None, dominant.lower(), minority.lower()).ratio()
+            if score >= similarity_threshold:
+                pairs.append((minority, dominant, score))
+    return pairs
+
+
+def test_consistency_candidates_match_all_pairs_comparison():
+    rng = random.Random(0)
+    words = ["Partnership", "Renewables", "Ren21", "Budget", "Transcript", "Kigali"]
+    vocabulary = [v.capitalize() for w in words for v in _variants(rng, w, 6)]
+    segments = [
+        _segment(" ".join(rng.choices(words, k=6) + rng.sample(vocabulary, 3)), n)
+        for n in range(40)
+    ]
+
+    candidates = detect_consistency_candidates(segments, "key", 0.8)
+
+    assert [
+        (c.proposed_wrong, c.proposed_right, c.confidence) for c in candidates
+    ] == _reference_consistency(segments, 0.8)
+    assert candidates
+
+
+def test_fuzzy_candidates_compare_each_token_once():
+    segments = [
+        _segment("Jonh met Jhon and Jon, then Mary and Marry.", 0),
+        # "Marie" only reaches 0.67 against "mary"
+        _segment("Jonh again with Marie.", 1),
+    ]
+    names = ["John", "Mary", "Johnathan"]
+
+    candidates = detect_fuzzy_candidates(segments, "key", names, 0.7, True)
+
+    pairs = [(c.proposed_wrong, c.proposed_right) for c in candidates]
+    assert pairs == [
+        ("Jonh", "John"),
+        ("Jhon", "John"),
+        ("Jon", "John"),
+        ("Marry", "Mary"),
+        ("Jonh", "John"),
+    ]
+    assert [c.occurrences[0].span for c in candidates[:2]] == [(0, 4), (9, 13)]
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_consistency_scales_to_large_vocabularies():
+    """Benchmark: consistency candidates over 50k distinct tokens."""
+    rng = random.Random(1)
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    base = {
+        "".join(rng.choices(letters, k=rng.randint(5, 12))).capitalize()
+        for _ in range(45000)
+    }
+    tokens = sorted(base)
+    typos = sorted(
+        {v.capitalize() for t in tokens[:5000] for v in _variants(rng, t.lower(), 1)}
+        - base
+    )
+    texts = [" ".join(tokens[i : i + 20]) for i in range(0, len(tokens), 20)]
+    # The first 5000 tokens are common, each with one rare typo variant
+    texts += [" ".join(tokens[i : i + 20]) for i in range(0, 5000, 20)] * 2
+    texts += [" ".join(typos[i : i + 20]) for i in range(0, len(typos), 20)]
+    segments = [_segment(text, n) for n, text in enumerate(texts)]
+
+    start = time.perf_counter()
+    candidates = detect_consistency_candidates(segments, "key", 0.85)
+    seconds = time.perf_counter() - start
+
+    print(
+        f"\n{len(tokens) + len(typos)} tokens: {len(candidates)} candidates "
+        f"in {seconds:.1f}s"
+    )
+    found = {(c.proposed_wrong, c.proposed_right) for c in candidates}
+    assert sum(1 for typo in typos if any(w == typo for w, _ in found)) > 0.5 * len(
+        typos
+    )
+    assert seconds < 120
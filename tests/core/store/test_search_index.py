@@ -0,0 +1,149 @@
+"""Unit tests for the on-disk transcript search index."""
+
+from __future__ import annotations
+
+import json
+import os
+import random
+
+import pytest
+
+from transcriptx.core.store import TranscriptStore
+from transcriptx.core.store import search_index
+from transcriptx.core.store.search_index import TranscriptSearchIndex
+
+WORDS = ["Ship", "the", "release", "budget", "café", "review", "don't", "plan"]
+
+
+@pytest.fixture
+def index(tmp_path, monkeypatch) -> TranscriptSearchIndex:
+    index = TranscriptSearchIndex(tmp_path / "index")
+    monkeypatch.setattr(search_index, "_index", index)
+    return index
+
+
+def _transcript(n: int = 200, seed: int = 0) -> dict:
+    rng = random.Random(seed)
+    segments = []
+    for i in range(n):
+        words = [rng.choice(WORDS) for _ in range(rng.randint(0, 8))]
+        segments.append(
+            {
+                "speaker": ["SPEAKER_00", "SPEAKER_01", None][i % 3],
+                "text": " ".join(words),
+                "start": float(i),
+                "end": float(i) + 0.5,
+            }
+        )
+    if n > 7:
+        segments[7]["text"] = 12  # non-string text is indexed as empty
+    return {"segments": segments, "source": {"original_path": "/in/meeting.wav"}}
+
+
+def _write(path, data) -> None:
+    path.write_text(json.dumps(data), encoding="utf-8")
+
+
+def test_find_substring_matches_scan(tmp_path, index) -> None:
+    path = tmp_path / "t.json"
+    data = _transcript()
+    _write(path, data)
+    shard = index.get(path)
+    texts = [
+        seg["text"] if isinstance(seg["text"], str) else "" for seg in data["segments"]
+    ]
+
+    for query in [
+        "ship",
+        "HIP THE rel",
+        "e rev",
+        "café",
+        "n't pl",
+        "plan ship",
+        "'",
+        "",
+    ]:
+        expected = [i for i, t in enumerate(texts) if query.lower() in t.lower()]
+        assert shard.find_substring(query) == expected, query
+
+    assert shard.has_term_containing("udge")
+    assert not shard.has_term_containing("zebra")
+    assert shard.original_path == "/in/meeting.wav"
+
+
+def test_segments_and_speaker_table(tmp_path, index) -> None:
+    path = tmp_path / "t.json"
+    data = _transcript(6)
+    data["segments"][1]["speaker_db_id"] = 42
+    _write(path, data)
+    shard = index.get(path)
+
+    assert [s["speaker"] for s in shard.speakers] == ["SPEAKER_00", "SPEAKER_01"]
+    assert shard.speakers[1]["speaker_db_id"] == 42
+    segment = shard.segment(1)
+    assert segment["text"] == data["segments"][1]["text"]
+    assert segment["speaker"] == "SPEAKER_01"
+    assert (segment["start"], segment["end"]) == (1.0, 1.5)
+    assert shard.segment(2)["speaker"] is None
+
+
+def test_shard_reused_until_content_changes(tmp_path, index) -> None:
+    path = tmp_path / "t.json"
+    _write(path, _transcript(20))
+    calls = []
+
+    def loader(p):
+        calls.append(p)
+        return json.loads(open(p, encoding="utf-8").read())
+
+    index.get(path, loader=loader)
+    assert len(calls) == 1
+
+    # Touched but identical content: the content hash keeps the shard
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+    index.get(path, loader=loader)
+    assert len(calls) == 1
+
+    # A fresh index object reads the shard from disk without loading JSON
+    assert TranscriptSearchIndex(index.root).get(path, loader=loader) is not None
+    assert len(calls) == 1
+
+    changed = _transcript(20)
+    changed["segments"][0]["text"] = "zebra crossing"
+    _write(path, changed)
+    shard = index.get(path, loader=loader)
+    assert len(calls) == 2
+    assert shard.find_substring("zebra") == [0]
+
+
+def test_transcript_store_write_refreshes_shard(tmp_path, index) -> None:
+    path = tmp_path / "t.json"
+    store = TranscriptStore()
+    store.write(path, {"segments": [{"speaker": "A", "text": "Hi there"}]})
+    store.mutate(path, lambda d: d["segments"].append({"speaker": "B", "text": "Bye"}))
+
+    def fail(_):
+        raise AssertionError("shard should be fresh after the write")
+
+    shard = index.get(path, loader=fail)
+    assert shard.segment_count == 2
+    assert shard.find_substring("bye") == [1]
+
+
+def test_prune_removes_shards_of_deleted_transcripts(tmp_path, index) -> None:
+    kept, deleted = tmp_path / "kept.json", tmp_path / "deleted.json"
+    for path in (kept, deleted):
+        _write(path, _transcript(20))
+        index.get(path)
+    index.shard_dir(tmp_path / "no_meta.json").mkdir()
+    deleted.unlink()
+
+    assert index.prune() == 2
+    assert sorted(p.name for p in index.root.iterdir()) == [index.shard_dir(kept).name]
+    assert index.get(kept) is not None
+    assert index.prune() == 0
+
+
+def test_missing_transcript(tmp_path, index) -> None:
+    assert index.get(tmp_path / "missing.json") is None
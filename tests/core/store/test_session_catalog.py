@@ -0,0 +1,133 @@
+"""Unit tests for the cached session catalog."""
+
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+from transcriptx.core.store.session_catalog import CATALOG_FILE, SessionCatalog
+from transcriptx.core.utils import slug_manager
+
+
+@pytest.fixture
+def outputs(tmp_path, monkeypatch) -> Path:
+    outputs = tmp_path / "outputs"
+    outputs.mkdir()
+    index_file = outputs / ".transcriptx_index.json"
+    index_file.write_text(
+        json.dumps({"slug_to_key": {"alpha": "key-a", "beta": "key-b"}})
+    )
+    monkeypatch.setattr(slug_manager, "INDEX_FILE", index_file)
+    return outputs
+
+
+def _make_run(outputs: Path, slug: str, run_id: str, mtime: int) -> Path:
+    run_dir = outputs / slug / run_id
+    (run_dir / ".transcriptx").mkdir(parents=True)
+    transcript = run_dir / f"{slug}.json"
+    transcript.write_text(json.dumps({"segments": []}))
+    os.utime(run_dir, ns=(mtime, mtime))
+    return run_dir
+
+
+class _Builder:
+    def __init__(self) -> None:
+        self.calls: list[str] = []
+
+    def __call__(self, session_id, run_dir, transcript_key):
+        self.calls.append(session_id)
+        transcript = run_dir / f"{session_id.split('/')[0]}.json"
+        if not transcript.exists():
+            return None
+        return {
+            "name": session_id,
+            "slug": session_id.split("/")[0],
+            "transcript_key": transcript_key,
+            "transcript_path": str(transcript),
+            "last_updated": str(run_dir.stat().st_mtime_ns),
+            "modules": [],
+        }
+
+
+def test_unchanged_runs_are_not_rebuilt(outputs):
+    _make_run(outputs, "alpha", "run1", 1_000)
+    _make_run(outputs, "beta", "run1", 2_000)
+    (outputs / "unindexed" / "run1").mkdir(parents=True)
+    builder = _Builder()
+
+    catalog = SessionCatalog(outputs, revalidate_seconds=0)
+    names = [s["name"] for s in catalog.sessions(builder)]
+    assert names == ["beta/run1", "alpha/run1"]
+    assert sorted(builder.calls) == ["alpha/run1", "beta/run1"]
+    assert all("_sig" not in s for s in catalog.sessions(builder))
+    assert len(builder.calls) == 2
+
+    # A new process reuses the persisted catalog
+    fresh = _Builder()
+    assert len(SessionCatalog(outputs, revalidate_seconds=0).sessions(fresh)) == 2
+    assert fresh.calls == []
+    assert (outputs / CATALOG_FILE).exists()
+
+
+def test_changed_transcript_and_new_runs_are_picked_up(outputs):
+    _make_run(outputs, "alpha", "run1", 1_000)
+    builder = _Builder()
+    catalog = SessionCatalog(outputs, revalidate_seconds=0)
+    catalog.sessions(builder)
+
+    (outputs / "alpha" / "run1" / "alpha.json").write_text('{"segments": [1]}')
+    _make_run(outputs, "alpha", "run2", 3_000)
+    names = [s["name"] for s in catalog.sessions(builder)]
+
+    assert names == ["alpha/run2", "alpha/run1"]
+    assert builder.calls == ["alpha/run1", "alpha/run1", "alpha/run2"]
+
+
+def test_removed_and_unresolvable_runs_are_not_listed(outputs):
+    _make_run(outputs, "alpha", "run1", 1_000)
+    run2 = _make_run(outputs, "alpha", "run2", 2_000)
+    (run2 / "alpha.json").unlink()
+    builder = _Builder()
+    catalog = SessionCatalog(outputs, revalidate_seconds=0)
+
+    assert [s["name"] for s in catalog.sessions(builder)] == ["alpha/run1"]
+    # Runs without a transcript are remembered, not rebuilt on every listing
+    catalog.sessions(builder)
+    assert builder.calls.count("alpha/run2") == 1
+
+    for item in (outputs / "alpha" / "run1").rglob("*"):
+        if item.is_file():
+            item.unlink()
+    (outputs / "alpha" / "run1" / ".transcriptx").rmdir()
+    (outputs / "alpha" / "run1").rmdir()
+    assert catalog.sessions(builder) == []
+
+
+def test_revalidation_is_throttled_until_invalidated(outputs):
+    _make_run(outputs, "alpha", "run1", 1_000)
+    builder = _Builder()
+    catalog = SessionCatalog(outputs, revalidate_seconds=3600)
+    assert len(catalog.sessions(builder)) == 1
+
+    run2 = _make_run(outputs, "alpha", "run2", 2_000)
+    assert len(catalog.sessions(builder)) == 1
+    catalog.invalidate(run2)
+    assert len(catalog.sessions(builder)) == 2
+
+
+def test_query_filters_and_paginates(outputs):
+    for i in range(5):
+        _make_run(outputs, "alpha", f"run{i}", 1_000 + i)
+    _make_run(outputs, "beta", "run9", 9_000)
+    catalog = SessionCatalog(outputs, revalidate_seconds=0)
+    builder = _Builder()
+
+    page, total = catalog.query(builder, slug="alpha", offset=1, limit=2)
+    assert total == 5
+    assert [s["name"] for s in page] == ["alpha/run3", "alpha/run2"]
+
+    page, total = catalog.query(builder, text="RUN9")
+    assert total == 1 and page[0]["slug"] == "beta"
@@ -0,0 +1,95 @@
+"""
+Tests for hash-on-write in the artifact writers.
+"""
+
+import hashlib
+import os
+import time
+
+import pytest
+
+from transcriptx.core.utils import artifact_writer
+from transcriptx.core.utils.artifact_writer import (
+    forget_written_artifacts,
+    recorded_hash,
+    write_bytes,
+    write_csv,
+    write_json,
+)
+
+
+def _sha256(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def test_writers_record_hash_of_written_bytes(tmp_path):
+    json_path = write_json(tmp_path / "data" / "result.json", {"score": 0.5, "é": 1})
+    csv_path = write_csv(
+        tmp_path / "data" / "rows.csv",
+        [["Alice", 'says "hi"'], ["Bob", "line\nbreak"]],
+        header=["speaker", "text"],
+    )
+    png_path = write_bytes(tmp_path / "charts" / "chart.png", b"\x89PNG\r\n")
+
+    for path in (json_path, csv_path, png_path):
+        assert recorded_hash(path) == _sha256(path)
+
+
+def test_changed_or_unknown_files_have_no_recorded_hash(tmp_path):
+    path = write_json(tmp_path / "result.json", {"score": 0.5})
+    assert recorded_hash(path) is not None
+
+    # Same size, rewritten behind the writer's back
+    path.write_text(path.read_text().replace("0.5", "0.6"))
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert recorded_hash(path) is None
+
+    other = tmp_path / "other.json"
+    other.write_text("{}")
+    assert recorded_hash(other) is None
+    assert recorded_hash(tmp_path / "missing.json") is None
+
+
+def test_forget_drops_entries_under_root(tmp_path):
+    kept = write_json(tmp_path / "kept" / "a.json", {})
+    dropped = write_json(tmp_path / "module" / "data" / "b.json", {})
+
+    forget_written_artifacts(tmp_path / "module")
+
+    assert recorded_hash(dropped) is None
+    assert recorded_hash(kept) == _sha256(kept)
+
+
+def test_manifest_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(artifact_writer, "_MAX_MANIFEST_ENTRIES", 3)
+    paths = [write_json(tmp_path / f"{i}.json", {"i": i}) for i in range(5)]
+
+    assert [recorded_hash(p) is not None for p in paths] == [
+        False,
+        False,
+        True,
+        True,
+        True,
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_recorded_hashes_skip_reading_large_outputs(tmp_path):
+    """Benchmark: hashes for 40 x 4 MB outputs, manifest vs re-reading."""
+    from transcriptx.database.artifact_registry import _file_hash
+
+    payload = os.urandom(4 * 1024 * 1024)
+    paths = [write_bytes(tmp_path / f"chart{i}.html", payload) for i in range(40)]
+
+    start = time.perf_counter()
+    recorded = [recorded_hash(path) for path in paths]
+    manifest_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    reread = [_file_hash(path) for path in paths]
+    reread_seconds = time.perf_counter() - start
+
+    print(f"\nmanifest {manifest_seconds * 1000:.1f}ms, re-read {reread_seconds:.2f}s")
+    assert recorded == reread
+    assert manifest_seconds < reread_seconds
@@ -0,0 +1,146 @@
+"""
+Tests for the shared parse-once spaCy Doc layer.
+"""
+
+import pytest
+
+from transcriptx.core.utils.doc_layer import (
+    SegmentDocLayer,
+    clear_segment_doc_layer,
+    docs_for_segments,
+    get_segment_doc_layer,
+    set_segment_doc_layer,
+)
+
+spacy = pytest.importorskip("spacy")
+
+
+class _CountingNLP:
+    """Wraps a spaCy pipeline and counts texts sent through nlp.pipe."""
+
+    def __init__(self, nlp):
+        self._nlp = nlp
+        self.piped = 0
+
+    def __getattr__(self, name):
+        return getattr(self._nlp, name)
+
+    def pipe(self, texts, **kwargs):
+        texts = list(texts)
+        self.piped += len(texts)
+        return self._nlp.pipe(texts, **kwargs)
+
+
+@pytest.fixture
+def counting_nlp():
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns([{"label": "GPE", "pattern": "London"}])
+    return _CountingNLP(nlp)
+
+
+@pytest.fixture(autouse=True)
+def _reset_layer():
+    clear_segment_doc_layer()
+    yield
+    clear_segment_doc_layer()
+
+
+def _segments():
+    return [
+        {"speaker": "Alice", "text": "I flew to London. It rained."},
+        {"speaker": "Bob", "text": "Nice."},
+        {"speaker": "Alice", "text": "I flew to London. It rained."},
+        {"speaker": "Bob", "text": ""},
+    ]
+
+
+class TestSegmentDocLayer:
+    """Tests for SegmentDocLayer."""
+
+    def test_parses_unique_texts_once(self, counting_nlp, tmp_path):
+        """Every unique segment text is parsed once, on first access."""
+        layer = SegmentDocLayer(
+            _segments(), "sha256:abc", nlp=counting_nlp, cache_dir=tmp_path
+        )
+        assert counting_nlp.piped == 0
+
+        docs = layer.docs_for_segments(_segments())
+        layer.docs_for_segments(_segments()[:2])
+
+        assert counting_nlp.piped == 3
+        assert [doc.text for doc in docs] == [s["text"] for s in _segments()]
+        assert [ent.label_ for ent in docs[0].ents] == ["GPE"]
+        assert len(list(docs[0].sents)) == 2
+
+    def test_docbin_cache_reused(self, counting_nlp, tmp_path):
+        """A second layer for the same transcript loads the DocBin cache."""
+        first = SegmentDocLayer(
+            _segments(), "sha256:abc", nlp=counting_nlp, cache_dir=tmp_path
+        )
+        first.docs_for_segments(_segments())
+        assert first.cache_path().exists()
+        assert not first.cache_hit
+
+        second = SegmentDocLayer(
+            _segments(), "sha256:abc", nlp=counting_nlp, cache_dir=tmp_path
+        )
+        docs = second.docs_for_segments(_segments())
+
+        assert second.cache_hit
+        assert counting_nlp.piped == 3
+        assert [ent.text for ent in docs[2].ents] == ["London"]
+
+    def test_cache_disabled(self, counting_nlp, tmp_path):
+        """use_cache=False never writes a DocBin."""
+        layer = SegmentDocLayer(
+            _segments(),
+            "sha256:abc",
+            nlp=counting_nlp,
+            cache_dir=tmp_path,
+            use_cache=False,
+        )
+        layer.docs_for_segments(_segments())
+
+        assert layer.cache_path() is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_unknown_text_returns_none_without_parsing(self, counting_nlp, tmp_path):
+        """Texts outside the transcript are not served and trigger no parse."""
+        layer = SegmentDocLayer(
+            _segments(), "sha256:abc", nlp=counting_nlp, cache_dir=tmp_path
+        )
+
+        assert layer.docs_for_texts(["Nice.", "Something else"]) is None
+        assert layer.doc_for_text("Something else") is None
+        assert counting_nlp.piped == 0
+
+    def test_module_helpers_use_registered_layer(self, counting_nlp, tmp_path):
+        """docs_for_segments serves the registered layer, or None without one."""
+        assert docs_for_segments(_segments()) is None
+
+        layer = SegmentDocLayer(
+            _segments(), "sha256:abc", nlp=counting_nlp, cache_dir=tmp_path
+        )
+        set_segment_doc_layer(layer)
+
+        docs = docs_for_segments(_segments()[1:2])
+        assert [doc.text for doc in docs] == ["Nice."]
+        assert layer.parses_with(counting_nlp)
+        assert not layer.parses_with(object())
+        # Docs from another pipeline (e.g. one without a tagger) are not served
+        assert docs_for_segments(_segments()[1:2], nlp=counting_nlp) is not None
+        assert docs_for_segments(_segments()[1:2], nlp=spacy.blank("en")) is None
+
+    def test_clear_only_own_layer(self, counting_nlp, tmp_path):
+        """clear_segment_doc_layer(layer) leaves a newer layer in place."""
+        old = SegmentDocLayer(_segments(), "sha256:a", nlp=counting_nlp)
+        new = SegmentDocLayer(_segments(), "sha256:b", nlp=counting_nlp)
+        set_segment_doc_layer(new)
+
+        clear_segment_doc_layer(old)
+        assert get_segment_doc_layer() is new
+
+        clear_segment_doc_layer(new)
+        assert get_segment_doc_layer() is None
@@ -0,0 +1,186 @@
+"""
+Tests for the persistent cross-run embedding store.
+"""
+
+import numpy as np
+
+from transcriptx.core.analysis.semantic_similarity.embeddings import EmbeddingCache
+from transcriptx.core.utils.embedding_store import EmbeddingStore, text_key
+
+
+class _CountingEncoder:
+    """Deterministic stand-in for an embedding model; records every text."""
+
+    def __init__(self, dim=8):
+        self.dim = dim
+        self.seen = []
+
+    def __call__(self, texts):
+        self.seen.extend(texts)
+        return [self._vector(text) for text in texts]
+
+    def _vector(self, text):
+        if text == "unembeddable":
+            return None
+        rng = np.random.default_rng(len(text) * 31 + ord(text[0]))
+        return rng.normal(size=self.dim).astype(np.float32)
+
+
+class TestEmbeddingStore:
+    """Tests for EmbeddingStore."""
+
+    def test_computes_only_misses(self, tmp_path):
+        """Cached texts are never passed to compute_fn again."""
+        store = EmbeddingStore("model-a", root=tmp_path)
+        encoder = _CountingEncoder()
+
+        first = store.get_or_compute(["alpha", "beta", "alpha"], encoder)
+        second = store.get_or_compute(["beta", "gamma"], encoder)
+
+        assert encoder.seen == ["alpha", "beta", "gamma"]
+        assert np.array_equal(first[1], second[0])
+        assert np.array_equal(first[0], first[2])
+        assert store.hits == 1 and store.misses == 3
+
+    def test_persists_across_instances(self, tmp_path):
+        """A new store for the same model reads vectors from disk."""
+        encoder = _CountingEncoder()
+        original = EmbeddingStore("model-a", root=tmp_path).get_or_compute(
+            ["alpha", "beta"], encoder
+        )
+
+        reopened = EmbeddingStore("model-a", root=tmp_path)
+        again = reopened.get_or_compute(["alpha", "beta"], encoder)
+
+        assert encoder.seen == ["alpha", "beta"]
+        assert all(np.array_equal(a, b) for a, b in zip(original, again))
+        assert again[0].dtype == np.float32
+
+    def test_models_and_whitespace(self, tmp_path):
+        """Keys are per model; whitespace-only differences share an entry."""
+        encoder = _CountingEncoder()
+        EmbeddingStore("model-a", root=tmp_path).get_or_compute(["a  b"], encoder)
+
+        assert text_key("a  b") == text_key(" a b ")
+        assert (
+            EmbeddingStore("model-a", root=tmp_path).get_many([" a b"])[0] is not None
+        )
+        assert EmbeddingStore("model-b", root=tmp_path).get_many(["a b"])[0] is None
+
+    def test_unembeddable_texts_are_not_stored(self, tmp_path):
+        """None results are returned but retried on the next call."""
+        store = EmbeddingStore("model-a", root=tmp_path)
+        encoder = _CountingEncoder()
+
+        assert store.get_or_compute(["unembeddable"], encoder) == [None]
+        store.get_or_compute(["unembeddable"], encoder)
+
+        assert encoder.seen == ["unembeddable", "unembeddable"]
+        assert len(store) == 0
+
+    def test_lru_eviction_by_size(self, tmp_path):
+        """Over the byte budget, least recently used entries are evicted."""
+        # 8 float32 dims = 32 bytes per vector; room for three vectors
+        store = EmbeddingStore("model-a", root=tmp_path, max_bytes=3 * 32)
+        encoder = _CountingEncoder()
+        store.get_or_compute(["alpha"], encoder)
+        store.get_or_compute(["beta"], encoder)
+        store.get_or_compute(["gamma"], encoder)
+        store.get_many(["alpha"])  # alpha is now more recent than beta
+
+        store.get_or_compute(["delta"], encoder)
+
+        assert len(store) == 3
+        assert store.get_many(["beta"]) == [None]
+        assert all(v is not None for v in store.get_many(["alpha", "gamma", "delta"]))
+        assert len(list(tmp_path.glob("model-a/shard-*.npy"))) <= 3
+
+        reopened = EmbeddingStore("model-a", root=tmp_path, max_bytes=3 * 32)
+        assert reopened.get_many(["beta"]) == [None]
+        assert reopened.get_many(["delta"])[0] is not None
+
+    def test_single_puts_are_buffered_into_one_shard(self, tmp_path, monkeypatch):
+        """One-text puts are written as one shard, with one index save, on flush."""
+        store = EmbeddingStore("model-a", root=tmp_path)
+        saves = []
+        original_save = store._save_index
+        monkeypatch.setattr(
+            store, "_save_index", lambda: saves.append(1) or original_save()
+        )
+        encoder = _CountingEncoder()
+        texts = [f"text {i}" for i in range(200)]
+        for text in texts:
+            store.put_many([text], encoder([text]))
+
+        assert list(tmp_path.glob("model-a/shard-*.npy")) == []
+        assert store.get_many(["text 5"])[0] is not None
+
+        store.flush()
+
+        assert len(list(tmp_path.glob("model-a/shard-*.npy"))) == 1
+        assert len(saves) == 1
+        reopened = EmbeddingStore("model-a", root=tmp_path)
+        assert all(v is not None for v in reopened.get_many(texts))
+
+    def test_buffer_is_written_once_full(self, tmp_path):
+        """Past ``buffer_rows`` pending rows, the buffer goes to a shard."""
+        store = EmbeddingStore("model-a", root=tmp_path, buffer_rows=10)
+        encoder = _CountingEncoder()
+        for i in range(25):
+            store.put_many([f"text {i}"], encoder([f"text {i}"]))
+
+        assert len(list(tmp_path.glob("model-a/shard-*.npy"))) == 2
+        assert len(EmbeddingStore("model-a", root=tmp_path)) == 20
+
+    def test_stores_sharing_a_directory_keep_each_others_shards(self, tmp_path):
+        """Eviction in one process never deletes shards another one wrote."""
+        encoder = _CountingEncoder()
+        # Room for ten vectors
+        first = EmbeddingStore("model-a", root=tmp_path, max_bytes=10 * 32)
+        second = EmbeddingStore("model-a", root=tmp_path, max_bytes=10 * 32)
+        second.get_or_compute([f"second {i}" for i in range(8)], encoder)
+        first.get_or_compute(["first 0", "first 1"], encoder)
+        # Over budget: evicts the two oldest rows and compacts
+        second.get_or_compute(["second 8", "second 9"], encoder)
+
+        fresh = EmbeddingStore("model-a", root=tmp_path, max_bytes=10 * 32)
+        assert len(fresh) == 10
+        assert all(v is not None for v in fresh.get_many(["first 0", "first 1"]))
+        assert fresh.get_many(["second 0", "second 1"]) == [None, None]
+        assert all(v is not None for v in first.get_many(["first 0", "first 1"]))
+
+    def test_memory_only_without_root(self, tmp_path):
+        """Without a root, vectors are kept for the process only."""
+        store = EmbeddingStore("model-a", root=None)
+        encoder = _CountingEncoder()
+        store.get_or_compute(["alpha"], encoder)
+        store.get_or_compute(["alpha"], encoder)
+
+        assert encoder.seen == ["alpha"]
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestEmbeddingCacheStore:
+    """EmbeddingCache reads through to the persistent store."""
+
+    def test_cache_uses_store(self, tmp_path):
+        """Vectors set in one cache are visible to a fresh cache on the store."""
+        store = EmbeddingStore("transformers-mean:test", root=tmp_path)
+        value = np.arange(4, dtype=np.float32)[np.newaxis, :]
+        EmbeddingCache(store=store).set_many(["hello world"], [value])
+        store.flush()
+
+        reopened = EmbeddingStore("transformers-mean:test", root=tmp_path)
+        cached = EmbeddingCache(store=reopened).get("hello world")
+
+        assert cached.shape == (1, 4)
+        assert np.array_equal(cached, value)
+
+    def test_cache_without_model_id_is_in_memory(self):
+        """The default cache has no persistent store."""
+        cache = EmbeddingCache()
+        cache.set("k", np.ones((1, 2)))
+
+        assert cache.store is None
+        assert cache.get("k").shape == (1, 2)
+        assert cache.get("missing") is None
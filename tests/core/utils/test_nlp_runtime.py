@@ -0,0 +1,102 @@
+"""
+Tests for spaCy streaming helpers in nlp_runtime.
+"""
+
+import pytest
+
+from transcriptx.core.utils.nlp_runtime import (
+    NER_COMPONENTS,
+    disabled_components,
+    pipe_docs,
+    required_components,
+)
+
+spacy = pytest.importorskip("spacy")
+
+
+@pytest.fixture
+def ruler_nlp():
+    """Blank English pipeline with a rule-based 'ner' and a sentencizer."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("sentencizer")
+    ruler = nlp.add_pipe("entity_ruler", name="ner")
+    ruler.add_patterns(
+        [
+            {"label": "GPE", "pattern": "London"},
+            {"label": "ORG", "pattern": "Google"},
+        ]
+    )
+    return nlp
+
+
+def _listener_nlp(listen):
+    """Blank pipeline whose 'ner' reads from a shared tok2vec when ``listen``."""
+    nlp = spacy.blank("en")
+    nlp.add_pipe("tok2vec")
+    nlp.add_pipe("sentencizer")
+    config = {}
+    if listen:
+        config = {
+            "model": {
+                "@architectures": "spacy.TransitionBasedParser.v2",
+                "state_type": "ner",
+                "extra_state_tokens": False,
+                "hidden_width": 16,
+                "maxout_pieces": 2,
+                "use_upper": True,
+                "tok2vec": {
+                    "@architectures": "spacy.Tok2VecListener.v1",
+                    "width": 96,
+                    "upstream": "*",
+                },
+            }
+        }
+    nlp.add_pipe("ner", config=config)
+    return nlp
+
+
+class TestPipeDocs:
+    """Tests for pipe_docs."""
+
+    def test_disabled_components(self, ruler_nlp):
+        """Only components outside the keep list are disabled."""
+        assert disabled_components(ruler_nlp, NER_COMPONENTS) == ["sentencizer"]
+
+    def test_keeps_listened_to_embedding_layer(self):
+        """A shared layer the NER listens to (tok2vec/transformer) stays enabled."""
+        nlp = _listener_nlp(listen=True)
+
+        assert required_components(nlp, NER_COMPONENTS) == ["tok2vec", "ner"]
+        assert disabled_components(nlp, required_components(nlp, NER_COMPONENTS)) == [
+            "sentencizer"
+        ]
+
+    def test_standalone_ner_skips_unused_embedding_layer(self):
+        """An NER with its own embedding does not keep the shared tok2vec."""
+        nlp = _listener_nlp(listen=False)
+
+        assert required_components(nlp, NER_COMPONENTS) == ["ner"]
+
+    def test_streams_with_context(self, ruler_nlp):
+        """as_tuples keeps each text's context attached to its doc."""
+        items = [("Flew to London.", "Alice"), ("Works at Google.", "Bob")]
+
+        results = [
+            (doc.text, [ent.label_ for ent in doc.ents], speaker)
+            for doc, speaker in pipe_docs(
+                ruler_nlp, items, batch_size=1, keep=NER_COMPONENTS, as_tuples=True
+            )
+        ]
+
+        assert results == [
+            ("Flew to London.", ["GPE"], "Alice"),
+            ("Works at Google.", ["ORG"], "Bob"),
+        ]
+
+    def test_skips_unneeded_components_without_mutating_model(self, ruler_nlp):
+        """Disabled components do not run, and the shared model is unchanged."""
+        doc = next(iter(pipe_docs(ruler_nlp, ["One. Two."], keep=NER_COMPONENTS)))
+
+        assert not doc.has_annotation("SENT_START")
+        assert ruler_nlp.pipe_names == ["sentencizer", "ner"]
+        assert ruler_nlp("One. Two.").has_annotation("SENT_START")
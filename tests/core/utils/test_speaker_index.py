@@ -0,0 +1,183 @@
+"""
+Tests for the precomputed speaker index.
+
+The index must give exactly the same answers as the segment-scanning helpers
+in speaker_extraction; these tests compare both paths on the same inputs.
+"""
+
+import time
+
+import pytest
+
+from transcriptx.core.utils.speaker_extraction import (
+    SpeakerIndex,
+    clear_speaker_index,
+    extract_speaker_info,
+    get_speaker_display_name,
+    get_speaker_index,
+    get_unique_speakers,
+    group_segments_by_speaker,
+    set_speaker_index,
+)
+
+
+def _segments():
+    return [
+        {"speaker": "Alice", "speaker_db_id": 1, "text": "a", "start": 0, "end": 1},
+        {"speaker": "Alice", "speaker_db_id": 2, "text": "b", "start": 1, "end": 2},
+        {"speaker": "Bob", "speaker_db_id": 3, "text": "c", "start": 2, "end": 3},
+        {"speaker": "SPEAKER_00", "text": "d", "start": 3, "end": 4},
+        {"text": "no speaker", "start": 4, "end": 5},
+        {"speaker": None, "text": "null speaker", "start": 5, "end": 6},
+        {"speaker": "Bob", "speaker_db_id": 3, "text": "e", "start": 6, "end": 7},
+        {
+            "speaker": "Carol",
+            "original_speaker_id": "SPEAKER_02",
+            "text": "f",
+            "start": 7,
+            "end": 8,
+        },
+    ]
+
+
+def _legacy_results(segments):
+    clear_speaker_index()
+    grouped = group_segments_by_speaker(segments)
+    return (
+        get_unique_speakers(segments),
+        grouped,
+        {
+            key: get_speaker_display_name(key, segs, segments)
+            for key, segs in grouped.items()
+        },
+        [extract_speaker_info(seg) for seg in segments],
+    )
+
+
+def _large_segments(n):
+    """Segments for 15 speakers; two db ids share a name to force disambiguation."""
+    return [
+        {
+            "speaker": f"Speaker {min(i % 15, 13)}",
+            "speaker_db_id": i % 15,
+            "text": "x",
+            "start": float(i),
+            "end": float(i) + 0.5,
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture(autouse=True)
+def _reset_index():
+    clear_speaker_index()
+    yield
+    clear_speaker_index()
+
+
+class TestSpeakerIndex:
+    """Tests for SpeakerIndex equivalence with the scanning helpers."""
+
+    def test_index_matches_legacy_helpers(self):
+        """Indexed results are identical to the scan-based results."""
+        segments = _segments()
+        unique, grouped, display, infos = _legacy_results(segments)
+
+        index = SpeakerIndex.build(segments)
+        set_speaker_index(index)
+
+        assert dict(index.display_names) == unique
+        assert get_unique_speakers(segments) == unique
+        assert list(get_unique_speakers(segments)) == list(unique)
+        assert group_segments_by_speaker(segments) == grouped
+        assert {
+            key: get_speaker_display_name(key, segs, segments)
+            for key, segs in grouped.items()
+        } == display
+        assert [extract_speaker_info(seg) for seg in segments] == infos
+
+    def test_index_flags(self):
+        """Disambiguated and named keys are precomputed."""
+        index = SpeakerIndex.build(_segments())
+
+        assert index.disambiguated_keys == frozenset({1, 2})
+        assert 3 in index.named_keys
+        assert "SPEAKER_00" not in index.named_keys
+        assert index.segment_indices[3] == (2, 6)
+
+    def test_index_is_read_only(self):
+        """Index mappings cannot be modified."""
+        index = SpeakerIndex.build(_segments())
+
+        with pytest.raises(TypeError):
+            index.display_names[99] = "Mallory"
+
+    def test_other_segment_lists_use_scan(self):
+        """Lists the index was not built from fall back to scanning."""
+        segments = _segments()
+        set_speaker_index(SpeakerIndex.build(segments))
+
+        subset = [dict(seg) for seg in segments[1:3]]
+        # Only one Alice in the subset: no disambiguation
+        assert get_speaker_display_name(2, subset[:1], subset) == "Alice"
+        assert get_unique_speakers(subset) == {2: "Alice", 3: "Bob"}
+
+        appended = segments + [{"speaker": "Dave", "speaker_db_id": 4, "text": "g"}]
+        assert get_unique_speakers(appended)[4] == "Dave"
+
+    def test_clear_only_own_index(self):
+        """clear_speaker_index(index) leaves a newer index in place."""
+        old = SpeakerIndex.build(_segments())
+        new = SpeakerIndex.build(_segments())
+        set_speaker_index(new)
+
+        clear_speaker_index(old)
+        assert get_speaker_index() is new
+
+        clear_speaker_index(new)
+        assert get_speaker_index() is None
+
+    def test_index_matches_scan_on_large_transcript(self):
+        """Indexed lookups equal the scan on a long transcript with shared names."""
+        segments = _large_segments(2_000)
+        unique, grouped, display, infos = _legacy_results(segments)
+
+        set_speaker_index(SpeakerIndex.build(segments))
+
+        assert get_unique_speakers(segments) == unique
+        assert group_segments_by_speaker(segments) == grouped
+        assert {
+            key: get_speaker_display_name(key, segs, segments)
+            for key, segs in grouped.items()
+        } == display
+        assert [extract_speaker_info(seg) for seg in segments] == infos
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_speaker_index_benchmark_20k_segments():
+    """Print scan vs. indexed display-name timings at 20k segments."""
+    segments = _large_segments(20_000)
+    sample = segments[:50]
+
+    clear_speaker_index()
+    start = time.perf_counter()
+    legacy = [
+        get_speaker_display_name(seg["speaker_db_id"], [seg], segments)
+        for seg in sample
+    ]
+    legacy_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    set_speaker_index(SpeakerIndex.build(segments))
+    indexed = [
+        get_speaker_display_name(seg["speaker_db_id"], [seg], segments)
+        for seg in sample
+    ]
+    indexed_elapsed = time.perf_counter() - start
+
+    assert indexed == legacy
+    print(
+        f"\n20k segments, {len(sample)} lookups: scan {legacy_elapsed * 1000:.1f} ms, "
+        f"build+indexed {indexed_elapsed * 1000:.1f} ms"
+    )
@@ -0,0 +1,105 @@
+"""
+Tests for the fit-once TF-IDF index and batch pair scoring.
+"""
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+from transcriptx.core.utils.similarity_utils import SimilarityCalculator
+from transcriptx.core.utils.tfidf_index import (
+    SegmentTfidfIndex,
+    TfidfIndex,
+    clear_segment_tfidf_index,
+    index_for_texts,
+    set_segment_tfidf_index,
+)
+
+TEXTS = [
+    "We should ship the release tomorrow after the smoke tests pass.",
+    "Shipping tomorrow works if the smoke tests pass tonight.",
+    "The budget review moved to Thursday afternoon.",
+    "Can we move the budget review to Friday instead?",
+    "   ",
+]
+
+
+@pytest.fixture(autouse=True)
+def _reset_index():
+    clear_segment_tfidf_index()
+    yield
+    clear_segment_tfidf_index()
+
+
+class _CountingFactory:
+    def __init__(self):
+        self.fits = 0
+
+    def __call__(self):
+        self.fits += 1
+        return TfidfVectorizer(lowercase=True, stop_words="english")
+
+
+class TestTfidfIndex:
+    """Tests for TfidfIndex and SegmentTfidfIndex."""
+
+    def test_pair_similarities_match_full_matrix_cosine(self):
+        """Sparse row products equal cosine similarity on the same fitted matrix."""
+        factory = _CountingFactory()
+        index = TfidfIndex(TEXTS, vectorizer_factory=factory)
+        expected = cosine_similarity(
+            TfidfVectorizer(lowercase=True, stop_words="english").fit_transform(
+                [t.strip() for t in TEXTS if t.strip()]
+            )
+        )
+
+        left, right = np.array([0, 0, 2, 1]), np.array([1, 2, 3, 1])
+        scores = index.pair_similarities(left, right)
+
+        assert factory.fits == 1
+        assert len(index) == 4
+        assert scores == pytest.approx(expected[left, right])
+        assert index.similarity(TEXTS[0], "not in corpus") is None
+
+    def test_segment_index_fits_once_lazily(self):
+        """The transcript index is fitted on first use and then reused."""
+        segments = [{"text": text} for text in TEXTS]
+        segment_index = SegmentTfidfIndex(segments)
+        set_segment_tfidf_index(segment_index)
+
+        first = index_for_texts(TEXTS[:2])
+        second = index_for_texts(TEXTS[2:4])
+
+        assert first is second is segment_index.index()
+        assert index_for_texts(["outside text about budgets"]) is not first
+
+
+class TestPairSimilarities:
+    """Tests for SimilarityCalculator.calculate_pair_similarities."""
+
+    def test_batch_scores(self):
+        """Batch TF-IDF scores follow the single-pair conventions."""
+        calculator = SimilarityCalculator()
+        texts = TEXTS + [TEXTS[0]]
+        pairs = [(0, 1), (2, 3), (0, 2), (0, 5), (0, 4)]
+
+        scores = calculator.calculate_pair_similarities(texts, pairs)
+
+        assert scores[0] > scores[2]
+        assert scores[1] > scores[2]
+        assert scores[3] == 1.0  # identical texts
+        assert scores[4] == 0.0  # empty text
+        assert all(0.0 <= s <= 1.0 + 1e-9 for s in scores)
+
+    def test_other_methods_score_each_pair(self):
+        """Non-TF-IDF methods equal calculate_text_similarity per pair."""
+        calculator = SimilarityCalculator()
+        pairs = [(0, 1), (2, 3)]
+
+        scores = calculator.calculate_pair_similarities(TEXTS, pairs, method="jaccard")
+
+        assert scores == [
+            calculator.calculate_text_similarity(TEXTS[i], TEXTS[j], method="jaccard")
+            for i, j in pairs
+        ]
@@ -0,0 +1,171 @@
+"""
+Tests for sorted-time window queries.
+
+Each helper is compared against the linear scan it replaces.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from transcriptx.core.analysis.dynamics.echoes import EchoesAnalysis
+from transcriptx.core.models.events import Event
+from transcriptx.core.utils.time_windows import (
+    IntervalIndex,
+    count_in_windows,
+    forward_window_ends,
+    sorted_times,
+)
+
+
+def _starts(n, seed=0):
+    """Sorted, bursty start times with repeated values."""
+    rng = np.random.default_rng(seed)
+    gaps = rng.choice([0.0, 0.5, 2.0, 30.0], size=n, p=[0.1, 0.5, 0.3, 0.1])
+    return np.cumsum(gaps).tolist()
+
+
+def _scan_counts(starts, window_seconds):
+    """The quadratic forward-window count used before the index."""
+    return [
+        sum(1 for t in starts[idx:] if t <= start + window_seconds)
+        for idx, start in enumerate(starts)
+    ]
+
+
+def _echo_events(starts):
+    return [
+        Event(
+            event_id=f"e{i}",
+            kind="echo",
+            time_start=t,
+            time_end=t + 1.0,
+            speaker=None,
+            segment_start_idx=i,
+            segment_end_idx=i + 1,
+            severity=0.5,
+        )
+        for i, t in enumerate(starts)
+    ]
+
+
+def _scan_bursts(events, window_seconds, count_threshold):
+    """Burst windows (first id, last id, size) from the former while loop."""
+    bursts = []
+    idx = 0
+    while idx < len(events):
+        window_end = events[idx].time_start + window_seconds
+        window = [e for e in events[idx:] if e.time_start <= window_end]
+        if len(window) >= count_threshold:
+            bursts.append((window[0].event_id, window[-1].event_id, len(window)))
+            idx += len(window)
+        else:
+            idx += 1
+    return bursts
+
+
+class TestForwardWindows:
+    """Tests for forward_window_ends and count_in_windows."""
+
+    def test_forward_counts_match_scan(self):
+        """Window counts equal the per-event scan, ties included."""
+        starts = _starts(400)
+        ends = forward_window_ends(starts, 25.0)
+
+        assert (ends - np.arange(len(starts))).tolist() == _scan_counts(starts, 25.0)
+
+    def test_count_in_windows_is_half_open(self):
+        """A time on a window's end belongs to the next window."""
+        times = sorted_times([5.0, None, 0.0, 10.0, 10.0, 19.9])
+
+        counts = count_in_windows(times, [0.0, 10.0, 20.0], [10.0, 20.0, 30.0])
+
+        assert counts.tolist() == [2, 3, 0]
+
+    def test_echo_bursts_match_scan(self):
+        """Echo bursts are the same windows the scanning loop produced."""
+        starts = _starts(300, seed=3)
+        events = _echo_events(starts)
+        analysis = EchoesAnalysis()
+        window = float(analysis.config.echo_burst_window_seconds)
+        min_events = int(analysis.config.echo_burst_min_events)
+        percentile = float(analysis.config.echo_burst_percentile_threshold)
+        threshold = max(
+            min_events,
+            int(np.percentile(_scan_counts(starts, window), percentile * 100)),
+        )
+
+        bursts = analysis._detect_echo_bursts(events, "hash")
+
+        assert bursts
+        assert [
+            (b.links[0]["event_id"], b.links[-1]["event_id"], len(b.links))
+            for b in bursts
+        ] == _scan_bursts(events, window, threshold)
+
+
+class TestIntervalIndex:
+    """Tests for IntervalIndex overlap queries."""
+
+    def _intervals(self, n=200, seed=1):
+        rng = np.random.default_rng(seed)
+        starts = rng.uniform(0, 500, size=n)
+        ends = starts + rng.uniform(0, 40, size=n)
+        return starts.tolist(), ends.tolist()
+
+    def test_overlapping_matches_scan(self):
+        """Overlap queries return the scanned positions in original order."""
+        starts, ends = self._intervals()
+        starts[7] = None
+        index = IntervalIndex(starts, ends)
+
+        for t0, t1 in [(0, 10), (100, 160), (250.5, 251.0), (600, 700)]:
+            expected = [
+                i
+                for i, (s, e) in enumerate(zip(starts, ends))
+                if s is not None and s < t1 and e > t0
+            ]
+            assert index.overlapping(t0, t1).tolist() == expected
+
+    def test_overlap_seconds_matches_scan(self):
+        """Clipped overlap totals equal the per-interval sum."""
+        starts, ends = self._intervals(seed=2)
+        index = IntervalIndex(starts, ends)
+
+        for t0, t1 in [(0, 60), (120, 180), (480, 540)]:
+            expected = sum(
+                max(0.0, min(t1, e) - max(t0, s)) for s, e in zip(starts, ends)
+            )
+            assert index.overlap_seconds(t0, t1) == pytest.approx(expected)
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_window_counts_benchmark_50k_events():
+    """Print scan vs. searchsorted window-count timings."""
+    starts = _starts(50_000)
+    scan_sample = starts[:5_000]
+
+    start = time.perf_counter()
+    legacy = _scan_counts(scan_sample, 25.0)
+    scan_elapsed = time.perf_counter() - start
+
+    start = time.perf_counter()
+    sample_ends = forward_window_ends(scan_sample, 25.0)
+    ends = forward_window_ends(starts, 25.0)
+    indexed_elapsed = time.perf_counter() - start
+
+    events = _echo_events(starts)
+    start = time.perf_counter()
+    bursts = EchoesAnalysis()._detect_echo_bursts(events, "hash")
+    burst_elapsed = time.perf_counter() - start
+
+    assert (sample_ends - np.arange(len(scan_sample))).tolist() == legacy
+    assert len(ends) == len(starts)
+    print(
+        f"\nscan 5k events {scan_elapsed * 1000:.1f} ms; "
+        f"searchsorted 5k + 50k events {indexed_elapsed * 1000:.1f} ms; "
+        f"echo bursts over 50k events {burst_elapsed * 1000:.1f} ms "
+        f"({len(bursts)} bursts)"
+    )
@@ -0,0 +1,150 @@
+"""
+Tests for the columnar segment timeline.
+
+Window queries are compared against the per-window segment scans they replace.
+"""
+
+import numpy as np
+import pytest
+
+from transcriptx.core.utils.timeline_index import (
+    SegmentTimeline,
+    clear_segment_timeline,
+    content_tokens,
+    get_segment_timeline,
+    set_segment_timeline,
+    timeline_for_segments,
+)
+
+WORDS = ["ship", "release", "budget", "review", "the", "and", "tomorrow", "plan"]
+
+
+@pytest.fixture(autouse=True)
+def _reset_timeline():
+    clear_segment_timeline()
+    yield
+    clear_segment_timeline()
+
+
+def _segments(n=300, seed=0):
+    rng = np.random.default_rng(seed)
+    starts = np.cumsum(rng.choice([0.0, 1.5, 4.0, 20.0], size=n))
+    segments = []
+    for i, start in enumerate(starts):
+        words = rng.choice(WORDS, size=int(rng.integers(0, 6))).tolist()
+        segments.append(
+            {
+                "speaker": ["Alice", "Bob", None][i % 7 % 3],
+                "text": " ".join(words),
+                "start": float(start),
+                "end": float(start + rng.uniform(0.0, 12.0)),
+            }
+        )
+    return segments
+
+
+def _windows(segments, length=60.0, step=30.0):
+    total = max(seg.get("end", seg["start"]) for seg in segments)
+    starts = np.arange(0.0, total, step)
+    return starts.tolist(), np.minimum(starts + length, total).tolist()
+
+
+def _starting_in(segments, t0, t1):
+    return [seg for seg in segments if t0 <= seg.get("start", 0.0) < t1]
+
+
+class TestSegmentTimeline:
+    """Tests for SegmentTimeline window queries."""
+
+    def test_list_order_restores_segment_order(self):
+        """Sorted columns map back onto the original segment list."""
+        segments = _segments()
+        timeline = SegmentTimeline(segments)
+
+        assert timeline.list_order(timeline.word_counts).tolist() == [
+            len(seg["text"].split()) for seg in segments
+        ]
+        assert timeline.list_order(timeline.starts).tolist() == [
+            seg["start"] for seg in segments
+        ]
+
+    def test_window_slices_and_totals_match_scan(self):
+        """Segments and speaker changes per window equal the scan."""
+        segments = _segments()
+        timeline = SegmentTimeline(segments)
+        window_starts, window_ends = _windows(segments)
+
+        lo, hi = timeline.start_bounds(window_starts, window_ends)
+        changes = timeline.speaker_changes(lo, hi)
+
+        for k, (t0, t1) in enumerate(zip(window_starts, window_ends)):
+            expected = _starting_in(segments, t0, t1)
+            speakers = [seg["speaker"] for seg in expected]
+            assert timeline.segments_in(int(lo[k]), int(hi[k])) == expected
+            assert changes[k] == sum(
+                1 for a, b in zip(speakers, speakers[1:]) if a != b
+            )
+
+    def test_overlapping_matches_scan(self):
+        """Overlap queries return list positions of segments touching the window."""
+        segments = _segments(seed=1)
+        del segments[5]["end"]
+        timeline = SegmentTimeline(segments)
+
+        for t0, t1 in zip(*_windows(segments, length=45.0, step=45.0)):
+            expected = [
+                i
+                for i, seg in enumerate(segments)
+                if seg["start"] < t1 and seg.get("end", seg["start"]) > t0
+            ]
+            assert timeline.overlapping(t0, t1).tolist() == expected
+
+    def test_unsorted_segments_are_sliced_in_start_order(self):
+        """Out-of-order input is sliced by start time, ties kept in list order."""
+        segments = [
+            {"speaker": "A", "text": "b", "start": 5.0, "end": 6.0},
+            {"speaker": "B", "text": "a", "start": 1.0, "end": 2.0},
+            {"speaker": "C", "text": "c", "start": 5.0, "end": 7.0},
+        ]
+        timeline = SegmentTimeline(segments)
+
+        lo, hi = timeline.start_bounds([0.0], [10.0])
+
+        assert [seg["text"] for seg in timeline.segments_in(lo[0], hi[0])] == [
+            "a",
+            "b",
+            "c",
+        ]
+
+    def test_window_tokens_union_content_tokens(self):
+        """Token-set ids are shared by equal texts and unioned per window."""
+        segments = [
+            {"text": "Ship the release", "start": 0.0, "end": 1.0},
+            {"text": "ship THE release", "start": 2.0, "end": 3.0},
+            {"text": "Budget review", "start": 4.0, "end": 5.0},
+        ]
+        timeline = SegmentTimeline(segments)
+
+        ids = timeline.token_set_ids()
+
+        assert ids[0] == ids[1] != ids[2]
+        assert len(timeline.token_sets()) == 2
+        assert timeline.window_tokens(0, 3) == set(
+            content_tokens("ship the release budget review")
+        )
+        assert timeline.window_tokens(1, 1) == set()
+
+    def test_registered_timeline_only_serves_its_segments(self):
+        """timeline_for_segments reuses the registered timeline for its own list."""
+        segments = _segments(20)
+        timeline = SegmentTimeline(segments)
+        set_segment_timeline(timeline)
+
+        assert get_segment_timeline() is timeline
+        assert timeline_for_segments(segments) is timeline
+        assert timeline_for_segments(list(segments)) is not timeline
+
+        clear_segment_timeline(SegmentTimeline(segments))
+        assert get_segment_timeline() is timeline
+        clear_segment_timeline(timeline)
+        assert get_segment_timeline() is None
@@ -0,0 +1,103 @@
+"""
+Tests for batched transformer inference helpers.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from transcriptx.core.utils.transformer_inference import (
+    classify_batched,
+    get_batch_size,
+    resolve_device,
+)
+
+
+class _FakeTokenizer:
+    def __call__(self, texts, **kwargs):
+        return {"input_ids": [text.split() for text in texts]}
+
+
+class _FakePipeline:
+    """Records batches; label is the text's word count."""
+
+    def __init__(self, tokenizer=None, flat=False):
+        self.tokenizer = tokenizer
+        self.flat = flat
+        self.batches = []
+
+    def __call__(self, texts, **kwargs):
+        self.batches.append(list(texts))
+        results = []
+        for text in texts:
+            item = {"label": str(len(text.split())), "score": 1.0}
+            results.append(item if self.flat else [item])
+        return results
+
+
+class TestClassifyBatched:
+    """Tests for classify_batched."""
+
+    def test_results_in_input_order(self):
+        """Results line up with the input texts, whatever the batch order."""
+        texts = ["a b c d", "a", "a b c", "a b", "a b c d e"]
+        pipe = _FakePipeline(tokenizer=_FakeTokenizer())
+
+        results = classify_batched(pipe, texts, batch_size=2)
+
+        assert [r[0]["label"] for r in results] == ["4", "1", "3", "2", "5"]
+
+    def test_batches_sorted_by_token_length(self):
+        """Texts of similar token length share a batch."""
+        texts = ["a b c d", "a", "a b c", "a b", "a b c d e"]
+        pipe = _FakePipeline(tokenizer=_FakeTokenizer())
+
+        classify_batched(pipe, texts, batch_size=2)
+
+        assert pipe.batches == [["a", "a b"], ["a b c", "a b c d"], ["a b c d e"]]
+
+    def test_without_tokenizer_uses_character_length(self):
+        """Pipelines without a tokenizer are sorted by character length."""
+        pipe = _FakePipeline()
+
+        classify_batched(pipe, ["xxxx", "x", "xx"], batch_size=3)
+
+        assert pipe.batches == [["x", "xx", "xxxx"]]
+
+    def test_flat_outputs_are_wrapped(self):
+        """A single dict per text is normalized to a list of dicts."""
+        pipe = _FakePipeline(flat=True)
+
+        results = classify_batched(pipe, ["a b"], batch_size=4)
+
+        assert results == [[{"label": "2", "score": 1.0}]]
+
+    def test_empty_input(self):
+        """No texts means no pipeline calls."""
+        pipe = _FakePipeline()
+
+        assert classify_batched(pipe, [], batch_size=4) == []
+        assert pipe.batches == []
+
+    def test_mismatched_output_raises(self):
+        """A pipeline returning the wrong number of results is an error."""
+
+        def bad_pipe(texts, **kwargs):
+            return [[{"label": "x", "score": 1.0}]]
+
+        with pytest.raises(ValueError):
+            classify_batched(bad_pipe, ["a", "b"], batch_size=2)
+
+
+class TestTransformerSettings:
+    """Tests for config-driven settings."""
+
+    def test_batch_size_from_config(self):
+        """Batch size comes from config and is at least 1."""
+        assert get_batch_size(SimpleNamespace(transformer_batch_size=8)) == 8
+        assert get_batch_size(SimpleNamespace(transformer_batch_size=0)) == 1
+        assert get_batch_size(SimpleNamespace()) == 32
+
+    def test_cpu_device(self):
+        """transformer_device='cpu' always maps to device -1."""
+        assert resolve_device(SimpleNamespace(transformer_device="cpu")) == -1
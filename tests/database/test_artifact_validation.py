@@ -174,3 +174,101 @@ def test_artifact_registry_registers_roles(
     assert "primary" in roles
     assert "intermediate" in roles
     assert len({artifact["artifact_key"] for artifact in artifacts}) == len(artifacts)
+
+
+@pytest.mark.database
+def test_artifact_registry_uses_hashes_recorded_on_write(
+    db_session, temp_transcript_file, tmp_path, monkeypatch
+):
+    import hashlib
+
+    import matplotlib
+
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+
+    from transcriptx.core.utils import _path_core
+    from transcriptx.core.utils._path_core import get_canonical_base_name
+    from transcriptx.core.utils.artifact_writer import recorded_hash, write_json
+    from transcriptx.core.viz.charts import save_static_chart
+    from transcriptx.database import artifact_registry
+
+    outputs_root = tmp_path / "outputs"
+    outputs_root.mkdir()
+    monkeypatch.setattr(_path_core, "OUTPUTS_DIR", str(outputs_root))
+
+    transcript = TranscriptFile(
+        file_path=str(temp_transcript_file.resolve()),
+        file_name=temp_transcript_file.name,
+        transcript_content_hash="hash" * 16,
+        schema_version=SCHEMA_VERSION,
+        sentence_schema_version=SENTENCE_SCHEMA_VERSION,
+        source_hash="source" * 10,
+        segment_count=1,
+        speaker_count=1,
+    )
+    db_session.add(transcript)
+    db_session.commit()
+    pipeline_run = PipelineRun(
+        transcript_file_id=transcript.id,
+        pipeline_version="1.0.0",
+        pipeline_config_hash="cfg",
+        pipeline_input_hash="input",
+        status="completed",
+    )
+    db_session.add(pipeline_run)
+    db_session.flush()
+    module_run = ModuleRun(
+        pipeline_run_id=pipeline_run.id,
+        transcript_file_id=transcript.id,
+        module_name="stats",
+        module_version="v1",
+        module_config_hash="cfg",
+        module_input_hash="input",
+        status="completed",
+    )
+    db_session.add(module_run)
+    db_session.commit()
+
+    module_dir = outputs_root / get_canonical_base_name(str(temp_transcript_file))
+    module_dir = module_dir / "stats"
+    written_json = write_json(module_dir / "data" / "global" / "stats.json", {"n": 1})
+    fig, ax = plt.subplots()
+    ax.plot([0, 1], [1, 0])
+    chart = save_static_chart(fig, module_dir / "charts" / "global" / "chart.png")
+    plt.close(fig)
+    external = module_dir / "data" / "global" / "notes.txt"
+    external.write_text("written without the artifact writer")
+
+    read_from_disk = []
+    file_hash = artifact_registry._file_hash
+
+    def tracking_file_hash(path):
+        read_from_disk.append(path)
+        return file_hash(path)
+
+    monkeypatch.setattr(artifact_registry, "_file_hash", tracking_file_hash)
+    with patch(
+        "transcriptx.database.artifact_registry.get_session", return_value=db_session
+    ):
+        registry = ArtifactRegistry()
+        artifacts = registry.register_module_artifacts(
+            transcript_path=str(temp_transcript_file),
+            module_name="stats",
+            module_run_id=module_run.id,
+            transcript_file_id=transcript.id,
+        )
+
+    assert read_from_disk == [external]
+    stored = {
+        row.relative_path: row.content_hash
+        for row in db_session.query(ArtifactIndex).filter_by(
+            module_run_id=module_run.id
+        )
+    }
+    assert len(stored) == len(artifacts) == 3
+    for path in (written_json, chart, external):
+        relative = str(path.relative_to(module_dir.parent))
+        assert stored[relative] == hashlib.sha256(path.read_bytes()).hexdigest()
+    # Registered files leave the in-memory manifest
+    assert recorded_hash(written_json) is None
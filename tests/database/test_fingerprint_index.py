@@ -0,0 +1,198 @@
+"""
+Tests for the behavioral fingerprint vector index.
+
+Each test uses its own database file through a fresh DatabaseManager.
+"""
+
+import time
+
+import numpy as np
+import pytest
+
+from transcriptx.database.database import DatabaseManager
+from transcriptx.database.cross_session_tracking import BEHAVIORAL_MATCH_THRESHOLD
+from transcriptx.database.fingerprint_index import (
+    MAX_SCORE_WITHOUT_VOCABULARY,
+    VECTOR_DIMENSION,
+    get_fingerprint_index,
+    project_fingerprint,
+)
+from transcriptx.database.models import (
+    BehavioralFingerprint,
+    FingerprintVector,
+    Speaker,
+)
+from transcriptx.database.repositories import ProfileRepository
+from transcriptx.database.speaker_profiling import IDENTIFICATION_THRESHOLD
+
+
+def _fingerprint(words, rate, sentiment=0.0):
+    return {
+        "behavioral_data": {
+            "vocabulary_patterns": {"top_features": {w: 1.0 for w in words}},
+            "emotion_patterns": {"average_emotion_scores": {"joy": 0.6, "fear": 0.1}},
+            "speech_patterns": {
+                "average_speaking_rate": rate,
+                "average_segment_duration": 4.0,
+            },
+            "sentiment_patterns": {"average_sentiment": sentiment},
+        }
+    }
+
+
+@pytest.fixture
+def session(tmp_path):
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'fingerprints.db'}")
+    manager.initialize()
+    manager.create_tables()
+    session = manager.get_session()
+    yield session
+    session.close()
+    manager.close()
+
+
+def _speakers(session, count):
+    speakers = [Speaker(name=f"speaker{i}") for i in range(count)]
+    session.add_all(speakers)
+    session.commit()
+    return speakers
+
+
+def test_projection_is_fixed_length_and_shape_agnostic():
+    profiling = _fingerprint(["budget", "quarter"], 2.5, 0.4)
+    stored = {
+        "vocabulary_fingerprint": {"top_features": {"budget": 1.0, "quarter": 1.0}},
+        "emotion_signature": {"average_emotion_scores": {"joy": 0.6, "fear": 0.1}},
+        "speech_rhythm": {
+            "average_speaking_rate": 2.5,
+            "average_segment_duration": 4.0,
+        },
+        "sentiment_patterns": {"average_sentiment": 0.4},
+    }
+
+    vector = project_fingerprint(profiling)
+    assert vector.shape == (VECTOR_DIMENSION,)
+    assert vector.dtype == np.float32
+    assert np.isclose(np.linalg.norm(vector), 1.0)
+    assert np.allclose(vector, project_fingerprint(stored))
+    assert not project_fingerprint({}).any()
+    # Nearby speaking rates stay similar; distant ones drift apart
+    near = project_fingerprint(_fingerprint(["budget", "quarter"], 2.7, 0.4))
+    far = project_fingerprint(_fingerprint(["budget", "quarter"], 0.3, 0.4))
+    assert vector @ near > vector @ far
+
+
+def test_disjoint_vocabularies_stay_below_match_thresholds(session):
+    alice, bob = _speakers(session, 2)
+    repo = ProfileRepository(session)
+    words = ["budget", "quarter", "tax", "revenue"]
+    repo.create_behavioral_fingerprint(alice.id, _fingerprint(words, 2.5))
+    # Same pace, emotions and sentiment, but not a single shared term
+    repo.create_behavioral_fingerprint(
+        bob.id, _fingerprint(["guitar", "tour", "album", "drums"], 2.5)
+    )
+
+    threshold = min(BEHAVIORAL_MATCH_THRESHOLD, IDENTIFICATION_THRESHOLD)
+    assert threshold > MAX_SCORE_WITHOUT_VOCABULARY
+    hits = dict(
+        get_fingerprint_index(session).search(session, _fingerprint(words, 2.5))
+    )
+    assert hits[bob.id] <= MAX_SCORE_WITHOUT_VOCABULARY + 1e-5
+    assert hits[alice.id] >= threshold
+    # The same speaker on a slower day still matches
+    slower = _fingerprint(["budget", "quarter", "tax", "forecast"], 2.2, 0.1)
+    assert (
+        project_fingerprint(slower) @ project_fingerprint(_fingerprint(words, 2.5))
+        >= threshold
+    )
+
+
+def test_search_returns_nearest_speakers(session):
+    alice, bob, carol = _speakers(session, 3)
+    repo = ProfileRepository(session)
+    repo.create_behavioral_fingerprint(alice.id, _fingerprint(["budget"], 2.5))
+    repo.create_behavioral_fingerprint(bob.id, _fingerprint(["guitar", "tour"], 1.0))
+    repo.create_behavioral_fingerprint(carol.id, _fingerprint(["budget", "tax"], 2.4))
+
+    index = get_fingerprint_index(session)
+    hits = index.search(session, _fingerprint(["budget"], 2.5), k=2)
+
+    assert [speaker_id for speaker_id, _ in hits] == [alice.id, carol.id]
+    assert hits[0][1] == pytest.approx(1.0, abs=1e-5)
+    assert index.search(session, _fingerprint(["budget"], 2.5), min_score=0.99) == [
+        (alice.id, pytest.approx(1.0, abs=1e-5))
+    ]
+
+
+def test_new_fingerprints_update_loaded_index(session):
+    alice, bob = _speakers(session, 2)
+    repo = ProfileRepository(session)
+    repo.create_behavioral_fingerprint(alice.id, _fingerprint(["budget"], 2.5))
+    index = get_fingerprint_index(session)
+    assert [s for s, _ in index.search(session, _fingerprint(["budget"], 2.5))] == [
+        alice.id
+    ]
+    signature = index._signature
+
+    # Alice's vocabulary changes and Bob is profiled for the first time
+    repo.create_behavioral_fingerprint(alice.id, _fingerprint(["guitar"], 1.0))
+    repo.create_behavioral_fingerprint(bob.id, _fingerprint(["budget"], 2.5))
+
+    assert len(index) == 2
+    assert index._signature != signature
+    assert index.search(session, _fingerprint(["budget"], 2.5), k=1)[0][0] == bob.id
+    assert session.query(FingerprintVector).count() == 2
+
+
+def test_existing_fingerprints_are_backfilled(session):
+    (alice,) = _speakers(session, 1)
+    session.add(
+        BehavioralFingerprint(
+            speaker_id=alice.id, fingerprint_data=_fingerprint(["budget"], 2.5)
+        )
+    )
+    session.commit()
+
+    hits = get_fingerprint_index(session).search(session, _fingerprint(["budget"], 2.5))
+
+    assert hits[0][0] == alice.id
+    row = session.query(FingerprintVector).one()
+    assert row.dimension == VECTOR_DIMENSION
+    assert len(row.vector) == VECTOR_DIMENSION * 4
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_search_scales_to_many_speakers(session):
+    """Benchmark: top-k over 5000 fingerprints stays in the millisecond range."""
+    count = 5000
+    speakers = _speakers(session, count)
+    rng = np.random.default_rng(0)
+    vocabulary = [f"term{i}" for i in range(500)]
+    fingerprints = [
+        BehavioralFingerprint(
+            speaker_id=speaker.id,
+            fingerprint_data=_fingerprint(
+                rng.choice(vocabulary, 20, replace=False).tolist(),
+                float(rng.uniform(0.5, 4.0)),
+                float(rng.uniform(-1, 1)),
+            ),
+        )
+        for speaker in speakers
+    ]
+    session.add_all(fingerprints)
+    session.commit()
+
+    index = get_fingerprint_index(session)
+    start = time.perf_counter()
+    index.search(session, fingerprints[0].fingerprint_data)
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(100):
+        hits = index.search(session, fingerprints[0].fingerprint_data, k=5)
+    search_ms = (time.perf_counter() - start) * 1000 / 100
+
+    print(f"\nload+backfill {load_seconds:.2f}s, search {search_ms:.2f}ms")
+    assert hits[0][0] == speakers[0].id
+    assert search_ms < 50
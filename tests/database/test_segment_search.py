@@ -0,0 +1,157 @@
+"""
+Tests for the full-text segment index.
+
+Each test uses its own SQLite database so the triggers and FTS table do not
+leak into the shared test schema.
+"""
+
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from transcriptx.database.models import Base, TranscriptFile, TranscriptSegment
+from transcriptx.database.segment_search import (
+    build_fts_query,
+    build_tsquery,
+    ensure_segment_search_index,
+    phrase_spans,
+    rebuild_segment_search_index,
+    search_segments,
+    segment_search_available,
+    spans_from_highlight,
+)
+
+TEXTS = [
+    "Ship the release tomorrow.",
+    "We should review the budget before we ship.",
+    "The release notes mention shipping delays.",
+    "Café meeting moved to Friday.",
+    "Nothing relevant here.",
+]
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_engine(f"sqlite:///{tmp_path / 'search.db'}")
+    Base.metadata.create_all(engine)
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(engine):
+    session = sessionmaker(bind=engine)()
+    yield session
+    session.close()
+
+
+def _add_segments(session, texts, file_name="meeting.json"):
+    transcript_file = TranscriptFile(
+        file_path=f"/test/{file_name}", file_name=file_name
+    )
+    session.add(transcript_file)
+    session.flush()
+    segments = [
+        TranscriptSegment(
+            transcript_file_id=transcript_file.id,
+            segment_index=i,
+            text=segment_text,
+            start_time=float(i),
+            end_time=float(i) + 1.0,
+        )
+        for i, segment_text in enumerate(texts)
+    ]
+    session.add_all(segments)
+    session.commit()
+    return transcript_file, segments
+
+
+def _texts(session, page):
+    by_id = {seg.id: seg.text for seg in session.query(TranscriptSegment).all()}
+    return [by_id[hit.segment_id] for hit in page.hits]
+
+
+def test_query_builders_use_phrase_with_prefix():
+    """User input becomes a phrase whose last word is a prefix."""
+    assert build_fts_query('Ship the "rel') == '"ship the rel"*'
+    assert build_tsquery("ship the rel") == "ship <-> the <-> rel:*"
+    assert build_fts_query("  -- ") is None
+
+
+def test_highlight_markers_become_spans():
+    """Spans are offsets into the unmarked text."""
+    marked = "\x02Ship the\x03 release and \x02ship\x03"
+    assert spans_from_highlight(marked) == [(0, 8), (21, 25)]
+    assert phrase_spans("Ship the release; re-ship", ["ship"]) == [
+        (0, 4),
+        (21, 25),
+    ]
+
+
+def test_backfill_and_ranked_phrase_prefix_search(engine, session):
+    """Existing segments are backfilled; matches are ranked and highlighted."""
+    _add_segments(session, TEXTS)
+
+    assert ensure_segment_search_index(engine)
+    assert segment_search_available(session)
+
+    page = search_segments(session, "ship")
+    assert page.total == 3
+    assert set(_texts(session, page)) == set(TEXTS[:3])
+    scores = [hit.score for hit in page.hits]
+    assert scores == sorted(scores, reverse=True)
+
+    page = search_segments(session, "ship the rel")
+    assert _texts(session, page) == [TEXTS[0]]
+    assert page.hits[0].match_spans == [(0, 16)]
+
+    page = search_segments(session, "cafe")
+    assert _texts(session, page) == [TEXTS[3]]
+
+
+def test_triggers_keep_index_in_sync(engine, session):
+    """Inserts, text updates and deletes reach the index without a rebuild."""
+    ensure_segment_search_index(engine)
+    transcript_file, segments = _add_segments(session, TEXTS)
+
+    assert search_segments(session, "budget").total == 1
+
+    segments[1].text = "We should review the forecast."
+    session.commit()
+    assert search_segments(session, "budget").total == 0
+    assert search_segments(session, "forecast").total == 1
+
+    session.delete(segments[0])
+    session.commit()
+    assert search_segments(session, "ship").total == 1
+
+
+def test_pagination_and_rebuild(engine, session):
+    """Pages partition the ranked hits; rebuild repairs a cleared index."""
+    ensure_segment_search_index(engine)
+    _add_segments(session, [f"status update number {i}" for i in range(25)])
+
+    pages = [
+        search_segments(session, "status upd", limit=10, offset=o) for o in (0, 10, 20)
+    ]
+    ids = [hit.segment_id for page in pages for hit in page.hits]
+    assert [len(page.hits) for page in pages] == [10, 10, 5]
+    assert len(set(ids)) == 25
+    assert all(page.total == 25 for page in pages)
+
+    with engine.begin() as connection:
+        connection.execute(
+            text(
+                "INSERT INTO transcript_segments_fts(transcript_segments_fts) "
+                "VALUES ('delete-all')"
+            )
+        )
+    assert search_segments(session, "status").total == 0
+
+    assert rebuild_segment_search_index(engine) == 25
+    assert search_segments(session, "status").total == 25
+
+
+def test_unavailable_without_index(session):
+    """Without the FTS table, callers fall back to substring search."""
+    assert not segment_search_available(session)
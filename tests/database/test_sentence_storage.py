@@ -4,9 +4,17 @@ Tests for SentenceStorageService.
 This module tests the sentence storage service functionality.
 """
 
+import numpy as np
 import pytest
-from transcriptx.database.sentence_storage import SentenceStorageService
-from transcriptx.database.models import TranscriptFile, TranscriptSegment
+from transcriptx.database.sentence_storage import (
+    SentenceStorageService,
+    _proportional_times,
+)
+from transcriptx.database.models import (
+    TranscriptFile,
+    TranscriptSegment,
+    TranscriptSentence,
+)
 
 
 class TestSentenceStorageService:
@@ -167,3 +175,118 @@ class TestSentenceStorageService:
             sorted_sentences = sorted(seg_sentences, key=lambda s: s.sentence_index)
             for i, sentence in enumerate(sorted_sentences):
                 assert sentence.sentence_index == i
+
+    def test_bulk_store_matches_orm_path(self, service, db_session, sample_segments):
+        """Bulk inserts produce the same sentences as the ORM path."""
+        expected = [
+            (s.transcript_segment_id, s.sentence_index, s.text, s.word_count)
+            + (pytest.approx(s.start_time), pytest.approx(s.end_time))
+            for s in service.store_sentences_from_segments(sample_segments)
+        ]
+
+        ids = service.bulk_store_sentences(
+            (seg for seg in sample_segments), chunk_size=1
+        )
+
+        stored = {
+            s.id: s
+            for s in db_session.query(TranscriptSentence).filter(
+                TranscriptSentence.id.in_(ids)
+            )
+        }
+        actual = [
+            (
+                stored[i].transcript_segment_id,
+                stored[i].sentence_index,
+                stored[i].text,
+                stored[i].word_count,
+                stored[i].start_time,
+                stored[i].end_time,
+            )
+            for i in ids
+        ]
+        assert actual == expected
+        assert all(stored[i].timestamp_estimated for i in ids)
+        assert len({stored[i].uuid for i in ids}) == len(ids)
+
+    def test_bulk_store_with_callers_session_does_not_commit(
+        self, db_session, sample_segments
+    ):
+        """A passed-in session is flushed, left open and not committed."""
+        service = SentenceStorageService(session=db_session)
+        ids = service.bulk_store_sentences(sample_segments)
+        service.close()
+
+        assert db_session.in_transaction()
+        assert db_session.query(TranscriptSentence).filter(
+            TranscriptSentence.id.in_(ids)
+        ).count() == len(ids)
+        db_session.rollback()
+        assert (
+            db_session.query(TranscriptSentence)
+            .filter(TranscriptSentence.id.in_(ids))
+            .count()
+            == 0
+        )
+
+
+def test_proportional_times_split_by_word_share():
+    """Times split by word share; wordless segments split evenly."""
+    starts, ends = _proportional_times(
+        np.array([0.0, 10.0, 20.0]),
+        np.array([10.0, 12.0, 23.0]),
+        np.array([2, 1, 3]),
+        np.array([1.0, 3.0, 5.0, 0.0, 0.0, 0.0]),
+    )
+    assert starts.tolist() == pytest.approx([0.0, 2.5, 10.0, 20.0, 21.0, 22.0])
+    assert ends.tolist() == pytest.approx([2.5, 10.0, 12.0, 21.0, 22.0, 23.0])
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_sentence_storage_benchmark_30k_segments(tmp_path):
+    """Print ORM vs. bulk sentence ingest throughput at 30k segments."""
+    import time
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from transcriptx.database.models import Base
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'bench.db'}")
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine)()
+    transcript = TranscriptFile(file_path="/bench.json", file_name="bench.json")
+    session.add(transcript)
+    session.flush()
+    segments = [
+        TranscriptSegment(
+            transcript_file_id=transcript.id,
+            segment_index=i,
+            text="We should ship it. The budget is fine? Let's review tomorrow.",
+            start_time=float(i),
+            end_time=float(i) + 0.9,
+        )
+        for i in range(30_000)
+    ]
+    session.add_all(segments)
+    session.commit()
+
+    timings = {}
+    for name in ("orm", "bulk"):
+        service = SentenceStorageService(session=session)
+        start = time.perf_counter()
+        if name == "orm":
+            count = len(service.store_sentences_from_segments(segments))
+        else:
+            count = len(service.bulk_store_sentences(iter(segments)))
+        session.commit()
+        timings[name] = time.perf_counter() - start
+        print(f"{name}: {count} sentences in {timings[name]:.2f}s")
+        session.expunge_all()
+        session.query(TranscriptSentence).delete()
+        session.commit()
+        segments = session.query(TranscriptSegment).order_by(TranscriptSegment.id).all()
+    session.close()
+    engine.dispose()
+    assert timings["bulk"] < timings["orm"]
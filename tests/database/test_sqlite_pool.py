@@ -0,0 +1,152 @@
+"""
+Tests for pooled SQLite connections.
+
+Each test uses its own database file through a fresh DatabaseManager.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.pool import StaticPool
+
+from transcriptx.core.utils.config import get_config
+from transcriptx.database.database import DatabaseManager
+from transcriptx.database.models import TranscriptFile, TranscriptSegment
+from transcriptx.database.sqlite_pool import (
+    MeteredQueuePool,
+    is_memory_database,
+    is_write_statement,
+)
+
+
+@pytest.fixture
+def manager(tmp_path):
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'pool.db'}")
+    manager.initialize()
+    yield manager
+    manager.close()
+
+
+def test_statement_classification():
+    assert is_memory_database("sqlite://")
+    assert is_memory_database("sqlite:///:memory:")
+    assert is_memory_database("sqlite:///file:db?mode=memory&uri=true")
+    assert not is_memory_database("sqlite:////data/transcriptx.db")
+    assert is_write_statement("  insert into t values (1)")
+    assert is_write_statement("BEGIN IMMEDIATE")
+    assert not is_write_statement("SELECT * FROM updates")
+
+
+def test_memory_database_keeps_single_connection():
+    manager = DatabaseManager("sqlite:///:memory:")
+    manager.initialize()
+    try:
+        assert isinstance(manager.engine.pool, StaticPool)
+        assert manager.pool_metrics is None
+    finally:
+        manager.close()
+
+
+def test_file_database_pools_wal_connections(manager):
+    assert isinstance(manager.engine.pool, MeteredQueuePool)
+    with manager.engine.connect() as first, manager.engine.connect() as second:
+        assert first.connection.dbapi_connection is not (
+            second.connection.dbapi_connection
+        )
+        assert first.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert second.execute(text("PRAGMA busy_timeout")).scalar() == 30000
+    info = manager.get_database_info()
+    assert info["pool"]["checkouts"] >= 2
+
+
+def test_busy_write_is_retried(tmp_path, monkeypatch):
+    monkeypatch.setattr(get_config().database, "sqlite_busy_timeout_ms", 20)
+    db_path = tmp_path / "busy.db"
+    manager = DatabaseManager(f"sqlite:///{db_path}")
+    manager.initialize()
+    try:
+        with manager.engine.begin() as connection:
+            connection.execute(text("CREATE TABLE items (id INTEGER PRIMARY KEY)"))
+
+        # Another process holds the write lock for a while
+        other = sqlite3.connect(db_path, check_same_thread=False)
+        other.execute("BEGIN IMMEDIATE")
+        threading.Timer(0.2, other.commit).start()
+
+        with manager.engine.begin() as connection:
+            connection.execute(text("INSERT INTO items (id) VALUES (1)"))
+        other.close()
+
+        with manager.engine.connect() as connection:
+            assert connection.execute(text("SELECT count(*) FROM items")).scalar() == 1
+        assert manager.pool_metrics.snapshot()["busy_retries"] > 0
+    finally:
+        manager.close()
+
+
+def test_readers_run_while_pipeline_writes_segments(manager):
+    """Load test: concurrent reads never fail or stall behind segment writes."""
+    manager.create_tables()
+    with manager.get_session() as session:
+        transcript = TranscriptFile(file_path="/test/load.json", file_name="load.json")
+        session.add(transcript)
+        session.commit()
+        transcript_id = transcript.id
+
+    batches, batch_size = 20, 50
+    errors = []
+    reads = []
+    writing = threading.Event()
+    writing.set()
+
+    def write_segments():
+        try:
+            for batch in range(batches):
+                with manager.get_session() as session:
+                    session.add_all(
+                        TranscriptSegment(
+                            transcript_file_id=transcript_id,
+                            segment_index=batch * batch_size + i,
+                            text=f"segment {batch} {i}",
+                            start_time=float(i),
+                            end_time=float(i) + 1.0,
+                        )
+                        for i in range(batch_size)
+                    )
+                    session.commit()
+        except Exception as e:
+            errors.append(e)
+        finally:
+            writing.clear()
+
+    def read_segments():
+        try:
+            while writing.is_set():
+                start = time.perf_counter()
+                with manager.get_session() as session:
+                    session.execute(
+                        text("SELECT count(*) FROM transcript_segments")
+                    ).scalar()
+                reads.append(time.perf_counter() - start)
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=read_segments) for _ in range(6)]
+    threads.append(threading.Thread(target=write_segments))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(timeout=60)
+
+    assert not errors
+    assert len(reads) > batches
+    assert max(reads) < 5.0
+    with manager.get_session() as session:
+        count = session.execute(text("SELECT count(*) FROM transcript_segments"))
+        assert count.scalar() == batches * batch_size
+    metrics = manager.pool_metrics.snapshot()
+    assert metrics["write_locks"] >= batches
+    assert metrics["busy_failures"] == 0
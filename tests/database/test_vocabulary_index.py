@@ -0,0 +1,208 @@
+"""
+Tests for the sparse speaker vocabulary index.
+
+Each test uses its own database file through a fresh DatabaseManager and
+its own on-disk index directory.
+"""
+
+import os
+import time
+
+import numpy as np
+import pytest
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from transcriptx.database import vocabulary_index, vocabulary_storage
+from transcriptx.database.database import DatabaseManager
+from transcriptx.database.models import Speaker, SpeakerVocabularyWord
+from transcriptx.database.vocabulary_index import (
+    SpeakerVocabularyIndex,
+    get_vocabulary_index,
+)
+from transcriptx.database.vocabulary_storage import VocabularyStorageService
+
+
+@pytest.fixture
+def session(tmp_path, monkeypatch):
+    index_root = tmp_path / "vocabulary_index"
+    index_root.mkdir()
+    monkeypatch.setattr(
+        vocabulary_index, "get_vocabulary_index_root", lambda: index_root
+    )
+    manager = DatabaseManager(f"sqlite:///{tmp_path / 'vocabulary.db'}")
+    manager.initialize()
+    manager.create_tables()
+    session = manager.get_session()
+    yield session
+    session.close()
+    manager.close()
+
+
+@pytest.fixture
+def service(session, monkeypatch):
+    monkeypatch.setattr(vocabulary_storage, "get_session", lambda: session)
+    return VocabularyStorageService()
+
+
+def _speakers(session, count):
+    speakers = [Speaker(name=f"speaker{i}") for i in range(count)]
+    session.add_all(speakers)
+    session.commit()
+    return speakers
+
+
+def _reference_scores(session, text):
+    """The per-lookup dict comparison the index replaced."""
+    vocabs = {}
+    for row in session.query(SpeakerVocabularyWord).all():
+        vocabs.setdefault(row.speaker_id, {})[row.word] = row.tfidf_score
+    vectorizer = TfidfVectorizer(
+        stop_words="english", ngram_range=(1, 2), min_df=1, max_df=1.0
+    )
+    scores = vectorizer.fit_transform([text]).toarray()[0]
+    inputs = dict(zip(vectorizer.get_feature_names_out(), scores))
+    result = {}
+    for speaker_id, vocab in vocabs.items():
+        common = set(inputs) & set(vocab)
+        if common:
+            x = np.array([inputs[w] for w in common])
+            s = np.array([vocab[w] for w in common])
+            result[speaker_id] = float(x @ s / (np.linalg.norm(x) * np.linalg.norm(s)))
+    return result
+
+
+def test_scores_match_dict_comparison(session, service):
+    speakers = _speakers(session, 3)
+    texts = [
+        ["Quarterly budget review and tax planning for the budget committee."],
+        ["Guitar tour dates, guitar strings and the drummer's tour bus."],
+        ["Tax law, budget deficits and the planning committee agenda."],
+    ]
+    for speaker, speaker_texts in zip(speakers, texts):
+        service.store_speaker_vocabulary_snapshot(speaker.id, speaker_texts)
+
+    query = "The budget committee discussed tax planning and a guitar."
+    expected = _reference_scores(session, query)
+    matches = service.find_speakers_by_vocabulary(query, top_n=5, min_confidence=0.0)
+
+    assert {speaker.id: score for speaker, score in matches} == pytest.approx(expected)
+    assert [score for _, score in matches] == pytest.approx(
+        sorted(expected.values(), reverse=True)
+    )
+
+
+def test_latest_snapshot_replaces_older_vocabulary(session, service):
+    (speaker,) = _speakers(session, 1)
+    service.store_speaker_vocabulary_snapshot(speaker.id, ["cooking baking recipes"])
+    assert service.find_speakers_by_vocabulary("baking recipes", min_confidence=0.1)
+
+    service.store_speaker_vocabulary_snapshot(speaker.id, ["guitar tour drummer"])
+    assert service.find_speakers_by_vocabulary("baking recipes") == []
+    assert service.find_speakers_by_vocabulary("guitar tour")[0][0].id == speaker.id
+
+
+def test_index_filters_by_vectorizer_params_hash(session, service):
+    first, second = _speakers(session, 2)
+    custom = {"stop_words": "english", "ngram_range": (1, 2), "max_features": 50}
+    service.store_speaker_vocabulary_snapshot(first.id, ["budget tax planning"])
+    service.store_speaker_vocabulary_snapshot(
+        second.id, ["budget tax planning"], vectorizer_params=custom
+    )
+    custom_hash = service._compute_vectorizer_params_hash(custom)
+
+    matches = service.find_speakers_by_vocabulary(
+        "budget planning", vectorizer_params_hash=custom_hash
+    )
+    assert [speaker.id for speaker, _ in matches] == [second.id]
+    assert len(service.find_speakers_by_vocabulary("budget planning")) == 2
+
+
+def test_index_is_reused_from_disk_until_snapshots_change(
+    session, service, monkeypatch
+):
+    first, second = _speakers(session, 2)
+    service.store_speaker_vocabulary_snapshot(first.id, ["budget tax planning"])
+    index = get_vocabulary_index(session)
+    assert len(index) == 1
+
+    # A new process loads the saved index instead of rebuilding it
+    monkeypatch.setattr(vocabulary_index, "_caches", type(vocabulary_index._caches)())
+    build = SpeakerVocabularyIndex.build
+    monkeypatch.setattr(
+        SpeakerVocabularyIndex,
+        "build",
+        classmethod(lambda cls, *a, **k: pytest.fail("index was rebuilt")),
+    )
+    reloaded = get_vocabulary_index(session)
+    assert reloaded.terms == index.terms
+    assert reloaded.search("tax planning")[0][0] == first.id
+
+    monkeypatch.setattr(SpeakerVocabularyIndex, "build", build)
+    service.store_speaker_vocabulary_snapshot(second.id, ["guitar tour drummer"])
+    assert len(get_vocabulary_index(session)) == 2
+
+
+def test_disk_cache_keeps_most_recently_used_files(tmp_path, monkeypatch):
+    root = tmp_path / "cache"
+    root.mkdir()
+    for i in range(5):
+        path = root / f"db{i}-index.npz"
+        path.write_bytes(b"")
+        os.utime(path, ns=(i * 10**9, i * 10**9))
+
+    vocabulary_index._evict_cache_files(root, keep=2)
+
+    assert sorted(p.name for p in root.iterdir()) == [
+        "db3-index.npz",
+        "db4-index.npz",
+    ]
+
+
+def test_batch_lookup_identifies_each_segment(session, service):
+    first, second = _speakers(session, 2)
+    service.store_speaker_vocabulary_snapshot(first.id, ["budget tax planning"])
+    service.store_speaker_vocabulary_snapshot(second.id, ["guitar tour drummer"])
+
+    results = service.find_speakers_by_vocabulary_batch(
+        ["guitar tour tonight", "", "tax planning budget", "unrelated words"]
+    )
+
+    assert [[s.id for s, _ in hits] for hits in results] == [
+        [second.id],
+        [],
+        [first.id],
+        [],
+    ]
+
+
+@pytest.mark.slow
+@pytest.mark.performance
+def test_batch_lookup_scales_to_many_speakers(session, service):
+    """Benchmark: 200 segment lookups against 1000 speaker vocabularies."""
+    speakers = _speakers(session, 1000)
+    rng = np.random.default_rng(0)
+    words = [f"term{i}" for i in range(3000)]
+    session.add_all(
+        SpeakerVocabularyWord(
+            speaker_id=speaker.id,
+            word=word,
+            tfidf_score=float(rng.uniform(0.1, 1.0)),
+            vectorizer_params_hash="0" * 64,
+            snapshot_version=1,
+        )
+        for speaker in speakers
+        for word in rng.choice(words, 100, replace=False)
+    )
+    session.commit()
+    segments = [" ".join(rng.choice(words, 30)) for _ in range(200)]
+
+    start = time.perf_counter()
+    results = service.find_speakers_by_vocabulary_batch(segments, min_confidence=0.0)
+    cold_seconds = time.perf_counter() - start
+    start = time.perf_counter()
+    service.find_speakers_by_vocabulary_batch(segments, min_confidence=0.0)
+    warm_seconds = time.perf_counter() - start
+
+    print(f"\ncold {cold_seconds:.2f}s, warm {warm_seconds:.3f}s for 200 segments")
+    assert all(results)
+    assert warm_seconds < cold_seconds
@@ -925,3 +925,175 @@ class TestExecutePipelineFakeDAG:
         assert len(started) == 1 and started[0]["module_name"] == "mod_a"
         assert len(completed) == 1 and completed[0]["module_name"] == "mod_a"
         assert "duration_ms" in completed[0]
+
+    @patch("transcriptx.core.pipeline.dag_pipeline.validate_transcript_file")
+    @patch("transcriptx.core.pipeline.dag_pipeline.validate_output_directory")
+    @patch("transcriptx.core.pipeline.dag_pipeline.PipelineContext")
+    def test_parallel_matches_sequential_and_reports_timing(
+        self, mock_context_class, _v1, _v2, temp_transcript_file, sample_speaker_map
+    ):
+        """Parallel runs independent modules concurrently with the same results."""
+        import threading
+
+        barrier = threading.Barrier(2, timeout=5)
+
+        def _independent(_path):
+            barrier.wait()  # only passes if both modules run at the same time
+            return {"status": "success"}
+
+        def _build():
+            pipeline = DAGPipeline()
+            pipeline.add_module("mod_a", "Module A", "light", [], _independent)
+            pipeline.add_module("mod_b", "Module B", "light", [], _independent)
+            pipeline.add_module(
+                "mod_c", "Module C", "medium", ["mod_a", "mod_b"], MagicMock()
+            )
+            return pipeline
+
+        mock_context = MagicMock()
+        mock_context.validate.return_value = True
+        mock_context.get_segments.return_value = [
+            {"speaker": "SPEAKER_00", "text": "Test"}
+        ]
+        mock_context_class.return_value = mock_context
+
+        events = []
+        parallel_result = _build().execute_pipeline(
+            transcript_path=str(temp_transcript_file),
+            selected_modules=["mod_c"],
+            skip_speaker_mapping=True,
+            parallel=True,
+            max_workers=2,
+            event_collector=events,
+        )
+
+        assert parallel_result["errors"] == []
+        assert sorted(parallel_result["modules_run"]) == ["mod_a", "mod_b", "mod_c"]
+        assert parallel_result["modules_run"][-1] == "mod_c"
+        assert set(parallel_result["module_results"]) == {"mod_a", "mod_b", "mod_c"}
+        assert parallel_result["wall_clock_seconds"] >= 0
+        assert parallel_result["module_seconds_total"] >= 0
+        completed = [e for e in events if e.get("event") == "module_completed"]
+        assert len(completed) == 3
+
+        barrier.reset()
+        sequential_build = _build()
+        sequential_build.nodes["mod_a"].function = MagicMock()
+        sequential_build.nodes["mod_b"].function = MagicMock()
+        sequential_result = sequential_build.execute_pipeline(
+            transcript_path=str(temp_transcript_file),
+            selected_modules=["mod_c"],
+            skip_speaker_mapping=True,
+        )
+        assert sorted(sequential_result["modules_run"]) == sorted(
+            parallel_result["modules_run"]
+        )
+        assert "module_seconds_total" in sequential_result
+
+    @patch("transcriptx.core.pipeline.dag_pipeline.validate_transcript_file")
+    @patch("transcriptx.core.pipeline.dag_pipeline.validate_output_directory")
+    @patch("transcriptx.core.pipeline.dag_pipeline.PipelineContext")
+    def test_parallel_segment_writers_match_sequential(
+        self, mock_context_class, _v1, _v2, temp_transcript_file
+    ):
+        """Modules writing and reading shared segment dicts give sequential results."""
+        import time
+
+        outputs = {}
+
+        class _SentimentLike:
+            """Writes seg["sentiment"] in place, like the sentiment module."""
+
+            def run_from_context(self, context):
+                for seg in context.get_segments():
+                    time.sleep(0.002)
+                    seg["sentiment"] = {"compound": len(seg["text"]) / 10}
+                return {"status": "success"}
+
+        class _TemporalLike:
+            """Reads seg["sentiment"], like temporal_dynamics."""
+
+            def run_from_context(self, context):
+                scores = [
+                    seg.get("sentiment", {}).get("compound", 0.0)
+                    for seg in context.get_segments()
+                ]
+                outputs[self.run] = sum(scores) / len(scores)
+                return {"status": "success"}
+
+        class _TicsLike:
+            """Iterates every segment dict, like save_transcript."""
+
+            def run_from_context(self, context):
+                for seg in context.get_segments():
+                    dict(seg)
+                return {"status": "success"}
+
+        def _run(parallel):
+            _TemporalLike.run = "parallel" if parallel else "sequential"
+            segments = [
+                {"speaker": "SPEAKER_00", "text": "x" * (i % 7 + 1)} for i in range(40)
+            ]
+            mock_context = MagicMock()
+            mock_context.validate.return_value = True
+            mock_context.get_segments.return_value = segments
+            mock_context_class.return_value = mock_context
+
+            pipeline = DAGPipeline()
+            for name, cls in (
+                ("a_sentiment_like", _SentimentLike),
+                ("b_tics_like", _TicsLike),
+                ("c_temporal_like", _TemporalLike),
+            ):
+                pipeline.add_module(name, name, "light", [], cls, shares_segments=True)
+            result = pipeline.execute_pipeline(
+                transcript_path=str(temp_transcript_file),
+                selected_modules=list(pipeline.nodes),
+                skip_speaker_mapping=True,
+                parallel=parallel,
+                max_workers=3,
+            )
+            assert result["errors"] == []
+            return segments
+
+        sequential_segments = _run(parallel=False)
+        parallel_segments = _run(parallel=True)
+
+        assert parallel_segments == sequential_segments
+        assert outputs["parallel"] == outputs["sequential"] > 0
+
+    @patch("transcriptx.core.pipeline.dag_pipeline.validate_transcript_file")
+    @patch("transcriptx.core.pipeline.dag_pipeline.validate_output_directory")
+    @patch("transcriptx.core.pipeline.dag_pipeline.PipelineContext")
+    def test_parallel_skips_dependents_of_failed_module(
+        self, mock_context_class, _v1, _v2, temp_transcript_file, sample_speaker_map
+    ):
+        """A failed dependency blocks its dependents, as in sequential runs."""
+        pipeline = DAGPipeline()
+        pipeline.add_module(
+            "base", "Base", "light", [], MagicMock(side_effect=RuntimeError("boom"))
+        )
+        dependent = MagicMock()
+        pipeline.add_module("dependent", "Dependent", "medium", ["base"], dependent)
+        other = MagicMock()
+        pipeline.add_module("other", "Other", "light", [], other)
+
+        mock_context = MagicMock()
+        mock_context.validate.return_value = True
+        mock_context.get_segments.return_value = [
+            {"speaker": "SPEAKER_00", "text": "Test"}
+        ]
+        mock_context_class.return_value = mock_context
+
+        result = pipeline.execute_pipeline(
+            transcript_path=str(temp_transcript_file),
+            selected_modules=["dependent", "other"],
+            skip_speaker_mapping=True,
+            parallel=True,
+        )
+
+        dependent.assert_not_called()
+        other.assert_called_once()
+        assert result["modules_run"] == ["other"]
+        assert any("boom" in err for err in result["errors"])
+        assert any("Missing dependencies" in err for err in result["errors"])
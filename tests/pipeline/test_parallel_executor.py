@@ -143,3 +143,65 @@ class TestParallelExecutor:
 
         assert "start_time" in results
         assert isinstance(results["start_time"], float)
+
+    def test_dispatches_dependents_without_waiting_for_level(self):
+        """A dependent starts as soon as its own dependency finishes."""
+        import threading
+
+        from transcriptx.core.pipeline.dag_pipeline import DAGPipeline
+
+        slow_release = threading.Event()
+        started = []
+
+        def _slow(_path):
+            started.append("slow")
+            assert slow_release.wait(timeout=5)
+
+        def _fast(_path):
+            started.append("fast")
+
+        def _after_fast(_path):
+            started.append("after_fast")
+            slow_release.set()
+
+        dag = DAGPipeline()
+        dag.add_module("slow", "Slow", "light", [], _slow)
+        dag.add_module("fast", "Fast", "light", [], _fast)
+        dag.add_module("after_fast", "After fast", "light", ["fast"], _after_fast)
+
+        results = ParallelExecutor(max_workers=2).execute_parallel(
+            dag, "test.json", ["slow", "after_fast"]
+        )
+
+        assert results["errors"] == []
+        assert sorted(results["modules_run"]) == ["after_fast", "fast", "slow"]
+        assert set(results["module_durations"]) == {"slow", "fast", "after_fast"}
+        assert results["module_seconds_total"] >= results["module_durations"]["slow"]
+
+    def test_resource_class_limits_concurrency(self):
+        """Modules sharing a capped resource class never overlap."""
+        import threading
+        import time
+
+        from transcriptx.core.pipeline.dag_pipeline import DAGPipeline
+
+        lock = threading.Lock()
+        active = {"now": 0, "peak": 0}
+
+        def _model(_path):
+            with lock:
+                active["now"] += 1
+                active["peak"] = max(active["peak"], active["now"])
+            time.sleep(0.02)
+            with lock:
+                active["now"] -= 1
+
+        dag = DAGPipeline()
+        for name in ("m1", "m2", "m3"):
+            dag.add_module(name, name, "medium", [], _model, resource_class="model")
+
+        executor = ParallelExecutor(max_workers=4, resource_limits={"model": 1})
+        results = executor.execute_parallel(dag, "test.json", ["m1", "m2", "m3"])
+
+        assert sorted(results["modules_run"]) == ["m1", "m2", "m3"]
+        assert active["peak"] == 1